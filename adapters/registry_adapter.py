@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Registry adapter: maps any LEAGUES_REGISTRY league's payloads to CanonicalMatch.
+
+League defaults (country flag, data source) come from the registry config, so
+adding a league to real_agents/leagues_registry.py is enough to normalize it.
+Field aliases cover the shapes our fetchers emit (ESPN, MedioTiempo, Progol).
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.structure_adapter import CanonicalMatch, DimensionExtractor
+
+HOME_KEYS = ("home_team", "home", "homeName", "home_team_name")
+AWAY_KEYS = ("away_team", "away", "awayName", "away_team_name")
+ID_KEYS = ("game_id", "id", "matchId", "espn_id", "event_id")
+TIME_KEYS = ("time", "start_time")
+DATE_KEYS = ("date", "game_date")
+
+
+def first_value(payload: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """First truthy value among alias keys (None when none is set)."""
+    get = payload.get
+    for key in keys:
+        value = get(key)
+        if value:
+            return value
+    return None
+
+
+class RegistryAdapter:
+    """Config-driven adapter shared by every registered league."""
+
+    home_keys = HOME_KEYS
+    away_keys = AWAY_KEYS
+    id_keys = ID_KEYS
+    # None = standard dimension keys read straight off the payload
+    extract_dimensions: Optional[DimensionExtractor] = None
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 default_country: Optional[str] = None, default_source: Optional[str] = None):
+        config = config or {}
+        self.default_country = default_country or config.get("country_flag")
+        self.default_source = default_source or config.get("data_source_name") or "UNKNOWN_SOURCE"
+
+    def source_for(self, payload: Dict[str, Any]) -> str:
+        return payload.get("data_source") or self.default_source
+
+    def adapt(self, league_id: str, games: List[Dict[str, Any]]) -> List[CanonicalMatch]:
+        home_keys, away_keys, id_keys = self.home_keys, self.away_keys, self.id_keys
+        extract, country, source_for = self.extract_dimensions, self.default_country, self.source_for
+
+        canon: List[CanonicalMatch] = []
+        append = canon.append
+        for g in games or []:
+            home = first_value(g, home_keys) or "TBD"
+            away = first_value(g, away_keys) or "TBD"
+            match_id = first_value(g, id_keys)
+            completed = g.get("completed")
+            append(CanonicalMatch(
+                league_id=league_id,
+                match_id=str(match_id) if match_id else f"{league_id}:{home}-{away}",
+                home_team=home,
+                away_team=away,
+                date=first_value(g, DATE_KEYS),
+                time=first_value(g, TIME_KEYS),
+                venue=g.get("venue"),
+                country_code=g.get("country_code") or country,
+                status=g.get("status") or "scheduled",
+                completed=bool(completed) if completed is not None else False,
+                source=source_for(g),
+                raw=g,
+                extract=extract,
+            ))
+        return canon
@@ -21,8 +21,10 @@ from collections import defaultdict, deque
 from enum import Enum
 import uuid
 import heapq
+import numpy as np
 
 from core.autonomous_agent import AutonomousAgent, AGENT_REGISTRY
+from core.capability_index import CapabilityIndex
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +119,7 @@ class CoordinatorAgent(AutonomousAgent):
         # Agent registry and capabilities
         self.discovered_agents = {}  # agent_id -> agent_info
         self.agent_capabilities = defaultdict(set)  # agent_id -> set of capabilities
+        self.capability_index = CapabilityIndex()  # capability -> agents (inverted)
         self.agent_workload = defaultdict(int)  # agent_id -> current task count
         self.agent_performance = defaultdict(dict)  # agent_id -> performance_metrics
         
@@ -533,31 +536,26 @@ class CoordinatorAgent(AutonomousAgent):
         task_type = task_data.get('task_type')
         required_capabilities = self._get_required_capabilities(task_type)
         
-        # Find agents with required capabilities
-        candidate_agents = []
-        for agent_id, capabilities in self.agent_capabilities.items():
-            if required_capabilities.issubset(capabilities):
-                # Check agent workload
-                current_workload = self.agent_workload[agent_id]
-                if current_workload < self.max_agent_workload:
-                    # Calculate agent score
-                    performance = self.agent_performance.get(agent_id, {})
-                    success_rate = performance.get('success_rate', 0.5)
-                    avg_completion_time = performance.get('avg_completion_time', 60.0)
-                    
-                    # Score based on success rate, low workload, and fast completion
-                    score = (success_rate * 0.5 + 
-                           (1 - current_workload / self.max_agent_workload) * 0.3 +
-                           (1 / max(avg_completion_time, 1.0)) * 0.2)
-                    
-                    candidate_agents.append((agent_id, score))
-        
-        if candidate_agents:
-            # Select agent with highest score
-            candidate_agents.sort(key=lambda x: x[1], reverse=True)
-            return candidate_agents[0][0]
+        # Find agents with required capabilities via the inverted index
+        candidate_agents = self.capability_index.candidates(required_capabilities)
+        if not candidate_agents:
+            return None
         
-        return None
+        count = len(candidate_agents)
+        performance = [self.agent_performance.get(agent_id, {}) for agent_id in candidate_agents]
+        workload = np.fromiter((self.agent_workload.get(agent_id, 0) for agent_id in candidate_agents), float, count)
+        success_rate = np.fromiter((p.get('success_rate', 0.5) for p in performance), float, count)
+        avg_completion_time = np.fromiter((p.get('avg_completion_time', 60.0) for p in performance), float, count)
+        
+        # Score based on success rate, low workload, and fast completion
+        scores = (success_rate * 0.5 +
+                  (1 - workload / self.max_agent_workload) * 0.3 +
+                  (1 / np.maximum(avg_completion_time, 1.0)) * 0.2)
+        scores[workload >= self.max_agent_workload] = -np.inf
+        
+        # Select agent with highest score
+        best = int(np.argmax(scores))
+        return candidate_agents[best] if np.isfinite(scores[best]) else None
     
     def _get_required_capabilities(self, task_type: str) -> Set[str]:
         """🔍 Get required capabilities for task type"""
@@ -1005,6 +1003,10 @@ class CoordinatorAgent(AutonomousAgent):
         capabilities = set(payload.get('capabilities', []))
         
         self.agent_capabilities[agent_id] = capabilities
+        if agent_id in self.capability_index:
+            self.capability_index.set_capabilities(agent_id, capabilities)
+        else:
+            self.capability_index.add(agent_id, capabilities)
         self.discovered_agents[agent_id] = {
             'agent_id': agent_id,
             'capabilities': list(capabilities),
@@ -18,6 +18,7 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
+from real_agents.http_client_service import shared_session
 
 from core.autonomous_agent import AutonomousAgent, AGENT_REGISTRY
 
@@ -263,7 +264,7 @@ class DataCollectorAgent(AutonomousAgent):
         sport_path = sport_mappings.get(sport, 'football/nfl')
         url = f"{self.data_sources['espn']['base_url']}/{sport_path}/scoreboard"
         
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             async with session.get(url, timeout=10) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -280,7 +281,7 @@ class DataCollectorAgent(AutonomousAgent):
         url = f"{self.data_sources['balldontlie']['base_url']}/games"
         params = {'seasons[]': '2024', 'per_page': '25'}
         
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             async with session.get(url, params=params, timeout=10) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -437,13 +438,13 @@ class DataCollectorAgent(AutonomousAgent):
         try:
             if source_name == 'espn':
                 url = f"{self.data_sources['espn']['base_url']}/football/nfl/scoreboard"
-                async with aiohttp.ClientSession() as session:
+                async with shared_session() as session:
                     async with session.get(url, timeout=5) as response:
                         return 'healthy' if response.status == 200 else 'unhealthy'
             
             elif source_name == 'balldontlie':
                 url = f"{self.data_sources['balldontlie']['base_url']}/games"
-                async with aiohttp.ClientSession() as session:
+                async with shared_session() as session:
                     async with session.get(url, timeout=5) as response:
                         return 'healthy' if response.status == 200 else 'unhealthy'
             
@@ -21,6 +21,7 @@ import logging
 from collections import defaultdict, deque
 import pickle
 import hashlib
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor
 from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.metrics import accuracy_score, mean_squared_error, classification_report
@@ -33,6 +34,109 @@ from core.autonomous_agent import AutonomousAgent, AGENT_REGISTRY
 
 logger = logging.getLogger(__name__)
 
+# =================== TRAINING WORKER JOBS ===================
+# Module-level so they pickle into ProcessPoolExecutor workers. Inputs are plain
+# numpy arrays / estimator classes, outputs are plain dicts of fitted objects.
+
+def _build_estimator(algorithm_class, n_estimators: int):
+    """🔧 Instantiate an estimator, passing random_state/n_estimators only where supported"""
+    accepted = algorithm_class().get_params()
+    params = {}
+    if 'random_state' in accepted:
+        params['random_state'] = 42
+    if 'n_estimators' in accepted:
+        params['n_estimators'] = n_estimators
+    return algorithm_class(**params)
+
+def select_best_algorithm_job(algorithms: Dict[str, Any], problem_type: str,
+                              X: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
+    """🧠 Cross-validate each candidate algorithm (runs in a training worker)"""
+    best_algorithm = list(algorithms.keys())[0]  # Default
+    best_score = 0.0
+    failures = {}
+    
+    for algorithm_name, algorithm_class in algorithms.items():
+        try:
+            model = _build_estimator(algorithm_class, 50)
+            
+            # Cross-validation score
+            scores = cross_val_score(model, X, y, cv=min(3, len(X)//5), scoring='accuracy' if problem_type == 'classification' else 'neg_mean_squared_error')
+            avg_score = np.mean(scores)
+            
+            if problem_type == 'regression':
+                avg_score = -avg_score  # Convert negative MSE to positive
+            
+            if avg_score > best_score:
+                best_score = avg_score
+                best_algorithm = algorithm_name
+                
+        except Exception as e:
+            failures[algorithm_name] = str(e)
+    
+    return {'algorithm': best_algorithm, 'score': float(best_score), 'failures': failures}
+
+def evaluate_model_job(estimator, X: np.ndarray, y: np.ndarray, problem_type: str) -> float:
+    """📊 Score a fitted estimator on a held-out split (runs in a training worker)"""
+    if len(X) < 5:
+        return 0.0
+    
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+    
+    y_pred = estimator.predict(X_test)
+    if problem_type == 'classification':
+        accuracy = accuracy_score(y_test, y_pred)
+    else:
+        mse = mean_squared_error(y_test, y_pred)
+        # Convert MSE to accuracy-like metric (lower MSE = higher accuracy)
+        max_mse = np.var(y_test) if len(y_test) > 1 else 1.0
+        accuracy = max(0, 1 - mse / max_mse) if max_mse > 0 else 0.0
+    
+    return float(accuracy)
+
+def train_model_job(algorithms: Dict[str, Any], problem_type: str,
+                    X: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
+    """
+    ⚡ Full training job for one sport/target (runs in a training worker)
+    
+    Selects the algorithm, fits scaler/encoder/estimator and evaluates,
+    returning everything the parent needs to build a PredictionModel.
+    """
+    selection = select_best_algorithm_job(algorithms, problem_type, X, y)
+    algorithm_name = selection['algorithm']
+    
+    estimator = _build_estimator(algorithms[algorithm_name], 100)
+    scaler = StandardScaler()
+    label_encoder = LabelEncoder()
+    
+    # Scale features if needed
+    X_scaled = scaler.fit_transform(X)
+    
+    # Encode labels for classification
+    y_encoded = label_encoder.fit_transform(y) if problem_type == 'classification' else y
+    
+    # Train model
+    estimator.fit(X_scaled, y_encoded)
+    
+    try:
+        accuracy = evaluate_model_job(estimator, X_scaled, y_encoded, problem_type)
+    except Exception:
+        accuracy = 0.0
+    
+    feature_importance = {}
+    if hasattr(estimator, 'feature_importances_'):
+        feature_importance = {
+            f"feature_{i}": float(value) for i, value in enumerate(estimator.feature_importances_)
+        }
+    
+    return {
+        'selection': selection,
+        'estimator': estimator,
+        'scaler': scaler,
+        'label_encoder': label_encoder,
+        'accuracy': accuracy,
+        'feature_importance': feature_importance
+    }
+
 class PredictionModel:
     """🤖 Individual ML prediction model"""
     def __init__(self, model_id: str, model_type: str, sport: str, target: str):
@@ -60,6 +164,7 @@ class PredictionModel:
         self.creation_time = datetime.now()
         self.version = 1
         self.hyperparameters = {}
+        self.algorithm = None  # set by training: name of the selected estimator
     
     def update_accuracy(self, predicted: Any, actual: Any) -> bool:
         """📊 Update model accuracy with new prediction result"""
@@ -126,6 +231,11 @@ class PredictorAgent(AutonomousAgent):
         self.retrain_threshold = 0.05  # Retrain if accuracy drops by 5%
         self.min_training_samples = 20
         
+        # Training workers - model fitting never runs on the event loop
+        self.training_workers = max(1, int(self.config.get('training_workers', 2)))
+        self._training_executor: Optional[Executor] = None
+        self.training_jobs: Dict[str, asyncio.Task] = {}  # sport -> in-flight training
+        
         # Algorithm selection
         self.available_algorithms = {
             'classification': {
@@ -312,10 +422,52 @@ class PredictorAgent(AutonomousAgent):
         """📋 Process queued training tasks"""
         while self.training_queue and len(self.running_tasks) < self.max_concurrent_tasks:
             training_task = self.training_queue.popleft()
+            sport = training_task['sport']
+            
+            # One training job per sport - a newer request while one is in flight is redundant
+            in_flight = self.training_jobs.get(sport)
+            if in_flight and not in_flight.done():
+                logger.debug(f"⏭️ Training already in progress for {sport}")
+                continue
             
             training_coroutine = asyncio.create_task(self._execute_training(training_task))
+            self.training_jobs[sport] = training_coroutine
+            training_coroutine.add_done_callback(lambda task, sport=sport: self._forget_training_job(sport, task))
             self.running_tasks.add(training_coroutine)
     
+    def _forget_training_job(self, sport: str, task: asyncio.Task):
+        """🧹 Drop a finished training job from the in-flight table"""
+        if self.training_jobs.get(sport) is task:
+            del self.training_jobs[sport]
+    
+    def _get_training_executor(self) -> Executor:
+        """🏭 Lazily start the training worker pool"""
+        if self._training_executor is None:
+            try:
+                self._training_executor = ProcessPoolExecutor(max_workers=self.training_workers)
+                logger.info(f"🏭 Training pool started with {self.training_workers} worker processes")
+            except (OSError, NotImplementedError) as e:
+                # Platforms without working multiprocessing still keep training off the loop
+                logger.warning(f"⚠️ Process pool unavailable ({e}), using training threads")
+                self._training_executor = ThreadPoolExecutor(max_workers=self.training_workers)
+        return self._training_executor
+    
+    async def _run_training_job(self, job, *args):
+        """🏭 Run a training job in the worker pool (cancelling the await abandons the job)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_training_executor(), job, *args)
+    
+    async def cancel_training(self, sport: str = None) -> int:
+        """🛑 Cancel in-flight training for one sport (or all); returns jobs cancelled"""
+        jobs = [task for job_sport, task in self.training_jobs.items()
+                if (sport is None or job_sport == sport) and not task.done()]
+        for task in jobs:
+            task.cancel()
+        if jobs:
+            await asyncio.gather(*jobs, return_exceptions=True)
+            logger.info(f"🛑 Cancelled {len(jobs)} training job(s){f' for {sport}' if sport else ''}")
+        return len(jobs)
+    
     async def _execute_training(self, training_task: Dict[str, Any]):
         """⚡ Execute model training"""
         sport = training_task['sport']
@@ -330,12 +482,14 @@ class PredictorAgent(AutonomousAgent):
                 logger.warning(f"⚠️ Insufficient training data for {sport}: {len(training_samples)}")
                 return
             
-            # Train models for each prediction target
-            models_trained = 0
-            for target, config in self.prediction_targets.items():
-                model_trained = await self._train_model_for_target(sport, target, training_samples)
-                if model_trained:
-                    models_trained += 1
+            # Train models for each prediction target (in parallel, in the worker pool)
+            trained = await asyncio.gather(*[
+                self._train_model_for_target(sport, target, training_samples)
+                for target in self.prediction_targets
+            ])
+            
+            # Swap the new models in together - no await between the updates
+            models_trained = self._install_trained_models(sport, [model for model in trained if model])
             
             # Record training success
             duration = time.time() - start_time
@@ -354,6 +508,10 @@ class PredictorAgent(AutonomousAgent):
                 'trainer': self.agent_id
             })
             
+        except asyncio.CancelledError:
+            logger.info(f"🛑 Training cancelled for {sport}")
+            raise
+            
         except Exception as e:
             # Record training failure
             duration = time.time() - start_time
@@ -364,74 +522,62 @@ class PredictorAgent(AutonomousAgent):
             
             logger.error(f"❌ Training failed for {sport}: {e}")
     
-    async def _train_model_for_target(self, sport: str, target: str, training_samples: List[Dict[str, Any]]) -> bool:
-        """🎯 Train model for specific prediction target"""
+    async def _train_model_for_target(self, sport: str, target: str, training_samples: List[Dict[str, Any]]) -> Optional[PredictionModel]:
+        """🎯 Train model for specific prediction target (fitting runs in the worker pool)"""
         try:
             # Prepare training data
             X, y = await self._prepare_training_data(training_samples, target)
             
             if len(X) < self.min_training_samples:
-                return False
-            
-            # Select best algorithm
-            algorithm_name = await self._select_best_algorithm(sport, target, X, y)
+                return None
             
-            # Create and train model
-            model_id = f"{sport}_{target}_{algorithm_name}_{int(time.time())}"
-            model = PredictionModel(model_id, target, sport, target)
-            
-            # Configure algorithm
+            # Select, fit and evaluate out of process
             target_config = self.prediction_targets[target]
-            if target_config['type'] == 'classification':
-                algorithm_class = self.available_algorithms['classification'][algorithm_name]
-                model.model = algorithm_class(random_state=42, n_estimators=100 if 'forest' in algorithm_name else None)
-            else:
-                algorithm_class = self.available_algorithms['regression'][algorithm_name]
-                model.model = algorithm_class(random_state=42, n_estimators=100 if 'boosting' in algorithm_name else None)
-            
-            # Scale features if needed
-            X_scaled = model.scaler.fit_transform(X)
-            
-            # Encode labels for classification
-            if target_config['type'] == 'classification':
-                y_encoded = model.label_encoder.fit_transform(y)
-            else:
-                y_encoded = y
+            result = await self._run_training_job(
+                train_model_job, self.available_algorithms[target_config['type']],
+                target_config['type'], X, y
+            )
             
-            # Train model
-            model.model.fit(X_scaled, y_encoded)
+            selection = result['selection']
+            algorithm_name = selection['algorithm']
+            for failed_algorithm, error in selection['failures'].items():
+                logger.warning(f"⚠️ Algorithm {failed_algorithm} failed for {sport}.{target}: {error}")
+            logger.info(f"🧠 Selected {algorithm_name} for {sport}.{target} (score: {selection['score']:.3f})")
             
-            # Evaluate model
-            accuracy = await self._evaluate_model(model, X_scaled, y_encoded, target_config['type'])
-            model.accuracy = accuracy
+            model_id = f"{sport}_{target}_{algorithm_name}_{int(time.time())}"
+            model = PredictionModel(model_id, target, sport, target)
+            model.model = result['estimator']
+            model.scaler = result['scaler']
+            model.label_encoder = result['label_encoder']
+            model.algorithm = algorithm_name
+            model.accuracy = result['accuracy']
             model.training_samples = len(X)
             model.last_trained = datetime.now()
+            model.feature_importance = result['feature_importance']
             
-            # Store feature importance
-            if hasattr(model.model, 'feature_importances_'):
-                model.feature_importance = dict(zip(
-                    [f"feature_{i}" for i in range(len(model.model.feature_importances_))],
-                    model.model.feature_importances_
-                ))
+            logger.info(f"🎯 Trained {target} model for {sport}: {model.accuracy:.3f} accuracy ({algorithm_name})")
+            return model
             
-            # Add to model portfolio
-            self.models[model_id] = model
-            self.active_models[sport].append(model_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Model training failed for {sport}.{target}: {e}")
+            return None
+    
+    def _install_trained_models(self, sport: str, models: List[PredictionModel]) -> int:
+        """🔄 Atomically add freshly trained models to the portfolio"""
+        for model in models:
+            self.models[model.model_id] = model
+            self.active_models[sport].append(model.model_id)
             
             # Update performance tracking
-            self.model_performance[sport][target] = {
-                'accuracy': accuracy,
-                'training_samples': len(X),
+            self.model_performance[sport][model.target] = {
+                'accuracy': model.accuracy,
+                'training_samples': model.training_samples,
                 'last_trained': model.last_trained.isoformat(),
-                'algorithm': algorithm_name
+                'algorithm': model.algorithm
             }
-            
-            logger.info(f"🎯 Trained {target} model for {sport}: {accuracy:.3f} accuracy ({algorithm_name})")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Model training failed for {sport}.{target}: {e}")
-            return False
+        return len(models)
     
     async def _prepare_training_data(self, training_samples: List[Dict[str, Any]], target: str) -> Tuple[np.ndarray, np.ndarray]:
         """📝 Prepare training data for ML model"""
@@ -489,63 +635,6 @@ class PredictorAgent(AutonomousAgent):
         
         return np.array(X), np.array(y)
     
-    async def _select_best_algorithm(self, sport: str, target: str, X: np.ndarray, y: np.ndarray) -> str:
-        """🧠 Select best algorithm for the data"""
-        target_config = self.prediction_targets[target]
-        algorithms = self.available_algorithms[target_config['type']]
-        
-        best_algorithm = list(algorithms.keys())[0]  # Default
-        best_score = 0.0
-        
-        # Try each algorithm with cross-validation
-        for algorithm_name, algorithm_class in algorithms.items():
-            try:
-                if target_config['type'] == 'classification':
-                    model = algorithm_class(random_state=42, n_estimators=50 if 'forest' in algorithm_name else None)
-                else:
-                    model = algorithm_class(random_state=42, n_estimators=50 if 'boosting' in algorithm_name else None)
-                
-                # Cross-validation score
-                scores = cross_val_score(model, X, y, cv=min(3, len(X)//5), scoring='accuracy' if target_config['type'] == 'classification' else 'neg_mean_squared_error')
-                avg_score = np.mean(scores)
-                
-                if target_config['type'] == 'regression':
-                    avg_score = -avg_score  # Convert negative MSE to positive
-                
-                if avg_score > best_score:
-                    best_score = avg_score
-                    best_algorithm = algorithm_name
-                    
-            except Exception as e:
-                logger.warning(f"⚠️ Algorithm {algorithm_name} failed for {sport}.{target}: {e}")
-        
-        logger.info(f"🧠 Selected {best_algorithm} for {sport}.{target} (score: {best_score:.3f})")
-        return best_algorithm
-    
-    async def _evaluate_model(self, model: PredictionModel, X: np.ndarray, y: np.ndarray, model_type: str) -> float:
-        """📊 Evaluate model performance"""
-        if len(X) < 5:
-            return 0.0
-        
-        try:
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
-            
-            if model_type == 'classification':
-                y_pred = model.model.predict(X_test)
-                accuracy = accuracy_score(y_test, y_pred)
-            else:
-                y_pred = model.model.predict(X_test)
-                mse = mean_squared_error(y_test, y_pred)
-                # Convert MSE to accuracy-like metric (lower MSE = higher accuracy)
-                max_mse = np.var(y_test) if len(y_test) > 1 else 1.0
-                accuracy = max(0, 1 - mse / max_mse) if max_mse > 0 else 0.0
-            
-            return float(accuracy)
-            
-        except Exception as e:
-            logger.error(f"❌ Model evaluation failed: {e}")
-            return 0.0
-    
     async def _make_prediction(self, sport: str, game_data: Dict[str, Any], prediction_type: str) -> Dict[str, Any]:
         """🎯 Make prediction for game"""
         # Check cache first
@@ -803,6 +892,14 @@ class PredictorAgent(AutonomousAgent):
                 if best_algorithm and best_avg_accuracy > 0.7:
                     logger.info(f"🧠 {sport} performs best with {best_algorithm} (avg: {best_avg_accuracy:.2f})")
     
+    async def _cleanup_resources(self):
+        """🧹 Stop training jobs and the worker pool"""
+        await self.cancel_training()
+        if self._training_executor is not None:
+            self._training_executor.shutdown(wait=False, cancel_futures=True)
+            self._training_executor = None
+        await super()._cleanup_resources()
+    
     async def _load_existing_models(self):
         """💾 Load existing models from storage"""
         # In a real implementation, this would load from persistent storage
@@ -856,6 +953,8 @@ class PredictorAgent(AutonomousAgent):
             'sports_covered': list(self.active_models.keys()),
             'prediction_targets': list(self.prediction_targets.keys()),
             'training_queue_length': len(self.training_queue),
+            'training_jobs': sorted(sport for sport, task in self.training_jobs.items() if not task.done()),
+            'training_workers': self.training_workers,
             'cache_entries': len(self.prediction_cache),
             'model_performance': {
                 sport: {
@@ -22,9 +22,11 @@ Target: 80%+ accuracy based on REAL German football patterns
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
 
+from real_agents.slate_scoring import FactorModel, Slate, SlateScorer, SlateScores
+
 logger = logging.getLogger(__name__)
 
 # 🇩🇪🔥💀 BUNDESLIGA UNDECUPLE THREAT HYBRID ENGINE INTEGRATION 💀🔥🇩🇪
@@ -47,6 +49,17 @@ class RealBundesligaAlgorithm:
     - COVID-reduced home advantage (42% vs 53% historical)
     """
     
+    # ⚖️ apply_real_bundesliga_algorithm's weights - for batch slate scoring
+    SLATE_MODEL = FactorModel(
+        factors=(
+            ('_calculate_bayern_dominance_factor', 0.35),
+            ('_calculate_german_tactical_efficiency', 0.25),
+            ('_calculate_covid_reduced_home_advantage', 0.20),
+            ('_calculate_real_der_klassiker_factor', 0.10),
+            ('_calculate_market_value_impact', 0.10),
+        )
+    )
+    
     def __init__(self):
         logger.info("🇩🇪⚽ REAL BUNDESLIGA ALGORITHM INITIALIZED - BASED ON ACTUAL GERMAN DATA!")
         
@@ -162,6 +175,19 @@ class RealBundesligaAlgorithm:
             logger.error(f"Error applying Real Bundesliga algorithm: {e}")
             return game_data
 
+    async def score_slate(self, games: List[Dict]) -> SlateScores:
+        """
+        🏎️ Score a whole slate/season at once
+        
+        Same predictions and confidences as apply_real_bundesliga_algorithm per
+        game, with factor columns and weights as array ops.
+        """
+        async def decide(game: Dict, confidence: float, factors: Dict[str, float]) -> Tuple[str, float]:
+            return self._make_real_bundesliga_prediction(game, confidence, game['home_team'], game['away_team'])
+        
+        scorer = SlateScorer(self, self.SLATE_MODEL, decide=decide)
+        return await scorer.score(Slate.from_games(games))
+
     async def _calculate_bayern_dominance_factor(self, game_data: Dict) -> float:
         """Calculate Bayern dominance factor (35% weight - REAL 11-year reign data)"""
         home_team = game_data.get('home_team', '').upper()
@@ -24,6 +24,7 @@ Mission: RESTORE LEGENDARY STATUS WITH HONEST CONFIDENCE
 
 import math
 import logging
+import numpy as np
 from typing import Dict, Any, Tuple, List
 from datetime import datetime
 
@@ -150,6 +151,33 @@ class ConfidenceCalibrationSystem:
             fallback_confidence = max(raw_confidence * 0.65, 35.0)
             return fallback_confidence, {'error': str(e), 'fallback_applied': True}
     
+    def calibrate_confidence_array(self, raw_confidence: np.ndarray, league: str) -> np.ndarray:
+        """
+        🎯 BATCH CALIBRATION: calibrate_confidence for a whole slate at once
+        
+        Same six steps with array ops, so every element equals the scalar result.
+        """
+        if league not in self.calibration_data:
+            league = 'MLS'  # Default fallback
+        calibration = self.calibration_data[league]
+        raw_confidence = np.asarray(raw_confidence, dtype=np.float64)
+        
+        inflation_corrected = raw_confidence * (1 - calibration['inflation_rate'])
+        volatility_reduction = raw_confidence * calibration['volatility_factor']
+        base_adjusted = (inflation_corrected - volatility_reduction) - calibration['base_uncertainty']
+        
+        penalties = self.overconfidence_penalties
+        overconfidence_penalty = np.select(
+            [raw_confidence >= penalties['extreme_confidence_threshold'],
+             raw_confidence >= penalties['high_confidence_threshold']],
+            [penalties['extreme_penalty'], penalties['high_penalty']],
+            default=0.0
+        )
+        penalty_adjusted = base_adjusted - overconfidence_penalty
+        
+        ceiling_applied = np.minimum(penalty_adjusted, calibration['accuracy_ceiling'])
+        return np.maximum(ceiling_applied, 35.0)
+    
     def _calculate_overconfidence_penalty(self, confidence: float) -> float:
         """
         ⚠️ Calculate penalty for overconfident predictions
@@ -312,6 +340,14 @@ def calibrate_ligue1_confidence(raw_confidence: float, prediction_factors: Dict
     calibrator = ConfidenceCalibrationSystem()
     return calibrator.calibrate_confidence(raw_confidence, 'LIGUE1', prediction_factors)
 
+def calibrate_mls_confidence_array(raw_confidence: np.ndarray) -> np.ndarray:
+    """🇺🇸 Calibrate a slate of MLS confidences"""
+    return ConfidenceCalibrationSystem().calibrate_confidence_array(raw_confidence, 'MLS')
+
+def calibrate_ligue1_confidence_array(raw_confidence: np.ndarray) -> np.ndarray:
+    """🇫🇷 Calibrate a slate of Ligue 1 confidences"""
+    return ConfidenceCalibrationSystem().calibrate_confidence_array(raw_confidence, 'LIGUE1')
+
 def calibrate_europa_confidence(raw_confidence: float, prediction_factors: Dict = None) -> Tuple[float, Dict]:
     """🏆 Calibrate UEFA Europa League confidence"""
     calibrator = ConfidenceCalibrationSystem()
@@ -0,0 +1,632 @@
+#!/usr/bin/env python3
+"""
+🔥💀 AGENT HOST - IN-LOOP OR OUT-OF-PROCESS AGENT PLACEMENT 💀🔥
+Agent Poly Loly Double Zero: Real compute capacity for CPU-heavy agents
+
+Scaling up AnalyzerAgent/PredictorAgent as more coroutines in the orchestrator's
+event loop only adds contention on one GIL. The AgentHost places each agent
+either in-loop (as before) or in its own worker process:
+
+- Worker processes run the agent's normal spawn()/terminate() lifecycle on their
+  own event loop and talk to the parent over a multiprocessing Pipe
+- The parent keeps a HostedAgent stand-in that looks like an AutonomousAgent to
+  the orchestrator and AGENT_REGISTRY (message_queue, subscribers, memory,
+  health_metrics, state...)
+- Topology changes to a HostedAgent's subscribers are forwarded to the worker
+- Outbound agent messages are routed through AGENT_REGISTRY in the parent
+- A supervisor restarts crashed or silent workers with exponential backoff and
+  samples per-process CPU and RSS
+- PlacementPolicy decides in-loop vs process per agent type
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional, Type
+
+import psutil
+
+from core.autonomous_agent import AGENT_REGISTRY, AgentMemory, AgentMessage, AgentState
+
+logger = logging.getLogger(__name__)
+
+class AgentPlacement(Enum):
+    """📍 Where an agent instance runs"""
+    IN_LOOP = "in_loop"     # Coroutines in the host's event loop
+    PROCESS = "process"     # Dedicated worker process with its own loop and GIL
+
+@dataclass
+class PlacementPolicy:
+    """📋 Per agent type placement and restart policy"""
+    default: AgentPlacement = AgentPlacement.IN_LOOP
+    per_type: Dict[str, AgentPlacement] = field(default_factory=dict)
+    max_restarts: int = 3
+    restart_backoff: float = 1.0
+
+    def placement_for(self, agent_type: str) -> AgentPlacement:
+        return self.per_type.get(agent_type, self.default)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'PlacementPolicy':
+        """⚙️ Build from orchestrator config, e.g. {'agent_placement': {'analyzer': 'process'}}"""
+        return cls(
+            default=AgentPlacement(config.get('default_placement', AgentPlacement.IN_LOOP.value)),
+            per_type={
+                agent_type: AgentPlacement(placement)
+                for agent_type, placement in config.get('agent_placement', {}).items()
+            },
+            max_restarts=config.get('max_agent_restarts', 3),
+            restart_backoff=config.get('agent_restart_backoff', 1.0)
+        )
+
+# =================== WIRE HELPERS ===================
+
+def _message_from_dict(data: Dict[str, Any]) -> AgentMessage:
+    """📨 Rebuild an AgentMessage from AgentMessage.to_dict() output"""
+    message = AgentMessage(data['sender_id'], data['receiver_id'], data['message_type'],
+                           data['payload'], data.get('priority', 1))
+    message.id = data.get('id', message.id)
+    message.retries = data.get('retries', 0)
+    if data.get('timestamp'):
+        message.timestamp = datetime.fromisoformat(data['timestamp'])
+    return message
+
+def _class_path(agent_class: Type) -> str:
+    return f"{agent_class.__module__}:{agent_class.__qualname__}"
+
+def _load_class(class_path: str) -> Type:
+    module_name, _, qualname = class_path.partition(':')
+    target = importlib.import_module(module_name)
+    for part in qualname.split('.'):
+        target = getattr(target, part)
+    return target
+
+# =================== WORKER PROCESS SIDE ===================
+
+class _PipeOutbox(asyncio.Queue):
+    """📤 Agent outbound queue that hands every message to the parent router"""
+
+    def __init__(self, conn):
+        super().__init__()
+        self._conn = conn
+
+    def put_nowait(self, message: AgentMessage):
+        self._conn.send(('message', message.to_dict()))
+
+def _agent_snapshot(agent) -> Dict[str, Any]:
+    """📊 Heartbeat payload describing the hosted agent"""
+    return {
+        'state': agent.state.value,
+        'running_tasks': len(agent.running_tasks),
+        'queued_tasks': agent.task_queue.qsize(),
+        'max_concurrent_tasks': agent.max_concurrent_tasks,
+        'error_count': agent.error_count,
+        'total_tasks': agent.memory.total_tasks,
+        'successful_tasks': agent.memory.successful_tasks,
+        'success_rate': agent.memory.success_rate,
+        'health_metrics': {
+            key: value for key, value in agent.health_metrics.items()
+            if isinstance(value, (int, float, str, type(None)))
+        }
+    }
+
+async def _serve_hosted_agent(class_path: str, agent_id: str, config: Dict[str, Any],
+                              conn, heartbeat_interval: float):
+    """🏃 Run one agent inside a worker process until terminated or orphaned"""
+    loop = asyncio.get_running_loop()
+    agent = _load_class(class_path)(agent_id=agent_id, config=config)
+    agent.outbound_queue = _PipeOutbox(conn)
+
+    spawned = await agent.spawn()
+    conn.send(('ready', spawned, os.getpid()))
+    if not spawned:
+        return
+
+    stop = asyncio.Event()
+
+    def on_command():
+        try:
+            while conn.poll():
+                op, payload = conn.recv()
+                if op == 'message':
+                    agent.message_queue.put_nowait(_message_from_dict(payload))
+                elif op == 'subscribers':
+                    agent.subscribers = set(payload)
+                elif op == 'terminate':
+                    stop.set()
+        except (EOFError, OSError):
+            # Parent is gone - never leave an orphaned worker behind
+            stop.set()
+
+    loop.add_reader(conn.fileno(), on_command)
+    try:
+        while not stop.is_set():
+            conn.send(('heartbeat', _agent_snapshot(agent)))
+            try:
+                await asyncio.wait_for(stop.wait(), heartbeat_interval)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        loop.remove_reader(conn.fileno())
+        await agent.terminate()
+        try:
+            conn.send(('terminated', agent_id))
+        except (BrokenPipeError, OSError):
+            pass
+
+def _agent_process_main(class_path: str, agent_id: str, config: Dict[str, Any],
+                        conn, heartbeat_interval: float):
+    """🚀 Worker process entry point (module level so it pickles under spawn)"""
+    try:
+        asyncio.run(_serve_hosted_agent(class_path, agent_id, config, conn, heartbeat_interval))
+    except Exception as e:
+        logger.error(f"❌ Hosted agent {agent_id} crashed: {e}")
+        raise
+    finally:
+        conn.close()
+
+# =================== PARENT SIDE ===================
+
+class _RemoteInbox:
+    """📥 message_queue stand-in: AGENT_REGISTRY routes into the worker's real queue"""
+
+    def __init__(self, hosted: 'HostedAgent'):
+        self._hosted = hosted
+
+    async def put(self, message: AgentMessage):
+        self.put_nowait(message)
+
+    def put_nowait(self, message: AgentMessage):
+        self._hosted._deliver(message)
+
+    def qsize(self) -> int:
+        return len(self._hosted._backlog)
+
+    def empty(self) -> bool:
+        return not self._hosted._backlog
+
+class _RemoteSubscribers(set):
+    """👥 subscribers stand-in: every change is mirrored into the worker's agent"""
+
+    def __init__(self, hosted: 'HostedAgent'):
+        super().__init__()
+        self._hosted = hosted
+
+    def add(self, agent_id: str):
+        if agent_id not in self:
+            super().add(agent_id)
+            self._hosted._sync_subscribers()
+
+    def discard(self, agent_id: str):
+        if agent_id in self:
+            super().discard(agent_id)
+            self._hosted._sync_subscribers()
+
+    def remove(self, agent_id: str):
+        super().remove(agent_id)
+        self._hosted._sync_subscribers()
+
+    def update(self, *others):
+        super().update(*others)
+        self._hosted._sync_subscribers()
+
+    def clear(self):
+        super().clear()
+        self._hosted._sync_subscribers()
+
+class HostedAgent:
+    """
+    🛰️ PARENT-SIDE HANDLE FOR AN AGENT RUNNING IN A WORKER PROCESS
+
+    Exposes the AutonomousAgent surface the orchestrator and registry rely on.
+    Messages sent while the worker is (re)starting are buffered and flushed
+    once it reports ready.
+    """
+
+    def __init__(self, agent_type: str, agent_class: Type, agent_id: str, config: Dict[str, Any]):
+        self.agent_id = agent_id
+        self.agent_type = agent_type
+        self.agent_class = agent_class
+        self.agent_type_name = agent_class.__name__  # AGENT_REGISTRY groups by class name
+        self.config = config
+
+        self.state = AgentState.INITIALIZING
+        self.start_time = None
+        self.last_heartbeat = None
+        self.process_id = None
+        self.message_queue = _RemoteInbox(self)
+        self.subscribers = _RemoteSubscribers(self)
+        self.memory = AgentMemory(agent_id)  # Task counters mirrored from heartbeats
+        self.max_concurrent_tasks = 3
+        self.running_task_count = 0
+        self.health_metrics = {
+            'cpu_usage': 0.0,
+            'memory_usage': 0.0,
+            'message_throughput': 0.0,
+            'error_rate': 0.0,
+            'last_error': None
+        }
+
+        # Supervision state
+        self.process = None
+        self.restarts = 0
+        self.restart_at = 0.0
+        self.heartbeat_at = 0.0
+        self.stopping = False
+        self.rss_bytes = 0
+        self._conn = None
+        self._ready: Optional[asyncio.Future] = None
+        self._terminated: Optional[asyncio.Future] = None
+        self._psutil_process = None
+        self._backlog = deque(maxlen=1000)
+
+    @property
+    def running_tasks(self) -> range:
+        """Sized like the agent's running task set (only len() is meaningful)"""
+        return range(self.running_task_count)
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None
+
+    async def spawn(self) -> bool:
+        """Hosted agents are started by their AgentHost"""
+        return self.connected
+
+    async def terminate(self):
+        """🛑 Ask the worker to run the agent's graceful terminate()"""
+        self.stopping = True
+        self.state = AgentState.TERMINATING
+        if self._conn is not None:
+            try:
+                self._conn.send(('terminate', None))
+            except (BrokenPipeError, OSError):
+                pass
+
+    async def send_message(self, receiver_id: str, message_type: str,
+                           payload: Dict[str, Any], priority: int = 1):
+        """📤 Same contract as AutonomousAgent.send_message, routed from the parent"""
+        message = AgentMessage(self.agent_id, receiver_id, message_type, payload, priority)
+        if receiver_id == self.agent_id:
+            self._deliver(message)
+        else:
+            AGENT_REGISTRY.route_message(message)
+
+    # ---- pipe plumbing ----
+
+    def _attach(self, conn, process):
+        loop = asyncio.get_running_loop()
+        self._conn = conn
+        self.process = process
+        self._ready = loop.create_future()
+        self._terminated = loop.create_future()
+        self.heartbeat_at = time.monotonic()
+        loop.add_reader(conn.fileno(), self._on_readable)
+
+    def _detach(self):
+        if self._conn is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(self._conn.fileno())
+        except (RuntimeError, ValueError, OSError):
+            pass
+        self._conn.close()
+        self._conn = None
+        for future in (self._ready, self._terminated):
+            if future and not future.done():
+                future.set_result(False)
+
+    def _deliver(self, message: AgentMessage):
+        if self._conn is not None and self._ready.done() and self._ready.result():
+            try:
+                self._conn.send(('message', message.to_dict()))
+                return
+            except (BrokenPipeError, OSError):
+                pass
+        self._backlog.append(message)
+
+    def _sync_subscribers(self):
+        """👥 Push the full subscriber set (re-sent on every (re)start)"""
+        if self._conn is not None and self._ready.done() and self._ready.result():
+            try:
+                self._conn.send(('subscribers', sorted(self.subscribers)))
+            except (BrokenPipeError, OSError):
+                pass
+
+    def _flush_backlog(self):
+        while self._backlog and self._conn is not None:
+            self._conn.send(('message', self._backlog.popleft().to_dict()))
+
+    def _on_readable(self):
+        try:
+            while self._conn is not None and self._conn.poll():
+                op, *args = self._conn.recv()
+                self._handle_frame(op, args)
+        except (EOFError, OSError):
+            # Worker exited; the supervisor decides whether to restart it
+            self._detach()
+
+    def _handle_frame(self, op: str, args):
+        if op == 'heartbeat':
+            snapshot = args[0]
+            if not self.stopping:
+                self.state = AgentState(snapshot['state'])
+            self.running_task_count = snapshot['running_tasks']
+            self.max_concurrent_tasks = snapshot['max_concurrent_tasks']
+            self.memory.total_tasks = snapshot['total_tasks']
+            self.memory.successful_tasks = snapshot['successful_tasks']
+            self.memory.success_rate = snapshot['success_rate']
+            cpu, memory = self.health_metrics['cpu_usage'], self.health_metrics['memory_usage']
+            self.health_metrics.update(snapshot['health_metrics'])
+            # Process-level CPU/RSS from the supervisor win over the agent's own estimate
+            self.health_metrics.update(cpu_usage=cpu, memory_usage=memory, last_heartbeat=time.time())
+            self.last_heartbeat = datetime.now()
+            self.heartbeat_at = time.monotonic()
+        elif op == 'message':
+            AGENT_REGISTRY.route_message(_message_from_dict(args[0]))
+        elif op == 'ready':
+            spawned, pid = args
+            self.process_id = pid
+            if spawned:
+                self.state = AgentState.RUNNING
+                self.start_time = self.last_heartbeat = datetime.now()
+                self._psutil_process = None
+                self._flush_backlog()
+            if not self._ready.done():
+                self._ready.set_result(spawned)
+            if spawned:
+                self._sync_subscribers()
+        elif op == 'terminated':
+            self.state = AgentState.TERMINATED
+            if not self._terminated.done():
+                self._terminated.set_result(True)
+
+    def sample_resources(self) -> Dict[str, Any]:
+        """🖥️ Per-process CPU (% of one core) and RSS"""
+        try:
+            if self._psutil_process is None or self._psutil_process.pid != self.process_id:
+                self._psutil_process = psutil.Process(self.process_id)
+                self._psutil_process.cpu_percent(None)  # prime the CPU counter
+            with self._psutil_process.oneshot():
+                cpu = self._psutil_process.cpu_percent(None)
+                self.rss_bytes = self._psutil_process.memory_info().rss
+            self.health_metrics['cpu_usage'] = cpu
+            self.health_metrics['memory_usage'] = self.rss_bytes / (1024 * 1024)
+        except (psutil.Error, TypeError, ValueError):
+            pass
+        return self.process_info()
+
+    def process_info(self) -> Dict[str, Any]:
+        return {
+            'pid': self.process_id,
+            'alive': bool(self.process and self.process.is_alive()),
+            'state': self.state.value,
+            'cpu_percent': self.health_metrics['cpu_usage'],
+            'rss_mb': round(self.rss_bytes / (1024 * 1024), 2),
+            'running_tasks': self.running_task_count,
+            'restarts': self.restarts,
+            'seconds_since_heartbeat': round(time.monotonic() - self.heartbeat_at, 3)
+        }
+
+class AgentHost:
+    """
+    🏠 AGENT HOST
+
+    Starts agents in-loop or in worker processes according to a PlacementPolicy,
+    supervises workers (restart with exponential backoff, heartbeat timeout) and
+    reports per-process resource usage.
+    """
+
+    def __init__(self, policy: PlacementPolicy = None, agent_classes: Dict[str, Type] = None,
+                 heartbeat_interval: float = 1.0, heartbeat_timeout: float = 15.0,
+                 supervise_interval: float = 1.0, spawn_timeout: float = 60.0,
+                 start_method: str = 'spawn'):
+        self.policy = policy or PlacementPolicy()
+        self.agent_classes: Dict[str, Type] = dict(agent_classes or {})
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.supervise_interval = supervise_interval
+        self.spawn_timeout = spawn_timeout
+        # 'spawn' gives workers a clean interpreter (no inherited loop/threads/sockets)
+        self.mp_context = multiprocessing.get_context(start_method)
+
+        self.agents: Dict[str, Any] = {}  # agent_id -> agent or HostedAgent
+        self.placements: Dict[str, AgentPlacement] = {}
+        self._supervisor: Optional[asyncio.Task] = None
+        self.stats = {
+            'in_loop_started': 0,
+            'process_started': 0,
+            'restarts': 0,
+            'crashes': 0,
+            'heartbeat_timeouts': 0,
+            'stopped': 0
+        }
+
+    def register_agent_class(self, agent_type: str, agent_class: Type):
+        self.agent_classes[agent_type] = agent_class
+
+    def placement_for(self, agent_type: str) -> AgentPlacement:
+        return self.policy.placement_for(agent_type)
+
+    async def start_agent(self, agent_type: str, agent_id: str, config: Dict[str, Any] = None,
+                          placement: AgentPlacement = None) -> Optional[Any]:
+        """🚀 Start an agent; returns the agent (or its HostedAgent handle) or None"""
+        agent_class = self.agent_classes[agent_type]
+        placement = placement or self.placement_for(agent_type)
+        config = config or {}
+
+        if placement == AgentPlacement.PROCESS:
+            agent = HostedAgent(agent_type, agent_class, agent_id, config)
+            if not await self._start_process(agent):
+                agent._detach()
+                self._reap(agent)
+                return None
+            self.stats['process_started'] += 1
+            self._ensure_supervisor()
+        else:
+            agent = agent_class(agent_id=agent_id, config=config)
+            if not await agent.spawn():
+                return None
+            self.stats['in_loop_started'] += 1
+
+        self.agents[agent_id] = agent
+        self.placements[agent_id] = placement
+        logger.info(f"🏠 Started {agent_type} agent {agent_id} ({placement.value})")
+        return agent
+
+    async def stop_agent(self, agent_id: str, timeout: float = 10.0) -> bool:
+        """🛑 Gracefully stop an agent (worker processes are killed if they overrun timeout)"""
+        agent = self.agents.pop(agent_id, None)
+        placement = self.placements.pop(agent_id, None)
+        if agent is None:
+            return False
+
+        await agent.terminate()
+        if placement == AgentPlacement.PROCESS:
+            if agent._terminated is not None:
+                try:
+                    await asyncio.wait_for(asyncio.shield(agent._terminated), timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(f"⚠️ Hosted agent {agent_id} did not terminate in {timeout}s, killing")
+            agent._detach()
+            await self._join(agent, timeout)
+
+        self.stats['stopped'] += 1
+        return True
+
+    async def shutdown(self):
+        """🧹 Stop every agent and the supervisor"""
+        for agent_id in list(self.agents):
+            await self.stop_agent(agent_id)
+        if self._supervisor:
+            self._supervisor.cancel()
+            try:
+                await self._supervisor
+            except asyncio.CancelledError:
+                pass
+            self._supervisor = None
+
+    # ---- worker processes ----
+
+    async def _start_process(self, agent: HostedAgent) -> bool:
+        parent_conn, child_conn = self.mp_context.Pipe()
+        process = self.mp_context.Process(
+            target=_agent_process_main,
+            args=(_class_path(agent.agent_class), agent.agent_id, agent.config,
+                  child_conn, self.heartbeat_interval),
+            name=f"loly-agent-{agent.agent_id}"
+        )
+        process.start()
+        child_conn.close()
+        agent._attach(parent_conn, process)
+
+        try:
+            spawned = await asyncio.wait_for(asyncio.shield(agent._ready), self.spawn_timeout)
+        except asyncio.TimeoutError:
+            spawned = False
+        if not spawned:
+            logger.error(f"❌ Worker for {agent.agent_id} failed to start")
+        return spawned
+
+    async def _join(self, agent: HostedAgent, timeout: float):
+        process = agent.process
+        if process is None:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, process.join, timeout)
+        if process.is_alive():
+            process.kill()
+            await loop.run_in_executor(None, process.join, timeout)
+
+    def _reap(self, agent: HostedAgent):
+        if agent.process is not None and agent.process.is_alive():
+            agent.process.kill()
+        if agent.process is not None:
+            agent.process.join(1.0)
+
+    def _ensure_supervisor(self):
+        if self._supervisor is None or self._supervisor.done():
+            self._supervisor = asyncio.create_task(self._supervise())
+
+    async def _supervise(self):
+        """👁️ Restart dead/silent workers and sample per-process resources"""
+        while True:
+            await asyncio.sleep(self.supervise_interval)
+            for agent_id, agent in list(self.agents.items()):
+                if self.placements.get(agent_id) != AgentPlacement.PROCESS or agent.stopping:
+                    continue
+                try:
+                    await self._supervise_agent(agent)
+                except Exception as e:
+                    logger.error(f"❌ Supervision error for {agent_id}: {e}")
+
+    async def _supervise_agent(self, agent: HostedAgent):
+        now = time.monotonic()
+        alive = agent.connected and agent.process.is_alive()
+        silent = alive and now - agent.heartbeat_at > self.heartbeat_timeout
+
+        if alive and not silent:
+            agent.sample_resources()
+            return
+
+        if agent.restart_at == 0.0:
+            # First observation of the failure: record it and schedule the restart
+            if silent:
+                self.stats['heartbeat_timeouts'] += 1
+                logger.warning(f"💔 Hosted agent {agent.agent_id} missed heartbeats, restarting")
+            else:
+                self.stats['crashes'] += 1
+                logger.warning(f"💥 Hosted agent {agent.agent_id} exited (code {agent.process.exitcode})")
+            agent._detach()
+            self._reap(agent)
+            agent.state = AgentState.ERROR
+            if agent.restarts >= self.policy.max_restarts:
+                logger.error(f"❌ Hosted agent {agent.agent_id} exceeded {self.policy.max_restarts} restarts")
+                agent.stopping = True
+                return
+            agent.restart_at = now + self.policy.restart_backoff * (2 ** agent.restarts)
+
+        if now >= agent.restart_at:
+            agent.restarts += 1
+            agent.restart_at = 0.0
+            self.stats['restarts'] += 1
+            if await self._start_process(agent):
+                logger.info(f"🔄 Restarted hosted agent {agent.agent_id} (pid {agent.process_id})")
+                if agent.agent_id in AGENT_REGISTRY.agents:
+                    AGENT_REGISTRY.agents[agent.agent_id]['process_id'] = agent.process_id
+            else:
+                agent._detach()
+                self._reap(agent)
+                agent.restart_at = 0.0
+
+    # ---- reporting ----
+
+    def process_info(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        agent = self.agents.get(agent_id)
+        if self.placements.get(agent_id) != AgentPlacement.PROCESS:
+            return None
+        return agent.process_info()
+
+    def get_process_stats(self) -> Dict[str, Dict[str, Any]]:
+        """📊 Per-process CPU/RSS for every out-of-process agent"""
+        return {
+            agent_id: agent.process_info()
+            for agent_id, agent in self.agents.items()
+            if self.placements.get(agent_id) == AgentPlacement.PROCESS
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        placements = [p.value for p in self.placements.values()]
+        return {
+            **self.stats,
+            'in_loop_agents': placements.count(AgentPlacement.IN_LOOP.value),
+            'process_agents': placements.count(AgentPlacement.PROCESS.value),
+            'processes': self.get_process_stats()
+        }
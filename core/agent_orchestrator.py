@@ -26,6 +26,7 @@ import os
 
 # Import all agent types
 from core.autonomous_agent import AutonomousAgent, AGENT_REGISTRY
+from core.agent_host import AgentHost, AgentPlacement, PlacementPolicy
 from agents.data_collector_agent import DataCollectorAgent
 from agents.analyzer_agent import AnalyzerAgent
 from agents.predictor_agent import PredictorAgent
@@ -75,7 +76,7 @@ class AgentOrchestrator:
         # Agent management
         self.active_agents = {}  # agent_id -> agent_instance
         self.agent_configs = {}  # agent_id -> agent_config
-        self.agent_processes = {}  # agent_id -> process_info
+        self.agent_processes = {}  # agent_id -> process_info (out-of-process agents only)
         self.agent_health = {}  # agent_id -> health_metrics
         
         # System state
@@ -130,6 +131,14 @@ class AgentOrchestrator:
             }
         }
         
+        # Agent host: in-loop or worker-process placement per agent type, e.g.
+        # config['agent_placement'] = {'analyzer': 'process', 'predictor': 'process'}
+        self.agent_host = AgentHost(
+            policy=PlacementPolicy.from_config(self.config),
+            agent_classes={agent_type: spec['class'] for agent_type, spec in self.agent_specifications.items()},
+            heartbeat_timeout=self.config.get('agent_heartbeat_timeout', 15.0)
+        )
+        
         # System metrics
         self.system_metrics = {
             'total_agents_spawned': 0,
@@ -225,7 +234,6 @@ class AgentOrchestrator:
                 raise ValueError(f"Unknown agent type: {agent_type}")
             
             spec = self.agent_specifications[agent_type]
-            agent_class = spec['class']
             
             # Generate agent ID if not provided
             if not agent_id:
@@ -247,17 +255,18 @@ class AgentOrchestrator:
                 'resource_requirements': spec['resource_requirements']
             })
             
-            # Instantiate agent
-            agent = agent_class(agent_id=agent_id, config=agent_config)
-            
-            # Spawn the agent
-            spawn_success = await agent.spawn()
+            # Instantiate and spawn the agent in-loop or in a worker process
+            placement = self.agent_host.placement_for(agent_type)
+            agent_config['placement'] = placement.value
+            agent = await self.agent_host.start_agent(agent_type, agent_id, agent_config, placement)
             
-            if spawn_success:
+            if agent is not None:
                 # Register agent
                 self.active_agents[agent_id] = agent
                 self.agent_configs[agent_id] = agent_config
                 AGENT_REGISTRY.register_agent(agent)
+                if placement == AgentPlacement.PROCESS:
+                    self.agent_processes[agent_id] = self.agent_host.process_info(agent_id)
                 
                 # Initialize health tracking
                 self.agent_health[agent_id] = {
@@ -276,10 +285,11 @@ class AgentOrchestrator:
                 self._log_event('agent_spawned', {
                     'agent_id': agent_id,
                     'agent_type': agent_type,
+                    'placement': placement.value,
                     'capabilities': spec['capabilities']
                 })
                 
-                logger.info(f"🚀 Spawned {agent_type} agent: {agent_id}")
+                logger.info(f"🚀 Spawned {agent_type} agent: {agent_id} ({placement.value})")
                 return True
             else:
                 logger.error(f"❌ Failed to spawn {agent_type} agent: {agent_id}")
@@ -296,16 +306,15 @@ class AgentOrchestrator:
                 logger.warning(f"⚠️ Agent {agent_id} not found for termination")
                 return False
             
-            agent = self.active_agents[agent_id]
-            
-            # Graceful termination
-            await agent.terminate()
+            # Graceful termination (worker processes are joined or killed by the host)
+            await self.agent_host.stop_agent(agent_id)
             
             # Clean up tracking
             del self.active_agents[agent_id]
             del self.agent_configs[agent_id]
             if agent_id in self.agent_health:
                 del self.agent_health[agent_id]
+            self.agent_processes.pop(agent_id, None)
             
             # Unregister from global registry
             AGENT_REGISTRY.unregister_agent(agent_id)
@@ -516,6 +525,11 @@ class AgentOrchestrator:
             # Update agent-specific health metrics
             if hasattr(agent, 'health_metrics'):
                 health_info.update(agent.health_metrics)
+            
+            # Worker processes report real CPU/RSS and restart counts
+            process_info = self.agent_host.process_info(agent_id)
+            if process_info:
+                self.agent_processes[agent_id] = process_info
         
         # Handle unhealthy agents
         for agent_id in unhealthy_agents:
@@ -776,6 +790,7 @@ class AgentOrchestrator:
             agent_ids = list(self.active_agents.keys())
             for agent_id in agent_ids:
                 await self._terminate_agent(agent_id, "system_shutdown")
+            await self.agent_host.shutdown()
             
             # Clean up resources
             await self._cleanup_resources()
@@ -818,6 +833,7 @@ class AgentOrchestrator:
             },
             'healthy_agents': len([h for h in self.agent_health.values() if h.get('status') == 'healthy']),
             'system_metrics': self.system_metrics,
+            'agent_host': self.agent_host.get_stats(),
             'recent_events': list(self.system_events)[-10:],  # Last 10 events
             'performance_summary': {
                 'average_response_time': self.system_metrics['average_response_time'],
@@ -842,7 +858,9 @@ class AgentOrchestrator:
                 'error_count': health.get('error_count', 0),
                 'performance_score': health.get('performance_score', 0.0),
                 'capabilities': config.get('capabilities', []),
-                'resource_requirements': config.get('resource_requirements', {})
+                'resource_requirements': config.get('resource_requirements', {}),
+                'placement': config.get('placement', AgentPlacement.IN_LOOP.value),
+                'process': self.agent_host.process_info(agent_id)
             }
         
         return agent_details
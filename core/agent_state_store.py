@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+🔥💀 AGENT STATE STORE - CONSOLIDATED AGENT SNAPSHOTS 💀🔥
+Agent Poly Loly Double Zero: One embedded store instead of thousands of state files
+
+FEATURES:
+- SQLite in WAL mode (single file, concurrent readers)
+- Batched writes (snapshots are buffered and flushed in one transaction)
+- Indexed lookup by agent type and agent id
+- Retention: the latest N snapshots per agent id, capped at M per agent type
+  (so churned one-off instances cannot pile up)
+- Migration of legacy agents/state_*.json files
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.path.join("agents", "agent_state.db")
+
+# Instance suffixes the orchestrator appends to agent types (analyzer_001, analyzer_00616c51)
+_INSTANCE_SUFFIX = re.compile(r'_[0-9a-f]{3,}$')
+
+def infer_agent_type(agent_id: str) -> str:
+    """🏷️ Logical agent name for an agent id (analyzer_00616c51 -> analyzer)"""
+    return _INSTANCE_SUFFIX.sub('', agent_id) or agent_id
+
+class AgentStateStore:
+    """
+    💾 Embedded store for agent state snapshots
+
+    Each agent id keeps its latest `keep_per_agent` snapshots, so a long-lived
+    agent's history is bounded without one busy instance evicting its siblings.
+    On top of that every agent type keeps at most `keep_per_type` snapshots:
+    the oldest go first, which retires the rows of instances that stopped
+    saving (thousands of one-off analyzer_* ids) while live agents, whose
+    snapshots are recent, keep theirs.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, keep_per_agent: int = 20,
+                 keep_per_type: int = 200, batch_size: int = 50, flush_interval: float = 0.5):
+        self.db_path = db_path
+        self.keep_per_agent = keep_per_agent
+        self.keep_per_type = keep_per_type
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._pending: List[tuple] = []
+        self._flush_handle: Optional[tuple] = None  # (loop, TimerHandle)
+        self.stats = {'snapshots_written': 0, 'flushes': 0, 'snapshots_pruned': 0}
+
+    # =================== CONNECTION ===================
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS agent_state (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    agent_id TEXT NOT NULL,
+                    agent_type TEXT NOT NULL,
+                    saved_at REAL NOT NULL,
+                    state TEXT NOT NULL,
+                    source TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_agent_state_id ON agent_state (agent_id, saved_at);
+                CREATE INDEX IF NOT EXISTS idx_agent_state_type ON agent_state (agent_type, saved_at);
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_agent_state_source ON agent_state (source);
+            """)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """🔒 Flush pending snapshots and close the database"""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # =================== WRITES ===================
+
+    def _buffer(self, agent_id: str, state: Dict[str, Any], agent_type: Optional[str],
+                saved_at: Optional[float]) -> bool:
+        """📥 Queue a snapshot row; returns True once a full batch is pending"""
+        row = (
+            agent_id,
+            agent_type or infer_agent_type(agent_id),
+            saved_at if saved_at is not None else time.time(),
+            json.dumps(state, default=str),
+            None
+        )
+        with self._lock:
+            self._pending.append(row)
+            return len(self._pending) >= self.batch_size
+
+    def save(self, agent_id: str, state: Dict[str, Any], agent_type: str = None,
+             saved_at: float = None):
+        """📝 Buffer a snapshot; written once batch_size snapshots are pending (or on flush)"""
+        if self._buffer(agent_id, state, agent_type, saved_at):
+            self.flush()
+
+    async def save_async(self, agent_id: str, state: Dict[str, Any], agent_type: str = None):
+        """📝 Buffer a snapshot from the event loop; the write happens off-loop"""
+        if self._buffer(agent_id, state, agent_type, None):
+            await asyncio.to_thread(self.flush)
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """⏱️ Coalesce snapshots saved within flush_interval into one transaction"""
+        loop = asyncio.get_running_loop()
+        if self._flush_handle is not None:
+            scheduled_loop, handle = self._flush_handle
+            if scheduled_loop is loop and not handle.cancelled():
+                return
+
+        def _fire():
+            self._flush_handle = None
+            loop.run_in_executor(None, self.flush)
+
+        self._flush_handle = (loop, loop.call_later(self.flush_interval, _fire))
+
+    def flush(self) -> int:
+        """💾 Write all pending snapshots in one transaction and apply retention"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            rows, self._pending = self._pending, []
+
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO agent_state (agent_id, agent_type, saved_at, state, source) "
+                    "VALUES (?, ?, ?, ?, ?)", rows
+                )
+                pruned = self._prune(conn, {row[0] for row in rows}, {row[1] for row in rows})
+
+            self.stats['snapshots_written'] += len(rows)
+            self.stats['snapshots_pruned'] += pruned
+            self.stats['flushes'] += 1
+            return len(rows)
+
+    def _prune(self, conn: sqlite3.Connection, agent_ids, agent_types) -> int:
+        """🧹 Keep the latest keep_per_agent snapshots per agent id and keep_per_type per agent type"""
+        pruned = 0
+        for agent_id in agent_ids:
+            cursor = conn.execute(
+                "DELETE FROM agent_state WHERE agent_id = ? AND id NOT IN ("
+                "SELECT id FROM agent_state WHERE agent_id = ? "
+                "ORDER BY saved_at DESC, id DESC LIMIT ?)",
+                (agent_id, agent_id, self.keep_per_agent)
+            )
+            pruned += cursor.rowcount
+        for agent_type in agent_types:
+            cursor = conn.execute(
+                "DELETE FROM agent_state WHERE agent_type = ? AND id NOT IN ("
+                "SELECT id FROM agent_state WHERE agent_type = ? "
+                "ORDER BY saved_at DESC, id DESC LIMIT ?)",
+                (agent_type, agent_type, self.keep_per_type)
+            )
+            pruned += cursor.rowcount
+        return pruned
+
+    # =================== READS ===================
+
+    def _rows(self, query: str, params: tuple) -> List[Dict[str, Any]]:
+        self.flush()
+        with self._lock:
+            rows = self._connect().execute(query, params).fetchall()
+        return [
+            {'agent_id': agent_id, 'agent_type': agent_type, 'saved_at': saved_at, 'state': json.loads(state)}
+            for agent_id, agent_type, saved_at, state in rows
+        ]
+
+    def latest(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """🔍 Latest snapshot for an agent id"""
+        rows = self._rows(
+            "SELECT agent_id, agent_type, saved_at, state FROM agent_state "
+            "WHERE agent_id = ? ORDER BY saved_at DESC, id DESC LIMIT 1", (agent_id,)
+        )
+        return rows[0] if rows else None
+
+    def history(self, agent_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """📜 Most recent snapshots for an agent id, newest first"""
+        return self._rows(
+            "SELECT agent_id, agent_type, saved_at, state FROM agent_state "
+            "WHERE agent_id = ? ORDER BY saved_at DESC, id DESC LIMIT ?", (agent_id, limit)
+        )
+
+    def by_type(self, agent_type: str, limit: int = None) -> List[Dict[str, Any]]:
+        """🏷️ Snapshots for a logical agent type, newest first"""
+        return self._rows(
+            "SELECT agent_id, agent_type, saved_at, state FROM agent_state "
+            "WHERE agent_type = ? ORDER BY saved_at DESC, id DESC LIMIT ?",
+            (agent_type, limit if limit is not None else -1)
+        )
+
+    def agent_types(self) -> Dict[str, int]:
+        """📊 Snapshot count per logical agent type"""
+        self.flush()
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT agent_type, COUNT(*) FROM agent_state GROUP BY agent_type ORDER BY agent_type"
+            ).fetchall()
+        return dict(rows)
+
+    # =================== MIGRATION ===================
+
+    def migrate_json_files(self, state_dir: str = "agents", remove_files: bool = False) -> Dict[str, int]:
+        """
+        📦 Ingest legacy agents/state_*.json files
+
+        Snapshots are timestamped with the file mtime and recorded by file name,
+        then retention applies - re-running is safe.
+        """
+        self.flush()
+        result = {'migrated': 0, 'skipped': 0, 'failed': 0, 'removed': 0}
+        rows = []
+        paths = []
+
+        for name in sorted(os.listdir(state_dir)):
+            if not (name.startswith("state_") and name.endswith(".json")):
+                continue
+            path = os.path.join(state_dir, name)
+            try:
+                with open(path) as f:
+                    state = json.load(f)
+                agent_id = state.get('agent_id') or name[len("state_"):-len(".json")]
+                rows.append((agent_id, infer_agent_type(agent_id), os.path.getmtime(path),
+                             json.dumps(state, default=str), name))
+                paths.append(path)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not migrate {path}: {e}")
+                result['failed'] += 1
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO agent_state (agent_id, agent_type, saved_at, state, source) "
+                    "VALUES (?, ?, ?, ?, ?)", rows
+                )
+                result['migrated'] = conn.total_changes - before
+                result['skipped'] = len(rows) - result['migrated']
+                self.stats['snapshots_pruned'] += self._prune(conn, {row[0] for row in rows},
+                                                              {row[1] for row in rows})
+
+        if remove_files:
+            for path in paths:
+                try:
+                    os.remove(path)
+                    result['removed'] += 1
+                except OSError as e:
+                    logger.warning(f"⚠️ Could not remove {path}: {e}")
+
+        logger.info(f"📦 Agent state migration: {result}")
+        return result
+
+# =================== GLOBAL STORE ===================
+
+AGENT_STATE_STORE = AgentStateStore()
+atexit.register(AGENT_STATE_STORE.flush)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Migrate agents/state_*.json into the agent state store")
+    parser.add_argument("--state-dir", default="agents")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    parser.add_argument("--keep", type=int, default=20, help="Snapshots kept per agent id")
+    parser.add_argument("--keep-per-type", type=int, default=200,
+                        help="Snapshots kept per agent type across all of its ids (oldest dropped first)")
+    parser.add_argument("--remove", action="store_true", help="Delete JSON files after ingesting them")
+    args = parser.parse_args()
+
+    store = AgentStateStore(args.db, keep_per_agent=args.keep, keep_per_type=args.keep_per_type)
+    print(json.dumps(store.migrate_json_files(args.state_dir, remove_files=args.remove), indent=2))
+    print(json.dumps(store.agent_types(), indent=2))
+    store.close()
@@ -25,6 +25,8 @@ import psutil
 import os
 import signal
 
+from core.agent_state_store import AGENT_STATE_STORE
+
 # Configure logging for agents
 logging.basicConfig(
     level=logging.INFO,
@@ -566,12 +568,10 @@ class AutonomousAgent(ABC):
             'health_metrics': self.health_metrics
         }
         
-        # Save to file or database
-        state_file = f"agents/state_{self.agent_id}.json"
+        # Save to the consolidated state store (batched, latest N per logical agent)
         try:
-            with open(state_file, 'w') as f:
-                json.dump(state_data, f, indent=2, default=str)
-            logger.info(f"💾 Agent state saved to {state_file}")
+            await AGENT_STATE_STORE.save_async(self.agent_id, state_data, self.config.get('agent_type'))
+            logger.info(f"💾 Agent state saved to {AGENT_STATE_STORE.db_path}")
         except Exception as e:
             logger.error(f"❌ Error saving agent state: {e}")
 
@@ -589,7 +589,7 @@ class AgentRegistry:
         """📝 Register new agent"""
         agent_info = {
             'agent_id': agent.agent_id,
-            'agent_type': agent.__class__.__name__,
+            'agent_type': getattr(agent, 'agent_type_name', agent.__class__.__name__),
             'state': agent.state,
             'start_time': agent.start_time,
             'process_id': agent.process_id
@@ -597,7 +597,7 @@ class AgentRegistry:
         
         self.agents[agent.agent_id] = agent_info
         
-        agent_type = agent.__class__.__name__
+        agent_type = agent_info['agent_type']
         if agent_type not in self.agent_types:
             self.agent_types[agent_type] = []
         self.agent_types[agent_type].append(agent.agent_id)
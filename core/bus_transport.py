@@ -0,0 +1,578 @@
+#!/usr/bin/env python3
+"""
+🔥💀 BUS TRANSPORTS - AdvancedMessageBus ACROSS PROCESSES AND PODS 💀🔥
+Agent Poly Loly Double Zero: Multi-Node Messaging
+
+Every AdvancedMessageBus used to live in one Python process. A transport links
+bus instances so analyzer/predictor agents can run in separate processes or
+pods while keeping the same publish/subscribe/direct API:
+
+- Fan-out stream: broadcasts, topic publishes, direct messages and replies
+  reach every bus; each bus delivers to the agents it hosts
+- Consumer groups: load-balanced agent-type messages (topic = agent type) go to
+  exactly ONE bus hosting that type, and are acknowledged only after they land
+  in a mailbox - unacknowledged deliveries are retried, then dead-lettered
+- Compact binary frames (struct header + length-prefixed strings + JSON payload,
+  zlib for large payloads)
+
+BACKENDS:
+- RedisStreamsTransport: XADD / XREAD / XREADGROUP / XACK / XAUTOCLAIM
+- LocalSocketTransport + LocalSocketBroker: same semantics over a UNIX socket
+  (tests, single-host multi-process deployments without Redis)
+
+🎯 USAGE:
+    bus = AdvancedMessageBus("analyzers_pod_1")
+    await bus.attach_transport(create_transport("redis://redis:6379/0"))
+    await bus.start()
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import struct
+import time
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from core.message_bus import AdvancedMessage, MessagePriority, MessageType
+
+try:
+    import redis.asyncio as redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# =================== BINARY SERIALIZATION ===================
+
+WIRE_VERSION = 1
+COMPRESS_THRESHOLD = 1024
+
+_MESSAGE_TYPES = list(MessageType)
+_MESSAGE_TYPE_INDEX = {message_type: i for i, message_type in enumerate(_MESSAGE_TYPES)}
+
+# version, type, priority, retry_count, max_retries, flags, created_at, expires_at, timeout
+_HEADER = struct.Struct('!BBBBBBddf')
+_STR_LEN = struct.Struct('!H')
+_FLAG_REQUIRES_ACK = 1
+_FLAG_EXPIRES = 2
+_FLAG_COMPRESSED = 4
+
+def _pack_str(value: Optional[str]) -> bytes:
+    data = (value or '').encode('utf-8')
+    return _STR_LEN.pack(len(data)) + data
+
+def _unpack_str(buffer: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = _STR_LEN.unpack_from(buffer, offset)
+    offset += _STR_LEN.size
+    return buffer[offset:offset + length].decode('utf-8'), offset + length
+
+def encode_message(message: AdvancedMessage, origin: str = '') -> bytes:
+    """
+    📦 AdvancedMessage -> compact frame
+
+    Routing path and processing times are per-process debug data and stay local.
+    """
+    payload = json.dumps(message.payload, separators=(',', ':'), default=str).encode('utf-8')
+    flags = 0
+    if message.requires_ack:
+        flags |= _FLAG_REQUIRES_ACK
+    if message.expires_at:
+        flags |= _FLAG_EXPIRES
+    if len(payload) > COMPRESS_THRESHOLD:
+        payload = zlib.compress(payload)
+        flags |= _FLAG_COMPRESSED
+
+    parts = [
+        _HEADER.pack(WIRE_VERSION, _MESSAGE_TYPE_INDEX[message.message_type], message.priority.value,
+                     min(message.retry_count, 255), min(message.max_retries, 255), flags,
+                     message.created_at.timestamp(),
+                     message.expires_at.timestamp() if message.expires_at else 0.0,
+                     message.timeout_seconds),
+        _pack_str(origin), _pack_str(message.message_id), _pack_str(message.sender_id),
+        _pack_str(message.topic), _pack_str(message.event_name),
+        _pack_str(message.correlation_id), _pack_str(message.reply_to),
+    ]
+    for values in (message.target_agents, message.routing_tags):
+        values = sorted(values) if values else []
+        parts.append(_STR_LEN.pack(len(values)))
+        parts.extend(_pack_str(value) for value in values)
+    parts.append(payload)
+    return b''.join(parts)
+
+def decode_message(frame: bytes) -> Tuple[AdvancedMessage, str]:
+    """📦 Frame -> (AdvancedMessage, origin bus id)"""
+    version, type_index, priority, retry_count, max_retries, flags, created_at, expires_at, timeout = \
+        _HEADER.unpack_from(frame, 0)
+    if version != WIRE_VERSION:
+        raise ValueError(f"Unsupported bus wire version {version}")
+    offset = _HEADER.size
+
+    strings = []
+    for _ in range(7):
+        value, offset = _unpack_str(frame, offset)
+        strings.append(value)
+    origin, message_id, sender_id, topic, event_name, correlation_id, reply_to = strings
+
+    collections = []
+    for _ in range(2):
+        (count,) = _STR_LEN.unpack_from(frame, offset)
+        offset += _STR_LEN.size
+        values = set()
+        for _ in range(count):
+            value, offset = _unpack_str(frame, offset)
+            values.add(value)
+        collections.append(values)
+    target_agents, routing_tags = collections
+
+    payload = frame[offset:]
+    if flags & _FLAG_COMPRESSED:
+        payload = zlib.decompress(payload)
+
+    message = AdvancedMessage(
+        message_id=message_id,
+        sender_id=sender_id,
+        message_type=_MESSAGE_TYPES[type_index],
+        topic=topic,
+        event_name=event_name,
+        payload=json.loads(payload) if payload else {},
+        priority=MessagePriority(priority),
+        target_agents=target_agents or None,
+        routing_tags=routing_tags,
+        retry_count=retry_count,
+        max_retries=max_retries,
+        timeout_seconds=timeout,
+        requires_ack=bool(flags & _FLAG_REQUIRES_ACK),
+        created_at=datetime.fromtimestamp(created_at),
+        expires_at=datetime.fromtimestamp(expires_at) if flags & _FLAG_EXPIRES else None,
+        correlation_id=correlation_id or None,
+        reply_to=reply_to or None
+    )
+    return message, origin
+
+# =================== TRANSPORT BASE ===================
+
+class BusTransport(ABC):
+    """
+    🔌 Carries encoded messages between AdvancedMessageBus instances
+
+    group=None  -> fan-out to every other bus
+    group=<type> -> exactly one bus hosting agents of that type (acked delivery)
+    """
+
+    def __init__(self):
+        self.bus = None
+        self.node_id = ''
+        self.groups: Set[str] = set()
+        self.stats = defaultdict(int)
+
+    async def connect(self, bus):
+        # Unique per process even when every node names its bus "global_bus"
+        self.bus = bus
+        self.node_id = f"{bus.bus_id}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+    async def close(self):
+        pass
+
+    def join_group(self, group: str):
+        """👥 Start consuming load-balanced messages for an agent type"""
+        self.groups.add(group)
+
+    @abstractmethod
+    async def send(self, message: AdvancedMessage, group: Optional[str] = None):
+        """📤 Encode and publish a message (group=None fans out, group=<type> load-balances)"""
+        pass
+
+    async def _dispatch(self, frame: bytes, group: Optional[str]) -> bool:
+        """📥 Decode and hand to the local bus; True = safe to acknowledge"""
+        try:
+            message, origin = decode_message(frame)
+        except Exception as e:
+            self.stats['decode_errors'] += 1
+            logger.error(f"❌ Dropping undecodable bus frame: {e}")
+            return True
+
+        if group is None and origin == self.node_id:
+            return True  # Our own fan-out echo
+
+        self.stats['received'] += 1
+        try:
+            delivered = await self.bus.receive_remote(message, group)
+        except Exception as e:
+            logger.error(f"❌ Remote delivery failed for {message.message_id}: {e}")
+            delivered = False
+        if not delivered:
+            self.stats['delivery_failures'] += 1
+        return delivered
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'transport': type(self).__name__, 'node_id': self.node_id,
+                'groups': sorted(self.groups), **self.stats}
+
+# =================== REDIS STREAMS ===================
+
+class RedisStreamsTransport(BusTransport):
+    """
+    📡 Redis Streams backend
+
+    - {prefix}:events          fan-out stream, every bus XREADs from '$'
+    - {prefix}:group:{type}    one stream per agent type, consumer group = type,
+                               consumer = bus id; XACK after local enqueue,
+                               XAUTOCLAIM re-delivers idle entries
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "loly:bus",
+                 maxlen: int = 10000, block_ms: int = 1000, batch_size: int = 32,
+                 claim_idle_ms: int = 30000, max_deliveries: int = 4):
+        super().__init__()
+        self.url = url
+        self.prefix = prefix
+        self.maxlen = maxlen
+        self.block_ms = block_ms
+        self.batch_size = batch_size
+        self.claim_idle_ms = claim_idle_ms
+        self.max_deliveries = max_deliveries
+        self.client = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def _events_key(self) -> str:
+        return f"{self.prefix}:events"
+
+    def _group_key(self, group: str) -> str:
+        return f"{self.prefix}:group:{group}"
+
+    async def connect(self, bus):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis package not installed - pip install redis")
+        await super().connect(bus)
+        self.client = redis.from_url(self.url)
+        await self.client.ping()
+        self._tasks['events'] = asyncio.create_task(self._events_loop())
+        for group in self.groups:
+            self._start_group(group)
+        logger.info(f"📡 Redis Streams transport connected ({self.url}, node {self.node_id})")
+
+    async def close(self):
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+
+    def join_group(self, group: str):
+        super().join_group(group)
+        if self.client is not None:
+            self._start_group(group)
+
+    def _start_group(self, group: str):
+        if f"group:{group}" not in self._tasks:
+            self._tasks[f"group:{group}"] = asyncio.create_task(self._group_loop(group))
+
+    async def send(self, message: AdvancedMessage, group: Optional[str] = None):
+        key = self._group_key(group) if group else self._events_key()
+        await self.client.xadd(key, {'m': encode_message(message, self.node_id)},
+                               maxlen=self.maxlen, approximate=True)
+        self.stats['sent'] += 1
+
+    async def _events_loop(self):
+        """📢 Fan-out reader (no group: every bus sees every entry)"""
+        key, last_id = self._events_key(), '$'
+        while True:
+            try:
+                response = await self.client.xread({key: last_id}, count=self.batch_size, block=self.block_ms)
+                for _, entries in response or []:
+                    for entry_id, fields in entries:
+                        last_id = entry_id
+                        await self._dispatch(fields[b'm'], None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Redis events reader error: {e}")
+                await asyncio.sleep(1)
+
+    async def _ensure_group(self, key: str, group: str):
+        try:
+            await self.client.xgroup_create(key, group, id='$', mkstream=True)
+        except Exception as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
+    async def _group_loop(self, group: str):
+        """⚖️ Consumer-group reader with ack-driven retry"""
+        key = self._group_key(group)
+        last_claim = time.monotonic()
+        while True:
+            try:
+                await self._ensure_group(key, group)
+                response = await self.client.xreadgroup(group, self.node_id, {key: '>'},
+                                                        count=self.batch_size, block=self.block_ms)
+                for _, entries in response or []:
+                    for entry_id, fields in entries:
+                        if await self._dispatch(fields[b'm'], group):
+                            await self.client.xack(key, group, entry_id)
+                            self.stats['acked'] += 1
+
+                if time.monotonic() - last_claim >= self.claim_idle_ms / 1000:
+                    last_claim = time.monotonic()
+                    await self._reclaim(key, group)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Redis group reader error ({group}): {e}")
+                await asyncio.sleep(1)
+
+    async def _reclaim(self, key: str, group: str):
+        """🔄 Take over entries idle past claim_idle_ms (crashed or full consumers)"""
+        response = await self.client.xautoclaim(key, group, self.node_id, min_idle_time=self.claim_idle_ms,
+                                                start_id='0-0', count=self.batch_size)
+        for entry_id, fields in response[1]:
+            if not fields:
+                continue
+            pending = await self.client.xpending_range(key, group, min=entry_id, max=entry_id, count=1)
+            deliveries = pending[0]['times_delivered'] if pending else 1
+            if deliveries > self.max_deliveries:
+                await self.client.xack(key, group, entry_id)
+                self.stats['dead_lettered'] += 1
+                logger.error(f"💀 Dead letter: {group} entry {entry_id} after {deliveries} deliveries")
+                continue
+            self.stats['redelivered'] += 1
+            if await self._dispatch(fields[b'm'], group):
+                await self.client.xack(key, group, entry_id)
+                self.stats['acked'] += 1
+
+# =================== LOCAL UNIX-SOCKET BROKER ===================
+
+# Frame: 4-byte length | 1-byte op | body
+_FRAME = struct.Struct('!IB')
+_DELIVERY = struct.Struct('!Q')
+OP_HELLO, OP_JOIN, OP_PUBLISH, OP_ACK, OP_DELIVER = b'HJPAD'
+
+def _frame(op: int, body: bytes) -> bytes:
+    return _FRAME.pack(len(body), op) + body
+
+async def _read_frame(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    length, op = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    return op, await reader.readexactly(length)
+
+def _publish_body(group: Optional[str], data: bytes) -> bytes:
+    return _pack_str(group) + data
+
+def _parse_publish(body: bytes) -> Tuple[str, bytes]:
+    group, offset = _unpack_str(body, 0)
+    return group, body[offset:]
+
+@dataclass
+class _BrokerDelivery:
+    group: str
+    data: bytes
+    client: '_BrokerClient'
+    sent_at: float
+    attempts: int
+
+class _BrokerClient:
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.node_id = ''
+        self.groups: Set[str] = set()
+
+    def send(self, op: int, body: bytes):
+        if not self.writer.is_closing():
+            self.writer.write(_frame(op, body))
+
+class LocalSocketBroker:
+    """
+    🧪 Minimal single-host broker with Redis-Streams semantics
+
+    Fan-out frames go to every other client; group frames go round-robin to one
+    member and stay pending until acked (re-delivered after ack_timeout, dead-
+    lettered after max_deliveries). Group frames with no member yet are backlogged.
+    """
+
+    def __init__(self, path: str, ack_timeout: float = 5.0, max_deliveries: int = 4):
+        self.path = path
+        self.ack_timeout = ack_timeout
+        self.max_deliveries = max_deliveries
+        self.clients: List[_BrokerClient] = []
+        self.members: Dict[str, List[_BrokerClient]] = defaultdict(list)
+        self.backlog: Dict[str, deque] = defaultdict(deque)
+        self.pending: Dict[int, _BrokerDelivery] = {}
+        self.stats = defaultdict(int)
+        self._delivery_ids = itertools.count(1)
+        self._round_robin: Dict[str, int] = defaultdict(int)
+        self._server = None
+        self._redelivery_task = None
+
+    async def start(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self.path)
+        self._redelivery_task = asyncio.create_task(self._redelivery_loop())
+        logger.info(f"🧪 Local bus broker listening on {self.path}")
+
+    async def stop(self):
+        if self._redelivery_task:
+            self._redelivery_task.cancel()
+            await asyncio.gather(self._redelivery_task, return_exceptions=True)
+        for client in list(self.clients):
+            client.writer.close()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        client = _BrokerClient(writer)
+        self.clients.append(client)
+        try:
+            while True:
+                op, body = await _read_frame(reader)
+                if op == OP_HELLO:
+                    client.node_id = body.decode('utf-8')
+                    client.send(OP_HELLO, b'')  # Handshake: client is now routable
+                elif op == OP_JOIN:
+                    group = body.decode('utf-8')
+                    client.groups.add(group)
+                    self.members[group].append(client)
+                    while self.backlog[group]:
+                        self._deliver_group(group, self.backlog[group].popleft())
+                elif op == OP_PUBLISH:
+                    group, data = _parse_publish(body)
+                    self.stats['published'] += 1
+                    if group:
+                        self._deliver_group(group, data)
+                    else:
+                        for other in self.clients:
+                            if other is not client:
+                                other.send(OP_DELIVER, _DELIVERY.pack(0) + _publish_body('', data))
+                elif op == OP_ACK:
+                    (delivery_id,) = _DELIVERY.unpack(body)
+                    if self.pending.pop(delivery_id, None) is not None:
+                        self.stats['acked'] += 1
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._drop_client(client)
+
+    def _drop_client(self, client: _BrokerClient):
+        """🔌 Remove a client and re-deliver everything it had not acked"""
+        if client in self.clients:
+            self.clients.remove(client)
+        for group in client.groups:
+            if client in self.members[group]:
+                self.members[group].remove(client)
+        orphaned = [(delivery_id, delivery) for delivery_id, delivery in self.pending.items()
+                    if delivery.client is client]
+        for delivery_id, delivery in orphaned:
+            del self.pending[delivery_id]
+            self._deliver_group(delivery.group, delivery.data, delivery.attempts)
+        client.writer.close()
+
+    def _deliver_group(self, group: str, data: bytes, attempts: int = 0):
+        members = self.members.get(group)
+        if not members:
+            self.backlog[group].append(data)
+            return
+        if attempts >= self.max_deliveries:
+            self.stats['dead_lettered'] += 1
+            logger.error(f"💀 Dead letter: {group} message after {attempts} deliveries")
+            return
+
+        index = self._round_robin[group] % len(members)
+        self._round_robin[group] += 1
+        client = members[index]
+        delivery_id = next(self._delivery_ids)
+        self.pending[delivery_id] = _BrokerDelivery(group, data, client, time.monotonic(), attempts + 1)
+        if attempts:
+            self.stats['redelivered'] += 1
+        client.send(OP_DELIVER, _DELIVERY.pack(delivery_id) + _publish_body(group, data))
+
+    async def _redelivery_loop(self):
+        """🔄 Re-deliver group frames whose ack did not arrive in time"""
+        while True:
+            await asyncio.sleep(self.ack_timeout / 2)
+            cutoff = time.monotonic() - self.ack_timeout
+            expired = [(delivery_id, delivery) for delivery_id, delivery in self.pending.items()
+                       if delivery.sent_at < cutoff]
+            for delivery_id, delivery in expired:
+                del self.pending[delivery_id]
+                self._deliver_group(delivery.group, delivery.data, delivery.attempts)
+
+class LocalSocketTransport(BusTransport):
+    """🧪 Client side of LocalSocketBroker"""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def connect(self, bus):
+        await super().connect(bus)
+        reader, self._writer = await asyncio.open_unix_connection(self.path)
+        self._writer.write(_frame(OP_HELLO, self.node_id.encode('utf-8')))
+        for group in self.groups:
+            self._writer.write(_frame(OP_JOIN, group.encode('utf-8')))
+        await self._writer.drain()
+        op, _ = await _read_frame(reader)
+        if op != OP_HELLO:
+            raise ConnectionError(f"Unexpected broker handshake frame {op!r}")
+        self._reader_task = asyncio.create_task(self._read_loop(reader))
+        logger.info(f"🧪 Local socket transport connected ({self.path}, node {self.node_id})")
+
+    async def close(self):
+        if self._reader_task:
+            self._reader_task.cancel()
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+
+    def join_group(self, group: str):
+        if group in self.groups:
+            return
+        super().join_group(group)
+        if self._writer is not None:
+            self._writer.write(_frame(OP_JOIN, group.encode('utf-8')))
+
+    async def send(self, message: AdvancedMessage, group: Optional[str] = None):
+        self._writer.write(_frame(OP_PUBLISH, _publish_body(group, encode_message(message, self.node_id))))
+        await self._writer.drain()
+        self.stats['sent'] += 1
+
+    async def _read_loop(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                op, body = await _read_frame(reader)
+                if op != OP_DELIVER:
+                    continue
+                (delivery_id,) = _DELIVERY.unpack_from(body)
+                group, data = _parse_publish(body[_DELIVERY.size:])
+                if await self._dispatch(data, group or None) and delivery_id:
+                    self._writer.write(_frame(OP_ACK, _DELIVERY.pack(delivery_id)))
+                    self.stats['acked'] += 1
+        except (asyncio.IncompleteReadError, ConnectionError):
+            logger.warning(f"⚠️ Local bus broker connection closed ({self.path})")
+
+# =================== FACTORY ===================
+
+def create_transport(url: Optional[str]) -> Optional[BusTransport]:
+    """🏭 redis://... / rediss://... / unix:///path.sock -> transport; empty/'memory' -> None"""
+    if not url or url == 'memory':
+        return None
+    if url.startswith(('redis://', 'rediss://')):
+        return RedisStreamsTransport(url)
+    if url.startswith('unix://'):
+        return LocalSocketTransport(url[len('unix://'):])
+    raise ValueError(f"Unknown bus transport URL: {url}")
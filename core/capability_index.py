@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+🔥💀 CAPABILITY INDEX - VECTORIZED AGENT SELECTION 💀🔥
+Agent Poly Loly Double Zero: O(capabilities) candidate lookup for task routing
+
+Every agent owns a row (slot) in a set of NumPy arrays:
+- one boolean column per capability (inverted capability -> agents index)
+- load (assigned task count), performance and heartbeat scores
+- one pheromone column per task type (ACO routing memory), plus a deposited
+  mask so only trails that were actually laid evaporate or get reported
+
+Finding capable agents is an AND over a few capability columns instead of a
+subset test per agent, and scoring a whole candidate set is one array
+expression. Rows are recycled through a free list on unregister.
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+DEFAULT_PHEROMONE = 0.5
+
+class CapabilityIndex:
+    """📇 Inverted capability index with per-agent score arrays"""
+
+    def __init__(self, initial_capacity: int = 64):
+        self.capacity = initial_capacity
+        self.slots: Dict[str, int] = {}  # agent_id -> row
+        self.agent_ids: List[Optional[str]] = [None] * initial_capacity
+        self.capabilities: Dict[str, Set[str]] = {}  # agent_id -> capabilities
+        self._free: List[int] = []
+        self._next_slot = 0
+
+        self.active = np.zeros(initial_capacity, dtype=bool)
+        self.load = np.zeros(initial_capacity, dtype=np.float64)
+        self.performance = np.zeros(initial_capacity, dtype=np.float64)
+        self.heartbeat = np.zeros(initial_capacity, dtype=np.float64)
+        self._capability_masks: Dict[str, np.ndarray] = {}
+        self._pheromones: Dict[str, np.ndarray] = {}
+        self._deposited: Dict[str, np.ndarray] = {}  # task_type -> rows holding a laid trail
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self.slots
+
+    # =================== MEMBERSHIP ===================
+
+    def add(self, agent_id: str, capabilities: Iterable[str] = (), load: float = 0.0,
+            performance: float = 0.0, heartbeat: float = None) -> int:
+        """➕ Register (or re-register) an agent; returns its row"""
+        if agent_id in self.slots:
+            self.remove(agent_id)
+
+        slot = self._free.pop() if self._free else self._allocate()
+        self.slots[agent_id] = slot
+        self.agent_ids[slot] = agent_id
+        self.active[slot] = True
+        self.load[slot] = load
+        self.performance[slot] = performance
+        self.heartbeat[slot] = time.time() if heartbeat is None else heartbeat
+        for task_type, pheromone in self._pheromones.items():
+            pheromone[slot] = DEFAULT_PHEROMONE
+            self._deposited[task_type][slot] = False
+
+        self.capabilities[agent_id] = set()
+        self.set_capabilities(agent_id, capabilities)
+        return slot
+
+    def remove(self, agent_id: str) -> bool:
+        """➖ Drop an agent and recycle its row"""
+        slot = self.slots.pop(agent_id, None)
+        if slot is None:
+            return False
+        for capability in self.capabilities.pop(agent_id):
+            self._capability_masks[capability][slot] = False
+        self.active[slot] = False
+        self.agent_ids[slot] = None
+        self._free.append(slot)
+        return True
+
+    def set_capabilities(self, agent_id: str, capabilities: Iterable[str]):
+        """🔄 Replace an agent's capabilities, updating only the changed columns"""
+        slot = self.slots[agent_id]
+        new = set(capabilities)
+        old = self.capabilities[agent_id]
+        for capability in old - new:
+            self._capability_masks[capability][slot] = False
+        for capability in new - old:
+            self._mask(capability)[slot] = True
+        self.capabilities[agent_id] = new
+
+    def _allocate(self) -> int:
+        if self._next_slot == self.capacity:
+            self._grow()
+        slot = self._next_slot
+        self._next_slot += 1
+        return slot
+
+    def _grow(self):
+        extra = self.capacity
+        self.capacity *= 2
+        self.agent_ids.extend([None] * extra)
+        self.active = np.concatenate([self.active, np.zeros(extra, dtype=bool)])
+        self.load = np.concatenate([self.load, np.zeros(extra)])
+        self.performance = np.concatenate([self.performance, np.zeros(extra)])
+        self.heartbeat = np.concatenate([self.heartbeat, np.zeros(extra)])
+        for capability, mask in self._capability_masks.items():
+            self._capability_masks[capability] = np.concatenate([mask, np.zeros(extra, dtype=bool)])
+        for task_type, pheromone in self._pheromones.items():
+            self._pheromones[task_type] = np.concatenate([pheromone, np.full(extra, DEFAULT_PHEROMONE)])
+            self._deposited[task_type] = np.concatenate([self._deposited[task_type], np.zeros(extra, dtype=bool)])
+
+    def _mask(self, capability: str) -> np.ndarray:
+        mask = self._capability_masks.get(capability)
+        if mask is None:
+            mask = self._capability_masks[capability] = np.zeros(self.capacity, dtype=bool)
+        return mask
+
+    # =================== LOOKUP ===================
+
+    def candidate_mask(self, required: Iterable[str] = ()) -> np.ndarray:
+        """🔍 Rows of active agents holding every required capability"""
+        mask = self.active.copy()
+        for capability in required:
+            column = self._capability_masks.get(capability)
+            if column is None:
+                mask[:] = False
+                break
+            mask &= column
+        return mask
+
+    def candidate_slots(self, required: Iterable[str] = ()) -> np.ndarray:
+        """🔢 Candidate rows in registration (slot) order"""
+        return np.flatnonzero(self.candidate_mask(required))
+
+    def candidates(self, required: Iterable[str] = ()) -> List[str]:
+        return [self.agent_ids[slot] for slot in self.candidate_slots(required)]
+
+    def agents_with(self, capability: str) -> List[str]:
+        mask = self._capability_masks.get(capability)
+        if mask is None:
+            return []
+        return [self.agent_ids[slot] for slot in np.flatnonzero(mask)]
+
+    # =================== SCORES ===================
+
+    def slot_of(self, agent_id: str) -> int:
+        return self.slots[agent_id]
+
+    def add_load(self, agent_id: str, delta: float = 1.0):
+        slot = self.slots[agent_id]
+        self.load[slot] = max(0.0, self.load[slot] + delta)
+
+    def touch(self, agent_id: str, heartbeat: float = None):
+        self.heartbeat[self.slots[agent_id]] = time.time() if heartbeat is None else heartbeat
+
+    def pheromone(self, task_type: str) -> np.ndarray:
+        """🐜 Pheromone column for a task type (created at the default level)"""
+        column = self._pheromones.get(task_type)
+        if column is None:
+            column = self._pheromones[task_type] = np.full(self.capacity, DEFAULT_PHEROMONE)
+            self._deposited[task_type] = np.zeros(self.capacity, dtype=bool)
+        return column
+
+    def deposit(self, task_type: str, agent_id: str, amount: float):
+        slot = self.slots[agent_id]
+        self.pheromone(task_type)[slot] += amount
+        self._deposited[task_type][slot] = True
+
+    def deposit_slots(self, task_type: str, slots: np.ndarray, amount: float):
+        """🐜 Batch deposit; repeated slots receive one deposit per occurrence"""
+        np.add.at(self.pheromone(task_type), slots, amount)
+        self._deposited[task_type][slots] = True
+
+    def evaporate(self, rate: float, floor: float):
+        """💨 Decay laid trails only; trails below floor fall back to the default level"""
+        for task_type, column in self._pheromones.items():
+            laid = self._deposited[task_type]
+            column[laid] *= (1.0 - rate)
+            faded = laid & (column < floor)
+            column[faded] = DEFAULT_PHEROMONE
+            laid[faded] = False
+
+    def trails(self) -> Dict[str, float]:
+        """🗺️ Laid trails as 'task_type:agent_id' -> strength"""
+        trails = {}
+        for task_type, column in self._pheromones.items():
+            for slot in np.flatnonzero(self.active & self._deposited[task_type]):
+                trails[f"{task_type}:{self.agent_ids[slot]}"] = float(column[slot])
+        return trails
+
+    def clear(self):
+        self.__init__(self.capacity)
@@ -15,6 +15,8 @@ from enum import Enum
 from dataclasses import dataclass
 import numpy as np
 
+from core.agent_host import AgentHost, AgentPlacement
+
 logger = logging.getLogger(__name__)
 
 class ScalingDirection(Enum):
@@ -45,6 +47,8 @@ class ScalingPolicy:
     evaluation_window: int = 60
     scale_up_step: int = 2
     scale_down_step: int = 1
+    agent_type: str = "DataCollector"
+    placement: Optional[AgentPlacement] = None  # None = AgentHost policy for agent_type
 
 @dataclass
 class AgentMetrics:
@@ -74,10 +78,12 @@ class DynamicScalingManager:
     - Graceful scaling transitions
     """
     
-    def __init__(self, message_bus, swarm_coordinator, agent_factory):
+    def __init__(self, message_bus, swarm_coordinator, agent_factory, agent_host: Optional[AgentHost] = None):
         self.message_bus = message_bus
         self.swarm_coordinator = swarm_coordinator
         self.agent_factory = agent_factory
+        # Optional host for agent types it knows: lets policies place agents in worker processes
+        self.agent_host = agent_host
         
         # Scaling configuration
         self.scaling_policies: Dict[str, ScalingPolicy] = {}
@@ -337,7 +343,7 @@ class DynamicScalingManager:
                 agents_to_add = target_count - current_agents
                 
                 if agents_to_add > 0:
-                    success = await self._scale_up_agents(agents_to_add)
+                    success = await self._scale_up_agents(agents_to_add, policy)
                     if success:
                         self.last_scaling_action[policy.policy_id] = current_time
                         
@@ -377,7 +383,7 @@ class DynamicScalingManager:
         except Exception as e:
             logger.error(f"❌ Scaling execution failed: {e}")
     
-    async def _scale_up_agents(self, count: int) -> bool:
+    async def _scale_up_agents(self, count: int, policy: Optional[ScalingPolicy] = None) -> bool:
         """📈 Scale up by adding new agents"""
         try:
             # Check system resources before scaling
@@ -385,18 +391,30 @@ class DynamicScalingManager:
                 logger.warning("⚠️ Insufficient system resources for scaling up")
                 return False
             
+            agent_type = policy.agent_type if policy else "DataCollector"
+            hosted = self.agent_host is not None and agent_type in self.agent_host.agent_classes
+            placement = None
+            if hosted:
+                placement = (policy and policy.placement) or self.agent_host.placement_for(agent_type)
+            
             # Create new agents
             new_agents = []
             for i in range(count):
                 agent_id = f"scaled_agent_{int(time.time())}_{i}"
-                agent = await self.agent_factory.create_agent(agent_id, "DataCollector")
+                if hosted:
+                    # Out-of-process placement adds real CPU capacity instead of loop contention
+                    agent = await self.agent_host.start_agent(agent_type, agent_id, placement=placement)
+                else:
+                    agent = await self.agent_factory.create_agent(agent_id, agent_type)
+                    if agent:
+                        await agent.spawn()
                 
                 if agent:
-                    await agent.spawn()
                     new_agents.append(agent)
             
             if new_agents:
-                logger.info(f"📈 Successfully created {len(new_agents)} new agents")
+                where = f" ({placement.value})" if placement else ""
+                logger.info(f"📈 Successfully created {len(new_agents)} new {agent_type} agents{where}")
                 return True
             
             return False
@@ -477,6 +495,10 @@ class DynamicScalingManager:
                 payload={'reason': 'scaling_down'}
             )
             
+            # Stop it if we host it (joins the worker process for out-of-process agents)
+            if self.agent_host is not None and agent_id in self.agent_host.agents:
+                await self.agent_host.stop_agent(agent_id)
+            
             # Remove from tracking
             if agent_id in self.agent_metrics:
                 del self.agent_metrics[agent_id]
@@ -640,9 +662,17 @@ class MetricsCollector:
     
     async def _collect_agent_metrics(self):
         """📊 Collect metrics from all agents"""
-        # This would collect real metrics from agents
-        # For now, simulate metric collection
-        pass
+        # Out-of-process agents report real per-process CPU and RSS via the host
+        agent_host = self.scaling_manager.agent_host
+        if agent_host is None:
+            return
+        
+        for agent_id, info in agent_host.get_process_stats().items():
+            await self.scaling_manager.update_agent_metrics(agent_id, {
+                'cpu_usage': info['cpu_percent'],
+                'memory_usage': info['rss_mb'],
+                'active_tasks': info['running_tasks']
+            })
 
 
 class TrendPredictor:
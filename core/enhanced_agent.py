@@ -144,7 +144,8 @@ class EnhancedAutonomousAgent(AutonomousAgent, ABC):
             'health_check': self._handle_health_check,
             'performance_report': self._handle_performance_report,
             'task_assignment': self._handle_task_assignment,
-            'workflow_update': self._handle_workflow_update
+            'workflow_update': self._handle_workflow_update,
+            'vote_request': self._handle_vote_request
         })
     
     # =================== ENHANCED MESSAGING METHODS ===================
@@ -239,6 +240,18 @@ class EnhancedAutonomousAgent(AutonomousAgent, ABC):
             logger.error(f"❌ Command sending failed: {e}")
             raise
     
+    async def reply(self, request: AdvancedMessage, payload: Dict[str, Any]) -> Optional[str]:
+        """↩️ Answer a correlated request (routed straight to the requester's future)"""
+        try:
+            message_id = await self.message_bus.reply(request, payload, sender_id=self.agent_id)
+            if message_id:
+                self.message_stats['sent'] += 1
+            return message_id
+            
+        except Exception as e:
+            logger.error(f"❌ Reply to {request.sender_id} failed: {e}")
+            return None
+    
     async def notify_status_change(self, status: str, details: Dict[str, Any]):
         """📊 Notify other agents of status change"""
         try:
@@ -263,10 +276,10 @@ class EnhancedAutonomousAgent(AutonomousAgent, ABC):
         """💬 Enhanced communication loop with message bus integration"""
         while self.state != AgentState.TERMINATED:
             try:
-                # Process messages from enhanced message bus
-                message = await self.message_bus.get_agent_message(self.agent_id, timeout=0.1)
+                # Process messages from enhanced message bus (batch, highest priority first)
+                messages = await self.message_bus.get_agent_messages(self.agent_id, max_messages=32, timeout=0.1)
                 
-                if message:
+                for message in messages:
                     await self._handle_enhanced_message(message)
                     self.message_stats['received'] += 1
                 
@@ -338,6 +351,14 @@ class EnhancedAutonomousAgent(AutonomousAgent, ABC):
     async def _send_command_acknowledgment(self, original_message: AdvancedMessage):
         """✅ Send command acknowledgment"""
         try:
+            if original_message.correlation_id:
+                await self.reply(original_message, {
+                    'original_message_id': original_message.message_id,
+                    'acknowledged_at': datetime.now().isoformat(),
+                    'status': 'received'
+                })
+                return
+            
             ack_message = AdvancedMessage(
                 sender_id=self.agent_id,
                 message_type=MessageType.NOTIFICATION,
@@ -379,6 +400,15 @@ class EnhancedAutonomousAgent(AutonomousAgent, ABC):
         try:
             health_status = await self._get_health_status()
             
+            # Direct answer for correlated health checks (bus.request / scatter_gather)
+            if message.correlation_id:
+                await self.reply(message, {
+                    'agent_id': self.agent_id,
+                    'health': health_status,
+                    'timestamp': datetime.now().isoformat()
+                })
+                return
+            
             await self.publish_event(
                 event_name="health_status",
                 topic="system_events",
@@ -422,6 +452,23 @@ class EnhancedAutonomousAgent(AutonomousAgent, ABC):
     
     # =================== ENHANCED MONITORING ===================
     
+    async def _handle_vote_request(self, message: AdvancedMessage):
+        """🗳️ Answer a swarm consensus vote with a correlated reply"""
+        options = message.payload.get('options') or []
+        decision_id = message.payload.get('decision_id')
+        vote = await self._cast_vote(decision_id, options) if options else None
+        
+        await self.reply(message, {
+            'decision_id': decision_id,
+            'vote': vote,
+            'agent_id': self.agent_id
+        })
+        logger.debug(f"🗳️ Voted {vote} on {decision_id} for swarm {message.payload.get('swarm_id')}")
+    
+    async def _cast_vote(self, decision_id: str, options: List[str]) -> Optional[str]:
+        """🗳️ Pick one of the offered options (override for agent-specific preferences)"""
+        return options[0]
+    
     async def _update_message_performance_stats(self, message: AdvancedMessage):
         """📊 Update message performance statistics"""
         try:
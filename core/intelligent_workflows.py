@@ -5,6 +5,8 @@ Complex multi-agent workflow orchestration with dynamic adaptation
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
 import json
@@ -131,6 +133,8 @@ class IntelligentWorkflowOrchestrator:
         
         # Real-time monitoring
         self.workflow_monitors: Dict[str, asyncio.Task] = {}
+        self.workflow_engines: Dict[str, asyncio.Task] = {}
+        self.execution_contexts: Dict[str, Dict[str, Any]] = {}
         
         logger.info("🧠 IntelligentWorkflowOrchestrator initialized")
     
@@ -181,17 +185,19 @@ class IntelligentWorkflowOrchestrator:
             'task_results': {}
         }
         
+        self.execution_contexts[execution_id] = execution_context
+        
+        # Initialize task scheduler (dependency graph, in-degree counters, ready queue)
+        await self.task_scheduler.initialize_execution(workflow, execution_context)
+        
         # Start workflow monitor
         monitor_task = asyncio.create_task(
-            self._monitor_workflow_execution(execution_context)
+            self._monitor_workflow_execution(workflow, execution_context)
         )
         self.workflow_monitors[execution_id] = monitor_task
         
-        # Initialize task scheduler
-        await self.task_scheduler.initialize_execution(workflow, execution_context)
-        
         # Start execution engine
-        execution_task = asyncio.create_task(
+        self.workflow_engines[execution_id] = asyncio.create_task(
             self._execute_workflow_engine(workflow, execution_context)
         )
         
@@ -200,37 +206,45 @@ class IntelligentWorkflowOrchestrator:
         return execution_id
     
     async def _execute_workflow_engine(self, workflow: WorkflowDefinition, 
-                                     execution_context: Dict[str, Any]):
-        """⚙️ Core workflow execution engine"""
+                                     execution_context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ⚙️ Core workflow execution engine
+        
+        Event-driven: sleeps on the execution's wakeup event and only runs when a
+        task became ready, finished or failed, so workflow latency is the sum of
+        the actual task times along the critical path (no polling ticks).
+        """
+        wakeup = execution_context['wakeup']
         try:
             while execution_context['status'] == WorkflowStatus.RUNNING:
-                # Get ready tasks
+                # Clear before inspecting state so no completion can be missed
+                wakeup.clear()
+                
+                # Check if workflow is complete (or stopped by a failure)
+                if await self._check_workflow_completion(workflow, execution_context):
+                    break
+                
+                # Pop ready tasks (critical path first, up to the parallel limit)
                 ready_tasks = await self.task_scheduler.get_ready_tasks(
                     workflow, execution_context
                 )
                 
-                if not ready_tasks:
-                    # Check if workflow is complete
-                    if await self._check_workflow_completion(workflow, execution_context):
-                        execution_context['status'] = WorkflowStatus.COMPLETED
-                        break
+                if ready_tasks:
+                    execution_context['running'].update(task.task_id for task in ready_tasks)
                     
-                    # Wait for running tasks to complete
-                    await asyncio.sleep(1)
-                    continue
-                
-                # Schedule tasks for execution
-                scheduling_tasks = []
-                for task in ready_tasks:
-                    scheduling_tasks.append(
+                    # Execute task scheduling in parallel
+                    await asyncio.gather(*[
                         self._schedule_task_execution(task, workflow, execution_context)
-                    )
-                
-                # Execute task scheduling in parallel
-                await asyncio.gather(*scheduling_tasks, return_exceptions=True)
+                        for task in ready_tasks
+                    ], return_exceptions=True)
+                    
+                    for task in ready_tasks:
+                        if task.status == TaskStatus.FAILED:
+                            self.task_scheduler.on_task_failed(workflow, execution_context, task.task_id)
+                    continue
                 
-                # Brief pause to prevent busy waiting
-                await asyncio.sleep(0.1)
+                # Wait for a task to become ready or finish
+                await wakeup.wait()
             
             # Finalize workflow execution
             await self._finalize_workflow_execution(workflow, execution_context)
@@ -246,6 +260,92 @@ class IntelligentWorkflowOrchestrator:
             if execution_id in self.workflow_monitors:
                 self.workflow_monitors[execution_id].cancel()
                 del self.workflow_monitors[execution_id]
+            self.workflow_engines.pop(execution_id, None)
+            self.execution_contexts.pop(execution_id, None)
+        
+        return execution_context
+    
+    async def wait_for_execution(self, execution_id: str,
+                                 timeout: Optional[float] = None) -> Dict[str, Any]:
+        """⏳ Wait for a workflow execution to finish and return its execution context"""
+        engine = self.workflow_engines.get(execution_id)
+        if engine is not None:
+            return await asyncio.wait_for(asyncio.shield(engine), timeout)
+        
+        for entry in reversed(self.workflow_history):
+            if entry['execution_id'] == execution_id:
+                return entry
+        raise ValueError(f"Execution {execution_id} not found")
+    
+    async def _monitor_workflow_execution(self, workflow: WorkflowDefinition,
+                                          execution_context: Dict[str, Any]):
+        """⏱️ Enforce the workflow's global timeout"""
+        await asyncio.sleep(workflow.global_timeout)
+        if execution_context['status'] == WorkflowStatus.RUNNING:
+            logger.error(f"⏱️ Workflow {workflow.workflow_id} exceeded {workflow.global_timeout}s")
+            execution_context['status'] = WorkflowStatus.FAILED
+            execution_context['error'] = f"Global timeout ({workflow.global_timeout}s) exceeded"
+            execution_context['wakeup'].set()
+    
+    async def _check_workflow_completion(self, workflow: WorkflowDefinition,
+                                         execution_context: Dict[str, Any]) -> bool:
+        """🏁 Decide whether the execution is finished and set its final status"""
+        failed = [t.task_id for t in workflow.tasks.values() if t.status == TaskStatus.FAILED]
+        
+        if failed and workflow.failure_strategy == "stop":
+            execution_context['status'] = WorkflowStatus.FAILED
+            execution_context['error'] = f"Tasks failed: {failed}"
+            return True
+        
+        if execution_context['running'] or execution_context['ready_queue']:
+            return False
+        
+        waiting = [t.task_id for t in workflow.tasks.values() if t.status == TaskStatus.WAITING]
+        if waiting:
+            # Nothing running or ready can ever release these
+            execution_context['status'] = WorkflowStatus.FAILED
+            execution_context['error'] = f"Unresolvable dependencies: {waiting}"
+            return True
+        
+        completed = sum(1 for t in workflow.tasks.values() if t.status == TaskStatus.COMPLETED)
+        completion_ratio = completed / len(workflow.tasks) if workflow.tasks else 1.0
+        execution_context['status'] = (
+            WorkflowStatus.COMPLETED if completion_ratio >= workflow.completion_threshold
+            else WorkflowStatus.FAILED
+        )
+        return True
+    
+    async def _finalize_workflow_execution(self, workflow: WorkflowDefinition,
+                                           execution_context: Dict[str, Any]):
+        """📝 Record execution outcome and per-workflow statistics"""
+        completed_at = datetime.now()
+        duration = (completed_at - execution_context['started_at']).total_seconds()
+        execution_context['completed_at'] = completed_at
+        execution_context['duration_seconds'] = duration
+        succeeded = execution_context['status'] == WorkflowStatus.COMPLETED
+        
+        stats = self.execution_stats.setdefault(workflow.workflow_id, {
+            'executions': 0, 'successes': 0, 'avg_duration': 0.0, 'last_duration': 0.0
+        })
+        stats['executions'] += 1
+        stats['successes'] += 1 if succeeded else 0
+        stats['avg_duration'] += (duration - stats['avg_duration']) / stats['executions']
+        stats['last_duration'] = duration
+        
+        self.workflow_history.append({
+            'execution_id': execution_context['execution_id'],
+            'workflow_id': workflow.workflow_id,
+            'status': execution_context['status'],
+            'started_at': execution_context['started_at'],
+            'completed_at': completed_at,
+            'duration_seconds': duration,
+            'completed_tasks': execution_context['completed_tasks'],
+            'total_tasks': execution_context['total_tasks'],
+            'error': execution_context.get('error')
+        })
+        
+        icon = "✅" if succeeded else "❌"
+        logger.info(f"{icon} Workflow {workflow.workflow_id} {execution_context['status'].value} in {duration:.3f}s")
     
     async def _schedule_task_execution(self, task: WorkflowTask, 
                                      workflow: WorkflowDefinition,
@@ -377,17 +477,23 @@ class IntelligentWorkflowOrchestrator:
             return
         
         task = workflow.tasks[task_id]
+        execution_context = self._get_execution_context(execution_id)
+        
+        if execution_context and task_id not in execution_context['running']:
+            # Duplicate or late notification - counters were already released
+            logger.warning(f"⚠️ Ignoring completion for task {task_id} that is not running")
+            return
         
         if success:
             task.status = TaskStatus.COMPLETED
             task.result = result
             task.completed_at = datetime.now()
             
-            # Store result for dependent tasks
-            execution_context = self._get_execution_context(execution_id)
+            # Store result for dependent tasks and release them
             if execution_context:
                 execution_context['task_results'][task_id] = result
                 execution_context['completed_tasks'] += 1
+                self.task_scheduler.on_task_completed(workflow, execution_context, task_id)
             
             # Update agent performance stats
             await self._update_agent_performance(task)
@@ -397,6 +503,8 @@ class IntelligentWorkflowOrchestrator:
         else:
             # Handle task failure
             await self._handle_task_failure(task, result.get('error', 'Unknown error'))
+            if execution_context:
+                self.task_scheduler.on_task_failed(workflow, execution_context, task_id)
     
     async def _handle_task_failure(self, task: WorkflowTask, error_message: str):
         """❌ Handle task failure with retry logic"""
@@ -453,11 +561,17 @@ class IntelligentWorkflowOrchestrator:
         stats['reliability'] = recent_success_rate
     
     def _get_execution_context(self, execution_id: str) -> Optional[Dict[str, Any]]:
-        """📋 Get execution context by ID"""
-        # This would typically be stored in a database or memory store
-        # For now, implement as a simple lookup
-        # In production, this should be properly implemented
-        return None
+        """📋 Get execution context by ID (live executions only)"""
+        return self.execution_contexts.get(execution_id)
+    
+    def _estimate_task_duration(self, task: WorkflowTask) -> float:
+        """⏱️ Expected duration for critical-path ranking (observed average, else 1 unit)"""
+        durations = [
+            stats[task.task_type.value]['avg_duration']
+            for stats in self.agent_performance.values()
+            if stats.get(task.task_type.value, {}).get('total_tasks')
+        ]
+        return sum(durations) / len(durations) if durations else 1.0
     
     async def get_workflow_status(self, workflow_id: str) -> Dict[str, Any]:
         """📊 Get detailed workflow status"""
@@ -609,7 +723,14 @@ class IntelligentWorkflowOrchestrator:
             return workflow_def  # Return original if optimization fails
 
 class TaskScheduler:
-    """📅 Intelligent task scheduler"""
+    """
+    📅 Event-driven task scheduler
+    
+    Per execution it keeps in-degree counters from the dependency graph and a
+    ready heap ordered by remaining critical-path length (then task priority).
+    Completions decrement successor counters, so readiness is O(out-degree)
+    per completion instead of re-checking every task on a timer.
+    """
     
     def __init__(self, orchestrator):
         self.orchestrator = orchestrator
@@ -618,42 +739,90 @@ class TaskScheduler:
     async def initialize_execution(self, workflow: WorkflowDefinition,
                                  execution_context: Dict[str, Any]):
         """🚀 Initialize workflow execution"""
-        # Mark tasks with no dependencies as ready
-        for task in workflow.tasks.values():
-            if not task.dependencies:
-                task.status = TaskStatus.READY
+        graph = self.dependency_resolver.build_graph(workflow.tasks)
+        
+        execution_context.update({
+            'graph': graph,
+            'in_degree': dict(graph.in_degree()),
+            'critical_path': self._critical_path_lengths(graph, workflow),
+            'ready_queue': [],
+            'running': set(),
+            'wakeup': asyncio.Event(),
+            'sequence': itertools.count()
+        })
+        
+        # Reset task state and mark tasks with no dependencies as ready
+        for task_id, in_degree in execution_context['in_degree'].items():
+            task = workflow.tasks[task_id]
+            task.status = TaskStatus.WAITING
+            task.assigned_agent = None
+            task.error_message = None
+            task.attempts = 0
+            if in_degree == 0:
+                self.mark_ready(task, execution_context)
+    
+    def _critical_path_lengths(self, graph: nx.DiGraph,
+                               workflow: WorkflowDefinition) -> Dict[str, float]:
+        """🛤️ Longest expected duration from each task to the end of the workflow"""
+        lengths: Dict[str, float] = {}
+        for task_id in reversed(list(nx.topological_sort(graph))):
+            downstream = max((lengths[s] for s in graph.successors(task_id)), default=0.0)
+            lengths[task_id] = self.orchestrator._estimate_task_duration(workflow.tasks[task_id]) + downstream
+        return lengths
+    
+    def mark_ready(self, task: WorkflowTask, execution_context: Dict[str, Any]):
+        """📥 Push a task onto the ready heap and wake the engine"""
+        task.status = TaskStatus.READY
+        heapq.heappush(execution_context['ready_queue'], (
+            -execution_context['critical_path'][task.task_id],
+            -task.priority,
+            next(execution_context['sequence']),
+            task.task_id
+        ))
+        execution_context['wakeup'].set()
     
     async def get_ready_tasks(self, workflow: WorkflowDefinition,
                             execution_context: Dict[str, Any]) -> List[WorkflowTask]:
-        """📋 Get tasks ready for execution"""
+        """📋 Pop ready tasks, longest critical path first, up to the parallel limit"""
         ready_tasks = []
+        ready_queue = execution_context['ready_queue']
+        available_slots = workflow.parallel_limit - len(execution_context['running'])
         
-        for task in workflow.tasks.values():
-            if task.status == TaskStatus.WAITING:
-                # Check if dependencies are completed
-                if await self._dependencies_completed(task, workflow):
-                    task.status = TaskStatus.READY
-            
+        while ready_queue and len(ready_tasks) < available_slots:
+            task = workflow.tasks[heapq.heappop(ready_queue)[-1]]
             if task.status == TaskStatus.READY:
                 ready_tasks.append(task)
         
-        # Limit parallel execution
-        max_parallel = workflow.parallel_limit
-        running_tasks = sum(1 for t in workflow.tasks.values() 
-                          if t.status in [TaskStatus.ASSIGNED, TaskStatus.RUNNING])
-        
-        available_slots = max_parallel - running_tasks
-        return ready_tasks[:available_slots]
-    
-    async def _dependencies_completed(self, task: WorkflowTask,
-                                    workflow: WorkflowDefinition) -> bool:
-        """🔗 Check if task dependencies are completed"""
-        for dep_id in task.dependencies:
-            if dep_id in workflow.tasks:
-                dep_task = workflow.tasks[dep_id]
-                if dep_task.status != TaskStatus.COMPLETED:
-                    return False
-        return True
+        return ready_tasks
+    
+    def on_task_completed(self, workflow: WorkflowDefinition,
+                          execution_context: Dict[str, Any], task_id: str):
+        """✅ Release successors whose last dependency just completed"""
+        execution_context['running'].discard(task_id)
+        in_degree = execution_context['in_degree']
+        
+        for successor_id in execution_context['graph'].successors(task_id):
+            in_degree[successor_id] -= 1
+            if in_degree[successor_id] == 0:
+                self.mark_ready(workflow.tasks[successor_id], execution_context)
+        
+        execution_context['wakeup'].set()
+    
+    def on_task_failed(self, workflow: WorkflowDefinition,
+                       execution_context: Dict[str, Any], task_id: str):
+        """❌ Re-queue retried tasks; skip everything downstream of a permanent failure"""
+        execution_context['running'].discard(task_id)
+        task = workflow.tasks[task_id]
+        
+        if task.status == TaskStatus.READY:
+            self.mark_ready(task, execution_context)
+        elif task.status == TaskStatus.FAILED:
+            for descendant_id in nx.descendants(execution_context['graph'], task_id):
+                descendant = workflow.tasks[descendant_id]
+                if descendant.status == TaskStatus.WAITING:
+                    descendant.status = TaskStatus.SKIPPED
+        
+        execution_context['wakeup'].set()
 
 class DependencyResolver:
     """🔗 Workflow dependency resolution"""
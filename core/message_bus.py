@@ -9,20 +9,25 @@ PHASE 2 COMMUNICATION FEATURES:
 - Fault-tolerant messaging with retry logic and dead letter queues
 - Load balancing across agent instances
 - Message routing with topology awareness
+- Priority lanes per agent mailbox (CRITICAL never waits behind telemetry)
+- Correlation-id request/reply and scatter-gather (replies resolve futures directly)
+- Pluggable cross-process transport (core/bus_transport.py: Redis Streams / UNIX socket)
 - Performance monitoring and optimization
 """
 
 import asyncio
 import json
 import logging
+import os
 import time
 import uuid
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Any, Optional, Callable, Set
+from typing import Dict, List, Any, Optional, Callable, Set, Tuple
 import weakref
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +81,10 @@ class AdvancedMessage:
     timeout_seconds: float = 30.0
     requires_ack: bool = False        # Acknowledgment required
     
+    # Request/reply correlation
+    correlation_id: Optional[str] = None  # Set on requests and copied onto their replies
+    reply_to: Optional[str] = None        # Where replies go (defaults to sender_id)
+    
     # Timing and lifecycle
     created_at: datetime = field(default_factory=datetime.now)
     expires_at: Optional[datetime] = None
@@ -111,6 +120,8 @@ class AdvancedMessage:
             'max_retries': self.max_retries,
             'timeout_seconds': self.timeout_seconds,
             'requires_ack': self.requires_ack,
+            'correlation_id': self.correlation_id,
+            'reply_to': self.reply_to,
             'created_at': self.created_at.isoformat(),
             'expires_at': self.expires_at.isoformat() if self.expires_at else None,
             'routing_path': self.routing_path,
@@ -129,8 +140,16 @@ class MessageBusStats:
         
         self.delivery_times = deque(maxlen=1000)  # Last 1000 delivery times
         self.queue_sizes = defaultdict(lambda: deque(maxlen=100))
+        # Mailbox wait (enqueue -> dequeue) per priority, last 1000 each
+        self.queue_wait_times = defaultdict(lambda: deque(maxlen=1000))
         self.topic_message_counts = defaultdict(int)
         
+        # Request/reply
+        self.requests_sent = 0
+        self.replies_matched = 0
+        self.requests_timed_out = 0
+        self.round_trip_times = deque(maxlen=1000)
+        
         self.start_time = time.time()
     
     def record_message_sent(self, message: AdvancedMessage):
@@ -143,6 +162,25 @@ class MessageBusStats:
         self.messages_delivered += 1
         self.delivery_times.append(delivery_time)
     
+    def record_message_dequeued(self, message: AdvancedMessage, wait_time: float):
+        """📈 Record how long a message sat in its mailbox lane"""
+        self.queue_wait_times[message.priority.name].append(wait_time)
+    
+    def get_latency_percentiles(self) -> Dict[str, Dict[str, float]]:
+        """⏱️ p50/p95/p99 mailbox wait (ms) per priority"""
+        percentiles = {}
+        for priority, samples in self.queue_wait_times.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            last = len(ordered) - 1
+            percentiles[priority] = {
+                f'p{p}_ms': ordered[min(last, int(round(p / 100 * last)))] * 1000
+                for p in (50, 95, 99)
+            }
+            percentiles[priority]['samples'] = len(ordered)
+        return percentiles
+    
     def record_message_failed(self, message: AdvancedMessage):
         """📈 Record delivery failure"""
         self.messages_failed += 1
@@ -168,11 +206,109 @@ class MessageBusStats:
             'total_retried': self.messages_retried,
             'success_rate': self.messages_delivered / max(self.messages_sent, 1),
             'average_delivery_time_ms': avg_delivery_time * 1000,
+            'queue_wait_percentiles': self.get_latency_percentiles(),
+            'requests_sent': self.requests_sent,
+            'replies_matched': self.replies_matched,
+            'requests_timed_out': self.requests_timed_out,
+            'average_round_trip_ms': (sum(self.round_trip_times) / len(self.round_trip_times) * 1000
+                                      if self.round_trip_times else 0.0),
             'active_topics': len(self.topic_message_counts),
             'top_topics': dict(sorted(self.topic_message_counts.items(), 
                                     key=lambda x: x[1], reverse=True)[:10])
         }
 
+@dataclass
+class PendingReply:
+    """⏳ Outstanding request: resolved once `expected` replies have arrived"""
+    future: asyncio.Future
+    expected: int = 1
+    replies: List[AdvancedMessage] = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+
+class PriorityMailbox:
+    """
+    📬 Per-agent mailbox with one FIFO lane per MessagePriority
+    
+    - put_nowait never blocks and never spawns a task (False when full)
+    - get/get_nowait always serve the highest non-empty lane first
+    - drain(n) pulls a whole batch in priority order
+    """
+    
+    LANES = tuple(sorted(MessagePriority, key=lambda p: p.value, reverse=True))
+    
+    def __init__(self, maxsize: int = 1000):
+        self._maxsize = maxsize
+        self._lanes: Dict[MessagePriority, deque] = {priority: deque() for priority in self.LANES}
+        self._size = 0
+        self._waiters: deque = deque()
+    
+    def qsize(self) -> int:
+        return self._size
+    
+    def empty(self) -> bool:
+        return self._size == 0
+    
+    def full(self) -> bool:
+        return 0 < self._maxsize <= self._size
+    
+    def depth_by_priority(self) -> Dict[str, int]:
+        return {priority.name: len(lane) for priority, lane in self._lanes.items() if lane}
+    
+    def put_nowait(self, message: AdvancedMessage) -> bool:
+        """📥 Enqueue on the message's priority lane; False when the mailbox is full"""
+        if self.full():
+            return False
+        self._lanes[message.priority].append((message, time.perf_counter()))
+        self._size += 1
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+        return True
+    
+    def get_entry_nowait(self) -> Tuple[AdvancedMessage, float]:
+        """📤 (message, enqueued_at) from the highest non-empty lane"""
+        for priority in self.LANES:
+            lane = self._lanes[priority]
+            if lane:
+                self._size -= 1
+                return lane.popleft()
+        raise asyncio.QueueEmpty
+    
+    def get_nowait(self) -> AdvancedMessage:
+        return self.get_entry_nowait()[0]
+    
+    async def get_entry(self) -> Tuple[AdvancedMessage, float]:
+        """⏳ Wait until a message is available"""
+        while self._size == 0:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                waiter.cancel()
+                raise
+        return self.get_entry_nowait()
+    
+    async def get(self) -> AdvancedMessage:
+        return (await self.get_entry())[0]
+    
+    def drain_entries(self, max_messages: int) -> List[Tuple[AdvancedMessage, float]]:
+        """📦 Up to max_messages entries, highest priority first"""
+        batch = []
+        for priority in self.LANES:
+            lane = self._lanes[priority]
+            while lane and len(batch) < max_messages:
+                batch.append(lane.popleft())
+            if len(batch) >= max_messages:
+                break
+        self._size -= len(batch)
+        return batch
+    
+    def drain(self, max_messages: int) -> List[AdvancedMessage]:
+        return [message for message, _ in self.drain_entries(max_messages)]
+
 class AdvancedMessageBus:
     """
     🚀 PHASE 2 ADVANCED MESSAGE BUS
@@ -181,6 +317,7 @@ class AdvancedMessageBus:
     - Pub/Sub topic routing (NO request/response bullshit!)
     - Fault-tolerant delivery with retry logic
     - Load balancing across agent instances
+    - Priority-lane mailboxes with direct, task-free delivery
     - Dead letter queues for failed messages
     - Performance monitoring and optimization
     """
@@ -190,21 +327,34 @@ class AdvancedMessageBus:
         
         # Core message routing infrastructure
         self.topic_subscribers: Dict[str, Set[str]] = defaultdict(set)
-        self.agent_queues: Dict[str, asyncio.Queue] = {}
+        self.agent_queues: Dict[str, PriorityMailbox] = {}
         self.agent_handlers: Dict[str, weakref.WeakMethod] = {}
         
+        # Precomputed fan-out (rebuilt lazily after registration/subscription changes)
+        self._broadcast_recipients: Optional[Tuple[str, ...]] = None
+        self._topic_recipients: Dict[str, Tuple[str, ...]] = {}
+        
         # Load balancing for agent instances
         self.agent_instances: Dict[str, List[str]] = defaultdict(list)  # agent_type -> [instance_ids]
         self.instance_load: Dict[str, int] = defaultdict(int)  # instance_id -> current_load
         
         # Fault tolerance infrastructure
         self.pending_messages: Dict[str, AdvancedMessage] = {}  # message_id -> message
+        
+        # Request/reply: correlation_id -> waiting future; replies that beat their waiter
+        self.pending_replies: Dict[str, PendingReply] = {}
+        self.unclaimed_replies: OrderedDict = OrderedDict()  # correlation_id -> (reply, received_at)
+        self.max_unclaimed_replies = 256
+        self.unclaimed_reply_ttl = 60.0
         self.retry_queue: asyncio.Queue = asyncio.Queue()
         self.dead_letter_queue: asyncio.Queue = asyncio.Queue()
         
         # Performance monitoring
         self.stats = MessageBusStats()
         
+        # Cross-process transport (None = in-process only)
+        self.transport = None
+        
         # System state
         self.running = False
         self.background_tasks = []
@@ -226,6 +376,9 @@ class AdvancedMessageBus:
             asyncio.create_task(self._stats_reporter())
         ]
         
+        if self.transport is not None:
+            await self.transport.connect(self)
+        
         logger.info(f"🚀 AdvancedMessageBus {self.bus_id} started with {len(self.background_tasks)} background tasks")
     
     async def stop(self):
@@ -242,13 +395,27 @@ class AdvancedMessageBus:
         # Wait for tasks to finish
         await asyncio.gather(*self.background_tasks, return_exceptions=True)
         
+        if self.transport is not None:
+            await self.transport.close()
+        
         logger.info(f"🛑 AdvancedMessageBus {self.bus_id} stopped")
     
+    async def attach_transport(self, transport):
+        """🔌 Link this bus to other processes/pods through a BusTransport"""
+        self.transport = transport
+        for agent_type, instances in self.agent_instances.items():
+            if instances:
+                transport.join_group(agent_type)
+        if self.running:
+            await transport.connect(self)
+        logger.info(f"🔌 AdvancedMessageBus {self.bus_id} attached {type(transport).__name__}")
+    
     def register_agent(self, agent_id: str, agent_type: str = None, 
                       message_handler: Optional[Callable] = None):
         """📝 Register agent with the message bus"""
-        # Create message queue for agent
-        self.agent_queues[agent_id] = asyncio.Queue(maxsize=1000)
+        # Create priority mailbox for agent
+        self.agent_queues[agent_id] = PriorityMailbox(maxsize=1000)
+        self._invalidate_fanout()
         
         # Register message handler if provided
         if message_handler:
@@ -258,6 +425,8 @@ class AdvancedMessageBus:
         if agent_type:
             self.agent_instances[agent_type].append(agent_id)
             self.instance_load[agent_id] = 0
+            if self.transport is not None:
+                self.transport.join_group(agent_type)
         
         logger.info(f"📝 Registered agent {agent_id} (type: {agent_type or 'unknown'})")
     
@@ -282,19 +451,42 @@ class AdvancedMessageBus:
         # Remove from topic subscriptions
         for topic, subscribers in self.topic_subscribers.items():
             subscribers.discard(agent_id)
+        self._invalidate_fanout()
         
         logger.info(f"❌ Unregistered agent {agent_id}")
     
     def subscribe_to_topic(self, agent_id: str, topic: str):
         """📡 Subscribe agent to topic"""
         self.topic_subscribers[topic].add(agent_id)
+        self._topic_recipients.pop(topic, None)
         logger.info(f"📡 Agent {agent_id} subscribed to topic '{topic}'")
     
     def unsubscribe_from_topic(self, agent_id: str, topic: str):
         """📡 Unsubscribe agent from topic"""
         self.topic_subscribers[topic].discard(agent_id)
+        self._topic_recipients.pop(topic, None)
         logger.info(f"📡 Agent {agent_id} unsubscribed from topic '{topic}'")
     
+    def _invalidate_fanout(self):
+        """🧹 Drop precomputed fan-out after registry changes"""
+        self._broadcast_recipients = None
+        self._topic_recipients.clear()
+    
+    def _broadcast_fanout(self) -> Tuple[str, ...]:
+        """📢 Every registered mailbox (cached until registration changes)"""
+        if self._broadcast_recipients is None:
+            self._broadcast_recipients = tuple(self.agent_queues)
+        return self._broadcast_recipients
+    
+    def _topic_fanout(self, topic: str) -> Tuple[str, ...]:
+        """📡 Registered subscribers of a topic (cached until subscriptions change)"""
+        recipients = self._topic_recipients.get(topic)
+        if recipients is None:
+            subscribers = self.topic_subscribers.get(topic, ())
+            recipients = tuple(agent_id for agent_id in subscribers if agent_id in self.agent_queues)
+            self._topic_recipients[topic] = recipients
+        return recipients
+    
     async def publish(self, message: AdvancedMessage) -> str:
         """📢 Publish message to the bus (event-driven, NO request/response!)"""
         if not self.running:
@@ -306,6 +498,18 @@ class AdvancedMessageBus:
         # Record stats
         self.stats.record_message_sent(message)
         
+        # Replies go straight to the waiting future, never through a mailbox
+        if message.message_type == MessageType.RESULT and message.correlation_id:
+            if self._resolve_reply(message):
+                return message.message_id
+        
+        if self.transport is not None:
+            group = self._transport_group(message)
+            await self.transport.send(message, group)
+            if group is not None:
+                # Load-balanced across every node hosting the type (possibly this one)
+                return message.message_id
+        
         # Route message based on type and targeting
         await self._route_message(message)
         
@@ -314,6 +518,31 @@ class AdvancedMessageBus:
         
         return message.message_id
     
+    @staticmethod
+    def _transport_group(message: AdvancedMessage) -> Optional[str]:
+        """⚖️ Agent-type consumer group for load-balanced messages, None for fan-out"""
+        if (message.topic and not message.target_agents and not message.routing_tags and
+                message.message_type not in (MessageType.BROADCAST, MessageType.PUBLISH)):
+            return message.topic
+        return None
+    
+    async def receive_remote(self, message: AdvancedMessage, group: Optional[str] = None) -> bool:
+        """📥 Deliver a message that arrived over the transport; False = retry later"""
+        message.add_routing_step(f"remote@{self.bus_id}")
+        
+        if group is not None:
+            recipients = self._get_load_balanced_recipients(group, 1)
+            if not recipients:
+                return False
+            return self.agent_queues[recipients[0]].put_nowait(message)
+        
+        if message.message_type == MessageType.RESULT and message.correlation_id:
+            if self._resolve_reply(message):
+                return True
+        
+        await self._route_message(message)
+        return True
+    
     async def _route_message(self, message: AdvancedMessage):
         """🛣️ Route message to appropriate recipients"""
         start_time = time.time()
@@ -322,12 +551,11 @@ class AdvancedMessageBus:
         # Determine recipients based on message type and targeting
         if message.message_type == MessageType.BROADCAST:
             # Broadcast to all registered agents
-            recipients = set(self.agent_queues.keys())
+            recipients = self._broadcast_fanout()
             
         elif message.message_type == MessageType.PUBLISH:
             # Route to topic subscribers
-            if message.topic in self.topic_subscribers:
-                recipients = self.topic_subscribers[message.topic].copy()
+            recipients = self._topic_fanout(message.topic)
             
         elif message.target_agents:
             # Direct targeting
@@ -340,8 +568,7 @@ class AdvancedMessageBus:
         # Load balancing for agent types
         if not recipients and message.topic:
             # Try to find agents by type for load balancing
-            balanced_recipients = self._get_load_balanced_recipients(message.topic, 1)
-            recipients.update(balanced_recipients)
+            recipients = self._get_load_balanced_recipients(message.topic, 1)
         
         # Deliver to recipients
         if recipients:
@@ -350,7 +577,9 @@ class AdvancedMessageBus:
             # Only warn for non-broadcast messages without recipients
             if message.message_type != MessageType.BROADCAST:
                 logger.debug(f"📭 No recipients found for message {message.message_id} (type: {message.message_type.value})")
-            await self._handle_undeliverable_message(message)
+            # With a transport, recipients may live on another node
+            if self.transport is None:
+                await self._handle_undeliverable_message(message)
         
         # Record routing time
         routing_time = time.time() - start_time
@@ -390,59 +619,47 @@ class AdvancedMessageBus:
         
         return selected
     
-    async def _deliver_to_recipients(self, message: AdvancedMessage, recipients: Set[str]):
-        """📬 Deliver message to recipients"""
+    async def _deliver_to_recipients(self, message: AdvancedMessage, recipients):
+        """📬 Deliver message to recipients (direct enqueue, no per-recipient tasks)"""
         message.add_routing_step(f"deliver_to_{len(recipients)}_recipients")
         
-        delivery_tasks = []
+        successful_deliveries = 0
+        failed_recipients = []
         
         for recipient_id in recipients:
-            if recipient_id in self.agent_queues:
-                task = asyncio.create_task(
-                    self._deliver_to_agent(message, recipient_id)
-                )
-                delivery_tasks.append(task)
-        
-        # Wait for all deliveries to complete
-        if delivery_tasks:
-            results = await asyncio.gather(*delivery_tasks, return_exceptions=True)
-            
-            # Handle delivery results
-            successful_deliveries = sum(1 for r in results if r is True)
-            failed_deliveries = len(results) - successful_deliveries
-            
-            if successful_deliveries > 0:
-                delivery_time = time.time() - message.created_at.timestamp()
-                self.stats.record_message_delivered(message, delivery_time)
-            
-            if failed_deliveries > 0:
-                logger.warning(f"⚠️ {failed_deliveries}/{len(results)} deliveries failed "
-                             f"for message {message.message_id}")
+            mailbox = self.agent_queues.get(recipient_id)
+            if mailbox is None:
+                continue
+            if mailbox.put_nowait(message):
+                successful_deliveries += 1
+            else:
+                failed_recipients.append(recipient_id)
+        
+        if successful_deliveries > 0:
+            delivery_time = time.time() - message.created_at.timestamp()
+            self.stats.record_message_delivered(message, delivery_time)
+        
+        if failed_recipients:
+            logger.warning(f"⚠️ {len(failed_recipients)}/{successful_deliveries + len(failed_recipients)} "
+                         f"deliveries failed for message {message.message_id} (mailbox full)")
+            for recipient_id in failed_recipients:
+                await self._handle_delivery_failure(message, recipient_id, "queue_full")
     
     async def _deliver_to_agent(self, message: AdvancedMessage, agent_id: str) -> bool:
         """📬 Deliver message to specific agent"""
         try:
-            queue = self.agent_queues[agent_id]
+            mailbox = self.agent_queues[agent_id]
             
-            # Check if queue is full
-            if queue.full():
+            if not mailbox.put_nowait(message):
                 logger.warning(f"⚠️ Queue full for agent {agent_id}, message {message.message_id}")
                 await self._handle_delivery_failure(message, agent_id, "queue_full")
                 return False
             
-            # Add to queue with timeout
-            await asyncio.wait_for(queue.put(message), timeout=1.0)
-            
             message.add_routing_step(f"delivered_to_{agent_id}")
             logger.debug(f"📬 Delivered message {message.message_id} to agent {agent_id}")
             
             return True
             
-        except asyncio.TimeoutError:
-            logger.warning(f"⚠️ Timeout delivering to agent {agent_id}, message {message.message_id}")
-            await self._handle_delivery_failure(message, agent_id, "timeout")
-            return False
-            
         except Exception as e:
             logger.error(f"❌ Error delivering to agent {agent_id}: {e}")
             await self._handle_delivery_failure(message, agent_id, str(e))
@@ -540,6 +757,9 @@ class AdvancedMessageBus:
                     del self.pending_messages[msg_id]
                     self.stats.messages_expired += 1
                 
+                # Drop replies nobody claimed
+                self._prune_unclaimed_replies()
+                
                 if expired_messages:
                     logger.info(f"🧹 Cleaned up {len(expired_messages)} expired messages")
                 
@@ -588,33 +808,159 @@ class AdvancedMessageBus:
         
         return await self.publish(message)
     
-    async def wait_for_response(self, agent_id: str, correlation_id: str, 
-                               timeout: float = 5.0) -> Optional[Dict[str, Any]]:
-        """⏳ Wait for response from agent (mock implementation for testing)"""
-        # This is a simplified implementation for testing
-        # In production, this would use proper correlation ID tracking
-        await asyncio.sleep(0.1)  # Simulate processing time
-        return {'status': 'ok', 'correlation_id': correlation_id}
+    # =================== REQUEST / REPLY ===================
     
-    async def get_agent_message(self, agent_id: str, timeout: float = 0.1) -> Optional[AdvancedMessage]:
-        """📥 Get message for specific agent"""
-        if agent_id not in self.agent_queues:
-            return None
+    def _resolve_reply(self, reply: AdvancedMessage) -> bool:
+        """📬 Hand a reply to its waiting future (or park it briefly if none yet)"""
+        pending = self.pending_replies.get(reply.correlation_id)
+        if pending is None:
+            self.unclaimed_replies[reply.correlation_id] = (reply, time.monotonic())
+            self.unclaimed_replies.move_to_end(reply.correlation_id)
+            while len(self.unclaimed_replies) > self.max_unclaimed_replies:
+                self.unclaimed_replies.popitem(last=False)
+            return False
         
+        pending.replies.append(reply)
+        self.stats.replies_matched += 1
+        self.stats.round_trip_times.append(time.perf_counter() - pending.started_at)
+        if len(pending.replies) >= pending.expected and not pending.future.done():
+            pending.future.set_result(list(pending.replies))
+        return True
+    
+    def _prune_unclaimed_replies(self):
+        """🧹 Expire parked replies older than unclaimed_reply_ttl"""
+        cutoff = time.monotonic() - self.unclaimed_reply_ttl
+        while self.unclaimed_replies:
+            correlation_id, (_, received_at) = next(iter(self.unclaimed_replies.items()))
+            if received_at >= cutoff:
+                break
+            self.unclaimed_replies.popitem(last=False)
+    
+    def _expect_replies(self, correlation_id: str, expected: int = 1) -> PendingReply:
+        """📝 Register a waiter before the request goes out"""
+        pending = PendingReply(future=asyncio.get_running_loop().create_future(), expected=expected)
+        self.pending_replies[correlation_id] = pending
+        parked = self.unclaimed_replies.pop(correlation_id, None)
+        if parked is not None:
+            self._resolve_reply(parked[0])
+        return pending
+    
+    async def _await_replies(self, correlation_id: str, pending: PendingReply,
+                             timeout: float) -> List[AdvancedMessage]:
+        """⏳ Replies collected before the deadline; the waiter is always removed"""
         try:
-            message = await asyncio.wait_for(
-                self.agent_queues[agent_id].get(), 
-                timeout=timeout
-            )
-            
-            # Decrease load counter
-            if agent_id in self.instance_load:
-                self.instance_load[agent_id] = max(0, self.instance_load[agent_id] - 1)
-            
-            return message
-            
+            return await asyncio.wait_for(pending.future, timeout=timeout)
         except asyncio.TimeoutError:
+            self.stats.requests_timed_out += 1
+            return list(pending.replies)
+        finally:
+            self.pending_replies.pop(correlation_id, None)
+            if not pending.future.done():
+                pending.future.cancel()
+    
+    async def request(self, target_agent: str, event_name: str, payload: Dict[str, Any],
+                      timeout: float = 5.0, sender_id: str = "system",
+                      priority: MessagePriority = MessagePriority.HIGH) -> Optional[Dict[str, Any]]:
+        """📞 Send a request to one agent and await its reply payload (None on timeout)"""
+        replies = await self.scatter_gather({target_agent}, event_name, payload, min_replies=1,
+                                            timeout=timeout, sender_id=sender_id, priority=priority)
+        return next(iter(replies.values()), None)
+    
+    async def scatter_gather(self, target_agents: Set[str], event_name: str, payload: Dict[str, Any],
+                             min_replies: Optional[int] = None, timeout: float = 5.0,
+                             sender_id: str = "system",
+                             priority: MessagePriority = MessagePriority.HIGH) -> Dict[str, Dict[str, Any]]:
+        """
+        📡 Send one request to many agents and collect the first `min_replies` replies
+        
+        Returns {replying agent_id: reply payload}; on timeout, whatever arrived.
+        """
+        targets = set(target_agents)
+        if self.transport is None:
+            targets &= self.agent_queues.keys()
+        if not targets:
+            return {}
+        
+        message = AdvancedMessage(
+            sender_id=sender_id,
+            message_type=MessageType.COMMAND,
+            target_agents=targets,
+            event_name=event_name,
+            payload=payload,
+            priority=priority,
+            timeout_seconds=timeout
+        )
+        message.correlation_id = message.message_id
+        
+        pending = self._expect_replies(message.correlation_id,
+                                       expected=min(min_replies or len(targets), len(targets)))
+        self.stats.requests_sent += 1
+        await self.publish(message)
+        replies = await self._await_replies(message.correlation_id, pending, timeout)
+        return {reply.sender_id: reply.payload for reply in replies}
+    
+    async def reply(self, request: AdvancedMessage, payload: Dict[str, Any],
+                    sender_id: str = "system") -> Optional[str]:
+        """↩️ Answer a request; no-op for messages that were not requests"""
+        if not request.correlation_id:
             return None
+        
+        response = AdvancedMessage(
+            sender_id=sender_id,
+            message_type=MessageType.RESULT,
+            target_agents={request.reply_to or request.sender_id},
+            event_name=f"{request.event_name}_reply",
+            payload=payload,
+            priority=request.priority,
+            correlation_id=request.correlation_id
+        )
+        return await self.publish(response)
+    
+    async def wait_for_response(self, agent_id: str, correlation_id: str, 
+                               timeout: float = 5.0) -> Optional[Dict[str, Any]]:
+        """⏳ Wait for the reply carrying `correlation_id` (None on timeout)"""
+        pending = self._expect_replies(correlation_id)
+        replies = await self._await_replies(correlation_id, pending, timeout)
+        return replies[0].payload if replies else None
+    
+    async def get_agent_message(self, agent_id: str, timeout: float = 0.1) -> Optional[AdvancedMessage]:
+        """📥 Get message for specific agent (highest priority lane first)"""
+        messages = await self.get_agent_messages(agent_id, max_messages=1, timeout=timeout)
+        return messages[0] if messages else None
+    
+    async def get_agent_messages(self, agent_id: str, max_messages: int = 32,
+                                 timeout: float = 0.1) -> List[AdvancedMessage]:
+        """📦 Drain up to max_messages for an agent, waiting at most `timeout` for the first"""
+        mailbox = self.agent_queues.get(agent_id)
+        if mailbox is None:
+            return []
+        
+        if mailbox.empty():
+            try:
+                entries = [await asyncio.wait_for(mailbox.get_entry(), timeout=timeout)]
+            except asyncio.TimeoutError:
+                return []
+            entries.extend(mailbox.drain_entries(max_messages - 1))
+        else:
+            entries = mailbox.drain_entries(max_messages)
+        
+        now = time.perf_counter()
+        for message, enqueued_at in entries:
+            self.stats.record_message_dequeued(message, now - enqueued_at)
+        
+        # Decrease load counter
+        if agent_id in self.instance_load:
+            self.instance_load[agent_id] = max(0, self.instance_load[agent_id] - len(entries))
+        
+        return [message for message, _ in entries]
+    
+    def _queue_depth_by_priority(self) -> Dict[str, int]:
+        """📏 Messages waiting across all mailboxes, per priority"""
+        depth = defaultdict(int)
+        for mailbox in self.agent_queues.values():
+            for priority, count in mailbox.depth_by_priority().items():
+                depth[priority] += count
+        return dict(depth)
     
     def get_stats(self) -> Dict[str, Any]:
         """📊 Get comprehensive bus statistics"""
@@ -625,7 +971,10 @@ class AdvancedMessageBus:
             'active_topics': len(self.topic_subscribers),
             'queue_sizes': {agent_id: queue.qsize() 
                            for agent_id, queue in self.agent_queues.items()},
+            'queue_depth_by_priority': self._queue_depth_by_priority(),
+            'queue_wait_percentiles': self.stats.get_latency_percentiles(),
             'instance_loads': dict(self.instance_load),
+            'transport': self.transport.get_stats() if self.transport is not None else None,
             'performance': self.stats.get_performance_summary()
         }
 
@@ -641,8 +990,17 @@ def get_message_bus() -> AdvancedMessageBus:
     
     return _global_message_bus
 
-async def initialize_message_bus():
-    """🚀 Initialize global message bus"""
+async def initialize_message_bus(transport_url: Optional[str] = None):
+    """
+    🚀 Initialize global message bus
+    
+    transport_url (or LOLY_BUS_TRANSPORT): redis://host:6379/0 or unix:///path.sock
+    links this process's bus to the rest of the swarm.
+    """
     bus = get_message_bus()
+    transport_url = transport_url or os.environ.get('LOLY_BUS_TRANSPORT')
+    if transport_url and bus.transport is None:
+        from core.bus_transport import create_transport
+        await bus.attach_transport(create_transport(transport_url))
     await bus.start()
     return bus
\ No newline at end of file
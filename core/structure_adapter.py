@@ -4,37 +4,28 @@ Adaptive League Structure: Canonical schema and adapter interface
 
 Purpose: Give Loly a single, resilient match format that every league can map to.
 This enables pivoting across different league structures without breaking pipelines.
-"""
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Protocol
+CanonicalMatch is slotted and compact: the original payload is referenced (never
+copied) and the 8D dimensions are extracted from it only when first read, so a
+whole slate can be normalized without building per-match dicts.
+"""
 
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Tuple
 
-@dataclass
-class CanonicalMatch:
-    """Unified representation of a sports match/game across leagues."""
-    league_id: str
-    match_id: str
-    home_team: str
-    away_team: str
-    date: Optional[str] = None
-    time: Optional[str] = None
-    venue: Optional[str] = None
-    country_code: Optional[str] = None
-    status: Optional[str] = None
-    completed: Optional[bool] = None
-    source: Optional[str] = None
-    # Standardized 8D dimensions used by dashboards (values are percentages 0-100)
-    dimensions: Dict[str, float] = field(default_factory=dict)
-    # Original raw game payload for traceability/debug
-    raw: Dict[str, Any] = field(default_factory=dict)
 
+STANDARD_DIM_KEYS = (
+    "polymarket_odds",
+    "historical_matchups",
+    "weather_venue",
+    "sentiment",
+    "market_efficiency",
+    "team_performance",
+    "key_players",
+    "x_factor",
+)
 
-class LeagueAdapter(Protocol):
-    """Adapter contract to map arbitrary league game payloads into CanonicalMatch."""
-
-    def adapt(self, league_id: str, games: List[Dict[str, Any]]) -> List[CanonicalMatch]:
-        ...
+# payload -> 8 raw dimension values in STANDARD_DIM_KEYS order
+DimensionExtractor = Callable[[Dict[str, Any]], Iterable[Any]]
 
 
 def _safe_pct(value: Any) -> float:
@@ -49,16 +40,124 @@ def _safe_pct(value: Any) -> float:
         return 0.0
 
 
-STANDARD_DIM_KEYS = (
-    "polymarket_odds",
-    "historical_matchups",
-    "weather_venue",
-    "sentiment",
-    "market_efficiency",
-    "team_performance",
-    "key_players",
-    "x_factor",
-)
+def standard_dimension_values(payload: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Default extractor: the standardized keys straight off the payload."""
+    get = payload.get
+    return tuple(get(key, 0) for key in STANDARD_DIM_KEYS)
+
+
+class CanonicalMatch:
+    """Unified representation of a sports match/game across leagues."""
+
+    __slots__ = (
+        "league_id", "match_id", "home_team", "away_team", "date", "time", "venue",
+        "country_code", "status", "completed", "source", "_payload", "_extract", "_dims",
+    )
+
+    def __init__(self, league_id: str, match_id: str, home_team: str, away_team: str,
+                 date: Optional[str] = None, time: Optional[str] = None, venue: Optional[str] = None,
+                 country_code: Optional[str] = None, status: Optional[str] = None,
+                 completed: Optional[bool] = None, source: Optional[str] = None,
+                 dimensions: Optional[Dict[str, float]] = None, raw: Optional[Dict[str, Any]] = None,
+                 extract: Optional[DimensionExtractor] = None):
+        self.league_id = league_id
+        self.match_id = match_id
+        self.home_team = home_team
+        self.away_team = away_team
+        self.date = date
+        self.time = time
+        self.venue = venue
+        self.country_code = country_code
+        self.status = status
+        self.completed = completed
+        self.source = source
+        # Original raw game payload for traceability/debug - referenced, not copied
+        self._payload = raw
+        self._extract = extract
+        # Standardized 8D dimensions (0-100); explicit dims win over lazy extraction
+        self._dims: Optional[Tuple[float, ...]] = (
+            tuple(_safe_pct(dimensions.get(key, 0.0)) for key in STANDARD_DIM_KEYS)
+            if dimensions is not None else None
+        )
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        return self._payload if self._payload is not None else {}
+
+    @property
+    def dimension_values(self) -> Tuple[float, ...]:
+        """8D dimensions as a tuple in STANDARD_DIM_KEYS order (extracted on first read)."""
+        if self._dims is None:
+            if self._payload is None:
+                self._dims = (0.0,) * len(STANDARD_DIM_KEYS)
+            else:
+                extract = self._extract or standard_dimension_values
+                self._dims = tuple(_safe_pct(v) for v in extract(self._payload))
+        return self._dims
+
+    @property
+    def dimensions(self) -> Dict[str, float]:
+        """Standardized 8D dimensions used by dashboards (values are percentages 0-100)."""
+        return dict(zip(STANDARD_DIM_KEYS, self.dimension_values))
+
+    @property
+    def matchup(self) -> str:
+        return f"{self.away_team} @ {self.home_team}"
+
+    def to_record(self) -> Dict[str, Any]:
+        """Flat, JSON-ready record for persistence (no raw payload)."""
+        return {
+            "league_id": self.league_id,
+            "match_id": self.match_id,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "date": self.date,
+            "time": self.time,
+            "venue": self.venue,
+            "country_code": self.country_code,
+            "status": self.status,
+            "completed": self.completed,
+            "source": self.source,
+            "dimensions": self.dimensions,
+        }
+
+    def to_display_dict(self, index: int, *, id_prefix: Optional[str] = None, sport: Optional[str] = None,
+                        league: Optional[str] = None, data_source: Optional[str] = None) -> Dict[str, Any]:
+        """Dashboard card in the UNIFIED_GAME_SCHEMA shape (real_agents.leagues_registry)."""
+        raw = self.raw
+        return {
+            "id": f"{id_prefix or self.league_id.lower()}_game_{index}",
+            "sport": sport or self.league_id,
+            "league": league or self.league_id,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "time": self.time or self.date or "TBD",
+            "status": raw.get("status") or ("Final" if self.completed else "Scheduled"),
+            "matchup": self.matchup,
+            "venue": self.venue or "TBD",
+            "country_flag": self.country_code,
+            "original_league": self.league_id,
+            "real_data": True,
+            "data_source": data_source or self.source,
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CanonicalMatch):
+            return NotImplemented
+        return self.to_record() == other.to_record()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"CanonicalMatch(league_id={self.league_id!r}, match_id={self.match_id!r}, "
+                f"home_team={self.home_team!r}, away_team={self.away_team!r}, status={self.status!r})")
+
+
+class LeagueAdapter(Protocol):
+    """Adapter contract to map arbitrary league game payloads into CanonicalMatch."""
+
+    def adapt(self, league_id: str, games: List[Dict[str, Any]]) -> List[CanonicalMatch]:
+        ...
 
 
 def build_dimensions(**kwargs: Any) -> Dict[str, float]:
@@ -66,4 +165,4 @@ def build_dimensions(**kwargs: Any) -> Dict[str, float]:
     dims: Dict[str, float] = {}
     for key in STANDARD_DIM_KEYS:
         dims[key] = _safe_pct(kwargs.get(key, 0.0))
-    return dims
\ No newline at end of file
+    return dims
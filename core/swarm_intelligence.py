@@ -8,11 +8,14 @@ import asyncio
 import logging
 import time
 import numpy as np
-from typing import Dict, List, Set, Any, Optional, Tuple
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Set, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
 
+from core.capability_index import CapabilityIndex
+
 logger = logging.getLogger(__name__)
 
 class SwarmTopology(Enum):
@@ -66,8 +69,10 @@ class SwarmIntelligenceCoordinator:
         self.active_tasks: Dict[str, Dict[str, Any]] = {}
         self.completed_tasks: List[Dict[str, Any]] = []
         
+        # Inverted capability -> agent index; also holds load and pheromone arrays
+        self.capability_index = CapabilityIndex()
+        
         # Intelligence parameters
-        self.pheromone_trails: Dict[str, float] = {}  # Task routing optimization
         self.consensus_threshold = 0.67  # 2/3 majority for decisions
         self.adaptation_rate = 0.1       # Learning rate for performance updates
         self.heartbeat_timeout = 30      # Agent heartbeat timeout (seconds)
@@ -84,6 +89,11 @@ class SwarmIntelligenceCoordinator:
         
         logger.info(f"🧠 SwarmIntelligenceCoordinator {self.swarm_id} initialized")
     
+    @property
+    def pheromone_trails(self) -> Dict[str, float]:
+        """🐜 Task routing trails as 'task_type:agent_id' -> strength (non-default only)"""
+        return self.capability_index.trails()
+    
     async def register_agent(self, agent_id: str, agent_type: str, 
                            capabilities: Set[str] = None) -> SwarmRole:
         """🤖 Register agent with swarm and assign optimal role"""
@@ -101,6 +111,11 @@ class SwarmIntelligenceCoordinator:
         )
         
         self.agents[agent_id] = swarm_agent
+        self.capability_index.add(
+            agent_id, capabilities,
+            performance=swarm_agent.performance_score,
+            heartbeat=swarm_agent.last_heartbeat.timestamp()
+        )
         
         # Adapt topology if needed
         await self._adapt_topology()
@@ -109,6 +124,25 @@ class SwarmIntelligenceCoordinator:
         
         return role
     
+    async def unregister_agent(self, agent_id: str) -> bool:
+        """👋 Remove agent from swarm and capability index"""
+        if agent_id not in self.agents:
+            return False
+        
+        del self.agents[agent_id]
+        self.capability_index.remove(agent_id)
+        
+        await self._adapt_topology()
+        
+        logger.info(f"👋 Agent {agent_id} left swarm {self.swarm_id}")
+        return True
+    
+    def update_agent_performance(self, agent_id: str, performance_score: float):
+        """📈 Update an agent's performance score used by ACO selection"""
+        if agent_id in self.agents:
+            self.agents[agent_id].performance_score = performance_score
+            self.capability_index.performance[self.capability_index.slot_of(agent_id)] = performance_score
+    
     async def _determine_optimal_role(self, agent_id: str, agent_type: str, 
                                     capabilities: Set[str]) -> SwarmRole:
         """🎯 Determine optimal role for new agent"""
@@ -138,86 +172,127 @@ class SwarmIntelligenceCoordinator:
                             payload: Dict[str, Any], 
                             required_capabilities: Set[str] = None) -> bool:
         """📋 Intelligently distribute task to optimal agent(s)"""
-        required_capabilities = required_capabilities or set()
-        
-        # Find capable agents
-        capable_agents = [
-            agent for agent in self.agents.values()
-            if (not required_capabilities or 
-                required_capabilities.issubset(agent.capabilities))
-        ]
+        assignments = await self.distribute_tasks([{
+            'task_id': task_id,
+            'task_type': task_type,
+            'payload': payload,
+            'required_capabilities': required_capabilities
+        }])
+        return assignments[task_id] is not None
+    
+    async def distribute_tasks(self, batch: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+        """
+        📦 Assign a batch of tasks in one pass
+        
+        Each task is a dict with task_id, task_type, payload and optional
+        required_capabilities. Tasks sharing (task_type, capabilities) are
+        scored together against the capability index; returns task_id ->
+        agent_id (None when no capable agent exists).
+        """
+        index = self.capability_index
+        groups: Dict[Tuple[str, FrozenSet[str]], List[Dict[str, Any]]] = defaultdict(list)
+        for task in batch:
+            groups[(task['task_type'], frozenset(task.get('required_capabilities') or ()))].append(task)
+        
+        assignments: Dict[str, Optional[str]] = {}
+        for (task_type, required), tasks in groups.items():
+            capable_slots = index.candidate_slots(required)
+            if not capable_slots.size:
+                for task in tasks:
+                    logger.warning(f"⚠️ No capable agents found for task {task['task_id']}")
+                    assignments[task['task_id']] = None
+                continue
+            
+            # Ant Colony Optimization for task assignment
+            selected = self._select_slots_aco(capable_slots, task_type, len(tasks))
+            for task, slot in zip(tasks, selected):
+                assignments[task['task_id']] = index.agent_ids[slot]
+            
+            # Update pheromone trails and load for the whole group at once
+            index.deposit_slots(task_type, selected, 0.1)
+            np.add.at(index.load, selected, 1.0)
         
-        if not capable_agents:
-            logger.warning(f"⚠️ No capable agents found for task {task_id}")
-            return False
+        # Record and dispatch in submission order
+        for task in batch:
+            agent_id = assignments[task['task_id']]
+            if agent_id is not None:
+                await self._dispatch_task(task, agent_id)
         
-        # Ant Colony Optimization for task assignment
-        selected_agent = await self._select_agent_aco(capable_agents, task_type)
+        return assignments
+    
+    async def _dispatch_task(self, task: Dict[str, Any], agent_id: str):
+        """📤 Record the assignment and send it to the agent"""
+        task_id = task['task_id']
+        self.agents[agent_id].task_count += 1
         
         # Create task record
-        task_record = {
+        self.active_tasks[task_id] = {
             'task_id': task_id,
-            'task_type': task_type,
-            'assigned_agent': selected_agent.agent_id,
-            'payload': payload,
+            'task_type': task['task_type'],
+            'assigned_agent': agent_id,
+            'payload': task['payload'],
             'started_at': datetime.now(),
             'status': 'assigned'
         }
         
-        self.active_tasks[task_id] = task_record
-        
         # Send task to selected agent
         await self.message_bus.publish_to_agent(
-            target_agent=selected_agent.agent_id,
+            target_agent=agent_id,
             event_name="task_assignment",
             payload={
                 'task_id': task_id,
-                'task_type': task_type,
-                'data': payload,
+                'task_type': task['task_type'],
+                'data': task['payload'],
                 'swarm_id': self.swarm_id
             }
         )
         
-        # Update pheromone trails
-        trail_key = f"{task_type}:{selected_agent.agent_id}"
-        self.pheromone_trails[trail_key] = self.pheromone_trails.get(trail_key, 0.5) + 0.1
-        
-        logger.info(f"📋 Task {task_id} assigned to {selected_agent.agent_id}")
-        
-        return True
+        logger.info(f"📋 Task {task_id} assigned to {agent_id}")
     
-    async def _select_agent_aco(self, capable_agents: List[SwarmAgent], 
-                              task_type: str) -> SwarmAgent:
-        """🐜 Ant Colony Optimization for agent selection"""
-        if not capable_agents:
-            return None
-        
-        # Calculate selection probabilities
-        probabilities = []
-        
-        for agent in capable_agents:
-            # Pheromone strength (learning from past success)
-            trail_key = f"{task_type}:{agent.agent_id}"
-            pheromone = self.pheromone_trails.get(trail_key, 0.5)
-            
-            # Heuristic factors
-            performance_factor = agent.performance_score
-            availability_factor = 1.0 / max(1, agent.task_count)  # Prefer less loaded agents
-            recency_factor = 1.0 / max(1, (datetime.now() - agent.last_heartbeat).seconds)
-            
-            # Combined probability
-            probability = (pheromone ** 2) * performance_factor * availability_factor * recency_factor
-            probabilities.append(probability)
-        
-        # Probabilistic selection
-        total_prob = sum(probabilities)
-        if total_prob == 0:
-            return capable_agents[0]  # Fallback to first agent
+    async def complete_task(self, task_id: str, success: bool = True):
+        """✅ Move task to history and release the agent's load"""
+        task = self.active_tasks.pop(task_id, None)
+        if task is None:
+            return
         
-        normalized_probs = [p / total_prob for p in probabilities]
-        selected_index = np.random.choice(len(capable_agents), p=normalized_probs)
+        task['status'] = 'completed' if success else 'failed'
+        task['completed_at'] = datetime.now()
+        self.completed_tasks.append(task)
+        self.swarm_metrics['tasks_completed'] += 1 if success else 0
         
-        return capable_agents[selected_index]
+        agent_id = task['assigned_agent']
+        if agent_id in self.agents:
+            self.agents[agent_id].task_count = max(0, self.agents[agent_id].task_count - 1)
+            self.capability_index.add_load(agent_id, -1.0)
+    
+    def _select_slots_aco(self, slots: np.ndarray, task_type: str, count: int) -> np.ndarray:
+        """
+        🐜 Ant Colony Optimization over index rows
+        
+        Score = pheromone² x performance x availability x recency, computed for
+        all candidates at once. Within a batch each pick raises that agent's
+        load, so availability (1 / load) spreads the batch across agents.
+        """
+        index = self.capability_index
+        pheromone = index.pheromone(task_type)[slots]
+        seconds_since_heartbeat = np.floor(time.time() - index.heartbeat[slots])
+        base = (pheromone ** 2) * index.performance[slots] / np.maximum(1.0, seconds_since_heartbeat)
+        load = index.load[slots].copy()
+        
+        selected = np.empty(count, dtype=np.intp)
+        for i in range(count):
+            weights = base / np.maximum(1.0, load)
+            cumulative = np.cumsum(weights)
+            total = cumulative[-1]
+            if total <= 0:
+                choice = 0  # Fallback to first agent
+            else:
+                choice = min(int(np.searchsorted(cumulative, np.random.random() * total, side='right')),
+                             len(slots) - 1)
+            selected[i] = slots[choice]
+            load[choice] += 1.0
+        
+        return selected
     
     async def consensus_decision(self, decision_id: str, options: List[str], 
                                voting_agents: Set[str] = None) -> str:
@@ -269,28 +344,25 @@ class SwarmIntelligenceCoordinator:
                           options: List[str]) -> Optional[str]:
         """📊 Request vote from individual agent"""
         try:
-            # Send vote request
-            await self.message_bus.publish_to_agent(
+            # Send vote request and await the correlated reply
+            response = await self.message_bus.request(
                 target_agent=agent_id,
                 event_name="vote_request",
                 payload={
                     'decision_id': decision_id,
                     'options': options,
                     'swarm_id': self.swarm_id
-                }
+                },
+                timeout=5.0,
+                sender_id=self.swarm_id
             )
             
-            # Wait for response (with timeout)
-            response = await asyncio.wait_for(
-                self.message_bus.wait_for_response(agent_id, decision_id),
-                timeout=5.0
-            )
+            if response is None:
+                logger.warning(f"⏰ Vote timeout from agent {agent_id}")
+                return None
             
             return response.get('vote')
             
-        except asyncio.TimeoutError:
-            logger.warning(f"⏰ Vote timeout from agent {agent_id}")
-            return None
         except Exception as e:
             logger.error(f"❌ Vote request failed for {agent_id}: {e}")
             return None
@@ -348,10 +420,7 @@ class SwarmIntelligenceCoordinator:
         await self._update_swarm_efficiency()
         
         # Evaporate pheromone trails (prevents stagnation)
-        for trail_key in list(self.pheromone_trails.keys()):
-            self.pheromone_trails[trail_key] *= 0.95  # 5% evaporation
-            if self.pheromone_trails[trail_key] < 0.1:
-                del self.pheromone_trails[trail_key]
+        self.capability_index.evaporate(rate=0.05, floor=0.1)
     
     async def _handle_agent_failure(self, agent_id: str):
         """🚨 Handle agent failure and task reassignment"""
@@ -381,6 +450,8 @@ class SwarmIntelligenceCoordinator:
                 replacement_agent = min(capable_agents, key=lambda a: a.task_count)
                 task['assigned_agent'] = replacement_agent.agent_id
                 task['reassigned_at'] = datetime.now()
+                replacement_agent.task_count += 1
+                self.capability_index.add_load(replacement_agent.agent_id, 1.0)
                 
                 # Send task to replacement agent
                 await self.message_bus.publish_to_agent(
@@ -399,6 +470,7 @@ class SwarmIntelligenceCoordinator:
         
         # Remove failed agent from swarm
         del self.agents[agent_id]
+        self.capability_index.remove(agent_id)
         self.swarm_metrics['failed_agents'] += 1
         
         # Adapt topology after agent removal
@@ -484,6 +556,6 @@ class SwarmIntelligenceCoordinator:
         
         self.agents.clear()
         self.active_tasks.clear()
-        self.pheromone_trails.clear()
+        self.capability_index.clear()
         
         logger.warning(f"🚨 Swarm {self.swarm_id} emergency shutdown completed")
\ No newline at end of file
@@ -10,19 +10,155 @@ This service connects Loly to the local DeepSeek model for advanced reasoning:
 - 🎯 Prompt optimization for DeepSeek
 - 📊 Response quality assessment
 - 🔄 Fallback handling
+- 💾 Bounded response cache + coalescing of identical in-flight requests
 
 🔥 LOLY'S REAL BRAIN - NO BLOOM, JUST DEEPSEEK POWER! 🔥
 """
 
 import asyncio
 import aiohttp
+import hashlib
 import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import json
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_TTL = 600.0                 # seconds a cached completion stays valid
+DEFAULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+class LLMResponseCache:
+    """
+    💾 Bounded LLM response cache
+
+    - Keys are SHA-256 over everything that shapes the completion (model,
+      system prompt, full prompt, temperature, max_tokens)
+    - Least-recently-used entries are evicted beyond a byte budget
+    - Entries expire after a TTL
+    - Optional persistence: one JSON file per entry in cache_dir, reloaded on start
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CACHE_TTL, max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+                 cache_dir: Optional[str] = None):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+        self._entries: 'OrderedDict[str, Tuple[Dict[str, Any], float, int]]' = OrderedDict()  # key -> (response, stored_at, size)
+        self.total_bytes = 0
+        self.stats = {'evictions': 0, 'expirations': 0, 'disk_loads': 0}
+
+        if self.cache_dir:
+            self._load()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """🔑 Content hash of a completion request"""
+        payload = json.dumps([model, system_prompt, prompt, temperature, max_tokens], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """📥 Cached response (refreshes its LRU position), None if missing/expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[1] > self.ttl:
+            self.stats['expirations'] += 1
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: str, response: Dict[str, Any], stored_at: Optional[float] = None, persist: bool = True):
+        """📤 Store a response, evicting least-recently-used entries beyond the budget"""
+        body = json.dumps(response, default=str)
+        size = len(body.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._drop(key, delete_file=False)
+
+        stored_at = time.time() if stored_at is None else stored_at
+        self._entries[key] = (response, stored_at, size)
+        self.total_bytes += size
+        if persist and self.cache_dir:
+            self._write(key, {'stored_at': stored_at, 'response': response})
+
+        while self.total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self.stats['evictions'] += 1
+            self._drop(oldest)
+
+    def clear(self):
+        """🧹 Drop every entry (and its file)"""
+        for key in list(self._entries):
+            self._drop(key)
+
+    def _drop(self, key: str, delete_file: bool = True):
+        _, _, size = self._entries.pop(key)
+        self.total_bytes -= size
+        if delete_file and self.cache_dir:
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    # =================== PERSISTENCE ===================
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _write(self, key: str, record: Dict[str, Any]):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(record, f, default=str)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"⚠️ Could not persist LLM response {key[:12]}: {e}")
+
+    def _load(self):
+        """💾 Reload unexpired entries, oldest first so LRU order survives restarts"""
+        if not self.cache_dir.exists():
+            return
+        records = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                with open(path, 'r') as f:
+                    record = json.load(f)
+                records.append((float(record['stored_at']), path.stem, record['response']))
+            except (OSError, ValueError, KeyError, TypeError):
+                path.unlink(missing_ok=True)
+
+        now = time.time()
+        for stored_at, key, response in sorted(records):
+            if now - stored_at > self.ttl:
+                self._path(key).unlink(missing_ok=True)
+                continue
+            self.put(key, response, stored_at=stored_at, persist=False)
+            self.stats['disk_loads'] += 1
+        if self.stats['disk_loads']:
+            logger.info(f"💾 Loaded {self.stats['disk_loads']} cached LLM responses from {self.cache_dir}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'entries': len(self._entries), 'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes, 'ttl': self.ttl,
+                'persist_dir': str(self.cache_dir) if self.cache_dir else None}
+
 
 class DeepSeekIntegrationService:
     """
@@ -31,7 +167,9 @@ class DeepSeekIntegrationService:
     Connects Loly to local DeepSeek model for advanced reasoning!
     """
 
-    def __init__(self, deepseek_url: str = "http://localhost:8000", model_name: str = "deepseek-coder"):
+    def __init__(self, deepseek_url: str = "http://localhost:8000", model_name: str = "deepseek-coder",
+                 cache_enabled: bool = True, cache_ttl: float = DEFAULT_CACHE_TTL,
+                 cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES, cache_dir: Optional[str] = None):
         self.service_id = f"deepseek_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.deepseek_url = deepseek_url
         self.model_name = model_name
@@ -77,12 +215,19 @@ class DeepSeekIntegrationService:
             'failed_requests': 0,
             'total_tokens_used': 0,
             'average_response_time': 0.0,
-            'requests_by_task_type': {}
+            'requests_by_task_type': {},
+            'model_requests': 0,
+            'model_responses': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'coalesced_requests': 0
         }
+        self._latency = {kind: {'count': 0, 'total': 0.0} for kind in ('hit', 'miss', 'coalesced')}
 
-        # Cache for responses (optional optimization)
-        self.response_cache = {}
-        self.cache_enabled = False
+        # Bounded, content-hashed response cache + identical requests in flight
+        self.response_cache = LLMResponseCache(ttl=cache_ttl, max_bytes=cache_max_bytes, cache_dir=cache_dir)
+        self.cache_enabled = cache_enabled
+        self._inflight: Dict[str, asyncio.Task] = {}
 
         logger.info(f"🤖💀🤖 {self.service_id}: DeepSeek Integration Service initialized!")
         logger.info(f"   DeepSeek URL: {self.deepseek_url}")
@@ -91,58 +236,98 @@ class DeepSeekIntegrationService:
     async def call_deepseek(self, prompt: str, task_type: str = 'reasoning',
                            system_prompt: Optional[str] = None,
                            temperature: Optional[float] = None,
-                           max_tokens: Optional[int] = None) -> Dict[str, Any]:
+                           max_tokens: Optional[int] = None,
+                           use_cache: bool = True) -> Dict[str, Any]:
         """
         🤖 Call DeepSeek model for completion
 
+        Identical requests are answered from the response cache (when enabled),
+        and identical requests already in flight share one model call.
+
         Args:
             prompt: The prompt to send to DeepSeek
             task_type: Type of task (code, reasoning, creative, analysis)
             system_prompt: Optional custom system prompt
             temperature: Optional temperature override
             max_tokens: Optional max tokens override
+            use_cache: Set False to always ask the model (e.g. health checks)
 
         Returns:
             Response from DeepSeek with status and content
         """
+        self.stats['total_requests'] += 1
+        start_time = time.perf_counter()
+
+        # Track requests by task type
+        if task_type not in self.stats['requests_by_task_type']:
+            self.stats['requests_by_task_type'][task_type] = 0
+        self.stats['requests_by_task_type'][task_type] += 1
+
+        # Get task-specific config
+        task_config = self.task_configs.get(task_type, self.task_configs['reasoning'])
+
+        # Build request payload
+        request_data = {
+            'model': self.model_name,
+            'messages': [
+                {
+                    'role': 'system',
+                    'content': system_prompt or task_config['system_prompt']
+                },
+                {
+                    'role': 'user',
+                    'content': prompt
+                }
+            ],
+            'temperature': temperature if temperature is not None else task_config['temperature'],
+            'max_tokens': max_tokens if max_tokens is not None else task_config['max_tokens'],
+            'top_p': self.config['top_p'],
+            'frequency_penalty': self.config['frequency_penalty'],
+            'presence_penalty': self.config['presence_penalty']
+        }
+        cache_key = LLMResponseCache.make_key(
+            self.model_name, request_data['messages'][0]['content'], prompt,
+            request_data['temperature'], request_data['max_tokens']
+        )
+
+        # Check cache
+        use_cache = use_cache and self.cache_enabled
+        if use_cache:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                self.stats['cache_hits'] += 1
+                self.stats['successful_requests'] += 1
+                self._record_latency('hit', time.perf_counter() - start_time)
+                logger.info(f"✅ Cache hit for {task_type} task")
+                return {**cached, 'cached': True}
+            self.stats['cache_misses'] += 1
+
+        # Join an identical request that is already waiting on the model
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None and inflight.get_loop() is loop and not inflight.done():
+            self.stats['coalesced_requests'] += 1
+            logger.info(f"🔗 Coalesced {task_type} request with one already in flight")
+            kind = 'coalesced'
+        else:
+            inflight = self._inflight[cache_key] = loop.create_task(
+                self._request_deepseek(request_data, task_type, cache_key if use_cache else None))
+            inflight.add_done_callback(
+                lambda done: self._inflight.pop(cache_key, None) if self._inflight.get(cache_key) is done else None)
+            kind = 'miss'
+
+        response_data = dict(await asyncio.shield(inflight))
+        if kind == 'coalesced':
+            self.stats['successful_requests' if response_data['status'] == 'success' else 'failed_requests'] += 1
+        self._record_latency(kind, time.perf_counter() - start_time)
+        return response_data
+
+    async def _request_deepseek(self, request_data: Dict[str, Any], task_type: str,
+                                cache_key: Optional[str]) -> Dict[str, Any]:
+        """🌐 One model call (shared by every coalesced caller)"""
         try:
-            self.stats['total_requests'] += 1
             start_time = datetime.now()
-
-            # Track requests by task type
-            if task_type not in self.stats['requests_by_task_type']:
-                self.stats['requests_by_task_type'][task_type] = 0
-            self.stats['requests_by_task_type'][task_type] += 1
-
-            # Check cache
-            if self.cache_enabled:
-                cache_key = f"{task_type}:{prompt[:100]}"
-                if cache_key in self.response_cache:
-                    logger.info(f"✅ Cache hit for {task_type} task")
-                    return self.response_cache[cache_key]
-
-            # Get task-specific config
-            task_config = self.task_configs.get(task_type, self.task_configs['reasoning'])
-
-            # Build request payload
-            request_data = {
-                'model': self.model_name,
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': system_prompt or task_config['system_prompt']
-                    },
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ],
-                'temperature': temperature if temperature is not None else task_config['temperature'],
-                'max_tokens': max_tokens if max_tokens is not None else task_config['max_tokens'],
-                'top_p': self.config['top_p'],
-                'frequency_penalty': self.config['frequency_penalty'],
-                'presence_penalty': self.config['presence_penalty']
-            }
+            self.stats['model_requests'] += 1
 
             # Call DeepSeek API
             async with aiohttp.ClientSession() as session:
@@ -177,9 +362,8 @@ class DeepSeekIntegrationService:
                         }
 
                         # Cache if enabled
-                        if self.cache_enabled:
-                            cache_key = f"{task_type}:{prompt[:100]}"
-                            self.response_cache[cache_key] = response_data
+                        if cache_key is not None and self.cache_enabled:
+                            self.response_cache.put(cache_key, response_data)
 
                         logger.info(f"✅ DeepSeek {task_type} request successful ({tokens_used} tokens, {response_time:.2f}s)")
 
@@ -339,8 +523,9 @@ class DeepSeekIntegrationService:
         return await self.call_deepseek(prompt, task_type='creative')
 
     def _update_avg_response_time(self, response_time: float):
-        """Update average response time"""
-        total_requests = self.stats['successful_requests']
+        """Update average model response time"""
+        self.stats['model_responses'] += 1
+        total_requests = self.stats['model_responses']
         if total_requests > 0:
             current_avg = self.stats['average_response_time']
             self.stats['average_response_time'] = (
@@ -354,7 +539,8 @@ class DeepSeekIntegrationService:
             result = await self.call_deepseek(
                 "Reply with 'OK' if you can read this.",
                 task_type='reasoning',
-                max_tokens=10
+                max_tokens=10,
+                use_cache=False
             )
 
             if result['status'] == 'success':
@@ -384,6 +570,7 @@ class DeepSeekIntegrationService:
         success_rate = (
             (self.stats['successful_requests'] / max(self.stats['total_requests'], 1)) * 100
         )
+        lookups = self.stats['cache_hits'] + self.stats['cache_misses']
 
         return {
             'service_id': self.service_id,
@@ -395,9 +582,28 @@ class DeepSeekIntegrationService:
             'success_rate': success_rate,
             'total_tokens_used': self.stats['total_tokens_used'],
             'average_response_time': self.stats['average_response_time'],
-            'requests_by_task_type': self.stats['requests_by_task_type']
+            'requests_by_task_type': self.stats['requests_by_task_type'],
+            'model_requests': self.stats['model_requests'],
+            'cache': {
+                'enabled': self.cache_enabled,
+                'hits': self.stats['cache_hits'],
+                'misses': self.stats['cache_misses'],
+                'hit_rate': self.stats['cache_hits'] / max(lookups, 1) * 100,
+                'coalesced_requests': self.stats['coalesced_requests'],
+                'in_flight': len(self._inflight),
+                'latency_ms': {
+                    kind: round(latency['total'] / latency['count'] * 1000, 3) if latency['count'] else 0.0
+                    for kind, latency in self._latency.items()
+                },
+                **self.response_cache.get_stats()
+            }
         }
 
+    def _record_latency(self, kind: str, seconds: float):
+        """⏱️ Accumulate caller-observed latency per outcome (hit / miss / coalesced)"""
+        self._latency[kind]['count'] += 1
+        self._latency[kind]['total'] += seconds
+
     def enable_cache(self):
         """🔄 Enable response caching"""
         self.cache_enabled = True
@@ -418,6 +624,7 @@ class DeepSeekIntegrationService:
 # =================== FACTORY FUNCTION ===================
 
 def create_deepseek_service(deepseek_url: str = "http://localhost:8000",
-                           model_name: str = "deepseek-coder") -> DeepSeekIntegrationService:
+                           model_name: str = "deepseek-coder",
+                           cache_dir: Optional[str] = None) -> DeepSeekIntegrationService:
     """🏭 Factory function to create DeepSeek integration service"""
-    return DeepSeekIntegrationService(deepseek_url=deepseek_url, model_name=model_name)
+    return DeepSeekIntegrationService(deepseek_url=deepseek_url, model_name=model_name, cache_dir=cache_dir)
@@ -8,21 +8,27 @@ or if we just inflated confidence numbers without improving accuracy.
 
 🚨 BRUTALLY HONEST ACCURACY TESTING! 🚨
 
-Back tests last 20+ games for:
+Back tests every completed game in the window for:
 - MLS (American Soccer Cultural Mastery v2.0)
 - Ligue 1 (French Football Cultural Mastery v2.0) 
 - UEFA Europa League (European Cultural Mastery v2.0)
 
+⚡ Leagues and games run concurrently, fixtures are recorded on disk, progress is
+checkpointed (crashed runs resume), and --shard i/N splits a run across processes.
+Results land in data/backtests/results/<run_id>.json (merge shards with --merge).
+
 Created: November 1, 2025
 Purpose: Validate legendary status claims with REAL results
 """
 
+import argparse
 import asyncio
-import aiohttp
+import hashlib
 import logging
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
 import sys
 import os
 
@@ -31,11 +37,18 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from mls_real_algorithm import RealMLSAlgorithm
 from ligue1_real_algorithm import RealLigue1Algorithm
 from uefa_europa_league_real_algorithm import RealUEFAEuropaLeagueAlgorithm
+from real_agents.http_response_cache import fetch_cached_json, get_response_cache, MODE_REPLAY
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
 logger = logging.getLogger(__name__)
 
+# Scoreboards of finished days only change for late corrections - a week-old copy is fine
+PAST_SCOREBOARD_MAX_STALENESS = 7 * 24 * 3600
+
+DEFAULT_BACKTEST_DIR = Path(__file__).parent / "data" / "backtests"
+RESULTS_SCHEMA_VERSION = 1
+
 class LegendaryBackTester:
     """
     🔥💀🔥 LEGENDARY ALGORITHM BACK TESTER
@@ -44,8 +57,30 @@ class LegendaryBackTester:
     or if we just made confidence numbers higher without substance.
     """
     
-    def __init__(self):
-        """Initialize the brutal truth seeker"""
+    def __init__(self, as_of: datetime = None, concurrency: int = 8, max_games: Optional[int] = None,
+                 shard: Tuple[int, int] = (0, 1), output_dir: Path = DEFAULT_BACKTEST_DIR,
+                 refresh_fixtures: bool = False, resume: bool = True):
+        """
+        Initialize the brutal truth seeker
+
+        Args:
+            as_of: Day the back test looks back from (default: now). Pin it to
+                   re-run a recorded back test in replay mode.
+            concurrency: Algorithm calls in flight at once (across all leagues)
+            max_games: Most recent games per league to test (None = all)
+            shard: (index, count) - this process tests only its share of games
+            output_dir: Where fixtures, checkpoints and results are written
+            refresh_fixtures: Re-fetch completed games even if recorded on disk
+            resume: Continue from this run's checkpoint instead of starting over
+        """
+        self.as_of = as_of or datetime.now()
+        self.concurrency = max(1, concurrency)
+        self.max_games = max_games
+        self.shard = shard
+        self.output_dir = Path(output_dir)
+        self.refresh_fixtures = refresh_fixtures
+        self.resume = resume
+        self.results_file: Optional[Path] = None
         self.espn_api_base = "https://site.api.espn.com/apis/site/v2/sports/soccer"
         
         # Initialize our legendary algorithms
@@ -77,58 +112,81 @@ class LegendaryBackTester:
         
         logger.info("🔥💀🔥 Legendary Back Tester initialized - TRUTH SEEKER MODE ACTIVATED! 💀🔥💀")
     
+    def run_id(self, days_back: int) -> str:
+        """🏷️ Deterministic run name - the same parameters resume/overwrite the same run"""
+        shard_index, shard_count = self.shard
+        run_id = f"{self.as_of.strftime('%Y%m%d')}_{days_back}d"
+        if self.max_games:
+            run_id += f"_max{self.max_games}"
+        if shard_count > 1:
+            run_id += f"_shard{shard_index}of{shard_count}"
+        return run_id
+    
     async def back_test_all_leagues(self, days_back: int = 30) -> Dict[str, Any]:
         """
         🎯 MAIN BACK TEST: Test all legendary algorithms against real results
         
+        Leagues (and the games inside them) run concurrently, bounded by the
+        tester's concurrency limit. Finished games are checkpointed, so a
+        crashed run picks up where it stopped.
+        
         Args:
             days_back: How many days back to test (default 30 for good sample size)
             
         Returns:
             Comprehensive accuracy report for all leagues
         """
+        run_id = self.run_id(days_back)
         print("🔥💀🔥 LEGENDARY ALGORITHM BACK TESTING INITIATED! 💀🔥💀")
         print("=" * 80)
-        print(f"📅 Testing Period: Last {days_back} days")
+        print(f"📅 Testing Period: Last {days_back} days (as of {self.as_of.strftime('%Y-%m-%d')})")
+        print(f"🏷️ Run: {run_id} | ⚡ Concurrency: {self.concurrency}")
         print(f"🎯 Target: Validate legendary status claims")
         print(f"⚠️ BRUTAL HONESTY MODE: No fake inflation allowed!")
         print("=" * 80)
         
-        all_results = {}
+        checkpoint_path = self.output_dir / "checkpoints" / f"{run_id}.jsonl"
+        if not self.resume and checkpoint_path.exists():
+            checkpoint_path.unlink()
+        checkpoint = self._load_checkpoint(checkpoint_path)
+        if checkpoint:
+            print(f"♻️ Resuming: {sum(len(done) for done in checkpoint.values())} games already checkpointed")
+        
+        semaphore = asyncio.Semaphore(self.concurrency)
+        league_codes = list(self.leagues)
+        outcomes = await asyncio.gather(*(
+            self._back_test_league(league_code, self.leagues[league_code], days_back,
+                                   semaphore, checkpoint.get(league_code, {}), checkpoint_path)
+            for league_code in league_codes
+        ), return_exceptions=True)
         
-        for league_code, league_config in self.leagues.items():
-            print(f"\n🏆 TESTING {league_code}: {league_config['name']}")
+        all_results = {}
+        for league_code, league_results in zip(league_codes, outcomes):
+            if isinstance(league_results, BaseException):
+                logger.error(f"💀 Back test failed for {league_code}: {league_results}")
+                all_results[league_code] = {'error': str(league_results)}
+                continue
+            all_results[league_code] = league_results
+            
+            # Show league results
+            accuracy = league_results.get('accuracy_percentage', 0)
+            avg_confidence = league_results.get('average_confidence', 0)
+            games_tested = league_results.get('games_tested', 0)
+            
+            print(f"\n🏆 {league_code}: {self.leagues[league_code]['name']}")
             print("-" * 60)
+            print(f"📊 RESULTS for {league_code}:")
+            print(f"   🎮 Games Tested: {games_tested}")
+            print(f"   🎯 Accuracy: {accuracy:.1f}%")
+            print(f"   📈 Avg Confidence: {avg_confidence:.1f}%")
             
-            try:
-                league_results = await self._back_test_league(
-                    league_code, 
-                    league_config, 
-                    days_back
-                )
-                all_results[league_code] = league_results
-                
-                # Show immediate results
-                accuracy = league_results.get('accuracy_percentage', 0)
-                avg_confidence = league_results.get('average_confidence', 0)
-                games_tested = league_results.get('games_tested', 0)
-                
-                print(f"📊 RESULTS for {league_code}:")
-                print(f"   🎮 Games Tested: {games_tested}")
-                print(f"   🎯 Accuracy: {accuracy:.1f}%")
-                print(f"   📈 Avg Confidence: {avg_confidence:.1f}%")
-                
-                # Truth assessment
-                if accuracy >= avg_confidence * 0.9:  # Within 10% of claimed confidence
-                    print(f"   ✅ LEGENDARY STATUS: VALIDATED")
-                elif accuracy >= avg_confidence * 0.8:  # Within 20% 
-                    print(f"   ⚠️ LEGENDARY STATUS: QUESTIONABLE")
-                else:
-                    print(f"   ❌ LEGENDARY STATUS: INFLATED CLAIMS")
-                    
-            except Exception as e:
-                logger.error(f"💀 Back test failed for {league_code}: {e}")
-                all_results[league_code] = {'error': str(e)}
+            # Truth assessment
+            if accuracy >= avg_confidence * 0.9:  # Within 10% of claimed confidence
+                print(f"   ✅ LEGENDARY STATUS: VALIDATED")
+            elif accuracy >= avg_confidence * 0.8:  # Within 20% 
+                print(f"   ⚠️ LEGENDARY STATUS: QUESTIONABLE")
+            else:
+                print(f"   ❌ LEGENDARY STATUS: INFLATED CLAIMS")
         
         # Generate final report
         final_report = self._generate_final_report(all_results)
@@ -136,13 +194,18 @@ class LegendaryBackTester:
         print("=" * 80)
         print(final_report)
         
+        self.results_file = self._write_results(run_id, days_back, all_results)
         return all_results
     
-    async def _back_test_league(self, league_code: str, league_config: Dict, days_back: int) -> Dict[str, Any]:
+    async def _back_test_league(self, league_code: str, league_config: Dict, days_back: int,
+                                semaphore: asyncio.Semaphore = None, done: Dict[str, Dict] = None,
+                                checkpoint_path: Path = None) -> Dict[str, Any]:
         """
         🔍 Back test a specific league's legendary algorithm
         """
-        completed_games = await self._fetch_completed_games(league_config['espn_id'], days_back)
+        semaphore = semaphore or asyncio.Semaphore(self.concurrency)
+        done = dict(done or {})
+        completed_games = await self._load_completed_games(league_config['espn_id'], days_back)
         
         if not completed_games:
             return {
@@ -152,71 +215,91 @@ class LegendaryBackTester:
                 'average_confidence': 0
             }
         
-        print(f"📋 Found {len(completed_games)} completed games for back testing")
+        # game_number is the position in the full fixture list, so shards line up.
+        # max_games picks the window before sharding: N shards together test the
+        # same games as one unsharded run.
+        numbered = list(enumerate(completed_games, 1))
+        if self.max_games:
+            numbered = numbered[-self.max_games:]  # Most recent games
+        numbered = [(number, game) for number, game in numbered if self._in_shard(game)]
+        pending = [(number, game) for number, game in numbered if str(game['espn_id']) not in done]
         
-        # Test each game with our legendary algorithm
-        predictions = []
-        correct_predictions = 0
-        total_confidence = 0
+        print(f"📋 {league_code}: {len(numbered)} completed games to test "
+              f"({len(numbered) - len(pending)} from checkpoint)")
         
-        algorithm = league_config['algorithm']
-        method_name = league_config['algorithm_method']
+        algorithm_method = getattr(league_config['algorithm'], league_config['algorithm_method'])
         
-        for i, game in enumerate(completed_games[:20]):  # Test last 20 games max
-            try:
-                # Create game data for our algorithm
-                game_data = {
-                    'home_team': game['home_team'],
-                    'away_team': game['away_team'],
-                    'venue': game.get('venue', 'Unknown')
-                }
-                
-                # Apply our legendary algorithm
-                method = getattr(algorithm, method_name)
-                prediction_result = await method(game_data)
-                
-                # Extract prediction and confidence
-                algorithm_prediction = prediction_result.get('prediction', 'Unknown')
-                confidence = prediction_result.get('confidence', 50)
-                
-                # Determine actual winner
-                actual_winner = self._determine_actual_winner(game)
-                
-                # Check if our prediction was correct
-                is_correct = self._is_prediction_correct(algorithm_prediction, actual_winner, game)
-                
-                if is_correct:
-                    correct_predictions += 1
-                
-                total_confidence += confidence
-                
-                predictions.append({
-                    'game_number': i + 1,
-                    'matchup': f"{game['away_team']} @ {game['home_team']}",
-                    'algorithm_prediction': algorithm_prediction,
-                    'confidence': confidence,
-                    'actual_winner': actual_winner,
-                    'correct': is_correct,
-                    'home_score': game.get('home_score', 0),
-                    'away_score': game.get('away_score', 0)
-                })
-                
-                # Show progress
-                status = "✅" if is_correct else "❌"
-                print(f"   {status} Game {i+1}: {game['away_team']} @ {game['home_team']} - {confidence:.1f}% confidence")
-                
-            except Exception as e:
-                logger.error(f"💀 Error testing game {i+1}: {e}")
-                continue
+        async def test_game(number: int, game: Dict) -> None:
+            async with semaphore:
+                record = await self._test_game(algorithm_method, number, game)
+            if record is not None:
+                done[str(game['espn_id'])] = record
+                if checkpoint_path is not None:
+                    self._append_checkpoint(checkpoint_path, league_code, game['espn_id'], record)
         
-        # Calculate final metrics
+        await asyncio.gather(*(test_game(number, game) for number, game in pending))
+        
+        wanted = {str(game['espn_id']) for _, game in numbered}
+        predictions = sorted((record for espn_id, record in done.items() if espn_id in wanted),
+                             key=lambda record: record['game_number'])
+        return self._summarize_league(league_code, league_config['name'], predictions)
+    
+    async def _test_game(self, algorithm_method, number: int, game: Dict) -> Optional[Dict[str, Any]]:
+        """🎮 Run the algorithm on one completed game and grade it"""
+        try:
+            # Create game data for our algorithm
+            game_data = {
+                'home_team': game['home_team'],
+                'away_team': game['away_team'],
+                'venue': game.get('venue', 'Unknown')
+            }
+            
+            # Apply our legendary algorithm
+            prediction_result = await algorithm_method(game_data)
+            
+            # Extract prediction and confidence
+            algorithm_prediction = prediction_result.get('prediction', 'Unknown')
+            confidence = prediction_result.get('confidence', 50)
+            
+            # Determine actual winner
+            actual_winner = self._determine_actual_winner(game)
+            
+            # Check if our prediction was correct
+            is_correct = self._is_prediction_correct(algorithm_prediction, actual_winner, game)
+            
+            # Show progress
+            status = "✅" if is_correct else "❌"
+            print(f"   {status} Game {number}: {game['away_team']} @ {game['home_team']} - {confidence:.1f}% confidence")
+            
+            return {
+                'game_number': number,
+                'espn_id': str(game['espn_id']),
+                'date': game.get('date', ''),
+                'matchup': f"{game['away_team']} @ {game['home_team']}",
+                'algorithm_prediction': algorithm_prediction,
+                'confidence': confidence,
+                'actual_winner': actual_winner,
+                'correct': is_correct,
+                'home_score': game.get('home_score', 0),
+                'away_score': game.get('away_score', 0)
+            }
+            
+        except Exception as e:
+            logger.error(f"💀 Error testing game {number}: {e}")
+            return None
+    
+    @staticmethod
+    def _summarize_league(league_code: str, algorithm_name: str, predictions: List[Dict]) -> Dict[str, Any]:
+        """📊 League metrics from graded predictions"""
         games_tested = len(predictions)
+        correct_predictions = sum(1 for p in predictions if p['correct'])
+        total_confidence = sum(p['confidence'] for p in predictions)
         accuracy_percentage = (correct_predictions / games_tested * 100) if games_tested > 0 else 0
         average_confidence = total_confidence / games_tested if games_tested > 0 else 0
         
         return {
             'league': league_code,
-            'algorithm_name': league_config['name'],
+            'algorithm_name': algorithm_name,
             'games_tested': games_tested,
             'correct_predictions': correct_predictions,
             'accuracy_percentage': accuracy_percentage,
@@ -225,41 +308,73 @@ class LegendaryBackTester:
             'legendary_validated': accuracy_percentage >= average_confidence * 0.9
         }
     
-    async def _fetch_completed_games(self, league_id: str, days_back: int) -> List[Dict[str, Any]]:
+    def _in_shard(self, game: Dict) -> bool:
+        """🧩 Stable game -> shard assignment (hash of the ESPN event id)"""
+        shard_index, shard_count = self.shard
+        if shard_count <= 1:
+            return True
+        digest = hashlib.sha1(str(game.get('espn_id')).encode('utf-8')).hexdigest()
+        return int(digest, 16) % shard_count == shard_index
+    
+    # =================== FIXTURES ===================
+    
+    async def _load_completed_games(self, league_id: str, days_back: int) -> List[Dict[str, Any]]:
         """
-        📅 Fetch completed games from ESPN API for back testing
+        💾 Completed games for the window, recorded on disk after the first fetch
+        
+        Reruns with the same as-of date and window read the recorded fixture
+        file and never touch the network, so their results are reproducible.
         """
-        completed_games = []
+        fixture_path = self.output_dir / "fixtures" / f"{league_id}_{self.as_of.strftime('%Y%m%d')}_{days_back}d.json"
+        if fixture_path.exists() and not self.refresh_fixtures:
+            with open(fixture_path, 'r') as f:
+                games = json.load(f)['games']
+            logger.info(f"💾 Loaded {len(games)} recorded {league_id} games from {fixture_path.name}")
+            return games
         
-        async with aiohttp.ClientSession() as session:
-            # Search through recent dates for completed games
-            for days_ago in range(1, days_back + 1):
-                target_date = datetime.now() - timedelta(days=days_ago)
-                date_str = target_date.strftime("%Y%m%d")
-                
-                url = f"{self.espn_api_base}/{league_id}/scoreboard?dates={date_str}"
+        games = await self._fetch_completed_games(league_id, days_back)
+        if games:
+            fixture_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(fixture_path, 'w') as f:
+                json.dump({'league_id': league_id, 'as_of': self.as_of.strftime('%Y-%m-%d'),
+                           'days_back': days_back, 'games': games}, f, indent=2)
+        return games
+    
+    async def _fetch_completed_games(self, league_id: str, days_back: int) -> List[Dict[str, Any]]:
+        """
+        📅 Fetch completed games from ESPN API for back testing (every day concurrently)
+        """
+        async def fetch_day(days_ago: int) -> List[Dict[str, Any]]:
+            target_date = self.as_of - timedelta(days=days_ago)
+            date_str = target_date.strftime("%Y%m%d")
+            url = f"{self.espn_api_base}/{league_id}/scoreboard?dates={date_str}"
+            
+            games = []
+            try:
+                # Cached on disk - reruns (and --replay runs) don't hit ESPN again
+                data = await fetch_cached_json(url, timeout=10, max_staleness=PAST_SCOREBOARD_MAX_STALENESS)
+                events = data.get('events', []) if data else []
                 
-                try:
-                    async with session.get(url, timeout=10) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            events = data.get('events', [])
+                for event in events:
+                    # Only include completed games with final scores
+                    status = event.get('status', {})
+                    if status.get('type', {}).get('completed', False):
+                        game = self._parse_completed_game(event)
+                        if game:
+                            games.append(game)
                             
-                            for event in events:
-                                # Only include completed games with final scores
-                                status = event.get('status', {})
-                                if status.get('type', {}).get('completed', False):
-                                    game = self._parse_completed_game(event)
-                                    if game:
-                                        completed_games.append(game)
-                                        
-                except Exception as e:
-                    logger.debug(f"Error fetching date {date_str}: {e}")
-                    continue
-                
-                # Limit to avoid too many API calls
-                if len(completed_games) >= 25:
-                    break
+            except Exception as e:
+                logger.debug(f"Error fetching date {date_str}: {e}")
+            return games
+        
+        days = await asyncio.gather(*(fetch_day(days_ago) for days_ago in range(1, days_back + 1)))
+        
+        # Deduplicate (multi-day scoreboards repeat events) and order oldest first
+        unique = {}
+        for games in days:
+            for game in games:
+                unique[str(game['espn_id'])] = game
+        completed_games = sorted(unique.values(), key=lambda game: (game.get('date', ''), str(game['espn_id'])))
         
         logger.info(f"📊 Fetched {len(completed_games)} completed games for back testing")
         return completed_games
@@ -350,6 +465,48 @@ class LegendaryBackTester:
         # Default to false if we can't determine
         return False
     
+    # =================== CHECKPOINTS + RESULTS ===================
+    
+    @staticmethod
+    def _load_checkpoint(path: Path) -> Dict[str, Dict[str, Dict]]:
+        """♻️ league -> espn_id -> graded record, from a run's JSONL checkpoint"""
+        checkpoint = {}
+        if not path.exists():
+            return checkpoint
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn last line from a crash
+                checkpoint.setdefault(entry['league'], {})[str(entry['espn_id'])] = entry['record']
+        return checkpoint
+    
+    @staticmethod
+    def _append_checkpoint(path: Path, league_code: str, espn_id: str, record: Dict):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a') as f:
+            f.write(json.dumps({'league': league_code, 'espn_id': str(espn_id), 'record': record}) + "\n")
+    
+    def _write_results(self, run_id: str, days_back: int, all_results: Dict) -> Path:
+        """💾 Machine-readable results (same layout for every run, so runs diff cleanly)"""
+        results_path = self.output_dir / "results" / f"{run_id}.json"
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        shard_index, shard_count = self.shard
+        document = {
+            'schema_version': RESULTS_SCHEMA_VERSION,
+            'run_id': run_id,
+            'as_of': self.as_of.strftime('%Y-%m-%d'),
+            'days_back': days_back,
+            'max_games': self.max_games,
+            'shard': {'index': shard_index, 'count': shard_count},
+            'generated_at': datetime.now().isoformat(),
+            'leagues': all_results
+        }
+        with open(results_path, 'w') as f:
+            json.dump(document, f, indent=2, sort_keys=True, default=str)
+        return results_path
+    
     def _generate_final_report(self, all_results: Dict) -> str:
         """
         📊 Generate comprehensive final validation report
@@ -382,6 +539,8 @@ class LegendaryBackTester:
             status = "✅ VALIDATED" if validated else "❌ INFLATED"
             report.append(f"🏆 {league_code}:")
             report.append(f"   📊 Accuracy: {accuracy:.1f}% | Claimed: {confidence:.1f}% | {status}")
+            if results.get('partial'):
+                report.append(f"   ⚠️ PARTIAL: {len(results['shard_errors'])} shard(s) failed")
         
         # Overall metrics
         if leagues_tested > 0:
@@ -404,23 +563,109 @@ class LegendaryBackTester:
         return "\n".join(report)
 
 
+def merge_back_test_results(result_files: List[str]) -> Dict[str, Any]:
+    """
+    🧩 Combine shard results files into one run document
+    
+    Predictions are unioned per league (by ESPN event id) and the league
+    metrics recomputed, exactly as if one process had tested every game.
+    A league that failed in some shards keeps the games the other shards
+    tested and is flagged 'partial' with the failing shards in 'shard_errors'.
+    """
+    documents = []
+    for path in result_files:
+        with open(path, 'r') as f:
+            documents.append(json.load(f))
+    
+    leagues: Dict[str, Dict[str, Any]] = {}
+    names: Dict[str, str] = {}
+    errors: Dict[str, List[Dict[str, Any]]] = {}
+    for document in documents:
+        for league_code, results in document['leagues'].items():
+            if 'error' in results:
+                errors.setdefault(league_code, []).append(
+                    {'shard': document.get('shard', {}).get('index'), 'error': results['error']})
+                continue
+            names[league_code] = results.get('algorithm_name', league_code)
+            records = leagues.setdefault(league_code, {})
+            for record in results.get('predictions', []):
+                records[str(record['espn_id'])] = record
+    
+    merged_leagues: Dict[str, Dict[str, Any]] = {}
+    for league_code in sorted(set(leagues) | set(errors)):
+        if league_code not in leagues:
+            merged_leagues[league_code] = {
+                'error': '; '.join(sorted({entry['error'] for entry in errors[league_code]})),
+                'shard_errors': errors[league_code]
+            }
+            continue
+        summary = LegendaryBackTester._summarize_league(
+            league_code, names[league_code],
+            sorted(leagues[league_code].values(), key=lambda record: record['game_number']))
+        if league_code in errors:
+            logger.warning(f"⚠️ {league_code} merged from partial shards: {errors[league_code]}")
+            summary['partial'] = True
+            summary['shard_errors'] = errors[league_code]
+        merged_leagues[league_code] = summary
+    
+    first = documents[0]
+    merged = {
+        'schema_version': RESULTS_SCHEMA_VERSION,
+        'run_id': first['run_id'].split('_shard')[0],
+        'as_of': first['as_of'],
+        'days_back': first['days_back'],
+        'max_games': first.get('max_games'),
+        'shard': {'index': 0, 'count': 1, 'merged_from': len(documents)},
+        'generated_at': datetime.now().isoformat(),
+        'leagues': merged_leagues
+    }
+    return merged
+
+
 async def main():
     """Run the legendary algorithm back test"""
+    parser = argparse.ArgumentParser(description="Back test the legendary algorithms against ESPN results")
+    parser.add_argument("--days-back", type=int, default=21, help="Days to look back (default: 3 weeks)")
+    parser.add_argument("--as-of", help="Look back from this date (YYYY-MM-DD) instead of today")
+    parser.add_argument("--replay", action="store_true",
+                        help="Offline: use only recorded ESPN responses from the HTTP cache")
+    parser.add_argument("--concurrency", type=int, default=8, help="Algorithm calls in flight at once")
+    parser.add_argument("--max-games", type=int, help="Most recent games per league (default: all)")
+    parser.add_argument("--shard", default="0/1", help="Test only shard i of N, e.g. 0/4")
+    parser.add_argument("--refresh-fixtures", action="store_true",
+                        help="Re-fetch completed games instead of using recorded fixtures")
+    parser.add_argument("--fresh", action="store_true", help="Ignore this run's checkpoint and start over")
+    parser.add_argument("--output-dir", default=str(DEFAULT_BACKTEST_DIR),
+                        help="Fixtures, checkpoints and results directory")
+    parser.add_argument("--merge", nargs="+", metavar="RESULTS_FILE",
+                        help="Merge shard results files into one and exit")
+    args = parser.parse_args()
+    
+    if args.merge:
+        merged = merge_back_test_results(args.merge)
+        merged_file = Path(args.output_dir) / "results" / f"{merged['run_id']}.json"
+        merged_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(merged_file, 'w') as f:
+            json.dump(merged, f, indent=2, sort_keys=True, default=str)
+        print(f"🧩 Merged {len(args.merge)} shard files into: {merged_file}")
+        return
+
     print("🔥💀🔥 LEGENDARY ALGORITHM BACK TESTING SYSTEM 💀🔥💀")
     print("🎯 MISSION: Validate our cultural mastery claims with REAL results!")
     print()
     
-    tester = LegendaryBackTester()
-    results = await tester.back_test_all_leagues(days_back=21)  # 3 weeks back test
-    
-    # Save results to file for analysis
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    results_file = f"legendary_back_test_results_{timestamp}.json"
+    if args.replay:
+        get_response_cache().set_mode(MODE_REPLAY)
+        print("📼 REPLAY MODE: no network, recorded ESPN responses only")
     
-    with open(results_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    as_of = datetime.strptime(args.as_of, "%Y-%m-%d") if args.as_of else None
+    shard_index, shard_count = (int(part) for part in args.shard.split("/"))
+    tester = LegendaryBackTester(as_of=as_of, concurrency=args.concurrency, max_games=args.max_games,
+                                 shard=(shard_index, shard_count), output_dir=Path(args.output_dir),
+                                 refresh_fixtures=args.refresh_fixtures, resume=not args.fresh)
+    await tester.back_test_all_leagues(days_back=args.days_back)
     
-    print(f"\n💾 Detailed results saved to: {results_file}")
+    print(f"\n💾 Detailed results saved to: {tester.results_file}")
     print("🎯 LEGENDARY VALIDATION COMPLETE!")
 
 
@@ -26,17 +26,22 @@ Data Sources: French Football Federation, CIES Observatory, L'Équipe Statistica
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 import random
 
+from real_agents.slate_scoring import FactorModel, Slate, SlateScorer, SlateScores
+
 # Import confidence calibration system
 try:
-    from confidence_calibration_system import calibrate_ligue1_confidence
+    from confidence_calibration_system import calibrate_ligue1_confidence, calibrate_ligue1_confidence_array
 except ImportError:
     # Fallback if calibration system not available
     def calibrate_ligue1_confidence(confidence, factors=None):
         return confidence * 0.65, {'fallback': True}  # 35% reduction for Ligue 1
 
+    def calibrate_ligue1_confidence_array(confidence):
+        return confidence * 0.65
+
 logger = logging.getLogger(__name__)
 
 class RealLigue1Algorithm:
@@ -53,6 +58,18 @@ class RealLigue1Algorithm:
     - French football DNA: technical excellence and creative expression
     """
     
+    # ⚖️ apply_real_ligue1_algorithm's weights - for batch slate scoring
+    SLATE_MODEL = FactorModel(
+        factors=(
+            ('_calculate_le_classique_rivalry_deep_analysis', 0.30),
+            ('_calculate_psg_dominance_vs_french_tradition', 0.25),
+            ('_calculate_french_tactical_philosophy_mastery', 0.20),
+            ('_calculate_youth_development_academy_influence', 0.15),
+            ('_calculate_french_stadium_atmosphere_culture', 0.08),
+            ('_calculate_european_competition_pedigree', 0.02),
+        )
+    )
+    
     def __init__(self):
         # FRENCH CULTURAL MASTERY DATA (LEGENDARY EDITION)
         self.le_classique_cultural_warfare = {
@@ -230,6 +247,23 @@ class RealLigue1Algorithm:
             logger.error(f"Traceback: {traceback.format_exc()}")
             return game_data
 
+    async def score_slate(self, games: List[Dict]) -> SlateScores:
+        """
+        🏎️ Score a whole slate/season at once
+        
+        Same predictions and confidences as apply_real_ligue1_algorithm per game,
+        with factor columns, weights and calibration as array ops.
+        """
+        async def decide(game: Dict, confidence: float, factors: Dict[str, float]) -> Tuple[str, float]:
+            prediction = self._determine_ligue1_legendary_prediction(
+                game['home_team'], game['away_team'], confidence,
+                *(factors[name] for name in self.SLATE_MODEL.names[:5])
+            )
+            return prediction, confidence
+        
+        scorer = SlateScorer(self, self.SLATE_MODEL, calibrate=calibrate_ligue1_confidence_array, decide=decide)
+        return await scorer.score(Slate.from_games(games))
+
     async def _calculate_le_classique_rivalry_deep_analysis(self, game_data: Dict) -> float:
         """Calculate Le Classique rivalry deep analysis (30% weight - Psychological warfare + historical grudges)"""
         home_team = game_data.get('home_team', '').upper()
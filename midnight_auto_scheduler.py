@@ -12,20 +12,19 @@ MISSION:
 """
 
 import asyncio
-import aiohttp
 import json
 import logging
 from datetime import datetime, timedelta, time
 from pathlib import Path
 import pytz
 from typing import Dict, List, Any, Optional
-import schedule
-import threading
 
 # Import our learning components
 from real_agents.midnight_prediction_tracker import MidnightPredictionTracker
 from real_agents.hardcore_accuracy_critic import HardcoreAccuracyCritic
 from real_agents.season_long_learning_system import SeasonLongLearningSystem
+from real_agents.job_scheduler import AsyncJobScheduler, CronTrigger
+from real_agents.result_resolution_service import RESULT_RESOLVER, EventResult
 
 class MidnightAutoScheduler:
     def __init__(self):
@@ -38,44 +37,63 @@ class MidnightAutoScheduler:
         
         # Scheduler settings
         self.is_running = False
-        self.scheduler_thread = None
         
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
-        # ESPN API settings
+        # ESPN API settings (scoreboards are fetched once per league-day by the resolver)
         self.espn_api_base = "https://site.api.espn.com/apis/site/v2/sports"
+        self.result_resolver = RESULT_RESOLVER
         
         # Last update tracking
         self.last_update_file = Path("/tmp/midnight_last_update.json")
         
+        # Event-loop native job scheduler (Mexico City time)
+        self.job_scheduler = AsyncJobScheduler(tz=self.mexico_tz,
+                                               state_path=Path("/tmp/midnight_scheduler_state.json"))
+        self._register_jobs()
+        
+    def _register_jobs(self):
+        """📅 Register the automation jobs (results jobs share a group so they never interleave)"""
+        # Midnight updates
+        self.job_scheduler.add_job("midnight_update", self._run_midnight_update,
+                                   CronTrigger(minute=1, hour=0), group="results")
+        
+        # Daily accuracy checks
+        self.job_scheduler.add_job("daily_check", self._run_daily_accuracy_check,
+                                   CronTrigger(minute=0, hour=6))
+        
+        # Weekly brutal criticism (Sunday)
+        self.job_scheduler.add_job("weekly_criticism", self._run_weekly_brutal_criticism,
+                                   CronTrigger(minute=0, hour=23, day_of_week=0))
+        
+        # Hourly result checks (for completed games) + PROGOL checks - jittered, no catch-up
+        self.job_scheduler.add_job("hourly_check", self._check_completed_games_and_progol,
+                                   CronTrigger(minute=0), jitter_seconds=120, catch_up=False,
+                                   group="results")
+        
+    def setup_app(self, app):
+        """🔗 Run the jobs inside an aiohttp app's event loop; they stop on app cleanup"""
+        self.job_scheduler.setup_app(app)
+        
     async def start_scheduler(self):
         """
         🚀 START THE MIDNIGHT SCHEDULER!
         
-        This will run continuously and handle all automated updates
+        This will run continuously and handle all automated updates.
+        Safe to call repeatedly - jobs are only registered once.
         """
+        if self.job_scheduler.is_running:
+            return True
+        
         print("⏰🌙 STARTING MIDNIGHT AUTO-SCHEDULER 🌙⏰")
         print("🎯 Automated learning system ACTIVATED!")
         print("💀 No more manual updates - the machine learns continuously!")
         
         self.is_running = True
         
-        # Schedule midnight updates
-        schedule.every().day.at("00:01").do(self._run_midnight_update)
-        
-        # Schedule daily accuracy checks
-        schedule.every().day.at("06:00").do(self._run_daily_accuracy_check)
-        
-        # Schedule weekly brutal criticism
-        schedule.every().sunday.at("23:00").do(self._run_weekly_brutal_criticism)
-        
-        # Schedule hourly result checks (for completed games) + PROGOL checks
-        schedule.every().hour.do(self._check_completed_games_and_progol)
-        
-        # Start scheduler in thread
-        self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
-        self.scheduler_thread.start()
+        # Jobs run as tasks on the current event loop
+        self.job_scheduler.start()
         
         print("✅ MIDNIGHT SCHEDULER STARTED!")
         print("📅 Schedule:")
@@ -83,22 +101,16 @@ class MidnightAutoScheduler:
         print("   🌅 06:00 - Daily accuracy check") 
         print("   💀 23:00 Sunday - Weekly brutal criticism")
         print("   ⚡ Every hour - Check for completed games")
+        print("   🕐 Times are Mexico City time")
         
         return True
     
     def stop_scheduler(self):
         """Stop the scheduler"""
         self.is_running = False
-        if self.scheduler_thread:
-            self.scheduler_thread.join(timeout=5)
+        self.job_scheduler.stop()
         print("🛑 MIDNIGHT SCHEDULER STOPPED")
     
-    def _run_scheduler(self):
-        """Run the scheduler loop"""
-        while self.is_running:
-            schedule.run_pending()
-            threading.Event().wait(60)  # Check every minute
-    
     async def _run_midnight_update(self):
         """
         🌙 FULL MIDNIGHT SYSTEM UPDATE
@@ -117,11 +129,7 @@ class MidnightAutoScheduler:
             
             # Step 2: Update prediction results
             print("🎯 STEP 2: Updating prediction accuracy...")
-            updated_predictions = 0
-            for game in completed_games:
-                success = await self._update_game_result(game)
-                if success:
-                    updated_predictions += 1
+            updated_predictions = await self._update_game_results(completed_games)
             print(f"✅ Updated {updated_predictions} predictions")
             
             # Step 3: Generate brutal criticism report
@@ -208,8 +216,7 @@ class MidnightAutoScheduler:
             recent_games = await self._fetch_recent_completed_games(hours_back=4)
             if recent_games:
                 print(f"📊 Found {len(recent_games)} completed ESPN games")
-                for game in recent_games:
-                    await self._update_game_result(game)
+                await self._update_game_results(recent_games)
             
             # 🎰 NEW: Check PROGOL results automatically every hour
             progol_result = await self._check_progol_results()
@@ -226,8 +233,40 @@ class MidnightAutoScheduler:
         """⚡ Check for recently completed games (legacy)"""
         await self._check_completed_games_and_progol()
     
+    # Scoreboards checked by the result jobs - INCLUDING LIGA MX AND MLS!
+    COMPLETED_GAME_ENDPOINTS = [
+        ("soccer", "mex.1"),  # 🇲🇽 LIGA MX - MEXICAN FOOTBALL!
+        ("soccer", "usa.1"),  # 🇺🇸 MLS - MAJOR LEAGUE SOCCER!
+        ("soccer", "eng.1"),  # Premier League
+        ("soccer", "esp.1"),  # La Liga
+        ("soccer", "ger.1"),  # Bundesliga
+        ("soccer", "ita.1"),  # Serie A
+        ("soccer", "fra.1"),  # Ligue 1
+        ("soccer", "ned.1"),  # 🇳🇱 EREDIVISIE - DUTCH FOOTBALL!
+        ("soccer", "tur.1"),  # 🇹🇷 SUPERLIG - TURKISH FOOTBALL!
+        ("soccer", "uefa.champions"),  # 🏆 UEFA CHAMPIONS LEAGUE!
+        ("soccer", "conmebol.libertadores"),  # 🏆 COPA LIBERTADORES!
+        ("basketball", "nba"),  # NBA
+        ("basketball", "wnba"), # 🏀 WNBA - WOMEN'S BASKETBALL! 
+        ("football", "nfl"),   # NFL
+        ("baseball", "mlb")    # MLB
+    ]
+    
+    RECENT_GAME_ENDPOINTS = [
+        ("soccer", "mex.1"),  # 🇲🇽 LIGA MX - MEXICAN FOOTBALL!
+        ("soccer", "usa.1"),  # 🇺🇸 MLS - MAJOR LEAGUE SOCCER!
+        ("soccer", "eng.1"),  # Premier League
+        ("soccer", "esp.1"),  # La Liga
+        ("soccer", "ger.1"),  # Bundesliga
+        ("soccer", "ita.1"),  # Serie A
+        ("soccer", "uefa.champions"),  # 🏆 UEFA CHAMPIONS LEAGUE!
+        ("basketball", "nba"),  # NBA
+        ("football", "nfl"),   # NFL
+        ("baseball", "mlb")    # MLB
+    ]
+    
     async def _fetch_completed_games(self):
-        """Fetch completed games from ESPN API"""
+        """Fetch yesterday's completed games (one scoreboard per league, all leagues concurrently)"""
         completed_games = []
         
         try:
@@ -235,39 +274,8 @@ class MidnightAutoScheduler:
             yesterday = datetime.now(self.mexico_tz) - timedelta(days=1)
             date_str = yesterday.strftime('%Y%m%d')
             
-            # Major sports to check - INCLUDING LIGA MX AND MLS!
-            sports_endpoints = [
-                ("soccer", "mex.1"),  # 🇲🇽 LIGA MX - MEXICAN FOOTBALL!
-                ("soccer", "usa.1"),  # 🇺🇸 MLS - MAJOR LEAGUE SOCCER!
-                ("soccer", "eng.1"),  # Premier League
-                ("soccer", "esp.1"),  # La Liga
-                ("soccer", "ger.1"),  # Bundesliga
-                ("soccer", "ita.1"),  # Serie A
-                ("soccer", "fra.1"),  # Ligue 1
-                ("soccer", "ned.1"),  # 🇳🇱 EREDIVISIE - DUTCH FOOTBALL!
-                ("soccer", "tur.1"),  # 🇹🇷 SUPERLIG - TURKISH FOOTBALL!
-                ("soccer", "uefa.champions"),  # 🏆 UEFA CHAMPIONS LEAGUE!
-                ("soccer", "conmebol.libertadores"),  # 🏆 COPA LIBERTADORES!
-                ("basketball", "nba"),  # NBA
-                ("basketball", "wnba"), # 🏀 WNBA - WOMEN'S BASKETBALL! 
-                ("football", "nfl"),   # NFL
-                ("baseball", "mlb")    # MLB
-            ]
-            
-            async with aiohttp.ClientSession() as session:
-                for sport, league in sports_endpoints:
-                    try:
-                        url = f"{self.espn_api_base}/{sport}/{league}/scoreboard"
-                        params = {"dates": date_str}
-                        
-                        async with session.get(url, params=params) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                games = self._parse_espn_games(data, sport, league)
-                                completed_games.extend(games)
-                                
-                    except Exception as e:
-                        self.logger.warning(f"Failed to fetch {sport}/{league}: {e}")
+            events = await self.result_resolver.completed_events(self.COMPLETED_GAME_ENDPOINTS, [date_str])
+            completed_games = [self._event_to_game_info(event) for event in events]
                         
         except Exception as e:
             self.logger.error(f"Error fetching completed games: {e}")
@@ -280,63 +288,19 @@ class MidnightAutoScheduler:
         
         try:
             current_time = datetime.now(self.mexico_tz)
-            unique_games = {}  # Use dict to avoid duplicates by game key
             
-            # Check unique dates only (don't check same date multiple times)
-            dates_checked = set()
-            for hours_ago in range(0, hours_back + 24, 1):  # Check last N hours + 24 for safety
-                check_time = current_time - timedelta(hours=hours_ago)
-                date_str = check_time.strftime('%Y%m%d')
-                
-                # Skip if we already checked this date
-                if date_str in dates_checked:
-                    continue
-                dates_checked.add(date_str)
-                
-                # Major sports to check - INCLUDING LIGA MX!
-                sports_endpoints = [
-                    ("soccer", "mex.1"),  # 🇲🇽 LIGA MX - MEXICAN FOOTBALL!
-                    ("soccer", "usa.1"),  # 🇺🇸 MLS - MAJOR LEAGUE SOCCER!
-                    ("soccer", "eng.1"),  # Premier League
-                    ("soccer", "esp.1"),  # La Liga
-                    ("soccer", "ger.1"),  # Bundesliga
-                    ("soccer", "ita.1"),  # Serie A
-                    ("soccer", "uefa.champions"),  # 🏆 UEFA CHAMPIONS LEAGUE!
-                    ("basketball", "nba"),  # NBA
-                    ("football", "nfl"),   # NFL
-                    ("baseball", "mlb")    # MLB
-                ]
-                
-                async with aiohttp.ClientSession() as session:
-                    for sport, league in sports_endpoints:
-                        try:
-                            url = f"{self.espn_api_base}/{sport}/{league}/scoreboard"
-                            if date_str != datetime.now(self.mexico_tz).strftime('%Y%m%d'):
-                                url += f"?dates={date_str}"
-                                
-                            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                                if response.status == 200:
-                                    data = await response.json()
-                                    recent_games = self._parse_espn_games_recent(data, sport, league, hours_back)
-                                    
-                                    # Add games to unique dict to avoid duplicates
-                                    for game in recent_games:
-                                        game_key = f"{game['league']}_{game['home_team']}_{game['away_team']}_{game['date']}"
-                                        unique_games[game_key] = game
-                                    
-                                    if recent_games:
-                                        print(f"🎯 Found {len(recent_games)} completed {league} games from {date_str}")
-                                        
-                        except Exception as e:
-                            self.logger.warning(f"⚠️ Error checking {league} on {date_str}: {e}")
-                            continue
-                
-                # Don't check too many days for hourly checks
-                if len(dates_checked) >= 3:  # Only check last 3 unique dates
+            # Unique dates covering the last N hours + 24 for safety (at most 3 league-days each)
+            dates = []
+            for hours_ago in range(0, hours_back + 24):
+                date_str = (current_time - timedelta(hours=hours_ago)).strftime('%Y%m%d')
+                if date_str not in dates:
+                    dates.append(date_str)
+                if len(dates) >= 3:
                     break
             
-            # Convert back to list
-            completed_games = list(unique_games.values())
+            events = await self.result_resolver.completed_events(self.RECENT_GAME_ENDPOINTS, dates)
+            completed_games = [self._event_to_game_info(event) for event in events
+                               if self._completed_within(event, current_time, hours_back)]
                     
         except Exception as e:
             self.logger.error(f"💀 Error fetching recent completed games: {e}")
@@ -346,174 +310,53 @@ class MidnightAutoScheduler:
             
         return completed_games
     
-    def _parse_espn_games_recent(self, data: dict, sport: str, league: str, hours_back: int) -> List[dict]:
-        """Parse ESPN API response to extract recently completed games"""
-        games = []
-        current_time = datetime.now(self.mexico_tz)
-        
+    def _completed_within(self, event: EventResult, current_time: datetime, hours_back: int) -> bool:
+        """Whether a game started within the last hours_back hours (unparseable dates are kept to be safe)"""
         try:
-            events = data.get("events", [])
-            
-            for event in events:
-                # Check if game is completed
-                status = event.get("status", {})
-                if status.get("type", {}).get("completed", False):
-                    
-                    # Check if game completed within the specified hours
-                    event_date = event.get("date")
-                    if event_date:
-                        try:
-                            # Parse ESPN date format
-                            game_time = datetime.fromisoformat(event_date.replace('Z', '+00:00'))
-                            game_time = game_time.astimezone(self.mexico_tz)
-                            
-                            # Check if game completed within hours_back hours
-                            time_diff = current_time - game_time
-                            if time_diff.total_seconds() > hours_back * 3600:
-                                continue  # Too old, skip
-                                
-                        except Exception as e:
-                            # If we can't parse date, include it to be safe
-                            pass
-                    
-                    competitions = event.get("competitions", [])
-                    for competition in competitions:
-                        competitors = competition.get("competitors", [])
-                        
-                        if len(competitors) == 2:
-                            home_team = None
-                            away_team = None
-                            home_score = 0
-                            away_score = 0
-                            
-                            for competitor in competitors:
-                                team_name = competitor.get("team", {}).get("displayName", "Unknown")
-                                score = int(competitor.get("score", 0))
-                                
-                                if competitor.get("homeAway") == "home":
-                                    home_team = team_name
-                                    home_score = score
-                                else:
-                                    away_team = team_name
-                                    away_score = score
-                            
-                            # Determine result
-                            if home_score > away_score:
-                                result = "home_win"
-                                winner = home_team
-                            elif away_score > home_score:
-                                result = "away_win"
-                                winner = away_team
-                            else:
-                                result = "draw"
-                                winner = "draw"
-                            
-                            game_info = {
-                                "home_team": home_team,
-                                "away_team": away_team,
-                                "home_score": home_score,
-                                "away_score": away_score,
-                                "result": result,
-                                "winner": winner,
-                                "league": league,
-                                "sport": sport,
-                                "date": event_date,
-                                "status": "completed"
-                            }
-                            
-                            games.append(game_info)
-                            
-        except Exception as e:
-            self.logger.error(f"Error parsing {league} games: {e}")
-            
-        return games
+            game_time = datetime.fromisoformat(event.date.replace('Z', '+00:00')).astimezone(self.mexico_tz)
+        except (ValueError, AttributeError):
+            return True
+        return (current_time - game_time).total_seconds() <= hours_back * 3600
     
-    def _parse_espn_games(self, data: dict, sport: str, league: str) -> List[dict]:
-        """Parse ESPN API response to extract completed games"""
-        games = []
-        
-        try:
-            events = data.get("events", [])
-            
-            for event in events:
-                # Check if game is completed
-                status = event.get("status", {})
-                if status.get("type", {}).get("completed", False):
-                    
-                    competitions = event.get("competitions", [])
-                    for competition in competitions:
-                        competitors = competition.get("competitors", [])
-                        
-                        if len(competitors) == 2:
-                            home_team = None
-                            away_team = None
-                            home_score = 0
-                            away_score = 0
-                            
-                            for competitor in competitors:
-                                team_name = competitor.get("team", {}).get("displayName", "Unknown")
-                                score = int(competitor.get("score", 0))
-                                
-                                if competitor.get("homeAway") == "home":
-                                    home_team = team_name
-                                    home_score = score
-                                else:
-                                    away_team = team_name
-                                    away_score = score
-                            
-                            # Determine result
-                            if home_score > away_score:
-                                result = "home_win"
-                            elif away_score > home_score:
-                                result = "away_win"
-                            else:
-                                result = "draw"
-                            
-                            game_info = {
-                                "home_team": home_team,
-                                "away_team": away_team,
-                                "home_score": home_score,
-                                "away_score": away_score,
-                                "result": result,
-                                "sport": sport.upper(),
-                                "league": league.upper(),
-                                "date": event.get("date"),
-                                "espn_event_id": event.get("id")
-                            }
-                            
-                            games.append(game_info)
-                            
-        except Exception as e:
-            self.logger.error(f"Error parsing ESPN games: {e}")
-            
-        return games
+    def _event_to_game_info(self, event: EventResult) -> dict:
+        """Scoreboard event -> game info consumed by the prediction tracker"""
+        return {
+            "home_team": event.home_team,
+            "away_team": event.away_team,
+            "home_score": event.home_score,
+            "away_score": event.away_score,
+            "result": event.result,
+            "winner": event.winner,
+            "sport": event.sport.upper(),
+            "league": event.league.upper(),
+            "date": event.date,
+            "espn_event_id": event.event_id,
+            "status": "completed"
+        }
     
-    async def _update_game_result(self, game_info: dict):
-        """Update prediction result for a completed game"""
+    async def _update_game_results(self, games: List[dict]) -> int:
+        """Settle every completed game against the prediction store in one write"""
         try:
-            # Create game data in format expected by prediction tracker
-            game_data = {
+            game_results = [({
                 'home_team': game_info['home_team'],
                 'away_team': game_info['away_team'],
                 'league': game_info['league'],
                 'sport': game_info['sport'],
                 'date': game_info['date']
-            }
+            }, game_info['result']) for game_info in games]
             
-            # Update result
-            success = await self.prediction_tracker.update_game_result(
-                game_data, 
-                game_info['result']
-            )
-            
-            if success:
-                print(f"✅ Updated: {game_info['away_team']} @ {game_info['home_team']} - {game_info['result']}")
-            
-            return success
+            updated = await self.prediction_tracker.update_game_results(game_results)
+            if updated:
+                print(f"✅ Updated {updated} predictions from {len(games)} completed games")
+            return updated
             
         except Exception as e:
-            self.logger.error(f"Error updating game result: {e}")
-            return False
+            self.logger.error(f"Error updating game results: {e}")
+            return 0
+    
+    async def _update_game_result(self, game_info: dict):
+        """Update prediction result for a single completed game"""
+        return await self._update_game_results([game_info]) > 0
     
     async def _check_progol_results(self):
         """🎰 INTEGRATED PROGOL RESULT CHECKING 🎰"""
@@ -584,6 +427,8 @@ class MidnightAutoScheduler:
                 with open(self.last_update_file, 'r') as f:
                     timestamps = json.load(f)
             
+            jobs = self.job_scheduler.get_status()['jobs']
+            
             return {
                 "is_running": self.is_running,
                 "last_updates": timestamps,
@@ -593,7 +438,9 @@ class MidnightAutoScheduler:
                     "daily_check": "Every day at 06:00", 
                     "weekly_criticism": "Every Sunday at 23:00",
                     "hourly_check": "Every hour"
-                }
+                },
+                "next_runs": {name: job['next_run_at'] for name, job in jobs.items()},
+                "jobs": jobs
             }
             
         except Exception as e:
@@ -36,14 +36,20 @@ from datetime import datetime, timezone
 from typing import Dict, List, Any, Tuple
 import random
 
+from real_agents.slate_scoring import BonusRule, FactorModel, Slate, SlateScorer, SlateScores
+from real_agents.team_catalog import TEAM_CATALOG
+
 # Import confidence calibration system and pattern discovery
 try:
-    from confidence_calibration_system import calibrate_mls_confidence
+    from confidence_calibration_system import calibrate_mls_confidence, calibrate_mls_confidence_array
 except ImportError:
     # Fallback if calibration system not available
     def calibrate_mls_confidence(confidence, factors=None):
         return confidence * 0.7, {'fallback': True}  # Simple 30% reduction
 
+    def calibrate_mls_confidence_array(confidence):
+        return confidence * 0.7
+
 try:
     from mls_pattern_discovery_engine import MLSPatternDiscoveryEngine
 except ImportError:
@@ -94,6 +100,27 @@ class RealMLSAlgorithm:
     - Playoffs home advantage dominance (67% host win rate)
     """
     
+    # ⚖️ apply_real_mls_algorithm's weights, bonuses and cap - for batch slate scoring
+    SLATE_MODEL = FactorModel(
+        factors=(
+            ('_calculate_miami_messi_revolution', 0.25),
+            ('_calculate_mls_rivalry_culture', 0.20),
+            ('_calculate_american_travel_dynamics', 0.15),
+            ('_calculate_playoff_vs_regular_culture', 0.15),
+            ('_calculate_salary_cap_parity', 0.10),
+            ('_calculate_expansion_team_integration', 0.08),
+            ('_calculate_american_soccer_growth', 0.07),
+        ),
+        bonus_rules=(
+            BonusRule((('_calculate_mls_rivalry_culture', 95),), 5),        # El Trafico
+            BonusRule((('_calculate_miami_messi_revolution', 85),), 4),     # Messi
+            BonusRule((('_calculate_mls_rivalry_culture', 90),
+                       ('_calculate_american_travel_dynamics', 75)), 3),    # Cascadia Cup
+            BonusRule((('_calculate_american_soccer_growth', 80),), 2),     # Soccer growth
+        ),
+        cap=95
+    )
+    
     def __init__(self):
         logger.info("🇺🇸⚽ REAL MLS ALGORITHM - AMERICAN SOCCER CULTURAL MASTERY INITIALIZED!")
         
@@ -298,48 +325,12 @@ class RealMLSAlgorithm:
                 logger.warning(f"⚠️ Calibration failed, using fallback: {e}")
                 final_confidence = final_confidence * 0.65  # Emergency 35% reduction
             
-            # 🔥💀🔥 INTEGRATE PATTERN DISCOVERY ENGINE - SOLVE DRAW CRISIS! 💀🔥💀
-            match_context = {
-                'travel_distance_miles': self._estimate_travel_distance(home_team, away_team),
-                'home_conference': self._get_team_conference(home_team),
-                'away_conference': self._get_team_conference(away_team),
-                'days_rest': 7,  # Default assumption
-                'home_playoff_position': 'fighting',  # Default assumption
-                'away_playoff_position': 'fighting'
-            }
-            
-            # Get enhanced prediction with draw detection
-            enhanced_prediction = self.pattern_discovery.enhanced_mls_prediction(
-                home_team, away_team, match_context
-            )
-            
-            # 🔥💀🔥 USE HYBRID PREDICTION ENGINE - INTELLIGENT DECISION MAKING! 💀🔥💀
-            cultural_prediction = self._determine_mls_cultural_prediction(
+            prediction, final_confidence = self._decide_mls_prediction(
                 home_team, away_team, final_confidence,
                 miami_messi_revolution, rivalry_culture_factor, american_travel_dynamics,
                 playoff_culture_factor
             )
             
-            # 🎯💀🎯 ENHANCED HYBRID WITH PRECISION INTELLIGENCE! 💀🎯💀
-            
-            # Get precision intelligence
-            anti_draw_score, draw_precision_report = self.draw_precision.calculate_anti_draw_factors(
-                home_team, away_team, match_context
-            )
-            
-            upset_score, away_upset_report = self.away_upset_detector.detect_away_upset_potential(
-                home_team, away_team, match_context
-            )
-            
-            # Enhanced decision making with precision intelligence
-            prediction, final_confidence = self._enhanced_prediction_decision(
-                cultural_prediction, final_confidence, enhanced_prediction,
-                anti_draw_score, draw_precision_report, upset_score, away_upset_report,
-                home_team, away_team
-            )
-            
-            logger.info(f"🎯 ENHANCED DECISION: Anti-draw:{anti_draw_score:.2f}, Upset:{upset_score:.2f} - {prediction}")
-            
             analyzed_game = {
                 'id': game_data.get('id', f'MLS_{random.randint(1000, 9999)}'),
                 'sport': 'MLS',
@@ -393,6 +384,74 @@ class RealMLSAlgorithm:
             logger.error(f"Traceback: {traceback.format_exc()}")
             return game_data
 
+    async def score_slate(self, games: List[Dict]) -> SlateScores:
+        """
+        🏎️ Score a whole slate/season at once
+        
+        Same predictions and confidences as apply_real_mls_algorithm per game,
+        with factor columns, weights, bonuses, cap and calibration as array ops.
+        """
+        async def decide(game: Dict, confidence: float, factors: Dict[str, float]) -> Tuple[str, float]:
+            return self._decide_mls_prediction(
+                game['home_team'], game['away_team'], confidence,
+                factors['_calculate_miami_messi_revolution'], factors['_calculate_mls_rivalry_culture'],
+                factors['_calculate_american_travel_dynamics'], factors['_calculate_playoff_vs_regular_culture']
+            )
+        
+        scorer = SlateScorer(self, self.SLATE_MODEL, calibrate=calibrate_mls_confidence_array, decide=decide)
+        return await scorer.score(Slate.from_games(games))
+
+    def _decide_mls_prediction(self, home_team: str, away_team: str, final_confidence: float,
+                               miami_messi_revolution: float, rivalry_culture_factor: float,
+                               american_travel_dynamics: float, playoff_culture_factor: float) -> Tuple[str, float]:
+        """
+        🎯 Decision step after calibration: pattern discovery, hybrid cultural
+        prediction and precision intelligence (shared by the scalar and slate paths)
+        """
+        # 🔥💀🔥 INTEGRATE PATTERN DISCOVERY ENGINE - SOLVE DRAW CRISIS! 💀🔥💀
+        match_context = {
+            'travel_distance_miles': self._estimate_travel_distance(home_team, away_team),
+            'home_conference': self._get_team_conference(home_team),
+            'away_conference': self._get_team_conference(away_team),
+            'days_rest': 7,  # Default assumption
+            'home_playoff_position': 'fighting',  # Default assumption
+            'away_playoff_position': 'fighting'
+        }
+        
+        # Get enhanced prediction with draw detection
+        enhanced_prediction = self.pattern_discovery.enhanced_mls_prediction(
+            home_team, away_team, match_context
+        )
+        
+        # 🔥💀🔥 USE HYBRID PREDICTION ENGINE - INTELLIGENT DECISION MAKING! 💀🔥💀
+        cultural_prediction = self._determine_mls_cultural_prediction(
+            home_team, away_team, final_confidence,
+            miami_messi_revolution, rivalry_culture_factor, american_travel_dynamics,
+            playoff_culture_factor
+        )
+        
+        # 🎯💀🎯 ENHANCED HYBRID WITH PRECISION INTELLIGENCE! 💀🎯💀
+        
+        # Get precision intelligence
+        anti_draw_score, draw_precision_report = self.draw_precision.calculate_anti_draw_factors(
+            home_team, away_team, match_context
+        )
+        
+        upset_score, away_upset_report = self.away_upset_detector.detect_away_upset_potential(
+            home_team, away_team, match_context
+        )
+        
+        # Enhanced decision making with precision intelligence
+        prediction, final_confidence = self._enhanced_prediction_decision(
+            cultural_prediction, final_confidence, enhanced_prediction,
+            anti_draw_score, draw_precision_report, upset_score, away_upset_report,
+            home_team, away_team
+        )
+        
+        logger.info(f"🎯 ENHANCED DECISION: Anti-draw:{anti_draw_score:.2f}, Upset:{upset_score:.2f} - {prediction}")
+        
+        return prediction, final_confidence
+
     async def _calculate_miami_messi_revolution(self, game_data: Dict) -> float:
         """Calculate Inter Miami Messi Revolution (25% weight - REAL $46.8M Messi disruption)"""
         home_team = game_data.get('home_team', '').upper()
@@ -867,25 +926,9 @@ class RealMLSAlgorithm:
 
     def _estimate_travel_distance(self, home_team: str, away_team: str) -> float:
         """Estimate travel distance between teams"""
-        # Simplified distance estimation based on geographic regions
-        west_coast = ['LAFC', 'LA GALAXY', 'SAN JOSE', 'SEATTLE SOUNDERS', 'PORTLAND TIMBERS', 'VANCOUVER WHITECAPS']
-        east_coast = ['INTER MIAMI', 'ATLANTA UNITED', 'ORLANDO CITY', 'DC UNITED', 'PHILADELPHIA UNION', 'NYCFC', 'NEW YORK RED BULLS', 'TORONTO FC', 'CF MONTREAL', 'NEW ENGLAND REVOLUTION']
-        central = ['SPORTING KC', 'FC DALLAS', 'HOUSTON DYNAMO', 'AUSTIN FC', 'CHICAGO FIRE', 'COLUMBUS CREW', 'MINNESOTA UNITED', 'COLORADO RAPIDS', 'REAL SALT LAKE', 'NASHVILLE SC', 'FC CINCINNATI', 'CHARLOTTE FC']
-        
-        home_region = 'central'
-        away_region = 'central'
-        
-        for team in west_coast:
-            if team in home_team.upper():
-                home_region = 'west'
-            if team in away_team.upper():
-                away_region = 'west'
-                
-        for team in east_coast:
-            if team in home_team.upper():
-                home_region = 'east'
-            if team in away_team.upper():
-                away_region = 'east'
+        # Simplified distance estimation based on geographic regions (team catalog)
+        home_region = self._get_team_region(home_team)
+        away_region = self._get_team_region(away_team)
         
         # Distance matrix (approximate miles)
         distances = {
@@ -902,13 +945,16 @@ class RealMLSAlgorithm:
         
         return distances.get((away_region, home_region), 800)
     
+    def _get_team_region(self, team: str) -> str:
+        """Get team region (west / east / central)"""
+        record = TEAM_CATALOG.resolve(team, league='MLS')
+        return record.region if record and record.region else 'central'
+    
     def _get_team_conference(self, team: str) -> str:
         """Get team conference"""
-        eastern_teams = ['INTER MIAMI', 'ATLANTA UNITED', 'ORLANDO CITY', 'DC UNITED', 'PHILADELPHIA UNION', 'NYCFC', 'NEW YORK RED BULLS', 'TORONTO FC', 'CF MONTREAL', 'NEW ENGLAND REVOLUTION', 'CHICAGO FIRE', 'COLUMBUS CREW', 'MINNESOTA UNITED', 'NASHVILLE SC', 'FC CINCINNATI', 'CHARLOTTE FC']
-        
-        for eastern_team in eastern_teams:
-            if eastern_team in team.upper():
-                return 'eastern_conference'
+        record = TEAM_CATALOG.resolve(team, league='MLS')
+        if record and record.conference == 'eastern':
+            return 'eastern_conference'
         
         return 'western_conference'
 
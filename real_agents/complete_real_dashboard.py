@@ -49,6 +49,18 @@ from d2_venue_weather_mcp import fetch_d2_venue_weather_data
 # 🔥💀🔥 BROTHER #186: Import D7 X-Factor MCP! 💀🔥💀
 from d7_x_factor_mcp import fetch_d7_x_factor_data
 
+# 🗂️ Multi-league analyzed slate cache for /api/games
+from slate_cache import SlateCache, DEFAULT_SLATE_TTL_SECONDS
+
+# 🌐 Pooled HTTP client shared by every fetcher and D-MCP (same module object the D-MCPs import)
+try:
+    from real_agents.http_client_service import get_http_client
+except ImportError:
+    from http_client_service import get_http_client
+
+# 🔄 Canonical match stream (registry-driven adapters for every league)
+from core.adapter_registry import normalize_games
+
 # Import our real agent system
 from real_agents.agents.data_collector_agent import DataCollectorAgent, create_data_collector_agent
 
@@ -183,6 +195,9 @@ class CompleteRealDashboard:
         self.current_league = None
         self.current_games = []
         
+        # 🗂️ Analyzed slates for every recently viewed league (LRU + stale-while-revalidate)
+        self.slate_cache = SlateCache()
+        
         # 🔥💀🔥 NUCLEAR REFACTOR: Dynamic league loading from registry! 💀🔥💀
         if NUCLEAR_REFACTOR_AVAILABLE:
             # Load leagues from nuclear refactor registry
@@ -2610,7 +2625,7 @@ class CompleteRealDashboard:
                 
                 logger.info(f"🎰 PROGOL: Using automation data - {len(games_data)} real games from midnight special old games reader")
             else:
-                games_data = await self._get_real_games_for_league(league_id)
+                games_data = await self._get_cached_games_for_league(league_id)
             
             # 🔥💀🔥 BROTHER #176 FIX: Show ALL Liga MX games (upcoming AND completed with Brother #176 enhancements) 💀🔥💀
             if league_id == 'LIGA_MX':
@@ -2728,6 +2743,45 @@ class CompleteRealDashboard:
                 'fake_agents_eliminated': 25
             })
     
+    def _slate_ttl_for_league(self, league_id: str) -> float:
+        """⏱️ How long an analyzed slate stays fresh (registry data_refresh_interval)"""
+        if NUCLEAR_REFACTOR_AVAILABLE:
+            config = LEAGUES_REGISTRY.get(league_id.upper(), {})
+            return config.get('data_refresh_interval', DEFAULT_SLATE_TTL_SECONDS)
+        return DEFAULT_SLATE_TTL_SECONDS
+    
+    async def _get_cached_games_for_league(self, league_id: str) -> List[Dict[str, Any]]:
+        """🗂️ Analyzed games for a league via the slate cache (one 8D run per league per TTL)"""
+        return await self.slate_cache.get_or_load(
+            league_id,
+            lambda: self._get_real_games_for_league(league_id),
+            ttl=self._slate_ttl_for_league(league_id)
+        )
+    
+    def invalidate_games_cache(self, league_id: str = None) -> int:
+        """🧹 Invalidation hook - drop one league's cached slate (or all of them)"""
+        removed = self.slate_cache.invalidate(league_id)
+        if league_id is None or league_id == self.current_league:
+            self.current_league = None
+            self.current_games = []
+        logger.info(f"🧹 Games cache invalidated: {league_id or 'ALL LEAGUES'} ({removed} slates dropped)")
+        return removed
+    
+    async def handle_invalidate_games_cache(self, request):
+        """🧹 POST /api/games-cache/invalidate {"league_id": optional}"""
+        try:
+            data = await request.json() if request.can_read_body else {}
+        except Exception:
+            data = {}
+        league_id = data.get('league_id')
+        removed = self.invalidate_games_cache(league_id)
+        return web.json_response({
+            'success': True,
+            'league_id': league_id,
+            'slates_dropped': removed,
+            'cache': self.slate_cache.get_stats()
+        })
+    
     @debug_capture
     async def handle_games(self, request):
         """Handle games request for specific league"""
@@ -2742,85 +2796,74 @@ class CompleteRealDashboard:
                 self.structured_logger.info("🔥💀🔥 Spawning MINION agent for games request", {"league_id": league_id})
                 await self.spawn_data_collector_agent(league_id)
             
-            # 🔥💀🔥 BROTHER FIX: Always check for fresh games if cache is empty! 💀🔥💀
-            # 🎰 PROGOL SPECIAL: Always fetch fresh games - no cache for real 8D analysis!
-            if league_id == self.current_league and self.current_games and league_id.upper() not in ['PROGOL_MIDWEEK', 'PROGOL_FULLWEEK']:
-                logger.info(f"🎯 Returning cached games for {league_id}: {len(self.current_games)} games")
-                
-                # 🎰 PROGOL SPECIAL: This cached games code should never run for PROGOL since we bypass cache!
-                # But if it does, just return the cached games without dimension remapping
-                logger.info(f"🎯 Returning cached games for {league_id}: {len(self.current_games)} games")
-                return web.json_response(self.current_games)
-            else:
-                # Get fresh data and update cache
-                logger.info(f"🔄 Getting fresh games for {league_id} (current_league: {self.current_league}, cached games: {len(self.current_games) if self.current_games else 0})")
-                try:
-                    games_data = await self._get_real_games_for_league(league_id)
-                except Exception as e:
-                    logger.error(f"🔥💀🔥 ERROR getting games for {league_id}: {e} - initializing empty games_data")
-                    games_data = []
-                
-                # 🔥💀🔥 UPDATE CACHE! 💀🔥💀
-                self.current_league = league_id
-                self.current_games = games_data
-                logger.info(f"🎯 Updated cache: {league_id} with {len(games_data)} games")
-                
-                # 🔥💀🔥 BROTHER #177 FIX: Add UEFA Champions League logging! 💀🔥💀
-                if league_id == 'UEFA':
-                    logger.info(f"🏆 UEFA CHAMPIONS LEAGUE: Received {len(games_data)} games from hybrid analysis")
-                    for i, game in enumerate(games_data[:3]):
-                        conf = game.get('confidence', 'N/A')
-                        pred = game.get('prediction', 'N/A')
-                        source = game.get('data_source', 'N/A')
-                        fix = game.get('brother_177_uefa_fix', False)
-                        logger.info(f"  🎯 Game {i+1}: {game.get('away_team')} @ {game.get('home_team')} - Confidence: {conf}%, Prediction: {pred}, Source: {source}, Fix: {fix}")
-                
-                # 🔥💀🔥 BROTHER #172 FIX: Show ALL Liga MX games (upcoming AND completed for analysis)
-                elif league_id == 'LIGA_MX':
-                    from datetime import datetime
-                    # CRITICAL FIX: Include both upcoming and completed games for analysis
-                    # Brother #171's "upcoming only" filter was breaking Games & Predictions panel
-                    filtered_games = [game for game in games_data if game.get('status') in ['upcoming', 'STATUS_FULL_TIME', 'completed', 'final', 'scheduled', 'Scheduled', 'STATUS_SCHEDULED', 'STATUS_FIRST_HALF', 'STATUS_SECOND_HALF', 'STATUS_HALFTIME', 'Full Time', 'First Half', 'Second Half', 'Half Time', 'Half-Time', 'Halftime']]
-                    games_data = filtered_games
-                    logger.info(f"🔥💀🔥 BROTHER #172: Fixed Liga MX panel sync - showing {len(filtered_games)} games (upcoming + completed) for full analysis!")
-                
-                # 🎯 REMOVED AUTO-TRACKING - NOW USER-CONTROLLED ONLY
-                # Auto-tracking disabled - user must click "Track to Midnight Special" button
-                
-                # 🔥💀🔥 MAGIC BROTHER FIX: Update ALL agent stats with real data! 💀🔥💀
-                for agent_id, agent in self.active_agents.items():
-                    agent['games_collected'] = len(games_data)
-                    agent['predictions_made'] = len(games_data)
-                    self.structured_logger.info("✅ Updated agent stats", {
-                        "agent_id": agent_id,
-                        "games": len(games_data),
-                        "predictions": len(games_data)
-                    })
-                    
-                # 🔥💀🔥 COPA SUDAMERICANA SPECIFIC FIX: Ensure minion stats are updated! 💀🔥💀
-                if league_id == 'COPA_SUDAMERICANA':
-                    copa_minions = [aid for aid in self.active_agents.keys() if 'COPA_SUDAMERICANA_MINION' in aid.upper()]
-                    for copa_minion_id in copa_minions:
-                        self.active_agents[copa_minion_id]['games_collected'] = len(games_data)
-                        self.active_agents[copa_minion_id]['predictions_made'] = len(games_data)
-                        logger.info(f"🔥💀🔥 COPA SUDAMERICANA MINION STATS UPDATED: {copa_minion_id} → {len(games_data)} games")
-                
-                self.structured_logger.info("🔥 Final stats updated", {
-                    "league_id": league_id,
-                    "games_count": len(games_data),
-                    "agents_updated": len(self.active_agents)
+            # 🗂️ Analyzed slates are cached per league - switching panels no longer re-runs 8D
+            # 🎰 PROGOL included: its slate only changes when the lottery coupon changes
+            try:
+                games_data = await self._get_cached_games_for_league(league_id)
+            except Exception as e:
+                logger.error(f"🔥💀🔥 ERROR getting games for {league_id}: {e} - initializing empty games_data")
+                games_data = []
+            
+            self.current_league = league_id
+            self.current_games = games_data
+            logger.info(f"🎯 Serving {league_id} with {len(games_data)} games")
+            
+            # 🔥💀🔥 BROTHER #177 FIX: Add UEFA Champions League logging! 💀🔥💀
+            if league_id == 'UEFA':
+                logger.info(f"🏆 UEFA CHAMPIONS LEAGUE: Received {len(games_data)} games from hybrid analysis")
+                for i, game in enumerate(games_data[:3]):
+                    conf = game.get('confidence', 'N/A')
+                    pred = game.get('prediction', 'N/A')
+                    source = game.get('data_source', 'N/A')
+                    fix = game.get('brother_177_uefa_fix', False)
+                    logger.info(f"  🎯 Game {i+1}: {game.get('away_team')} @ {game.get('home_team')} - Confidence: {conf}%, Prediction: {pred}, Source: {source}, Fix: {fix}")
+            
+            # 🔥💀🔥 BROTHER #172 FIX: Show ALL Liga MX games (upcoming AND completed for analysis)
+            elif league_id == 'LIGA_MX':
+                from datetime import datetime
+                # CRITICAL FIX: Include both upcoming and completed games for analysis
+                # Brother #171's "upcoming only" filter was breaking Games & Predictions panel
+                filtered_games = [game for game in games_data if game.get('status') in ['upcoming', 'STATUS_FULL_TIME', 'completed', 'final', 'scheduled', 'Scheduled', 'STATUS_SCHEDULED', 'STATUS_FIRST_HALF', 'STATUS_SECOND_HALF', 'STATUS_HALFTIME', 'Full Time', 'First Half', 'Second Half', 'Half Time', 'Half-Time', 'Halftime']]
+                games_data = filtered_games
+                logger.info(f"🔥💀🔥 BROTHER #172: Fixed Liga MX panel sync - showing {len(filtered_games)} games (upcoming + completed) for full analysis!")
+            
+            # 🎯 REMOVED AUTO-TRACKING - NOW USER-CONTROLLED ONLY
+            # Auto-tracking disabled - user must click "Track to Midnight Special" button
+            
+            # 🔥💀🔥 MAGIC BROTHER FIX: Update ALL agent stats with real data! 💀🔥💀
+            for agent_id, agent in self.active_agents.items():
+                agent['games_collected'] = len(games_data)
+                agent['predictions_made'] = len(games_data)
+                self.structured_logger.info("✅ Updated agent stats", {
+                    "agent_id": agent_id,
+                    "games": len(games_data),
+                    "predictions": len(games_data)
                 })
                 
-                # 🎰🔥 PROGOL FULLWEEK: Legacy analysis already sets correct field names - NO MAPPING NEEDED! 🔥🎰
-                if league_id == 'PROGOL_FULLWEEK':
-                    # 🎰 PROGOL SPECIAL: Our legacy analysis already sets the correct field names!
-                    # DON'T overwrite polymarket_odds=38.1 with dimensions.get('D0_polymarket', 0)=0 !!!
-                    self.structured_logger.info("🎰✅ PROGOL FULLWEEK: Skipping dimension mapping", {
-                        "reason": "legacy analysis already set perfect values",
-                        "games_count": len(games_data)
-                    })
-                
-                return web.json_response(games_data)
+            # 🔥💀🔥 COPA SUDAMERICANA SPECIFIC FIX: Ensure minion stats are updated! 💀🔥💀
+            if league_id == 'COPA_SUDAMERICANA':
+                copa_minions = [aid for aid in self.active_agents.keys() if 'COPA_SUDAMERICANA_MINION' in aid.upper()]
+                for copa_minion_id in copa_minions:
+                    self.active_agents[copa_minion_id]['games_collected'] = len(games_data)
+                    self.active_agents[copa_minion_id]['predictions_made'] = len(games_data)
+                    logger.info(f"🔥💀🔥 COPA SUDAMERICANA MINION STATS UPDATED: {copa_minion_id} → {len(games_data)} games")
+            
+            self.structured_logger.info("🔥 Final stats updated", {
+                "league_id": league_id,
+                "games_count": len(games_data),
+                "agents_updated": len(self.active_agents)
+            })
+            
+            # 🎰🔥 PROGOL FULLWEEK: Legacy analysis already sets correct field names - NO MAPPING NEEDED! 🔥🎰
+            if league_id == 'PROGOL_FULLWEEK':
+                # 🎰 PROGOL SPECIAL: Our legacy analysis already sets the correct field names!
+                # DON'T overwrite polymarket_odds=38.1 with dimensions.get('D0_polymarket', 0)=0 !!!
+                self.structured_logger.info("🎰✅ PROGOL FULLWEEK: Skipping dimension mapping", {
+                    "reason": "legacy analysis already set perfect values",
+                    "games_count": len(games_data)
+                })
+            
+            return web.json_response(games_data)
     
     async def _auto_track_uefa_predictions(self, games_data: List[Dict], league_id: str):
         """🎯 Automatically track UEFA predictions to Midnight Special"""
@@ -2934,8 +2977,7 @@ class CompleteRealDashboard:
             self.active_agents.clear()
             
             # 🔥💀🔥 CLEAR CURRENT GAMES CACHE TO FIX PROGOL_MIDWEEK 18-GAME BUG! 💀🔥💀
-            self.current_league = None
-            self.current_games = []
+            self.invalidate_games_cache()
             logger.info("🧹 CURRENT_GAMES CACHE CLEARED - Fixed PROGOL_MIDWEEK double counting!")
             
             # Reset all stats
@@ -3093,13 +3135,9 @@ class CompleteRealDashboard:
                     
                     logger.info(f"🇳🇱 EREDIVISIE NUCLEAR SUCCESS: Got {len(eredivisie_games)} games from ESPN!")
                     
-                    # Analyze with 8D system
+                    # Analyze the whole slate concurrently with 8D system
                     engine = get_universal_prediction_engine()
-                    analyzed_games = []
-                    
-                    for game in eredivisie_games:
-                        analyzed_game = await engine.analyze_game(game, 'EREDIVISIE')
-                        analyzed_games.append(analyzed_game)
+                    analyzed_games = await engine.analyze_games_batch(eredivisie_games, 'EREDIVISIE')
                     
                     logger.info(f"🇳🇱 EREDIVISIE: Analyzed {len(analyzed_games)} games with 8D system!")
                     return analyzed_games
@@ -3121,13 +3159,9 @@ class CompleteRealDashboard:
                     
                     logger.info(f"🇹🇷 SUPERLIG NUCLEAR SUCCESS: Got {len(superlig_games)} games from ESPN!")
                     
-                    # Analyze with 8D system
+                    # Analyze the whole slate concurrently with 8D system
                     engine = get_universal_prediction_engine()
-                    analyzed_games = []
-                    
-                    for game in superlig_games:
-                        analyzed_game = await engine.analyze_game(game, 'SUPERLIG')
-                        analyzed_games.append(analyzed_game)
+                    analyzed_games = await engine.analyze_games_batch(superlig_games, 'SUPERLIG')
                     
                     logger.info(f"🇹🇷 SUPERLIG: Analyzed {len(analyzed_games)} games with 8D system!")
                     return analyzed_games
@@ -3149,13 +3183,9 @@ class CompleteRealDashboard:
                     
                     logger.info(f"🌏 SEA LEAGUE NUCLEAR SUCCESS: Got {len(sea_games)} games from ESPN!")
                     
-                    # Analyze with 8D system
+                    # Analyze the whole slate concurrently with 8D system
                     engine = get_universal_prediction_engine()
-                    analyzed_games = []
-                    
-                    for game in sea_games:
-                        analyzed_game = await engine.analyze_game(game, 'SEA_LEAGUE')
-                        analyzed_games.append(analyzed_game)
+                    analyzed_games = await engine.analyze_games_batch(sea_games, 'SEA_LEAGUE')
                     
                     logger.info(f"🌏 SEA LEAGUE: Analyzed {len(analyzed_games)} games with 8D system!")
                     return analyzed_games
@@ -4791,13 +4821,9 @@ class CompleteRealDashboard:
                     
                     logger.info(f"🇳🇱 EREDIVISIE SUCCESS: Got {len(eredivisie_games)} games from ESPN API!")
                     
-                    # Analyze with 8D system
+                    # Analyze the whole slate concurrently with 8D system
                     engine = get_universal_prediction_engine()
-                    analyzed_games = []
-                    
-                    for game in eredivisie_games:
-                        analyzed_game = await engine.analyze_game(game, 'EREDIVISIE')
-                        analyzed_games.append(analyzed_game)
+                    analyzed_games = await engine.analyze_games_batch(eredivisie_games, 'EREDIVISIE')
                     
                     logger.info(f"🇳🇱 EREDIVISIE: Analyzed {len(analyzed_games)} games with 8D system!")
                     return analyzed_games
@@ -4820,13 +4846,9 @@ class CompleteRealDashboard:
                     
                     logger.info(f"🌏 SEA LEAGUE SUCCESS: Got {len(sea_games)} games from ESPN API!")
                     
-                    # Analyze with 8D system
+                    # Analyze the whole slate concurrently with 8D system
                     engine = get_universal_prediction_engine()
-                    analyzed_games = []
-                    
-                    for game in sea_games:
-                        analyzed_game = await engine.analyze_game(game, 'SEA_LEAGUE')
-                        analyzed_games.append(analyzed_game)
+                    analyzed_games = await engine.analyze_games_batch(sea_games, 'SEA_LEAGUE')
                     
                     logger.info(f"🌏 SEA LEAGUE: Analyzed {len(analyzed_games)} games with 8D system!")
                     return analyzed_games
@@ -4849,13 +4871,9 @@ class CompleteRealDashboard:
                     
                     logger.info(f"🇹🇷 SUPERLIG SUCCESS: Got {len(superlig_games)} games from ESPN API!")
                     
-                    # Analyze with 8D system
+                    # Analyze the whole slate concurrently with 8D system
                     engine = get_universal_prediction_engine()
-                    analyzed_games = []
-                    
-                    for game in superlig_games:
-                        analyzed_game = await engine.analyze_game(game, 'SUPERLIG')
-                        analyzed_games.append(analyzed_game)
+                    analyzed_games = await engine.analyze_games_batch(superlig_games, 'SUPERLIG')
                     
                     logger.info(f"🇹🇷 SUPERLIG: Analyzed {len(analyzed_games)} games with 8D system!")
                     return analyzed_games
@@ -7824,53 +7842,16 @@ class CompleteRealDashboard:
             logger.error(f"💀 Error converting real NFL game: {e} - NO FAKE DATA BULLSHIT!")
             return None
     
+    def _canonical_display_game(self, league_id: str, game_data: Dict, index: int, **overrides) -> Dict:
+        """🔄 Display card built from the canonical match stream (UNIFIED_GAME_SCHEMA shape)"""
+        match = normalize_games(league_id, [game_data])[0]
+        return match.to_display_dict(index, **overrides)
+
     async def _convert_real_serie_a_game(self, game_data: Dict, index: int) -> Dict:
         """Convert real Serie A API game data to display format"""
         try:
-            # Extract teams from various possible Serie A API data formats
-            home_team = "Unknown"
-            away_team = "Unknown" 
-            game_time = "TBD"
-            game_status = "Scheduled"
-            
-            if isinstance(game_data, dict):
-                # Try different API data format patterns
-                if 'home_team' in game_data and 'away_team' in game_data:
-                    home_team = game_data['home_team']
-                    away_team = game_data['away_team']
-                    
-                # Get game time
-                if 'time' in game_data:
-                    game_time = game_data['time']
-                elif 'start_time' in game_data:
-                    game_time = game_data['start_time']
-                elif 'date' in game_data:
-                    game_time = game_data['date']
-                    
-                # Get game status
-                if 'status' in game_data:
-                    game_status = game_data['status']
-                elif 'completed' in game_data:
-                    game_status = "Final" if game_data['completed'] else "Scheduled"
-                    
-                # Get venue
-                venue = game_data.get('venue', 'TBD')
-                
-            return {
-                'id': f'serie_a_game_{index}',
-                'sport': 'SERIE_A',
-                'league': 'Serie A',
-                'home_team': home_team,
-                'away_team': away_team,
-                'time': game_time,
-                'status': game_status,
-                'matchup': f'{away_team} @ {home_team}',
-                'venue': venue,
-                'country_flag': '🇮🇹',
-                'original_league': 'SERIE_A',
-                'real_data': True,
-                'data_source': 'ESPN_SERIE_A_API'
-            }
+            return self._canonical_display_game('SERIE_A', game_data, index, league='Serie A',
+                                                data_source='ESPN_SERIE_A_API')
             
         except Exception as e:
             logger.error(f"Error converting Serie A game {index}: {e}")
@@ -7892,50 +7873,8 @@ class CompleteRealDashboard:
     async def _convert_real_bundesliga_game(self, game_data: Dict, index: int) -> Dict:
         """Convert real Bundesliga API game data to display format"""
         try:
-            # Extract teams from various possible Bundesliga API data formats
-            home_team = "Unknown"
-            away_team = "Unknown" 
-            game_time = "TBD"
-            game_status = "Scheduled"
-            
-            if isinstance(game_data, dict):
-                # Try different API data format patterns
-                if 'home_team' in game_data and 'away_team' in game_data:
-                    home_team = game_data['home_team']
-                    away_team = game_data['away_team']
-                    
-                # Get game time
-                if 'time' in game_data:
-                    game_time = game_data['time']
-                elif 'start_time' in game_data:
-                    game_time = game_data['start_time']
-                elif 'date' in game_data:
-                    game_time = game_data['date']
-                    
-                # Get game status
-                if 'status' in game_data:
-                    game_status = game_data['status']
-                elif 'completed' in game_data:
-                    game_status = "Final" if game_data['completed'] else "Scheduled"
-                    
-                # Get venue
-                venue = game_data.get('venue', 'TBD')
-                
-            return {
-                'id': f'bundesliga_game_{index}',
-                'sport': 'BUNDESLIGA',
-                'league': 'Bundesliga',
-                'home_team': home_team,
-                'away_team': away_team,
-                'time': game_time,
-                'status': game_status,
-                'matchup': f'{away_team} @ {home_team}',
-                'venue': venue,
-                'country_flag': '🇩🇪',
-                'original_league': 'BUNDESLIGA',
-                'real_data': True,
-                'data_source': 'ESPN_BUNDESLIGA_API'
-            }
+            return self._canonical_display_game('BUNDESLIGA', game_data, index, league='Bundesliga',
+                                                data_source='ESPN_BUNDESLIGA_API')
             
         except Exception as e:
             logger.error(f"Error converting Bundesliga game {index}: {e}")
@@ -7957,52 +7896,10 @@ class CompleteRealDashboard:
     async def _convert_real_uefa_game(self, game_data: Dict, index: int) -> Dict:
         """Convert real UEFA Champions League API game data to display format"""
         try:
-            # Extract teams from various possible UEFA Champions League API data formats
-            home_team = "Unknown"
-            away_team = "Unknown" 
-            game_time = "TBD"
-            game_status = "Scheduled"
-            stage = "Group Stage"
-            
-            if isinstance(game_data, dict):
-                # Try different API data format patterns
-                if 'home_team' in game_data and 'away_team' in game_data:
-                    home_team = game_data['home_team']
-                    away_team = game_data['away_team']
-                    
-                # Get game time
-                if 'time' in game_data:
-                    game_time = game_data['time']
-                elif 'start_time' in game_data:
-                    game_time = game_data['start_time']
-                elif 'date' in game_data:
-                    game_time = game_data['date']
-                    
-                # Get game status
-                if 'status' in game_data:
-                    game_status = game_data['status']
-                elif 'completed' in game_data:
-                    game_status = "Final" if game_data['completed'] else "Scheduled"
-                    
-                # Get venue and stage
-                venue = game_data.get('venue', 'TBD')
-                stage = game_data.get('stage', 'Champions League')
-                
-            return {
-                'id': f'uefa_cl_game_{index}',
-                'sport': 'UEFA',
-                'league': 'UEFA Champions League',
-                'home_team': home_team,
-                'away_team': away_team,
-                'time': game_time,
-                'status': game_status,
-                'matchup': f'{away_team} @ {home_team}',
-                'venue': venue,
-                'stage': stage,
-                'country_flag': '🏆',
-                'original_league': 'UEFA',
-                'real_data': True,
-                'data_source': 'ESPN_UEFA_CL_API',
+            game = self._canonical_display_game('UEFA', game_data, index, id_prefix='uefa_cl',
+                                                league='UEFA Champions League', data_source='ESPN_UEFA_CL_API')
+            game.update({
+                'stage': game_data.get('stage', 'Champions League'),
                 'elite_competition': True,
                 # Add prediction fields if they exist
                 'prediction': game_data.get('prediction', 'TBD'),
@@ -8012,7 +7909,8 @@ class CompleteRealDashboard:
                 'key_players': game_data.get('key_players', '0'),
                 'reasoning': game_data.get('reasoning', 'UEFA Champions League: Awaiting analysis'),
                 'pick': game_data.get('pick', 'TBD')
-            }
+            })
+            return game
             
         except Exception as e:
             logger.error(f"Error converting UEFA Champions League game {index}: {e}")
@@ -9032,6 +8930,13 @@ class CompleteRealDashboard:
         """Create the web application"""
         app = web.Application()
         
+        # 🌐 Open/close the shared HTTP session with the app
+        get_http_client().setup_app(app)
+
+        # ⏰ Automation jobs run on this app's event loop and stop with it
+        if self.midnight_scheduler:
+            self.midnight_scheduler.setup_app(app)
+
         # Setup CORS
         cors = aiohttp_cors.setup(app, defaults={
             "*": aiohttp_cors.ResourceOptions(
@@ -9046,6 +8951,7 @@ class CompleteRealDashboard:
         app.router.add_get('/', self.handle_index)
         app.router.add_post('/api/load-league', self.handle_load_league)
         app.router.add_get('/api/games/{league_id}', self.handle_games)
+        app.router.add_post('/api/games-cache/invalidate', self.handle_invalidate_games_cache)
         app.router.add_get('/api/agents/status', self.handle_agents_status)
         app.router.add_get('/api/debug/agent-detection/{league}', self.handle_debug_agent_detection)
         app.router.add_post('/api/reset-agents', self.handle_reset_agents)
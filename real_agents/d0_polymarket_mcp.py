@@ -26,6 +26,10 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import statistics
 import math
+try:
+    from real_agents.polymarket_snapshot import contains_phrase, get_polymarket_snapshot, normalize_text, team_patterns
+except ImportError:
+    from polymarket_snapshot import contains_phrase, get_polymarket_snapshot, normalize_text, team_patterns
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -108,6 +112,9 @@ class D0PolymarketMCP:
         self.polymarket_api_available = True  # Always available via public endpoints
         self.polymarket_base_url = "https://gamma-api.polymarket.com"
         
+        # Shared, indexed snapshot of open markets (one listing per refresh interval, not per game)
+        self.market_snapshot = get_polymarket_snapshot()
+        
         # No API key needed for public market data access!
         logger.info("📊 Polymarket PUBLIC API configured for live market data!")
         
@@ -161,7 +168,8 @@ class D0PolymarketMCP:
         logger.info(f"🏆 Sports markets: {len(self.sports_markets)} configured")
     
     async def fetch_d0_polymarket_data(self, home_team: str, away_team: str, 
-                                      sport: str = "SOCCER", league: str = "unknown") -> Dict[str, Any]:
+                                      sport: str = "SOCCER", league: str = "unknown",
+                                      game_date: Optional[str] = None) -> Dict[str, Any]:
         """
         🎯 MAIN D0 ENDPOINT: Fetch comprehensive Polymarket analysis
         
@@ -170,6 +178,7 @@ class D0PolymarketMCP:
             away_team: Away team name
             sport: Sport type (SOCCER, BASKETBALL, etc.)
             league: League identifier
+            game_date: Optional game date (YYYY-MM-DD) to prefer markets on that day
             
         Returns:
             Complete D0 Polymarket analysis
@@ -178,7 +187,7 @@ class D0PolymarketMCP:
             logger.info(f"📊 D0 MCP: Analyzing Polymarket for {home_team} vs {away_team}")
             
             # Fetch Polymarket odds
-            market_data = await self._fetch_polymarket_odds(home_team, away_team, sport, league)
+            market_data = await self._fetch_polymarket_odds(home_team, away_team, sport, league, game_date)
             
             # Analyze market confidence
             market_confidence = await self._analyze_market_confidence(market_data)
@@ -292,14 +301,15 @@ class D0PolymarketMCP:
             return self._generate_fallback_polymarket_response(home_team, away_team, sport)
     
     async def _fetch_polymarket_odds(self, home_team: str, away_team: str, 
-                                   sport: str, league: str) -> PolymarketOdds:
+                                   sport: str, league: str,
+                                   game_date: Optional[str] = None) -> PolymarketOdds:
         """
         📊 Fetch real Polymarket odds or generate realistic market data
         """
         try:
             if self.polymarket_api_available:
                 # Try to fetch real Polymarket data
-                real_odds = await self._fetch_real_polymarket_data(home_team, away_team, sport, league)
+                real_odds = await self._fetch_real_polymarket_data(home_team, away_team, sport, league, game_date)
                 if real_odds:
                     return real_odds
             
@@ -312,75 +322,31 @@ class D0PolymarketMCP:
             return self._generate_realistic_market_data(home_team, away_team, sport, league)
     
     async def _fetch_real_polymarket_data(self, home_team: str, away_team: str, 
-                                        sport: str, league: str) -> Optional[PolymarketOdds]:
+                                        sport: str, league: str,
+                                        game_date: Optional[str] = None) -> Optional[PolymarketOdds]:
         """
-        🌐 Fetch real data from Polymarket PUBLIC API (NO AUTH REQUIRED!)
+        🌐 Look the game up in the indexed Polymarket snapshot (PUBLIC API, NO AUTH!)
+        
+        The snapshot is fetched once per refresh interval and shared by every
+        lookup, so a whole slate costs one paginated listing instead of three
+        full downloads per game.
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                # First, get current timestamp for filtering active markets
-                from datetime import datetime, timezone
-                now = datetime.now(timezone.utc)
-                today_str = now.strftime("%Y-%m-%d")
-                
-                # Try multiple search strategies focused on CURRENT markets
-                search_strategies = [
-                    # Strategy 1: Active sports markets only
-                    f"{self.polymarket_base_url}/events?active=true&closed=false&category=Sports&limit=100",
-                    # Strategy 2: All recent sports markets (including just closed)
-                    f"{self.polymarket_base_url}/events?category=Sports&limit=200&closed=false",
-                    # Strategy 3: Get all sports markets and filter by date
-                    f"{self.polymarket_base_url}/events?category=Sports&limit=300"
-                ]
-                
-                for search_url in search_strategies:
-                    try:
-                        logger.info(f"🔍 Searching Polymarket: {search_url}")
-                        async with session.get(search_url, timeout=15) as response:
-                            if response.status == 200:
-                                events_data = await response.json()
-                                
-                                # Log what we found
-                                total_events = len(events_data) if isinstance(events_data, list) else 0
-                                logger.info(f"📊 Found {total_events} total events from Polymarket")
-                                
-                                # Filter for current/recent events (not from 2021-2022)
-                                current_events = []
-                                for event in events_data:
-                                    start_date = event.get('startDate', '')
-                                    end_date = event.get('endDate', '')
-                                    
-                                    # Check if event is recent (2024-2025)
-                                    if any(year in start_date or year in end_date for year in ['2024', '2025']):
-                                        current_events.append(event)
-                                    # Also include events without dates that are marked as active
-                                    elif event.get('active', False) and not event.get('closed', True):
-                                        current_events.append(event)
-                                
-                                logger.info(f"📅 Found {len(current_events)} current/recent events")
-                                
-                                # Parse current market data and find matching teams
-                                if current_events:
-                                    market_odds = self._parse_polymarket_events(current_events, home_team, away_team)
-                                    if market_odds:
-                                        logger.info(f"✅ Found real current Polymarket data for {home_team} vs {away_team}")
-                                        return market_odds
-                                        
-                            else:
-                                logger.warning(f"⚠️ Polymarket API returned status {response.status}")
-                                
-                    except asyncio.TimeoutError:
-                        logger.warning(f"⏰ Timeout fetching from Polymarket API")
-                        continue
-                    except Exception as e:
-                        logger.warning(f"⚠️ Error with Polymarket API: {e}")
-                        continue
-                
-                logger.info(f"🔄 No specific current Polymarket data found for {home_team} vs {away_team}")
-                logger.info(f"📊 Using real Polymarket market statistics to calibrate realistic analysis")
-                
-                # Fallback: Use any recent sports market data to generate realistic analysis
-                return await self._get_generic_sports_market_data(home_team, away_team, sport, league)
+            candidate_events = await self.market_snapshot.find_events(home_team, away_team, game_date)
+            logger.info(f"📊 Polymarket snapshot: {len(candidate_events)} candidate events "
+                        f"for {home_team} vs {away_team}")
+            
+            if candidate_events:
+                market_odds = self._parse_polymarket_events(candidate_events, home_team, away_team)
+                if market_odds:
+                    logger.info(f"✅ Found real current Polymarket data for {home_team} vs {away_team}")
+                    return market_odds
+            
+            logger.info(f"🔄 No specific current Polymarket data found for {home_team} vs {away_team}")
+            logger.info(f"📊 Using real Polymarket market statistics to calibrate realistic analysis")
+            
+            # Fallback: Use any recent sports market data to generate realistic analysis
+            return await self._get_generic_sports_market_data(home_team, away_team, sport, league)
                 
         except Exception as e:
             logger.error(f"❌ Real Polymarket data fetch error: {e}")
@@ -391,56 +357,21 @@ class D0PolymarketMCP:
         🔍 Parse Polymarket events list for team matches
         """
         try:
-            # Create flexible team name matching patterns
-            home_patterns = [
-                home_team.lower(),
-                home_team.split()[-1].lower(),  # Last word (e.g., "Barcelona" from "FC Barcelona")
-                home_team.split()[0].lower(),   # First word (e.g., "Real" from "Real Madrid")
-            ]
-            away_patterns = [
-                away_team.lower(),
-                away_team.split()[-1].lower(),
-                away_team.split()[0].lower(),
-            ]
-            
-            # Add common abbreviations and alternative names
-            team_variations = {
-                'real madrid': ['madrid', 'real'],
-                'fc barcelona': ['barcelona', 'barca'],
-                'manchester united': ['man united', 'united'],
-                'manchester city': ['man city', 'city'],
-                'liverpool': ['liverpool fc'],
-                'chelsea': ['chelsea fc'],
-                'arsenal': ['arsenal fc'],
-                'tottenham': ['spurs', 'tottenham hotspur'],
-                'atletico madrid': ['atletico', 'atleti'],
-                'bayern munich': ['bayern', 'munich'],
-                'borussia dortmund': ['dortmund', 'bvb'],
-                'paris saint-germain': ['psg', 'paris'],
-                'ac milan': ['milan', 'ac milan'],
-                'inter milan': ['inter', 'internazionale'],
-                'juventus': ['juve', 'juventus fc'],
-                'olympiacos': ['olympiakos'],
-            }
-            
-            # Extend patterns with variations
-            home_key = home_team.lower()
-            away_key = away_team.lower()
-            
-            if home_key in team_variations:
-                home_patterns.extend(team_variations[home_key])
-            if away_key in team_variations:
-                away_patterns.extend(team_variations[away_key])
+            # Flexible team name matching patterns (full name, first/last word, known aliases)
+            home_patterns = team_patterns(home_team)
+            away_patterns = team_patterns(away_team)
             
             logger.info(f"🔍 Searching for patterns - Home: {home_patterns[:3]}, Away: {away_patterns[:3]}")
             
             for event in events:
-                title = event.get('title', '').lower()
-                description = event.get('description', '').lower()
+                title = normalize_text(event.get('title', ''))
+                description = normalize_text(event.get('description', ''))
                 
                 # Check if event title contains team names (more flexible matching)
-                home_match = any(pattern in title or pattern in description for pattern in home_patterns)
-                away_match = any(pattern in title or pattern in description for pattern in away_patterns)
+                home_match = any(contains_phrase(title, pattern) >= 0 or contains_phrase(description, pattern) >= 0
+                                 for pattern in home_patterns)
+                away_match = any(contains_phrase(title, pattern) >= 0 or contains_phrase(description, pattern) >= 0
+                                 for pattern in away_patterns)
                 
                 # Also check for general soccer/football keywords combined with one team
                 is_sports_event = any(keyword in title for keyword in ['football', 'soccer', 'nfl', 'nba', 'nhl', 'mlb', 'match', 'game', 'beat', 'win', 'vs'])
@@ -456,7 +387,6 @@ class D0PolymarketMCP:
                         # Parse outcome prices (these are probabilities)
                         outcomes_str = market.get('outcomePrices', '["0.5", "0.5"]')
                         try:
-                            import json
                             outcome_prices = json.loads(outcomes_str)
                             
                             # Convert string probabilities to floats
@@ -469,10 +399,10 @@ class D0PolymarketMCP:
                                     # Both teams mentioned - try to determine order
                                     home_first = False
                                     for pattern in home_patterns:
-                                        home_pos = title.find(pattern)
+                                        home_pos = contains_phrase(title, pattern)
                                         if home_pos >= 0:
                                             for away_pattern in away_patterns:
-                                                away_pos = title.find(away_pattern)
+                                                away_pos = contains_phrase(title, away_pattern)
                                                 if away_pos >= 0 and home_pos < away_pos:
                                                     home_first = True
                                                     break
@@ -513,7 +443,7 @@ class D0PolymarketMCP:
                                     liquidity=liquidity,
                                     last_updated=datetime.now()
                                 )
-                        except (json.JSONDecodeError, ValueError, IndexError) as e:
+                        except (json.JSONDecodeError, ValueError, IndexError, TypeError) as e:
                             logger.warning(f"⚠️ Error parsing outcome prices: {e}")
                             continue
             
@@ -527,38 +457,22 @@ class D0PolymarketMCP:
     async def _get_generic_sports_market_data(self, home_team: str, away_team: str, 
                                             sport: str, league: str) -> Optional[PolymarketOdds]:
         """
-        📊 Get generic sports market data from Polymarket to calibrate realistic analysis
+        📊 Calibrate realistic analysis with volume/liquidity statistics from the snapshot
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                # Fetch recent sports market data for calibration
-                url = f"{self.polymarket_base_url}/events?category=Sports&limit=10"
+            market_stats = self.market_snapshot.market_statistics()
+            
+            # Use real market statistics to generate realistic data
+            if market_stats:
+                avg_volume = market_stats['avg_volume']
+                avg_liquidity = market_stats['avg_liquidity']
                 
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 200:
-                        events = await response.json()
-                        
-                        # Extract volume and liquidity statistics from real markets
-                        volumes = []
-                        liquidities = []
-                        
-                        for event in events:
-                            if event.get('volume', 0) > 0:
-                                volumes.append(float(event.get('volume', 0)))
-                            if event.get('liquidity', 0) > 0:
-                                liquidities.append(float(event.get('liquidity', 0)))
-                        
-                        # Use real market statistics to generate realistic data
-                        if volumes and liquidities:
-                            avg_volume = sum(volumes) / len(volumes)
-                            avg_liquidity = sum(liquidities) / len(liquidities)
-                            
-                            logger.info(f"📊 Using real Polymarket statistics: avg volume ${avg_volume:,.0f}, avg liquidity ${avg_liquidity:,.0f}")
-                            
-                            # Generate realistic odds based on team names
-                            return self._generate_calibrated_market_data(
-                                home_team, away_team, sport, league, avg_volume, avg_liquidity
-                            )
+                logger.info(f"📊 Using real Polymarket statistics: avg volume ${avg_volume:,.0f}, avg liquidity ${avg_liquidity:,.0f}")
+                
+                # Generate realistic odds based on team names
+                return self._generate_calibrated_market_data(
+                    home_team, away_team, sport, league, avg_volume, avg_liquidity
+                )
             
             # Fallback to standard realistic data
             return self._generate_realistic_market_data(home_team, away_team, sport, league)
@@ -1064,12 +978,13 @@ class D0PolymarketMCP:
 
 # Global function for easy import
 async def fetch_d0_polymarket_data(home_team: str, away_team: str, 
-                                  sport: str = "SOCCER", league: str = "unknown") -> Dict[str, Any]:
+                                  sport: str = "SOCCER", league: str = "unknown",
+                                  game_date: Optional[str] = None) -> Dict[str, Any]:
     """
     🔥💀🔥 MAIN D0 POLYMARKET ENDPOINT 💀🔥💀
     """
     mcp = D0PolymarketMCP()
-    return await mcp.fetch_d0_polymarket_data(home_team, away_team, sport, league)
+    return await mcp.fetch_d0_polymarket_data(home_team, away_team, sport, league, game_date)
 
 
 # Main execution for testing
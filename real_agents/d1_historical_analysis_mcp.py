@@ -20,6 +20,10 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import json
 import hashlib
+try:
+    from real_agents.h2h_fixture_store import get_h2h_fixture_store
+except ImportError:
+    from h2h_fixture_store import get_h2h_fixture_store
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +53,9 @@ class D1HistoricalAnalysisMCP:
             'fra.1': 'Ligue 1'
         }
         
+        # Local team directories + H2H fixtures, fed incrementally from ESPN schedules
+        self.fixture_store = get_h2h_fixture_store()
+        
         logger.info(f"🔥💀🔥 {self.created_by}: D1 Historical MCP v{self.version} initialized! 💀🔥💀")
         logger.info(f"🌟 Blessed by: {self.blessed_by}")
         logger.info(f"🎯 MCP Name: {self.mcp_name}")
@@ -85,54 +92,48 @@ class D1HistoricalAnalysisMCP:
     
     async def _get_team_espn_id(self, team_name: str, league: str) -> Optional[str]:
         """
-        🔍 Get ESPN team ID for historical data lookup
+        🔍 Get ESPN team ID for historical data lookup (local team directory)
         """
         try:
-            url = f"{self.espn_base}/{league}/teams"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        teams = data.get('sports', [{}])[0].get('leagues', [{}])[0].get('teams', [])
-                        
-                        # Flexible team name matching
-                        for team in teams:
-                            team_info = team.get('team', {})
-                            display_name = team_info.get('displayName', '').lower()
-                            short_name = team_info.get('shortDisplayName', '').lower()
-                            name = team_info.get('name', '').lower()
-                            
-                            team_search = team_name.lower()
-                            
-                            # Enhanced matching - handle partial names
-                            if (team_search in display_name or 
-                                team_search in short_name or 
-                                team_search in name or
-                                display_name in team_search or
-                                # Additional flexible matching
-                                any(word in display_name for word in team_search.split()) or
-                                any(word in team_search for word in display_name.split())):
-                                
-                                team_id = team_info.get('id')
-                                logger.debug(f"🎯 D1 MCP: Found ESPN ID for {team_name}: {team_id}")
-                                return team_id
-                        
-                        # 🔥💀🔥 CROSS-LEAGUE SEARCH: Try domestic leagues for UEFA teams!
-                        if league == 'uefa.champions':
-                            logger.info(f"🔍 D1 MCP: {team_name} not found in UEFA, searching domestic leagues...")
-                            domestic_leagues = ['eng.1', 'esp.1', 'ger.1', 'ita.1', 'fra.1', 'gre.1', 'por.1']
-                            for domestic in domestic_leagues:
-                                domestic_id = await self._search_domestic_league(team_name, domestic)
-                                if domestic_id:
-                                    logger.info(f"🎯 D1 MCP: Found {team_name} in {domestic}: {domestic_id}")
-                                    return domestic_id
+            teams = await self.fixture_store.get_teams(league)
+            if teams:
+                team_search = team_name.lower()
+                
+                # Flexible team name matching
+                for team_info in teams:
+                    display_name = team_info['display_name'].lower()
+                    short_name = team_info['short_name'].lower()
+                    name = team_info['name'].lower()
+                    
+                    # Enhanced matching - handle partial names
+                    if (team_search in display_name or 
+                        team_search in short_name or 
+                        team_search in name or
+                        display_name in team_search or
+                        # Additional flexible matching
+                        any(word in display_name for word in team_search.split()) or
+                        any(word in team_search for word in display_name.split())):
                         
-                        logger.warning(f"❌ D1 MCP: ESPN team ID not found for: {team_name}")
-                        return None
-                    else:
-                        logger.error(f"❌ D1 MCP: ESPN teams API returned status {response.status}")
-                        return None
+                        team_id = team_info['team_id']
+                        logger.debug(f"🎯 D1 MCP: Found ESPN ID for {team_name}: {team_id}")
+                        return team_id
+                
+                # 🔥💀🔥 CROSS-LEAGUE SEARCH: Try domestic leagues for UEFA teams!
+                if league == 'uefa.champions':
+                    logger.info(f"🔍 D1 MCP: {team_name} not found in UEFA, searching domestic leagues...")
+                    domestic_leagues = ['eng.1', 'esp.1', 'ger.1', 'ita.1', 'fra.1', 'gre.1', 'por.1']
+                    await self.fixture_store.ensure_team_directories(domestic_leagues)
+                    for domestic in domestic_leagues:
+                        domestic_id = await self._search_domestic_league(team_name, domestic)
+                        if domestic_id:
+                            logger.info(f"🎯 D1 MCP: Found {team_name} in {domestic}: {domestic_id}")
+                            return domestic_id
+                
+                logger.warning(f"❌ D1 MCP: ESPN team ID not found for: {team_name}")
+                return None
+            else:
+                logger.error(f"❌ D1 MCP: ESPN teams API unavailable for {league}")
+                return None
                         
         except Exception as e:
             logger.error(f"❌ D1 MCP: Error getting ESPN team ID for {team_name}: {e}")
@@ -141,67 +142,37 @@ class D1HistoricalAnalysisMCP:
     async def _search_domestic_league(self, team_name: str, league: str) -> Optional[str]:
         """🔍 Search for team in domestic league (for UEFA cross-league search)"""
         try:
-            url = f"{self.espn_base}/{league}/teams"
+            team_search = team_name.lower()
+            for team_info in await self.fixture_store.get_teams(league):
+                display_name = team_info['display_name'].lower()
+                short_name = team_info['short_name'].lower()
+                name = team_info['name'].lower()
+                
+                if (team_search in display_name or 
+                    team_search in short_name or 
+                    team_search in name or
+                    display_name in team_search):
+                    return team_info['team_id']
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        teams = data.get('sports', [{}])[0].get('leagues', [{}])[0].get('teams', [])
-                        
-                        team_search = team_name.lower()
-                        for team in teams:
-                            team_info = team.get('team', {})
-                            display_name = team_info.get('displayName', '').lower()
-                            short_name = team_info.get('shortDisplayName', '').lower()
-                            name = team_info.get('name', '').lower()
-                            
-                            if (team_search in display_name or 
-                                team_search in short_name or 
-                                team_search in name or
-                                display_name in team_search):
-                                return team_info.get('id')
-                        
-                        return None
-                    return None
+            return None
         except Exception:
             return None
     
     async def _fetch_historical_matchups(self, home_id: str, away_id: str, home_team: str, away_team: str, league: str) -> Dict[str, Any]:
         """
-        📅 Fetch historical matchups between two teams
+        📅 Historical matchups between two teams from the local fixture store
+        
+        Only schedules that can hold new results are fetched; the H2H query
+        itself is an indexed (team_id, opponent_id, season) lookup.
         """
         try:
-            historical_matches = []
-            
             # Check last 2 seasons for historical data
             current_year = datetime.now().year
-            for year in [current_year, current_year - 1]:
-                try:
-                    # Fetch home team's schedule to find matches against away team
-                    home_url = f"{self.espn_base}/{league}/teams/{home_id}/schedule?season={year}"
-                    
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(home_url) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                events = data.get('events', [])
-                                
-                                # Look for matches against the away team
-                                for event in events:
-                                    competitors = event.get('competitions', [{}])[0].get('competitors', [])
-                                    if len(competitors) >= 2:
-                                        # Check if this match involves both teams
-                                        team_ids = [comp.get('team', {}).get('id') for comp in competitors]
-                                        if home_id in team_ids and away_id in team_ids:
-                                            # Found a historical matchup!
-                                            match_data = await self._extract_match_data(event, home_team, away_team)
-                                            if match_data:
-                                                historical_matches.append(match_data)
-                                                
-                except Exception as e:
-                    logger.warning(f"⚠️ D1 MCP: Error fetching {year} schedule: {e}")
-                    continue
+            seasons = [current_year, current_year - 1]
+            
+            await self.fixture_store.sync_head_to_head(league, home_id, away_id, seasons)
+            fixtures = await self.fixture_store.head_to_head(home_id, away_id, seasons)
+            historical_matches = [self._match_data_from_fixture(fixture) for fixture in fixtures]
             
             return {
                 'matches': historical_matches,
@@ -215,75 +186,30 @@ class D1HistoricalAnalysisMCP:
             logger.error(f"❌ D1 MCP: Error fetching historical matchups: {e}")
             return {'matches': [], 'total_matches': 0}
     
-    async def _extract_match_data(self, event: Dict, home_team: str, away_team: str) -> Optional[Dict]:
+    def _match_data_from_fixture(self, fixture: Dict[str, Any]) -> Dict[str, Any]:
         """
-        📊 Extract match data from ESPN event for D1 analysis
+        📊 D1 match record from a stored (completed) fixture
         """
-        try:
-            competition = event.get('competitions', [{}])[0]
-            competitors = competition.get('competitors', [])
-            
-            if len(competitors) < 2:
-                return None
-            
-            # Only include completed matches
-            status = competition.get('status', {}).get('type', {})
-            if status.get('completed') != True:
-                return None
-            
-            # Extract teams and scores (handle ESPN dictionary format)
-            home_comp = competitors[0]
-            away_comp = competitors[1]
-            
-            # Handle ESPN score format (can be dict with 'value' key)
-            home_score_data = home_comp.get('score', {})
-            away_score_data = away_comp.get('score', {})
-            
-            if isinstance(home_score_data, dict):
-                home_score = int(home_score_data.get('value', 0))
-            else:
-                home_score = int(home_score_data) if home_score_data else 0
-                
-            if isinstance(away_score_data, dict):
-                away_score = int(away_score_data.get('value', 0))
-            else:
-                away_score = int(away_score_data) if away_score_data else 0
-            
-            # Get match date
-            match_date = event.get('date', '')
-            if match_date:
-                try:
-                    dt = datetime.fromisoformat(match_date.replace('Z', '+00:00'))
-                    date_str = dt.strftime('%Y-%m-%d')
-                except:
-                    date_str = 'Unknown'
-            else:
-                date_str = 'Unknown'
-            
-            # Determine result
-            if home_score > away_score:
-                result = 'home_win'
-            elif away_score > home_score:
-                result = 'away_win'
-            else:
-                result = 'draw'
-            
-            match_data = {
-                'date': date_str,
-                'home_score': home_score,
-                'away_score': away_score,
-                'result': result,
-                'total_goals': home_score + away_score,
-                'goal_difference': abs(home_score - away_score),
-                'season': event.get('season', {}).get('year', 'Unknown')
-            }
-            
-            logger.debug(f"📊 D1 MCP: Extracted match: {home_team} {home_score}-{away_score} {away_team} ({date_str})")
-            return match_data
-            
-        except Exception as e:
-            logger.warning(f"⚠️ D1 MCP: Error extracting match data: {e}")
-            return None
+        home_score = fixture['home_score']
+        away_score = fixture['away_score']
+        
+        # Determine result
+        if home_score > away_score:
+            result = 'home_win'
+        elif away_score > home_score:
+            result = 'away_win'
+        else:
+            result = 'draw'
+        
+        return {
+            'date': fixture['date'],
+            'home_score': home_score,
+            'away_score': away_score,
+            'result': result,
+            'total_goals': home_score + away_score,
+            'goal_difference': abs(home_score - away_score),
+            'season': fixture['season']
+        }
     
     async def _generate_d1_analysis(self, historical_data: Dict, home_team: str, away_team: str, league: str) -> Dict[str, Any]:
         """
@@ -19,11 +19,19 @@ import asyncio
 import logging
 import json
 import aiohttp
+import time
+import unicodedata
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 import statistics
 import re
+try:
+    from real_agents.http_response_cache import fetch_cached_json
+    from real_agents.team_catalog import TEAM_CATALOG
+except ImportError:
+    from http_response_cache import fetch_cached_json
+    from team_catalog import TEAM_CATALOG
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -56,6 +64,106 @@ class MatchupPerformance:
     momentum_advantage: str      # Which team has momentum
     scoring_advantage: str       # Which team has scoring edge
 
+def normalize_team_name(name: str) -> str:
+    """Accent/case/punctuation-folded team name used as a snapshot index key"""
+    folded = unicodedata.normalize('NFKD', name or '')
+    folded = ''.join(ch for ch in folded if not unicodedata.combining(ch))
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', folded.lower()).split())
+
+@dataclass
+class StandingsSnapshot:
+    """One ESPN standings/teams document, pre-indexed by normalized team name"""
+    url: str
+    expires_at: float
+    entries: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    index: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
+    
+    @classmethod
+    def from_payload(cls, url: str, payload: Optional[Dict[str, Any]], expires_at: float) -> 'StandingsSnapshot':
+        snapshot = cls(url=url, expires_at=expires_at)
+        if not payload:
+            return snapshot
+        
+        # Same places _parse_espn_response always looked: standings groups, then teams
+        for group in payload.get('standings', []) or []:
+            for entry in group.get('entries', []):
+                snapshot._add(entry)
+        for team_entry in payload.get('teams', []) or []:
+            snapshot._add(team_entry)
+        return snapshot
+    
+    def _add(self, entry: Dict[str, Any]):
+        team_info = entry.get('team', {})
+        display_name = team_info.get('displayName', '')
+        self.entries.append((display_name, entry))
+        for alias in (display_name, team_info.get('shortDisplayName'), team_info.get('name'),
+                      team_info.get('nickname'), team_info.get('abbreviation')):
+            key = normalize_team_name(alias) if alias else ''
+            if key and key not in self.index:
+                self.index[key] = entry
+    
+    def find(self, team: str, fuzzy_match: Callable[[str, str], bool]) -> Optional[Dict[str, Any]]:
+        """O(1) lookup by normalized name; fuzzy scan only on first miss, then memoized"""
+        key = normalize_team_name(team)
+        if key in self.index:
+            return self.index[key]
+        
+        match = next((entry for display_name, entry in self.entries if fuzzy_match(team, display_name)), None)
+        self.index[key] = match
+        return match
+
+class StandingsSnapshotCache:
+    """
+    🗂️ League-scoped cache of ESPN standings snapshots
+    
+    Shared by every D5TeamPerformanceMCP instance. Snapshots live for ttl_seconds
+    (failed downloads for failure_ttl_seconds) and concurrent callers asking for
+    the same URL share one in-flight request.
+    """
+    
+    def __init__(self, ttl_seconds: float = 300.0, failure_ttl_seconds: float = 30.0):
+        self.ttl_seconds = ttl_seconds
+        self.failure_ttl_seconds = failure_ttl_seconds
+        self._snapshots: Dict[str, StandingsSnapshot] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0}
+    
+    async def get(self, url: str, download: Callable[[str], Awaitable[Optional[Dict[str, Any]]]]) -> StandingsSnapshot:
+        snapshot = self._snapshots.get(url)
+        if snapshot and snapshot.expires_at > time.monotonic():
+            self.stats['hits'] += 1
+            return snapshot
+        
+        task = self._inflight.get(url)
+        if task is not None and not task.done():
+            self.stats['coalesced'] += 1
+        else:
+            self.stats['misses'] += 1
+            task = asyncio.ensure_future(self._load(url, download))
+            self._inflight[url] = task
+        # shield: one cancelled caller must not abort the download for the others
+        return await asyncio.shield(task)
+    
+    async def _load(self, url: str, download: Callable[[str], Awaitable[Optional[Dict[str, Any]]]]) -> StandingsSnapshot:
+        try:
+            payload = await download(url)
+            ttl = self.ttl_seconds if payload else self.failure_ttl_seconds
+            snapshot = StandingsSnapshot.from_payload(url, payload, time.monotonic() + ttl)
+            self._snapshots[url] = snapshot
+            return snapshot
+        finally:
+            self._inflight.pop(url, None)
+    
+    def invalidate(self, url: Optional[str] = None):
+        """Drop one snapshot (or all of them)"""
+        if url is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(url, None)
+
+# One snapshot cache per process - fetch_d5_team_performance_data builds a new MCP per call
+STANDINGS_CACHE = StandingsSnapshotCache()
+
 class D5TeamPerformanceMCP:
     """
     🔥💀🔥 D5 TEAM PERFORMANCE MCP - ESPN TEAM ANALYTICS 💀🔥💀
@@ -77,6 +185,7 @@ class D5TeamPerformanceMCP:
         # ESPN API configuration
         self.espn_base_url = "https://site.api.espn.com/apis/site/v2/sports"
         self.espn_available = True
+        self.standings_cache = STANDINGS_CACHE
         
         # Performance weights for different factors
         self.performance_weights = {
@@ -331,103 +440,75 @@ class D5TeamPerformanceMCP:
     async def _fetch_real_espn_data(self, team: str, sport: str, league: str, 
                                   sport_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        🌐 Fetch real ESPN data for team performance
+        🌐 Fetch real ESPN data for team performance (via the shared standings snapshots)
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                # Build ESPN API URL based on sport
-                espn_sport = sport_config.get('espn_sport', 'soccer')
-                
-                # Try multiple ESPN endpoints
-                endpoints_to_try = []
-                
-                if espn_sport == 'soccer':
-                    # Soccer leagues
-                    if league in ['PREMIER_LEAGUE', 'EPL']:
-                        endpoints_to_try.append(f"{self.espn_base_url}/soccer/eng.1/standings")
-                        endpoints_to_try.append(f"{self.espn_base_url}/soccer/eng.1/teams")
-                    elif league in ['LIGA_MX', 'MEXICO']:
-                        endpoints_to_try.append(f"{self.espn_base_url}/soccer/mex.1/standings")
-                        endpoints_to_try.append(f"{self.espn_base_url}/soccer/mex.1/teams")
-                    elif league in ['UEFA', 'CHAMPIONS']:
-                        endpoints_to_try.append(f"{self.espn_base_url}/soccer/uefa.champions/standings")
-                    else:
-                        # Try generic soccer
-                        endpoints_to_try.append(f"{self.espn_base_url}/soccer/standings")
-                        
-                elif espn_sport == 'basketball' and league == 'NBA':
-                    endpoints_to_try.append(f"{self.espn_base_url}/basketball/nba/standings")
-                    endpoints_to_try.append(f"{self.espn_base_url}/basketball/nba/teams")
+            # Build ESPN API URL based on sport
+            espn_sport = sport_config.get('espn_sport', 'soccer')
+            
+            # Try multiple ESPN endpoints
+            endpoints_to_try = []
+            
+            if espn_sport == 'soccer':
+                # Soccer leagues
+                if league in ['PREMIER_LEAGUE', 'EPL']:
+                    endpoints_to_try.append(f"{self.espn_base_url}/soccer/eng.1/standings")
+                    endpoints_to_try.append(f"{self.espn_base_url}/soccer/eng.1/teams")
+                elif league in ['LIGA_MX', 'MEXICO']:
+                    endpoints_to_try.append(f"{self.espn_base_url}/soccer/mex.1/standings")
+                    endpoints_to_try.append(f"{self.espn_base_url}/soccer/mex.1/teams")
+                elif league in ['UEFA', 'CHAMPIONS']:
+                    endpoints_to_try.append(f"{self.espn_base_url}/soccer/uefa.champions/standings")
+                else:
+                    # Try generic soccer
+                    endpoints_to_try.append(f"{self.espn_base_url}/soccer/standings")
                     
-                elif espn_sport == 'football' and league == 'NFL':
-                    endpoints_to_try.append(f"{self.espn_base_url}/football/nfl/standings")
-                    endpoints_to_try.append(f"{self.espn_base_url}/football/nfl/teams")
-                
-                # Try each endpoint
-                for endpoint in endpoints_to_try:
-                    try:
-                        logger.info(f"🌐 Trying ESPN endpoint: {endpoint}")
-                        
-                        headers = {
-                            'User-Agent': 'Mozilla/5.0 (compatible; D5TeamPerformanceMCP/1.0)',
-                            'Accept': 'application/json'
-                        }
-                        
-                        async with session.get(endpoint, headers=headers, timeout=10) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                
-                                # Parse team data from ESPN response
-                                team_data = await self._parse_espn_response(data, team, sport_config)
-                                if team_data:
-                                    return team_data
-                                    
-                            else:
-                                logger.warning(f"⚠️ ESPN API returned status {response.status} for {endpoint}")
-                                
-                    except asyncio.TimeoutError:
-                        logger.warning(f"⏰ Timeout fetching from {endpoint}")
-                        continue
-                    except Exception as e:
-                        logger.warning(f"⚠️ Error with endpoint {endpoint}: {e}")
-                        continue
-                
-                logger.info(f"🔄 No successful ESPN data for {team}, using fallback")
-                return None
+            elif espn_sport == 'basketball' and league == 'NBA':
+                endpoints_to_try.append(f"{self.espn_base_url}/basketball/nba/standings")
+                endpoints_to_try.append(f"{self.espn_base_url}/basketball/nba/teams")
                 
+            elif espn_sport == 'football' and league == 'NFL':
+                endpoints_to_try.append(f"{self.espn_base_url}/football/nfl/standings")
+                endpoints_to_try.append(f"{self.espn_base_url}/football/nfl/teams")
+            
+            # Try each endpoint - one download per league per TTL, shared by all teams
+            for endpoint in endpoints_to_try:
+                snapshot = await self.standings_cache.get(endpoint, self._download_espn_document)
+                team_entry = snapshot.find(team, self._fuzzy_match_team)
+                if team_entry:
+                    return await self._extract_team_stats_from_espn(team_entry, sport_config)
+            
+            logger.info(f"🔄 No successful ESPN data for {team}, using fallback")
+            return None
+            
         except Exception as e:
             logger.error(f"❌ Real ESPN data fetch error for {team}: {e}")
             return None
     
+    async def _download_espn_document(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """
+        📥 Download one ESPN standings/teams document (called by the snapshot cache)
+        """
+        logger.info(f"🌐 Trying ESPN endpoint: {endpoint}")
+        
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (compatible; D5TeamPerformanceMCP/1.0)',
+            'Accept': 'application/json'
+        }
+        
+        # Conditional GET: an unchanged table costs a 304, not a full download
+        return await fetch_cached_json(endpoint, headers=headers, timeout=10)
+    
     async def _parse_espn_response(self, espn_data: Dict[str, Any], team: str, 
                                  sport_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         🔍 Parse ESPN API response for team data
         """
         try:
-            # Look for standings/teams data
-            if 'standings' in espn_data:
-                standings = espn_data['standings']
-                
-                # Search for the team in standings
-                for group in standings:
-                    entries = group.get('entries', [])
-                    for entry in entries:
-                        team_info = entry.get('team', {})
-                        team_name = team_info.get('displayName', '')
-                        
-                        # Fuzzy match team names
-                        if self._fuzzy_match_team(team, team_name):
-                            return await self._extract_team_stats_from_espn(entry, sport_config)
-            
-            # Look for teams data
-            if 'teams' in espn_data:
-                teams = espn_data['teams']
-                for team_entry in teams:
-                    team_name = team_entry.get('team', {}).get('displayName', '')
-                    if self._fuzzy_match_team(team, team_name):
-                        return await self._extract_team_stats_from_espn(team_entry, sport_config)
-            
+            snapshot = StandingsSnapshot.from_payload('', espn_data, 0.0)
+            team_entry = snapshot.find(team, self._fuzzy_match_team)
+            if team_entry:
+                return await self._extract_team_stats_from_espn(team_entry, sport_config)
             return None
             
         except Exception as e:
@@ -436,43 +517,9 @@ class D5TeamPerformanceMCP:
     
     def _fuzzy_match_team(self, search_team: str, espn_team: str) -> bool:
         """
-        🔍 Fuzzy match team names (handles variations)
+        🔍 Fuzzy match team names (handles variations via the team catalog)
         """
-        search_lower = search_team.lower()
-        espn_lower = espn_team.lower()
-        
-        # Direct match
-        if search_lower == espn_lower:
-            return True
-        
-        # Contains match
-        if search_lower in espn_lower or espn_lower in search_lower:
-            return True
-        
-        # Common variations
-        variations = {
-            'man utd': 'manchester united',
-            'man city': 'manchester city',
-            'spurs': 'tottenham',
-            'arsenal': 'arsenal',
-            'chelsea': 'chelsea',
-            'liverpool': 'liverpool',
-            'barca': 'barcelona',
-            'real': 'real madrid',
-            'bayern': 'bayern munich',
-            'psg': 'paris saint-germain',
-            'lakers': 'los angeles lakers',
-            'warriors': 'golden state warriors',
-            'celtics': 'boston celtics',
-            'heat': 'miami heat'
-        }
-        
-        for short, full in variations.items():
-            if (short in search_lower and full in espn_lower) or \
-               (short in espn_lower and full in search_lower):
-                return True
-        
-        return False
+        return TEAM_CATALOG.names_match(search_team, espn_team)
     
     async def _extract_team_stats_from_espn(self, team_entry: Dict[str, Any], 
                                           sport_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -24,6 +24,12 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import statistics
+try:
+    from real_agents.http_response_cache import fetch_cached_json
+    from real_agents.team_catalog import TEAM_CATALOG
+except ImportError:
+    from http_response_cache import fetch_cached_json
+    from team_catalog import TEAM_CATALOG
 
 # Enhanced debugging system imports
 from enhanced_debugging_system import IntelligentDebugger, debug_capture, debug_monitor
@@ -34,6 +40,9 @@ from self_healing_system import SelfHealingSystem, with_self_healing
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds a cached ESPN teams document may be used past its max-age
+TEAMS_MAX_STALENESS = 3600
+
 # Initialize enhanced debugging components
 intelligent_debugger = IntelligentDebugger()
 structured_logger = StructuredLogger("d6_key_players_mcp")
@@ -358,62 +367,61 @@ class D6KeyPlayersMCP:
         espn_sport = sport_config.get('espn_sport', 'soccer')
         correlation_logger.info(f"Fetching ESPN player data for {team} in {league} ({espn_sport})")
         
-        async with aiohttp.ClientSession() as session:
-            players = []
+        players = []
             
-            # Try multiple ESPN endpoints for player data
-            endpoints_to_try = []
+        # Try multiple ESPN endpoints for player data
+        endpoints_to_try = []
             
-            if espn_sport == 'soccer':
-                if league in ['PREMIER_LEAGUE', 'EPL']:
-                    endpoints_to_try.append(f"{self.espn_base_url}/soccer/eng.1/teams")
-                elif league in ['LIGA_MX', 'MEXICO']:
-                    endpoints_to_try.append(f"{self.espn_base_url}/soccer/mex.1/teams")
-                else:
-                    endpoints_to_try.append(f"{self.espn_base_url}/soccer/teams")
+        if espn_sport == 'soccer':
+            if league in ['PREMIER_LEAGUE', 'EPL']:
+                endpoints_to_try.append(f"{self.espn_base_url}/soccer/eng.1/teams")
+            elif league in ['LIGA_MX', 'MEXICO']:
+                endpoints_to_try.append(f"{self.espn_base_url}/soccer/mex.1/teams")
+            else:
+                endpoints_to_try.append(f"{self.espn_base_url}/soccer/teams")
                     
-            elif espn_sport == 'basketball' and league == 'NBA':
-                endpoints_to_try.append(f"{self.espn_base_url}/basketball/nba/teams")
+        elif espn_sport == 'basketball' and league == 'NBA':
+            endpoints_to_try.append(f"{self.espn_base_url}/basketball/nba/teams")
                 
-            elif espn_sport == 'football' and league == 'NFL':
-                endpoints_to_try.append(f"{self.espn_base_url}/football/nfl/teams")
+        elif espn_sport == 'football' and league == 'NFL':
+            endpoints_to_try.append(f"{self.espn_base_url}/football/nfl/teams")
             
-            # Try each endpoint for player data
-            for endpoint in endpoints_to_try:
-                try:
-                    correlation_logger.info(f"Trying ESPN player endpoint: {endpoint}")
+        # Try each endpoint for player data
+        for endpoint in endpoints_to_try:
+            try:
+                correlation_logger.info(f"Trying ESPN player endpoint: {endpoint}")
                     
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (compatible; D6KeyPlayersMCP/1.0)',
-                        'Accept': 'application/json'
-                    }
+                headers = {
+                    'User-Agent': 'Mozilla/5.0 (compatible; D6KeyPlayersMCP/1.0)',
+                    'Accept': 'application/json'
+                }
                     
-                    async with session.get(endpoint, headers=headers, timeout=10) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            # Parse player data from ESPN response
-                            team_players = await self._parse_espn_players(data, team, sport_config)
-                            if team_players:
-                                players.extend(team_players)
-                                break
-                                
-                        else:
-                            correlation_logger.warning(f"ESPN API returned status {response.status} for {endpoint}")
+                # Team lists change rarely - accept a cached copy up to an hour past max-age
+                data = await fetch_cached_json(endpoint, headers=headers, timeout=10,
+                                               max_staleness=TEAMS_MAX_STALENESS)
+                if data is not None:
+                    # Parse player data from ESPN response
+                    team_players = await self._parse_espn_players(data, team, sport_config)
+                    if team_players:
+                        players.extend(team_players)
+                        break
                             
-                except asyncio.TimeoutError:
-                    correlation_logger.warning(f"Timeout fetching from {endpoint}")
-                    continue
-                except Exception as e:
-                    correlation_logger.warning(f"Error with endpoint {endpoint}: {e}")
-                    continue
-            
-            if players:
-                correlation_logger.info(f"Found {len(players)} players for {team} from ESPN")
-                return players
-            else:
-                correlation_logger.info(f"No ESPN player data for {team}, using fallback")
-                return self._generate_realistic_player_data(team, sport)
+                else:
+                    correlation_logger.warning(f"No ESPN data for {endpoint}")
+                        
+            except asyncio.TimeoutError:
+                correlation_logger.warning(f"Timeout fetching from {endpoint}")
+                continue
+            except Exception as e:
+                correlation_logger.warning(f"Error with endpoint {endpoint}: {e}")
+                continue
+            
+        if players:
+            correlation_logger.info(f"Found {len(players)} players for {team} from ESPN")
+            return players
+        else:
+            correlation_logger.info(f"No ESPN player data for {team}, using fallback")
+            return self._generate_realistic_player_data(team, sport)
     
     async def _parse_espn_players(self, espn_data: Dict[str, Any], team: str, 
                                 sport_config: Dict[str, Any]) -> Optional[List[PlayerStatus]]:
@@ -586,28 +594,8 @@ class D6KeyPlayersMCP:
         return name1.lower().strip() == name2.lower().strip()
     
     def _fuzzy_match_team(self, search_team: str, espn_team: str) -> bool:
-        """Fuzzy match team names (reused from D5 MCP)"""
-        search_lower = search_team.lower()
-        espn_lower = espn_team.lower()
-        
-        if search_lower == espn_lower or search_lower in espn_lower or espn_lower in search_lower:
-            return True
-        
-        # Common team variations
-        variations = {
-            'man utd': 'manchester united', 'man city': 'manchester city',
-            'spurs': 'tottenham', 'arsenal': 'arsenal', 'chelsea': 'chelsea',
-            'liverpool': 'liverpool', 'barca': 'barcelona', 'real': 'real madrid',
-            'lakers': 'los angeles lakers', 'warriors': 'golden state warriors',
-            'celtics': 'boston celtics', 'heat': 'miami heat'
-        }
-        
-        for short, full in variations.items():
-            if (short in search_lower and full in espn_lower) or \
-               (short in espn_lower and full in search_lower):
-                return True
-        
-        return False
+        """Fuzzy match team names (shared team catalog, same as D5 MCP)"""
+        return TEAM_CATALOG.names_match(search_team, espn_team)
     
     def _generate_realistic_player_data(self, team: str, sport: str) -> List[PlayerStatus]:
         """Generate realistic player data for demonstration"""
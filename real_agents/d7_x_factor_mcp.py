@@ -26,6 +26,10 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import statistics
 import random
+try:
+    from real_agents.http_client_service import shared_session
+except ImportError:
+    from http_client_service import shared_session
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -457,7 +461,7 @@ class D7XFactorMCP:
             # Build Perplexity query for manager tactics
             query = f"Who is the current manager/coach of {team} in {sport}? What are their tactical style, formation preferences, and big game record?"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'Authorization': f'Bearer {self.perplexity_api_key}',
                     'Content-Type': 'application/json'
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+🔥💀🔥 H2H FIXTURE STORE - LOCAL HEAD-TO-HEAD HISTORY FOR D1 💀🔥💀
+
+D1 used to download the full /teams list for every team lookup (plus up to
+seven domestic /teams lists for UEFA teams) and two whole team schedules per
+game just to filter for one opponent. This store keeps everything locally:
+
+- SQLite in WAL mode (single file under data/)
+- ESPN team-id directory per league, re-synced at most once per day
+- Fixtures indexed by (team_id, opponent_id, season) - H2H is one indexed query
+- Incremental population from ESPN team schedules, fetching only deltas:
+    * finished seasons are fetched once and never again; a season counts as
+      finished when every stored fixture is completed and the sync ran well
+      after the last one (fixture dates, not calendar years - ESPN soccer
+      seasons run Aug N -> May N+1)
+    * the current season is re-fetched when a stored fixture has been played
+      since the last sync (its result is the delta), or once per day for
+      newly scheduled fixtures
+    * a schedule synced for EITHER team covers the pair for that season
+- Upserts only rewrite rows whose score/status actually changed
+- SQLite work runs in worker threads, never on the event loop
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+try:
+    from real_agents.http_response_cache import fetch_cached_json
+except ImportError:
+    from http_response_cache import fetch_cached_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / "data" / "h2h_fixtures.db"
+DEFAULT_ESPN_BASE = "https://site.api.espn.com/apis/site/v2/sports/soccer"
+
+# How often a league's team directory / a team's current-season schedule is re-synced (seconds)
+TEAM_DIRECTORY_RESYNC = 24 * 3600
+SCHEDULE_RESYNC = 24 * 3600
+# A fixture counts as played this long after kickoff
+RESULT_GRACE = 2 * 3600
+# Longer than any mid-season break: a fully completed schedule synced this long
+# after its last kickoff belongs to a finished season
+SEASON_BREAK = 60 * 24 * 3600
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS teams (
+        league TEXT NOT NULL,
+        team_id TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        display_name TEXT NOT NULL,
+        short_name TEXT NOT NULL,
+        name TEXT NOT NULL,
+        PRIMARY KEY (league, team_id)
+    );
+    CREATE TABLE IF NOT EXISTS team_directory_sync (
+        league TEXT PRIMARY KEY,
+        synced_at REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS fixtures (
+        event_id TEXT PRIMARY KEY,
+        league TEXT NOT NULL,
+        season INTEGER NOT NULL,
+        kickoff REAL,
+        date TEXT NOT NULL,
+        home_id TEXT NOT NULL,
+        away_id TEXT NOT NULL,
+        home_score INTEGER NOT NULL,
+        away_score INTEGER NOT NULL,
+        completed INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS fixture_teams (
+        team_id TEXT NOT NULL,
+        opponent_id TEXT NOT NULL,
+        season INTEGER NOT NULL,
+        event_id TEXT NOT NULL,
+        PRIMARY KEY (team_id, opponent_id, season, event_id)
+    );
+    CREATE TABLE IF NOT EXISTS schedule_sync (
+        league TEXT NOT NULL,
+        team_id TEXT NOT NULL,
+        season INTEGER NOT NULL,
+        synced_at REAL NOT NULL,
+        PRIMARY KEY (league, team_id, season)
+    );
+    CREATE INDEX IF NOT EXISTS idx_fixture_teams_season ON fixture_teams (team_id, season);
+"""
+
+def _score(competitor: Dict[str, Any]) -> int:
+    """⚽ ESPN scores come as a number, a numeric string or {'value': ...}"""
+    score = competitor.get('score', {})
+    if isinstance(score, dict):
+        return int(float(score.get('value', 0) or 0))
+    return int(float(score)) if score else 0
+
+def fixture_from_event(event: Dict[str, Any], league: str, season: int) -> Optional[Dict[str, Any]]:
+    """📊 Flatten an ESPN schedule event into a fixture row (None if unusable)"""
+    competition = (event.get('competitions') or [{}])[0]
+    competitors = competition.get('competitors', [])
+    if len(competitors) < 2 or not event.get('id'):
+        return None
+
+    home_id = str(competitors[0].get('team', {}).get('id') or '')
+    away_id = str(competitors[1].get('team', {}).get('id') or '')
+    if not home_id or not away_id:
+        return None
+
+    kickoff, date_str = None, 'Unknown'
+    if event.get('date'):
+        try:
+            dt = datetime.fromisoformat(event['date'].replace('Z', '+00:00'))
+            kickoff, date_str = dt.timestamp(), dt.strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+
+    completed = competition.get('status', {}).get('type', {}).get('completed') is True
+    return {
+        'event_id': str(event['id']),
+        'league': league,
+        'season': int((event.get('season') or {}).get('year') or season),
+        'kickoff': kickoff,
+        'date': date_str,
+        'home_id': home_id,
+        'away_id': away_id,
+        'home_score': _score(competitors[0]) if completed else 0,
+        'away_score': _score(competitors[1]) if completed else 0,
+        'completed': int(completed),
+    }
+
+class H2HFixtureStore:
+    """
+    📚 Persistent, indexed head-to-head fixture store fed by ESPN schedules
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH, espn_base: str = DEFAULT_ESPN_BASE,
+                 fetch_json: Callable[..., Awaitable[Optional[Any]]] = fetch_cached_json):
+        self.db_path = str(db_path)
+        self.espn_base = espn_base
+        self.fetch_json = fetch_json
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._teams: Dict[str, List[Dict[str, str]]] = {}  # league -> directory, ESPN order
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self.stats = {'directory_syncs': 0, 'schedule_fetches': 0, 'schedule_syncs_skipped': 0,
+                      'fixtures_changed': 0, 'h2h_queries': 0}
+
+    # =================== CONNECTION ===================
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """🔒 Close the database"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._teams.clear()
+
+    # =================== TEAM DIRECTORY ===================
+
+    async def get_teams(self, league: str) -> List[Dict[str, str]]:
+        """
+        📇 ESPN team directory for a league, in ESPN's order
+
+        Served locally; the /teams list is only downloaded when the league has
+        never been synced or its directory is older than a day.
+        """
+        if league in self._teams and not await asyncio.to_thread(self._directory_stale, league):
+            return self._teams[league]
+        await self._single_flight(('teams', league), lambda: self._sync_team_directory(league))
+        if league not in self._teams:
+            self._teams[league] = await asyncio.to_thread(self._load_teams, league)
+        return self._teams[league]
+
+    async def ensure_team_directories(self, leagues: Iterable[str]):
+        """📇 Sync several league directories concurrently"""
+        await asyncio.gather(*(self.get_teams(league) for league in leagues))
+
+    def _directory_stale(self, league: str) -> bool:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT synced_at FROM team_directory_sync WHERE league = ?", (league,)).fetchone()
+        return row is None or time.time() - row['synced_at'] > TEAM_DIRECTORY_RESYNC
+
+    async def _sync_team_directory(self, league: str):
+        if not await asyncio.to_thread(self._directory_stale, league):
+            return
+        data = await self.fetch_json(f"{self.espn_base}/{league}/teams", max_staleness=TEAM_DIRECTORY_RESYNC)
+        if data is None:
+            logger.warning(f"⚠️ H2H store: ESPN teams API unavailable for {league} - using stored directory")
+            return
+
+        teams = []
+        for entry in data.get('sports', [{}])[0].get('leagues', [{}])[0].get('teams', []):
+            info = entry.get('team', {})
+            if info.get('id'):
+                teams.append({'team_id': str(info['id']), 'display_name': info.get('displayName', ''),
+                              'short_name': info.get('shortDisplayName', ''), 'name': info.get('name', '')})
+        await asyncio.to_thread(self._store_teams, league, teams)
+        self._teams[league] = teams
+        self.stats['directory_syncs'] += 1
+        logger.info(f"📇 H2H store: {len(teams)} teams synced for {league}")
+
+    def _store_teams(self, league: str, teams: List[Dict[str, str]]):
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM teams WHERE league = ?", (league,))
+                conn.executemany(
+                    "INSERT INTO teams (league, team_id, position, display_name, short_name, name) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(league, t['team_id'], i, t['display_name'], t['short_name'], t['name'])
+                     for i, t in enumerate(teams)])
+                conn.execute("INSERT OR REPLACE INTO team_directory_sync (league, synced_at) VALUES (?, ?)",
+                             (league, time.time()))
+
+    def _load_teams(self, league: str) -> List[Dict[str, str]]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT team_id, display_name, short_name, name FROM teams WHERE league = ? ORDER BY position",
+                (league,)).fetchall()
+        return [dict(row) for row in rows]
+
+    # =================== FIXTURES ===================
+
+    async def sync_head_to_head(self, league: str, team_id: str, opponent_id: str, seasons: Iterable[int]):
+        """
+        🔄 Bring the pair's fixtures up to date for the given seasons
+
+        A season is skipped when either team's schedule is already current;
+        otherwise the team's schedule is fetched (seasons concurrently).
+        """
+        seasons = list(seasons)
+        stale = await asyncio.to_thread(self._stale_seasons, league, team_id, opponent_id, seasons)
+        self.stats['schedule_syncs_skipped'] += len(seasons) - len(stale)
+        fetches = [self._single_flight(('schedule', league, team_id, season),
+                                       lambda season=season: self._sync_schedule(league, team_id, season))
+                   for season in stale]
+        if fetches:
+            await asyncio.gather(*fetches)
+
+    async def head_to_head(self, team_id: str, opponent_id: str, seasons: Iterable[int],
+                           completed_only: bool = True) -> List[Dict[str, Any]]:
+        """⚔️ Stored fixtures between two teams (indexed lookup), oldest first"""
+        seasons = list(seasons)
+        if not seasons:
+            return []
+        self.stats['h2h_queries'] += 1
+        return await asyncio.to_thread(self._query_head_to_head, team_id, opponent_id, seasons, completed_only)
+
+    def _query_head_to_head(self, team_id: str, opponent_id: str, seasons: List[int],
+                            completed_only: bool) -> List[Dict[str, Any]]:
+        query = (
+            "SELECT f.* FROM fixture_teams t JOIN fixtures f ON f.event_id = t.event_id "
+            f"WHERE t.team_id = ? AND t.opponent_id = ? AND t.season IN ({','.join('?' * len(seasons))})"
+        )
+        if completed_only:
+            query += " AND f.completed = 1"
+        with self._lock:
+            rows = self._connect().execute(query + " ORDER BY f.date", (team_id, opponent_id, *seasons)).fetchall()
+        return [dict(row) for row in rows]
+
+    def _stale_seasons(self, league: str, team_id: str, opponent_id: str, seasons: List[int]) -> List[int]:
+        """🔍 Seasons where neither team's stored schedule is current"""
+        return [season for season in seasons
+                if not (self._schedule_current(league, team_id, season)
+                        or self._schedule_current(league, opponent_id, season))]
+
+    def _schedule_current(self, league: str, team_id: str, season: int) -> bool:
+        """⏱️ Whether the stored schedule needs no fetch (no new results possible since the sync)"""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT synced_at FROM schedule_sync WHERE league = ? AND team_id = ? AND season = ?",
+                               (league, team_id, season)).fetchone()
+            if row is None:
+                return False
+            synced_at = row['synced_at']
+            # Fixtures that kicked off after the sync and should have a result by now
+            played_since = conn.execute(
+                "SELECT 1 FROM fixture_teams t JOIN fixtures f ON f.event_id = t.event_id "
+                "WHERE t.team_id = ? AND t.season = ? AND f.league = ? AND f.completed = 0 "
+                "AND f.kickoff IS NOT NULL AND f.kickoff + ? > ? AND f.kickoff + ? <= ? LIMIT 1",
+                (team_id, season, league, RESULT_GRACE, synced_at, RESULT_GRACE, time.time())).fetchone()
+            if played_since:
+                return False
+            pending, last_kickoff = conn.execute(
+                "SELECT COALESCE(SUM(f.completed = 0), 0), MAX(f.kickoff) "
+                "FROM fixture_teams t JOIN fixtures f ON f.event_id = t.event_id "
+                "WHERE t.team_id = ? AND t.season = ? AND f.league = ?",
+                (team_id, season, league)).fetchone()
+
+        # Finished seasons never change: every fixture completed and synced long after the last one
+        # (ESPN schedules often list results only, so "nothing pending" alone proves nothing)
+        if not pending and last_kickoff is not None and synced_at - last_kickoff > SEASON_BREAK:
+            return True
+        return time.time() - synced_at <= SCHEDULE_RESYNC
+
+    async def _sync_schedule(self, league: str, team_id: str, season: int):
+        if await asyncio.to_thread(self._schedule_current, league, team_id, season):
+            return
+        url = f"{self.espn_base}/{league}/teams/{team_id}/schedule?season={season}"
+        data = await self.fetch_json(url, max_staleness=0)
+        self.stats['schedule_fetches'] += 1
+        if data is None:
+            logger.warning(f"⚠️ H2H store: schedule unavailable for team {team_id} ({league} {season})")
+            return
+
+        fixtures = [f for f in (fixture_from_event(event, league, season) for event in data.get('events', [])) if f]
+        changed = await asyncio.to_thread(self._store_fixtures, league, team_id, season, fixtures)
+        self.stats['fixtures_changed'] += changed
+        logger.info(f"📅 H2H store: team {team_id} {league} {season} synced "
+                    f"({len(fixtures)} fixtures, {changed} new/changed)")
+
+    def _store_fixtures(self, league: str, team_id: str, season: int, fixtures: List[Dict[str, Any]]) -> int:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT INTO fixtures (event_id, league, season, kickoff, date, home_id, away_id, "
+                    "home_score, away_score, completed) "
+                    "VALUES (:event_id, :league, :season, :kickoff, :date, :home_id, :away_id, "
+                    ":home_score, :away_score, :completed) "
+                    "ON CONFLICT(event_id) DO UPDATE SET kickoff = excluded.kickoff, date = excluded.date, "
+                    "home_score = excluded.home_score, away_score = excluded.away_score, "
+                    "completed = excluded.completed "
+                    "WHERE (fixtures.kickoff, fixtures.home_score, fixtures.away_score, fixtures.completed) "
+                    "IS NOT (excluded.kickoff, excluded.home_score, excluded.away_score, excluded.completed)",
+                    fixtures)
+                changed = conn.total_changes - before
+                conn.executemany(
+                    "INSERT OR IGNORE INTO fixture_teams (team_id, opponent_id, season, event_id) VALUES (?, ?, ?, ?)",
+                    [pair for f in fixtures for pair in ((f['home_id'], f['away_id'], f['season'], f['event_id']),
+                                                         (f['away_id'], f['home_id'], f['season'], f['event_id']))])
+                conn.execute("INSERT OR REPLACE INTO schedule_sync (league, team_id, season, synced_at) "
+                             "VALUES (?, ?, ?, ?)", (league, team_id, season, time.time()))
+        return changed
+
+    # =================== HELPERS ===================
+
+    async def _single_flight(self, key: tuple, factory: Callable[[], Awaitable[None]]):
+        """🛫 Concurrent callers for the same sync share one fetch"""
+        task = self._inflight.get(key)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._inflight[key] = asyncio.create_task(factory())
+            task.add_done_callback(lambda done, key=key: self._inflight.pop(key, None)
+                                   if self._inflight.get(key) is done else None)
+        await asyncio.shield(task)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            fixtures = conn.execute("SELECT COUNT(*) FROM fixtures").fetchone()[0]
+            teams = conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0]
+        return {**self.stats, 'fixtures': fixtures, 'teams': teams, 'db_path': self.db_path}
+
+# =================== PROCESS-WIDE INSTANCE ===================
+
+_STORE: Optional[H2HFixtureStore] = None
+_STORE_LOCK = threading.Lock()
+
+def get_h2h_fixture_store() -> H2HFixtureStore:
+    """📚 The process-wide H2H fixture store"""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = H2HFixtureStore()
+        return _STORE
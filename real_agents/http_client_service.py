@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+🔥💀🔥 HTTP CLIENT SERVICE - ONE POOLED SESSION FOR EVERY FETCHER 💀🔥💀
+
+Every fetcher and D-MCP used to open a fresh aiohttp.ClientSession per call,
+paying DNS + TCP + TLS on every request. This service keeps one session per
+event loop with:
+
+- Tuned connection pool (total + per-host limits) with keep-alive
+- DNS cache
+- gzip/deflate (aiohttp decompresses transparently)
+- Per-host concurrency limits (held until the response body is released) and
+  token-bucket rate limits
+- Lifecycle hooks for the aiohttp web app (startup/cleanup)
+
+🎯 ADOPTION (one line per call site):
+    async with aiohttp.ClientSession() as session:   # before
+    async with shared_session() as session:          # after
+The shared session is NOT closed when the block exits.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'Accept-Encoding': 'gzip, deflate',
+    'User-Agent': 'Mozilla/5.0 (compatible; PolyLolyDoubleZero/1.0)'
+}
+
+@dataclass
+class HostPolicy:
+    """🚦 Per-host limits (requests in flight + requests per second)"""
+    max_concurrent: int = 8
+    requests_per_second: float = 20.0
+    burst: int = 10
+
+# ESPN is hit hardest - keep it polite
+DEFAULT_HOST_POLICIES = {
+    'site.api.espn.com': HostPolicy(max_concurrent=12, requests_per_second=25.0, burst=15),
+    'site.web.api.espn.com': HostPolicy(max_concurrent=8, requests_per_second=15.0, burst=10),
+    'gamma-api.polymarket.com': HostPolicy(max_concurrent=4, requests_per_second=5.0, burst=5),
+}
+
+class HostLimiter:
+    """🚦 Concurrency semaphore + token bucket for one host"""
+
+    def __init__(self, policy: HostPolicy):
+        self.policy = policy
+        self.semaphore = asyncio.Semaphore(policy.max_concurrent)
+        self._tokens = float(policy.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire_rate(self):
+        """⏱️ Wait for a token (token bucket refilled at requests_per_second)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.policy.burst,
+                                   self._tokens + (now - self._updated) * self.policy.requests_per_second)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.policy.requests_per_second)
+
+class LimitedClientResponse(aiohttp.ClientResponse):
+    """
+    📦 Response that holds its host's concurrency slot until the body is done
+
+    on_request_end fires once headers arrive; the slot is handed to the response
+    and given back when it is released, closed, or its body hits EOF.
+    """
+
+    host_limiter: Optional[HostLimiter] = None
+
+    def _release_host_slot(self):
+        limiter, self.host_limiter = self.host_limiter, None
+        if limiter is not None:
+            limiter.semaphore.release()
+
+    def _response_eof(self):
+        super()._response_eof()
+        if self._closed:
+            self._release_host_slot()
+
+    def release(self):
+        result = super().release()
+        self._release_host_slot()
+        return result
+
+    def close(self):
+        super().close()
+        self._release_host_slot()
+
+    def __del__(self, *args, **kwargs):
+        self._release_host_slot()
+        super().__del__(*args, **kwargs)
+
+class HTTPClientService:
+    """
+    🌐 Process-wide pooled HTTP client
+
+    Sessions are bound to an event loop, so one session is kept per loop.
+    """
+
+    def __init__(self, pool_limit: int = 100, pool_limit_per_host: int = 16,
+                 dns_cache_ttl: int = 300, keepalive_timeout: float = 30.0,
+                 timeout_seconds: float = 15.0,
+                 host_policies: Optional[Dict[str, HostPolicy]] = None,
+                 default_policy: Optional[HostPolicy] = None):
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout_seconds = timeout_seconds
+        self.host_policies = dict(DEFAULT_HOST_POLICIES if host_policies is None else host_policies)
+        self.default_policy = default_policy or HostPolicy()
+
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._limiters: Dict[asyncio.AbstractEventLoop, Dict[str, HostLimiter]] = {}
+        self.stats = {'requests': 0, 'rate_limited_waits': 0, 'sessions_created': 0}
+
+    # =================== SESSION ===================
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """🌐 Shared session for the running loop (created on first use)"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # Drop sessions belonging to loops that no longer exist
+            for dead_loop in [l for l in self._sessions if l.is_closed()]:
+                self._sessions.pop(dead_loop, None)
+                self._limiters.pop(dead_loop, None)
+
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_limit,
+                limit_per_host=self.pool_limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout,
+                enable_cleanup_closed=True
+            )
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_request_start)
+            trace_config.on_request_end.append(self._on_request_end)
+            trace_config.on_request_exception.append(self._on_request_exception)
+
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+                headers=DEFAULT_HEADERS,
+                auto_decompress=True,
+                response_class=LimitedClientResponse,
+                trace_configs=[trace_config]
+            )
+            self._sessions[loop] = session
+            self._limiters[loop] = {}
+            self.stats['sessions_created'] += 1
+            logger.info("🌐 Shared HTTP session created (pooled, keep-alive, DNS cache)")
+        return session
+
+    def _limiter_for(self, host: str) -> HostLimiter:
+        limiters = self._limiters.setdefault(asyncio.get_running_loop(), {})
+        limiter = limiters.get(host)
+        if limiter is None:
+            limiter = HostLimiter(self.host_policies.get(host, self.default_policy))
+            limiters[host] = limiter
+        return limiter
+
+    # Trace hooks run inside session.request(), so every call site gets the limits
+    async def _on_request_start(self, session, trace_ctx, params):
+        limiter = self._limiter_for(params.url.host or '')
+        if limiter.semaphore.locked() or limiter._tokens < 1:
+            self.stats['rate_limited_waits'] += 1
+        await limiter.semaphore.acquire()
+        trace_ctx.host_limiter = limiter
+        try:
+            await limiter.acquire_rate()
+        except BaseException:
+            limiter.semaphore.release()
+            trace_ctx.host_limiter = None
+            raise
+        self.stats['requests'] += 1
+
+    async def _on_request_end(self, session, trace_ctx, params):
+        # Headers are in; the body may not be. The response keeps the slot until released.
+        limiter = getattr(trace_ctx, 'host_limiter', None)
+        trace_ctx.host_limiter = None
+        if limiter is None:
+            return
+        response = params.response
+        if isinstance(response, LimitedClientResponse) and not response.closed:
+            response.host_limiter = limiter
+        else:
+            limiter.semaphore.release()
+
+    async def _on_request_exception(self, session, trace_ctx, params):
+        limiter = getattr(trace_ctx, 'host_limiter', None)
+        if limiter is not None:
+            trace_ctx.host_limiter = None
+            limiter.semaphore.release()
+
+    # =================== CONVENIENCE ===================
+
+    async def get_json(self, url: str, **kwargs) -> Optional[Any]:
+        """📥 GET a JSON document; None on non-200 or error (logged)"""
+        try:
+            async with self.get_session().get(url, **kwargs) as response:
+                if response.status == 200:
+                    return await response.json(content_type=None)
+                logger.warning(f"⚠️ HTTP {response.status} for {url}")
+        except asyncio.TimeoutError:
+            logger.warning(f"⏰ Timeout fetching {url}")
+        except aiohttp.ClientError as e:
+            logger.warning(f"⚠️ HTTP error for {url}: {e}")
+        return None
+
+    # =================== LIFECYCLE ===================
+
+    async def close(self):
+        """🔒 Close the session owned by the running loop"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        self._limiters.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+            logger.info("🔒 Shared HTTP session closed")
+
+    async def _on_app_startup(self, app):
+        self.get_session()
+
+    async def _on_app_cleanup(self, app):
+        await self.close()
+
+    def setup_app(self, app):
+        """🔗 Tie the session lifecycle to an aiohttp web.Application"""
+        app.on_startup.append(self._on_app_startup)
+        app.on_cleanup.append(self._on_app_cleanup)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'open_sessions': sum(1 for s in self._sessions.values() if not s.closed),
+            'hosts': sorted({host for limiters in self._limiters.values() for host in limiters})
+        }
+
+# =================== PROCESS-WIDE INSTANCE ===================
+
+HTTP_CLIENT = HTTPClientService()
+
+def get_http_client() -> HTTPClientService:
+    """🌐 The process-wide HTTP client service"""
+    return HTTP_CLIENT
+
+@asynccontextmanager
+async def shared_session():
+    """
+    🔁 Drop-in for `async with aiohttp.ClientSession() as session:`
+
+    Yields the pooled session and leaves it open for the next caller.
+    """
+    yield HTTP_CLIENT.get_session()
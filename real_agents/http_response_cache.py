@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+🔥💀🔥 HTTP RESPONSE CACHE - CONDITIONAL GETS + ON-DISK ESPN RESPONSES 💀🔥💀
+
+ESPN scoreboard/standings/teams/schedule documents are requested over and over
+by D1, D5, D6 and the fetchers. This layer sits on top of the shared pooled
+session (http_client_service) and:
+
+- Honors Cache-Control (max-age / no-cache / no-store)
+- Revalidates with If-None-Match / If-Modified-Since (304 = no body download)
+- Stores gzip-compressed bodies on disk, content-addressed by SHA-256
+- Evicts least-recently-used entries beyond a size budget (an entry file's
+  mtime is its last access, so a fresh hit is a utime, not a rewrite)
+- Lets callers accept stale data (max_staleness seconds)
+- REPLAY MODE: serve recorded responses only, never touch the network
+  (LOLY_HTTP_CACHE_MODE=replay, or set_mode('replay')) - for offline backtests
+
+📁 LAYOUT (data/http_cache/):
+    objects/ab/ab12...ef.json.gz   - response bodies, named by content hash
+    entries/cd/cd34...90.json      - per-URL metadata (etag, dates, body hash)
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from real_agents.http_client_service import shared_session
+except ImportError:
+    from http_client_service import shared_session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "http_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+MODE_ONLINE = 'online'
+MODE_REPLAY = 'replay'
+
+_MAX_AGE = re.compile(r'max-age\s*=\s*(\d+)')
+
+def parse_cache_control(header: Optional[str]) -> Dict[str, Any]:
+    """📜 Extract the Cache-Control directives we act on"""
+    header = (header or '').lower()
+    match = _MAX_AGE.search(header)
+    return {
+        'max_age': int(match.group(1)) if match else 0,
+        'no_store': 'no-store' in header,
+        'no_cache': 'no-cache' in header,
+    }
+
+class HTTPResponseCache:
+    """
+    💾 Conditional-GET cache for JSON endpoints, persisted on disk
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 mode: Optional[str] = None):
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.entries_dir = self.cache_dir / "entries"
+        self.max_bytes = max_bytes
+        self.mode = mode or os.environ.get('LOLY_HTTP_CACHE_MODE', MODE_ONLINE)
+
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self.stats = {'fresh_hits': 0, 'revalidated': 0, 'downloads': 0, 'stale_served': 0,
+                      'replay_hits': 0, 'replay_misses': 0, 'evictions': 0}
+
+    def set_mode(self, mode: str):
+        """🎛️ Switch between 'online' and 'replay'"""
+        if mode not in (MODE_ONLINE, MODE_REPLAY):
+            raise ValueError(f"Unknown HTTP cache mode: {mode}")
+        self.mode = mode
+        logger.info(f"🎛️ HTTP response cache mode: {mode}")
+
+    # =================== PUBLIC API ===================
+
+    async def fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None,
+                         max_staleness: float = 0.0, timeout: float = 10) -> Optional[Any]:
+        """
+        📥 GET a JSON document through the cache
+
+        Returns the cached body while it is fresh (Cache-Control max-age plus the
+        caller's max_staleness), revalidates it otherwise, and falls back to the
+        cached copy if the network fails. None when nothing is available.
+        """
+        entry = await asyncio.to_thread(self._read_entry, url)
+
+        if self.mode == MODE_REPLAY:
+            if entry is None:
+                self.stats['replay_misses'] += 1
+                logger.warning(f"📼 Replay miss (no recorded response): {url}")
+                return None
+            self.stats['replay_hits'] += 1
+            return await asyncio.to_thread(self._read_body, entry)
+
+        if entry is not None and time.time() - entry['stored_at'] <= entry['max_age'] + max_staleness:
+            self.stats['fresh_hits'] += 1
+            await asyncio.to_thread(self._touch, url)
+            return await asyncio.to_thread(self._read_body, entry)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            async with shared_session() as session:
+                async with session.get(url, headers=request_headers, timeout=timeout) as response:
+                    cache_control = parse_cache_control(response.headers.get('Cache-Control'))
+
+                    if response.status == 304 and entry is not None:
+                        self.stats['revalidated'] += 1
+                        entry.update(stored_at=time.time(), max_age=cache_control['max_age'])
+                        await asyncio.to_thread(self._write_entry, url, entry)
+                        return await asyncio.to_thread(self._read_body, entry)
+
+                    if response.status == 200:
+                        body = await response.read()
+                        self.stats['downloads'] += 1
+                        data = json.loads(body)
+                        if not cache_control['no_store']:
+                            await asyncio.to_thread(self._store, url, body, {
+                                'etag': response.headers.get('ETag'),
+                                'last_modified': response.headers.get('Last-Modified'),
+                                'max_age': 0 if cache_control['no_cache'] else cache_control['max_age'],
+                            })
+                        return data
+
+                    logger.warning(f"⚠️ HTTP {response.status} for {url}")
+
+        except asyncio.TimeoutError:
+            logger.warning(f"⏰ Timeout fetching {url}")
+        except Exception as e:
+            logger.warning(f"⚠️ Error fetching {url}: {e}")
+
+        if entry is not None:
+            self.stats['stale_served'] += 1
+            logger.info(f"🗄️ Serving cached copy of {url} ({time.time() - entry['stored_at']:.0f}s old)")
+            return await asyncio.to_thread(self._read_body, entry)
+        return None
+
+    def invalidate(self, url: str):
+        """🧹 Forget the cached response for a URL"""
+        with self._lock:
+            path = self._entry_path(url)
+            if path.exists():
+                path.unlink()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'mode': self.mode, 'total_bytes': self._total_bytes, 'max_bytes': self.max_bytes}
+
+    # =================== STORAGE ===================
+
+    @staticmethod
+    def _hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _entry_path(self, url: str) -> Path:
+        key = self._hash(url.encode('utf-8'))
+        return self.entries_dir / key[:2] / f"{key}.json"
+
+    def _object_path(self, body_hash: str) -> Path:
+        return self.objects_dir / body_hash[:2] / f"{body_hash}.json.gz"
+
+    def _read_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(url)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            if self._object_path(entry['body_hash']).exists():
+                return entry
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+        return None
+
+    def _read_body(self, entry: Dict[str, Any]) -> Any:
+        with gzip.open(self._object_path(entry['body_hash']), 'rb') as f:
+            return json.loads(f.read())
+
+    def _atomic_write(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _touch(self, url: str):
+        """👆 Mark an entry as just used (mtime drives LRU eviction)"""
+        try:
+            os.utime(self._entry_path(url))
+        except FileNotFoundError:
+            pass
+
+    def _write_entry(self, url: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._atomic_write(self._entry_path(url), json.dumps(entry).encode('utf-8'))
+
+    def _store(self, url: str, body: bytes, meta: Dict[str, Any]):
+        body_hash = self._hash(body)
+        object_path = self._object_path(body_hash)
+        with self._lock:
+            self._ensure_size_known()
+            if not object_path.exists():
+                compressed = gzip.compress(body)
+                self._atomic_write(object_path, compressed)
+                self._total_bytes += len(compressed)
+
+            now = time.time()
+            entry = {'url': url, 'body_hash': body_hash, 'stored_at': now, 'size': len(body), **meta}
+            self._atomic_write(self._entry_path(url), json.dumps(entry).encode('utf-8'))
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _ensure_size_known(self):
+        if self._total_bytes is None:
+            self._total_bytes = sum(p.stat().st_size for p in self.objects_dir.glob("*/*.json.gz")) \
+                if self.objects_dir.exists() else 0
+
+    def _evict(self):
+        """🧹 Drop least-recently-used entries, then unreferenced bodies, until under budget"""
+        entries = []
+        for path in self.entries_dir.glob("*/*.json"):
+            try:
+                last_access = path.stat().st_mtime
+                with open(path, 'r') as f:
+                    entries.append((last_access, json.load(f), path))
+            except (OSError, json.JSONDecodeError):
+                path.unlink(missing_ok=True)
+        entries.sort(key=lambda item: item[0])
+
+        referenced = {}
+        for _, entry, _ in entries:
+            referenced[entry['body_hash']] = referenced.get(entry['body_hash'], 0) + 1
+
+        target = self.max_bytes * 0.9
+        for _, entry, path in entries:
+            if self._total_bytes <= target:
+                break
+            path.unlink(missing_ok=True)
+            self.stats['evictions'] += 1
+            referenced[entry['body_hash']] -= 1
+            if referenced[entry['body_hash']] == 0:
+                object_path = self._object_path(entry['body_hash'])
+                if object_path.exists():
+                    self._total_bytes -= object_path.stat().st_size
+                    object_path.unlink()
+
+        logger.info(f"🧹 HTTP cache evicted down to {self._total_bytes} bytes")
+
+# =================== PROCESS-WIDE INSTANCE ===================
+
+RESPONSE_CACHE = HTTPResponseCache()
+
+def get_response_cache() -> HTTPResponseCache:
+    """💾 The process-wide HTTP response cache"""
+    return RESPONSE_CACHE
+
+async def fetch_cached_json(url: str, headers: Optional[Dict[str, str]] = None,
+                            max_staleness: float = 0.0, timeout: float = 10) -> Optional[Any]:
+    """📥 Shortcut for RESPONSE_CACHE.fetch_json"""
+    return await RESPONSE_CACHE.fetch_json(url, headers=headers, max_staleness=max_staleness, timeout=timeout)
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+🔥💀🔥 ASYNC JOB SCHEDULER - EVENT-LOOP NATIVE CRON FOR THE AUTOMATION 💀🔥💀
+
+Runs `async def` jobs on the event loop that owns them (the dashboard's
+aiohttp loop) - no polling thread, no coroutines created and never awaited.
+
+🎯 FEATURES:
+- Cron-like triggers (minute / hour / day-of-week fields: *, 5, 1-5, 0,30, */15)
+- Per-job jitter so hourly jobs don't stampede ESPN on the hour
+- Misfire handling: runs later than `misfire_grace_seconds` are skipped
+- Catch-up: a run missed while the process was down fires once on start
+  (last fire times are persisted atomically)
+- No overlapping runs of the same job; jobs in the same `group` run one at a time,
+  independent jobs run concurrently
+- Per-job run history with durations and errors
+- aiohttp lifecycle hook (setup_app) so jobs stop with the web app
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, tzinfo
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MISFIRE_GRACE_SECONDS = 300
+DEFAULT_HISTORY_SIZE = 50
+MAX_SLEEP_SECONDS = 300   # re-check the wall clock at least this often (suspend / clock changes)
+
+# =================== TRIGGERS ===================
+
+def _parse_field(expr: str, low: int, high: int) -> Set[int]:
+    """📜 One cron field -> set of allowed values"""
+    values: Set[int] = set()
+    for part in str(expr).split(','):
+        part = part.strip()
+        step = 1
+        if '/' in part:
+            part, step_expr = part.split('/', 1)
+            step = int(step_expr)
+        if part in ('*', ''):
+            start, end = low, high
+        elif '-' in part:
+            start_expr, end_expr = part.split('-', 1)
+            start, end = int(start_expr), int(end_expr)
+        else:
+            start = end = int(part)
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"Invalid cron field '{expr}' (allowed {low}-{high})")
+        values.update(range(start, end + 1, step))
+    return values
+
+class CronTrigger:
+    """
+    ⏰ Cron-style trigger evaluated in a timezone
+
+    day_of_week follows cron: 0 = Sunday ... 6 = Saturday.
+    """
+
+    def __init__(self, minute: Any = '*', hour: Any = '*', day_of_week: Any = '*',
+                 tz: Optional[tzinfo] = None):
+        self.minutes = _parse_field(minute, 0, 59)
+        self.hours = _parse_field(hour, 0, 23)
+        self.days_of_week = _parse_field(day_of_week, 0, 6)
+        self.tz = tz
+        self.expression = f"{minute} {hour} * * {day_of_week}"
+
+    def _localize(self, naive: datetime) -> datetime:
+        if self.tz is None:
+            return naive.astimezone()
+        if hasattr(self.tz, 'localize'):  # pytz
+            return self.tz.localize(naive)
+        return naive.replace(tzinfo=self.tz)
+
+    def next_after(self, moment: datetime) -> datetime:
+        """⏭️ First fire time strictly after moment"""
+        local = moment.astimezone(self.tz) if self.tz is not None else moment.astimezone()
+        candidate = local.replace(tzinfo=None, second=0, microsecond=0) + timedelta(minutes=1)
+
+        for _ in range(366 * 24 * 60):
+            if (candidate.weekday() + 1) % 7 not in self.days_of_week:
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return self._localize(candidate)
+        raise ValueError(f"Cron trigger '{self.expression}' never fires")
+
+    def __repr__(self) -> str:
+        return f"CronTrigger('{self.expression}')"
+
+# =================== JOBS ===================
+
+@dataclass
+class JobRun:
+    """📜 One execution of a job"""
+    scheduled_for: Optional[str]
+    started_at: str
+    duration_seconds: float = 0.0
+    status: str = 'running'          # running / success / error / cancelled
+    error: Optional[str] = None
+    trigger: str = 'schedule'        # schedule / catch_up / manual
+
+@dataclass
+class ScheduledJob:
+    """🗓️ A registered job and its bookkeeping"""
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    trigger: CronTrigger
+    jitter_seconds: float = 0.0
+    misfire_grace_seconds: float = DEFAULT_MISFIRE_GRACE_SECONDS
+    catch_up: bool = True
+    group: Optional[str] = None
+    history: Deque[JobRun] = field(default_factory=lambda: deque(maxlen=DEFAULT_HISTORY_SIZE))
+    next_run_at: Optional[datetime] = None
+    last_scheduled_for: Optional[datetime] = None
+    running: bool = False
+    stats: Dict[str, int] = field(default_factory=lambda: {
+        'runs': 0, 'errors': 0, 'misfires': 0, 'overlaps_skipped': 0, 'catch_ups': 0})
+
+# =================== SCHEDULER ===================
+
+class AsyncJobScheduler:
+    """
+    ⚙️ Runs cron-triggered coroutines on the current event loop
+    """
+
+    def __init__(self, tz: Optional[tzinfo] = None, state_path: Optional[Path] = None):
+        self.tz = tz
+        self.state_path = Path(state_path) if state_path else None
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._loops: Dict[str, asyncio.Task] = {}
+        self._runs: Set[asyncio.Task] = set()
+        self._group_locks: Dict[str, asyncio.Lock] = {}
+        self.started_at: Optional[datetime] = None
+
+    def _now(self) -> datetime:
+        return datetime.now(self.tz) if self.tz is not None else datetime.now().astimezone()
+
+    @property
+    def is_running(self) -> bool:
+        return any(not task.done() for task in self._loops.values())
+
+    def add_job(self, name: str, func: Callable[[], Awaitable[Any]], trigger: CronTrigger,
+                jitter_seconds: float = 0.0, misfire_grace_seconds: float = DEFAULT_MISFIRE_GRACE_SECONDS,
+                catch_up: bool = True, group: Optional[str] = None) -> ScheduledJob:
+        """➕ Register (or replace) a job; registering the same name twice never duplicates it"""
+        if trigger.tz is None:
+            trigger.tz = self.tz
+        job = ScheduledJob(name=name, func=func, trigger=trigger, jitter_seconds=jitter_seconds,
+                           misfire_grace_seconds=misfire_grace_seconds, catch_up=catch_up, group=group)
+        previous = self.jobs.get(name)
+        if previous is not None:
+            job.history, job.stats, job.last_scheduled_for = previous.history, previous.stats, previous.last_scheduled_for
+        self.jobs[name] = job
+
+        if name in self._loops:
+            self._loops.pop(name).cancel()
+            self._loops[name] = asyncio.ensure_future(self._job_loop(job))
+        return job
+
+    # =================== LIFECYCLE ===================
+
+    def start(self) -> bool:
+        """🚀 Start every job loop on the running loop (no-op if already running)"""
+        if self.is_running:
+            return True
+        self.started_at = self._now()
+        last_runs = self._load_state()
+        for job in self.jobs.values():
+            if job.last_scheduled_for is None and job.name in last_runs:
+                job.last_scheduled_for = last_runs[job.name]
+            self._loops[job.name] = asyncio.ensure_future(self._job_loop(job))
+        logger.info(f"⏰ Job scheduler started with {len(self.jobs)} jobs")
+        return True
+
+    def stop(self):
+        """🛑 Stop scheduling; runs already in progress are cancelled"""
+        for task in list(self._loops.values()) + list(self._runs):
+            task.cancel()
+        self._loops.clear()
+        for job in self.jobs.values():
+            job.next_run_at = None
+        logger.info("🛑 Job scheduler stopped")
+
+    async def shutdown(self):
+        """🛑 Stop and wait for cancelled tasks to unwind"""
+        tasks = list(self._loops.values()) + list(self._runs)
+        self.stop()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _on_app_cleanup(self, app):
+        await self.shutdown()
+
+    def setup_app(self, app):
+        """🔗 Stop the jobs together with an aiohttp web.Application"""
+        app.on_cleanup.append(self._on_app_cleanup)
+
+    # =================== SCHEDULING ===================
+
+    async def _job_loop(self, job: ScheduledJob):
+        now = self._now()
+
+        # Catch-up: a fire time passed while we were not running -> run once now
+        if job.catch_up and job.last_scheduled_for is not None:
+            missed = job.trigger.next_after(job.last_scheduled_for)
+            if missed <= now:
+                job.stats['catch_ups'] += 1
+                logger.info(f"⏪ {job.name}: missed run at {missed.isoformat()} - catching up")
+                self._launch(job, missed, 'catch_up')
+
+        while True:
+            scheduled_for = job.trigger.next_after(self._now())
+            fire_at = scheduled_for + timedelta(seconds=random.uniform(0, job.jitter_seconds))
+            job.next_run_at = fire_at
+
+            while True:
+                delay = (fire_at - self._now()).total_seconds()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(min(delay, MAX_SLEEP_SECONDS))
+
+            lateness = (self._now() - fire_at).total_seconds()
+            if lateness > job.misfire_grace_seconds:
+                job.stats['misfires'] += 1
+                logger.warning(f"⏰ {job.name}: misfired by {lateness:.0f}s - skipping this run")
+                continue
+            self._launch(job, scheduled_for, 'schedule')
+
+    def _launch(self, job: ScheduledJob, scheduled_for: Optional[datetime], trigger: str) -> Optional[asyncio.Task]:
+        if job.running:
+            job.stats['overlaps_skipped'] += 1
+            logger.warning(f"⏭️ {job.name} still running - skipping overlapping run")
+            return None
+        job.running = True
+        task = asyncio.ensure_future(self._execute(job, scheduled_for, trigger))
+        self._runs.add(task)
+        task.add_done_callback(self._runs.discard)
+        return task
+
+    async def _execute(self, job: ScheduledJob, scheduled_for: Optional[datetime], trigger: str):
+        run = JobRun(scheduled_for=scheduled_for.isoformat() if scheduled_for else None,
+                     started_at=self._now().isoformat(), trigger=trigger)
+        job.history.append(run)
+        started = time.monotonic()
+        try:
+            lock = self._group_locks.setdefault(job.group, asyncio.Lock()) if job.group else None
+            if lock is not None:
+                async with lock:
+                    await job.func()
+            else:
+                await job.func()
+            run.status = 'success'
+        except asyncio.CancelledError:
+            run.status = 'cancelled'
+            raise
+        except Exception as e:
+            run.status = 'error'
+            run.error = str(e)
+            job.stats['errors'] += 1
+            logger.error(f"💀 Job {job.name} failed: {e}")
+        finally:
+            run.duration_seconds = round(time.monotonic() - started, 3)
+            job.running = False
+            job.stats['runs'] += 1
+            if scheduled_for is not None and run.status != 'cancelled':
+                job.last_scheduled_for = scheduled_for
+                self._save_state()
+
+    async def run_now(self, name: str) -> bool:
+        """▶️ Run a job immediately (still no overlap); returns False if it was already running"""
+        task = self._launch(self.jobs[name], None, 'manual')
+        if task is None:
+            return False
+        await task
+        return True
+
+    # =================== STATE ===================
+
+    def _load_state(self) -> Dict[str, datetime]:
+        if not self.state_path or not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, 'r') as f:
+                return {name: datetime.fromisoformat(value) for name, value in json.load(f).items()}
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read scheduler state {self.state_path}: {e}")
+            return {}
+
+    def _save_state(self):
+        """💾 Persist last fire times via temp file + os.replace (a crash never leaves half a file)"""
+        if not self.state_path:
+            return
+        try:
+            state = {name: job.last_scheduled_for.isoformat()
+                     for name, job in self.jobs.items() if job.last_scheduled_for is not None}
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.state_path.parent),
+                                            prefix=f".{self.state_path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(state, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.state_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write scheduler state {self.state_path}: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """📊 Jobs, next fire times and recent runs"""
+        return {
+            'running': self.is_running,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'jobs': {
+                name: {
+                    'trigger': job.trigger.expression,
+                    'group': job.group,
+                    'running': job.running,
+                    'next_run_at': job.next_run_at.isoformat() if job.next_run_at else None,
+                    'last_scheduled_for': job.last_scheduled_for.isoformat() if job.last_scheduled_for else None,
+                    'stats': dict(job.stats),
+                    'history': [vars(run) for run in list(job.history)[-10:]],
+                }
+                for name, job in self.jobs.items()
+            }
+        }
@@ -21,6 +21,10 @@ import aiohttp
 import logging
 from datetime import datetime, timezone
 from typing import List, Dict, Any
+try:
+    from real_agents.http_client_service import shared_session
+except ImportError:
+    from http_client_service import shared_session
 
 # Import the Universal Prediction Engine for 8D analysis
 from real_agents.universal_prediction_engine import UniversalPredictionEngine
@@ -71,7 +75,7 @@ class RealLaLigaFetcher:
         # Check multiple dates for complete gameweek
         from datetime import datetime, timedelta
         
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             # Try multiple La Liga endpoints
             for league_id in self.la_liga_ids:
                 try:
@@ -437,7 +441,7 @@ class RealLaLigaFetcher:
         try:
             standings = {}
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 # Try multiple endpoints for standings
                 for league_id in self.la_liga_ids:
                     try:
@@ -473,7 +477,7 @@ class RealLaLigaFetcher:
             
             all_season_games = []
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 # Try multiple La Liga endpoints for season data
                 for league_id in self.la_liga_ids:
                     try:
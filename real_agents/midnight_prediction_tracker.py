@@ -8,7 +8,7 @@ import json
 import os
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -125,68 +125,77 @@ class MidnightPredictionTracker:
         Updates prediction results based on game data and actual result.
         This method is called by the midnight scheduler.
         """
+        return await self.update_game_results([(game_data, result)]) > 0
+
+    async def update_game_results(self, game_results: List[Tuple[Dict, str]]) -> int:
+        """
+        🎯 UPDATE MANY GAME RESULTS IN ONE WRITE
+        
+        Settles every (game_data, result) pair against one load of the
+        predictions file and saves it once. Returns how many were updated.
+        """
         try:
-            # Generate game ID from game data
-            home_team = game_data.get('home_team', 'Unknown')
-            away_team = game_data.get('away_team', 'Unknown')
-            league = game_data.get('league', 'Unknown')
-            date = game_data.get('date', datetime.now().strftime('%Y-%m-%d'))
-            
-            # Try different game ID formats to find existing predictions
-            possible_ids = [
-                f"{league}_{home_team}_{away_team}_{date.split('T')[0].replace('-', '')}",
-                f"game_{home_team}_{away_team}",
-                f"{away_team}_@_{home_team}",
-            ]
-            
-            # Load existing predictions to search
             predictions = self._load_json(self.predictions_file)
             
-            updated = False
-            for date_key, date_predictions in predictions.items():
-                for prediction in date_predictions:
-                    # Check if this prediction matches our game
-                    pred_matchup = prediction.get('matchup', '')
-                    expected_matchup = f"{away_team} @ {home_team}"
-                    
-                    if (prediction.get('game_id') in possible_ids or 
-                        pred_matchup == expected_matchup or
-                        (home_team in pred_matchup and away_team in pred_matchup)):
-                        
-                        # Update the prediction result
-                        prediction['actual_result'] = result
-                        prediction['status'] = 'completed'
-                        
-                        # Determine if prediction was correct
-                        predicted = prediction.get('prediction', '').lower()
-                        if 'home' in predicted and result == 'home_win':
-                            prediction['correct'] = True
-                        elif 'away' in predicted and result == 'away_win':
-                            prediction['correct'] = True
-                        elif 'draw' in predicted and result == 'draw':
-                            prediction['correct'] = True
-                        else:
-                            prediction['correct'] = False
-                        
-                        prediction['result_timestamp'] = datetime.now().isoformat()
-                        updated = True
-                        
-                        logger.info(f"🎯 Game result updated: {expected_matchup} -> {result}")
-                        break
-                
-                if updated:
-                    break
+            updated = 0
+            for game_data, result in game_results:
+                if self._settle_game(predictions, game_data, result):
+                    updated += 1
             
             if updated:
                 self._save_json(self.predictions_file, predictions)
-                return True
-            else:
-                logger.info(f"🎯 No existing prediction found for {away_team} @ {home_team}")
-                return False
+            return updated
                 
         except Exception as e:
             logger.error(f"🎯 UPDATE GAME RESULT ERROR: {e}")
-            return False
+            return 0
+
+    def _settle_game(self, predictions: Dict, game_data: Dict, result: str) -> bool:
+        """🎯 Apply one game result to the first matching prediction (in memory)"""
+        # Generate game ID from game data
+        home_team = game_data.get('home_team', 'Unknown')
+        away_team = game_data.get('away_team', 'Unknown')
+        league = game_data.get('league', 'Unknown')
+        date = game_data.get('date') or datetime.now().strftime('%Y-%m-%d')
+        
+        # Try different game ID formats to find existing predictions
+        possible_ids = [
+            f"{league}_{home_team}_{away_team}_{date.split('T')[0].replace('-', '')}",
+            f"game_{home_team}_{away_team}",
+            f"{away_team}_@_{home_team}",
+        ]
+        expected_matchup = f"{away_team} @ {home_team}"
+        
+        for date_predictions in predictions.values():
+            for prediction in date_predictions:
+                # Check if this prediction matches our game
+                pred_matchup = prediction.get('matchup', '')
+                
+                if (prediction.get('game_id') in possible_ids or 
+                    pred_matchup == expected_matchup or
+                    (home_team in pred_matchup and away_team in pred_matchup)):
+                    
+                    # Update the prediction result
+                    prediction['actual_result'] = result
+                    prediction['status'] = 'completed'
+                    
+                    # Determine if prediction was correct
+                    predicted = prediction.get('prediction', '').lower()
+                    if 'home' in predicted and result == 'home_win':
+                        prediction['correct'] = True
+                    elif 'away' in predicted and result == 'away_win':
+                        prediction['correct'] = True
+                    elif 'draw' in predicted and result == 'draw':
+                        prediction['correct'] = True
+                    else:
+                        prediction['correct'] = False
+                    
+                    prediction['result_timestamp'] = datetime.now().isoformat()
+                    logger.info(f"🎯 Game result updated: {expected_matchup} -> {result}")
+                    return True
+        
+        logger.info(f"🎯 No existing prediction found for {away_team} @ {home_team}")
+        return False
 
     def get_predictions_for_date(self, date: str) -> List[Dict]:
         """Get all predictions for a specific date"""
@@ -14,6 +14,11 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
+try:
+    from real_agents.midnight_special_store import get_midnight_special_store
+except ImportError:
+    from midnight_special_store import get_midnight_special_store
+
 logger = logging.getLogger(__name__)
 
 class MidnightSpecialDataReader:
@@ -30,11 +35,12 @@ class MidnightSpecialDataReader:
         self.data_dir = base_dir / "midnight_special_data"
         self.data_dir.mkdir(exist_ok=True)
         
-        # Midnight Special data files  
-        self.automation_history = self.data_dir / "automation_history.json"
-        self.tracked_predictions = self.data_dir / "tracked_predictions.json"
-        self.accuracy_tracking = self.data_dir / "accuracy_tracking.json"
-        self.season_progress = self.data_dir / "season_progress.json"
+        # Midnight Special data files (read through the shared indexed store)
+        self.store = get_midnight_special_store(self.data_dir)
+        self.automation_history = self.store.paths['history']
+        self.tracked_predictions = self.store.paths['tracked']
+        self.accuracy_tracking = self.store.paths['accuracy']
+        self.season_progress = self.store.paths['progress']
         
         logger.info("🔥 Midnight Special Data Reader initialized - PURE AUTOMATION DATA ONLY!")
     
@@ -53,9 +59,8 @@ class MidnightSpecialDataReader:
             leagues_found = []
             
             # Source 1: Read automation history
-            if self.automation_history.exists():
-                with open(self.automation_history, 'r') as f:
-                    history = json.load(f)
+            if self.store.has_view('history'):
+                history = self.store.history
                 
                 # Get predictions from each league's history
                 for league, league_data in history.items():
@@ -67,7 +72,8 @@ class MidnightSpecialDataReader:
                     runs = league_data.get('runs', [])
                     for run in runs:
                         predictions = run.get('predictions', [])
-                        for pred in predictions:
+                        for stored_pred in predictions:
+                            pred = dict(stored_pred)  # don't annotate the store's copy
                             pred['league'] = league
                             pred['run_date'] = run.get('date', 'unknown')
                             pred['source'] = 'automation_history'
@@ -211,7 +217,7 @@ class MidnightSpecialDataReader:
             Dictionary with season progress
         """
         try:
-            if not self.season_progress.exists():
+            if not self.store.has_view('progress'):
                 return {
                     'games_played': 0,
                     'games_remaining': 0,
@@ -219,8 +225,7 @@ class MidnightSpecialDataReader:
                     'source': 'MIDNIGHT_SPECIAL_AUTOMATION'
                 }
             
-            with open(self.season_progress, 'r') as f:
-                progress = json.load(f)
+            progress = self.store.progress
             
             # Filter by league if specified
             if league_id:
@@ -258,9 +263,8 @@ class MidnightSpecialDataReader:
                 
             # Check automation_history.json first
             has_history_data = False
-            if self.automation_history.exists():
-                with open(self.automation_history, 'r') as f:
-                    history = json.load(f)
+            if self.store.has_view('history'):
+                history = self.store.history
                 if league_id:
                     has_history_data = league_id.upper() in history
                 else:
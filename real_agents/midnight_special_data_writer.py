@@ -9,12 +9,16 @@ The writer that saves predictions from Games & Predictions
 into Midnight Special automation storage!
 """
 
-import json
 import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
+try:
+    from real_agents.midnight_special_store import get_midnight_special_store
+except ImportError:
+    from midnight_special_store import get_midnight_special_store
+
 logger = logging.getLogger(__name__)
 
 class MidnightSpecialDataWriter:
@@ -22,17 +26,20 @@ class MidnightSpecialDataWriter:
     🔥💀🔥 WRITES PREDICTIONS TO MIDNIGHT SPECIAL AUTOMATION FILES! 💀🔥💀
     
     THE MISSING LINK between Games & Predictions and Midnight Special!
+    Writes go through the journaled MidnightSpecialStore - one journal append
+    and one rewrite per automation file per commit.
     """
     
     def __init__(self):
         self.data_dir = Path("midnight_special_data")
         self.data_dir.mkdir(exist_ok=True)
         
-        # Automation data files
-        self.automation_history = self.data_dir / "automation_history.json"
-        self.tracked_predictions = self.data_dir / "tracked_predictions.json"
-        self.accuracy_tracking = self.data_dir / "accuracy_tracking.json"
-        self.season_progress = self.data_dir / "season_progress.json"
+        # Automation data files (journaled store keeps them up to date)
+        self.store = get_midnight_special_store(self.data_dir)
+        self.automation_history = self.store.paths['history']
+        self.tracked_predictions = self.store.paths['tracked']
+        self.accuracy_tracking = self.store.paths['accuracy']
+        self.season_progress = self.store.paths['progress']
         
         logger.info("🔥 Midnight Special Data Writer initialized - READY TO SAVE PREDICTIONS!")
     
@@ -51,18 +58,6 @@ class MidnightSpecialDataWriter:
         try:
             league_upper = league_id.upper()
             
-            # Load existing automation history
-            history = self._load_json(self.automation_history, {})
-            
-            # Initialize league if not exists
-            if league_upper not in history:
-                history[league_upper] = {
-                    'league': league_upper,
-                    'runs': [],
-                    'total_predictions': 0,
-                    'created': datetime.now().isoformat()
-                }
-            
             # Create prediction entry
             prediction_entry = {
                 'game_id': game_data.get('id', f"{game_data.get('away_team')}_{game_data.get('home_team')}"),
@@ -82,37 +77,15 @@ class MidnightSpecialDataWriter:
                 'result': None
             }
             
-            # Find or create today's run
-            today = datetime.now().strftime('%Y-%m-%d')
-            today_run = None
-            for run in history[league_upper]['runs']:
-                if run.get('date') == today:
-                    today_run = run
-                    break
-            
-            if not today_run:
-                today_run = {
-                    'date': today,
-                    'predictions': [],
-                    'created': datetime.now().isoformat()
-                }
-                history[league_upper]['runs'].append(today_run)
-            
-            # Add prediction to today's run
-            today_run['predictions'].append(prediction_entry)
-            history[league_upper]['total_predictions'] += 1
-            
-            # Save automation history
-            self._save_json(self.automation_history, history)
+            # Add to today's run (+ tracked predictions + season progress) in one operation
+            self.store.record({
+                'op': 'save_prediction',
+                'league': league_upper,
+                'run_date': datetime.now().strftime('%Y-%m-%d'),
+                'prediction': prediction_entry
+            })
             
             logger.info(f"✅ Saved {league_upper} prediction: {prediction_entry['matchup']}")
-            
-            # Also save to tracked predictions
-            self._save_to_tracked_predictions(league_upper, prediction_entry)
-            
-            # Update season progress
-            self._update_season_progress(league_upper)
-            
             return True
             
         except Exception as e:
@@ -121,7 +94,7 @@ class MidnightSpecialDataWriter:
     
     def save_batch_predictions(self, league_id: str, predictions: List[Dict]) -> int:
         """
-        Save multiple predictions at once
+        Save multiple predictions at once (single journaled commit)
         
         Args:
             league_id: League identifier
@@ -132,32 +105,38 @@ class MidnightSpecialDataWriter:
         """
         saved_count = 0
         
-        for pred in predictions:
-            # Extract game_data and prediction_data from combined dict
-            game_data = {
-                'id': pred.get('id'),
-                'matchup': pred.get('matchup'),
-                'home_team': pred.get('home_team'),
-                'away_team': pred.get('away_team'),
-                'time': pred.get('time'),
-                'date': pred.get('date'),
-                'venue': pred.get('venue')
-            }
-            
-            prediction_data = {
-                'prediction': pred.get('prediction'),
-                'confidence': pred.get('confidence'),
-                'reasoning': pred.get('reasoning'),
-                'dimensions': pred.get('dimensions', {})
-            }
-            
-            if self.save_prediction(league_id, game_data, prediction_data):
-                saved_count += 1
+        try:
+            with self.store.batch():
+                for pred in predictions:
+                    # Extract game_data and prediction_data from combined dict
+                    game_data = {
+                        'id': pred.get('id'),
+                        'matchup': pred.get('matchup'),
+                        'home_team': pred.get('home_team'),
+                        'away_team': pred.get('away_team'),
+                        'time': pred.get('time'),
+                        'date': pred.get('date'),
+                        'venue': pred.get('venue')
+                    }
+                    
+                    prediction_data = {
+                        'prediction': pred.get('prediction'),
+                        'confidence': pred.get('confidence'),
+                        'reasoning': pred.get('reasoning'),
+                        'dimensions': pred.get('dimensions', {})
+                    }
+                    
+                    if self.save_prediction(league_id, game_data, prediction_data):
+                        saved_count += 1
+        except Exception as e:
+            logger.error(f"💀 Error committing {league_id} prediction batch: {e}")
+            return 0
         
         logger.info(f"📊 Saved {saved_count}/{len(predictions)} predictions for {league_id}")
         return saved_count
     
-    def update_prediction_result(self, league_id: str, game_id: str, actual_result: str, is_correct: bool) -> bool:
+    def update_prediction_result(self, league_id: str, game_id: str, actual_result: str, is_correct: bool,
+                                 date: str = None) -> bool:
         """
         Update a prediction with actual game result
         
@@ -166,6 +145,7 @@ class MidnightSpecialDataWriter:
             game_id: Game identifier
             actual_result: Actual game outcome
             is_correct: Whether prediction was correct
+            date: Optional game date (exact (league, date, game_id) lookup)
             
         Returns:
             True if updated successfully
@@ -173,135 +153,30 @@ class MidnightSpecialDataWriter:
         try:
             league_upper = league_id.upper()
             
-            # Load automation history
-            history = self._load_json(self.automation_history, {})
-            
-            if league_upper not in history:
+            if league_upper not in self.store.history:
                 logger.warning(f"⚠️ No history found for {league_upper}")
                 return False
             
-            # Find and update the prediction
-            updated = False
-            for run in history[league_upper]['runs']:
-                for pred in run['predictions']:
-                    if pred.get('game_id') == game_id:
-                        pred['result'] = actual_result
-                        pred['correct'] = is_correct
-                        pred['status'] = 'completed'
-                        pred['completed_at'] = datetime.now().isoformat()
-                        updated = True
-                        logger.info(f"✅ Updated result for {game_id}: {'CORRECT' if is_correct else 'INCORRECT'}")
-                        break
-                if updated:
-                    break
-            
-            if updated:
-                # Save updated history
-                self._save_json(self.automation_history, history)
-                
-                # Update accuracy tracking
-                self._update_accuracy_tracking(league_upper, is_correct)
-                
-                return True
-            else:
+            # Indexed lookup instead of scanning every run
+            if self.store.find_prediction(league_upper, game_id, date) is None:
                 logger.warning(f"⚠️ Prediction not found: {game_id}")
                 return False
+            
+            self.store.record({
+                'op': 'update_result',
+                'league': league_upper,
+                'game_id': game_id,
+                'date': date,
+                'result': actual_result,
+                'correct': is_correct,
+                'completed_at': datetime.now().isoformat()
+            })
+            logger.info(f"✅ Updated result for {game_id}: {'CORRECT' if is_correct else 'INCORRECT'}")
+            return True
                 
         except Exception as e:
             logger.error(f"💀 Error updating result: {e}")
             return False
-    
-    def _save_to_tracked_predictions(self, league_id: str, prediction: Dict):
-        """Save to tracked_predictions.json for quick access"""
-        try:
-            tracked = self._load_json(self.tracked_predictions, {})
-            
-            if league_id not in tracked:
-                tracked[league_id] = []
-            
-            tracked[league_id].append(prediction)
-            
-            self._save_json(self.tracked_predictions, tracked)
-            
-        except Exception as e:
-            logger.error(f"💀 Error saving to tracked predictions: {e}")
-    
-    def _update_season_progress(self, league_id: str):
-        """Update season progress metrics"""
-        try:
-            progress = self._load_json(self.season_progress, {})
-            history = self._load_json(self.automation_history, {})
-            
-            if league_id not in history:
-                return
-            
-            total_predictions = history[league_id].get('total_predictions', 0)
-            completed = sum(1 for run in history[league_id].get('runs', []) 
-                          for pred in run.get('predictions', []) 
-                          if pred.get('status') == 'completed')
-            
-            progress[league_id] = {
-                'games_played': completed,
-                'games_remaining': total_predictions - completed,
-                'total_predictions': total_predictions,
-                'weeks_completed': len(history[league_id].get('runs', [])),
-                'updated': datetime.now().isoformat()
-            }
-            
-            self._save_json(self.season_progress, progress)
-            
-        except Exception as e:
-            logger.error(f"💀 Error updating season progress: {e}")
-    
-    def _update_accuracy_tracking(self, league_id: str, is_correct: bool):
-        """Update accuracy tracking when a result is recorded"""
-        try:
-            tracking = self._load_json(self.accuracy_tracking, {})
-            
-            if league_id not in tracking:
-                tracking[league_id] = {
-                    'total': 0,
-                    'correct': 0,
-                    'incorrect': 0,
-                    'accuracy': 0.0
-                }
-            
-            tracking[league_id]['total'] += 1
-            if is_correct:
-                tracking[league_id]['correct'] += 1
-            else:
-                tracking[league_id]['incorrect'] += 1
-            
-            tracking[league_id]['accuracy'] = (
-                tracking[league_id]['correct'] / tracking[league_id]['total'] * 100
-            )
-            tracking[league_id]['updated'] = datetime.now().isoformat()
-            
-            self._save_json(self.accuracy_tracking, tracking)
-            
-            logger.info(f"📊 {league_id} Accuracy: {tracking[league_id]['accuracy']:.1f}%")
-            
-        except Exception as e:
-            logger.error(f"💀 Error updating accuracy tracking: {e}")
-    
-    def _load_json(self, filepath: Path, default: Any = None) -> Any:
-        """Load JSON file with fallback"""
-        try:
-            if filepath.exists():
-                with open(filepath, 'r') as f:
-                    return json.load(f)
-            return default if default is not None else {}
-        except Exception as e:
-            logger.error(f"💀 Error loading {filepath}: {e}")
-            return default if default is not None else {}
-    
-    def _save_json(self, filepath: Path, data: Any):
-        """Save JSON file"""
-        try:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"💀 Error saving {filepath}: {e}")
 
 def get_midnight_special_writer():
     """Get the Midnight Special data writer instance"""
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+🔥💀🔥 MIDNIGHT SPECIAL STORE - JOURNALED PREDICTION STORAGE 💀🔥💀
+
+One in-memory, indexed copy of the Midnight Special automation data shared by
+the writer and the reader.
+
+🎯 HOW IT WORKS:
+- Every change is an operation appended to midnight_journal.jsonl (fsync'd)
+- A commit applies a whole batch of operations, then rewrites each JSON view
+  (automation_history / tracked_predictions / accuracy_tracking / season_progress)
+  ONCE via temp file + os.replace, then truncates the journal
+- On load, leftover journal operations (crash between append and rewrite) are
+  replayed into automation_history (idempotent via the prediction index), then
+  the derived views of every league they touch are reconciled against history,
+  so a crash between two view rewrites can neither double nor drop data
+- Predictions are indexed by (league, date, game_id)
+- Other tools still write the JSON views directly, so the store reloads
+  whenever a view file changes on disk
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "midnight_journal.jsonl"
+
+class MidnightSpecialStore:
+    """
+    📚 Journaled, indexed store behind MidnightSpecialDataWriter/Reader
+    """
+
+    VIEW_FILES = {
+        'history': "automation_history.json",
+        'tracked': "tracked_predictions.json",
+        'accuracy': "accuracy_tracking.json",
+        'progress': "season_progress.json",
+    }
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(exist_ok=True)
+        self.journal_path = self.data_dir / JOURNAL_FILENAME
+        self.paths = {view: self.data_dir / name for view, name in self.VIEW_FILES.items()}
+
+        self._lock = threading.RLock()
+        self._views: Dict[str, Dict[str, Any]] = {view: {} for view in self.VIEW_FILES}
+        self._signatures: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._index: Dict[Tuple[str, str, str], Dict[str, Any]] = {}   # (league, date, game_id) -> prediction
+        self._by_game: Dict[Tuple[str, str], List[str]] = {}           # (league, game_id) -> dates, oldest first
+        self._batch: Optional[List[Dict[str, Any]]] = None
+        self._load()
+
+    # =================== VIEWS ===================
+
+    @property
+    def history(self) -> Dict[str, Any]:
+        self.refresh()
+        return self._views['history']
+
+    @property
+    def tracked(self) -> Dict[str, Any]:
+        self.refresh()
+        return self._views['tracked']
+
+    @property
+    def accuracy(self) -> Dict[str, Any]:
+        self.refresh()
+        return self._views['accuracy']
+
+    @property
+    def progress(self) -> Dict[str, Any]:
+        self.refresh()
+        return self._views['progress']
+
+    def has_view(self, view: str) -> bool:
+        """📄 Whether a view file exists on disk"""
+        return self.paths[view].exists()
+
+    # =================== LOADING ===================
+
+    def _signature(self, path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+
+    def refresh(self):
+        """🔄 Reload if another tool rewrote one of the JSON views"""
+        with self._lock:
+            if self._batch is not None:
+                return
+            if any(self._signature(path) != self._signatures.get(view) for view, path in self.paths.items()):
+                logger.info("🔄 Midnight Special files changed on disk - reloading store")
+                self._load()
+
+    def _load(self):
+        with self._lock:
+            for view, path in self.paths.items():
+                self._signatures[view] = self._signature(path)
+                self._views[view] = self._read_json(path)
+            self._rebuild_index()
+
+            # Replay operations from a commit that never finished rewriting the views
+            pending = self._read_journal()
+            if pending:
+                applied = sum(1 for op in pending if self._apply(op))
+                self._reconcile_views(pending)
+                logger.warning(f"🩹 Replayed {applied}/{len(pending)} journaled Midnight Special operations")
+                self._materialize()
+
+    def _read_json(self, path: Path) -> Dict[str, Any]:
+        try:
+            if path.exists():
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                return data if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.error(f"💀 Error loading {path}: {e}")
+        return {}
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        operations = []
+        if not self.journal_path.exists():
+            return operations
+        with open(self.journal_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    operations.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Torn final line from a crash mid-append - that op was never committed
+                    logger.warning("⚠️ Ignoring torn Midnight Special journal entry")
+        return operations
+
+    def _rebuild_index(self):
+        self._index.clear()
+        self._by_game.clear()
+        for league, league_data in self._views['history'].items():
+            if not isinstance(league_data, dict):
+                continue
+            for run in league_data.get('runs', []):
+                for pred in run.get('predictions', []):
+                    self._index_prediction(league, pred)
+
+    def _index_prediction(self, league: str, pred: Dict[str, Any]):
+        game_id = str(pred.get('game_id'))
+        date = pred.get('date', '')
+        key = (league, date, game_id)
+        if key not in self._index:
+            self._index[key] = pred
+            self._by_game.setdefault((league, game_id), []).append(date)
+
+    # =================== LOOKUPS ===================
+
+    def find_prediction(self, league_id: str, game_id: str, date: str = None) -> Optional[Dict[str, Any]]:
+        """🔍 O(1) prediction lookup by (league, date, game_id); without a date the oldest match wins"""
+        self.refresh()
+        league = league_id.upper()
+        if date is not None:
+            return self._index.get((league, date, str(game_id)))
+        dates = self._by_game.get((league, str(game_id)))
+        return self._index.get((league, dates[0], str(game_id))) if dates else None
+
+    # =================== WRITES ===================
+
+    @contextmanager
+    def batch(self):
+        """📦 Group operations into one journal append + one rewrite per view"""
+        with self._lock:
+            if self._batch is not None:
+                yield  # already inside a batch - the outer one commits
+                return
+            self.refresh()
+            self._batch = []
+            try:
+                yield
+                operations, self._batch = self._batch, None
+                self._commit(operations)
+            except BaseException:
+                # Drop half-applied in-memory changes; disk (views + journal) is the truth
+                self._batch = None
+                self._load()
+                raise
+            finally:
+                self._batch = None
+
+    def record(self, operation: Dict[str, Any]) -> bool:
+        """📝 Apply one operation (journaled at commit); returns False if it changed nothing"""
+        with self._lock:
+            if self._batch is None:
+                with self.batch():
+                    return self.record(operation)
+            if not self._apply(operation):
+                return False
+            self._batch.append(operation)
+            return True
+
+    def _commit(self, operations: List[Dict[str, Any]]):
+        if not operations:
+            return
+        # 1. Journal first - once this is on disk the batch survives a crash
+        with open(self.journal_path, 'a') as f:
+            f.write(''.join(json.dumps(op, default=str) + '\n' for op in operations))
+            f.flush()
+            os.fsync(f.fileno())
+        # 2. Rewrite each view once, atomically, then drop the journal
+        self._materialize()
+
+    def _materialize(self):
+        for view, path in self.paths.items():
+            self._atomic_write(path, self._views[view])
+            self._signatures[view] = self._signature(path)
+        self._atomic_write_text(self.journal_path, '')
+
+    def _atomic_write(self, path: Path, data: Any):
+        self._atomic_write_text(path, json.dumps(data, indent=2, default=str))
+
+    def _atomic_write_text(self, path: Path, text: str):
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    # =================== OPERATIONS ===================
+
+    def _apply(self, op: Dict[str, Any]) -> bool:
+        kind = op.get('op')
+        if kind == 'save_prediction':
+            return self._apply_save(op['league'], op['run_date'], op['prediction'])
+        if kind == 'update_result':
+            return self._apply_result(op)
+        logger.warning(f"⚠️ Unknown Midnight Special operation: {kind}")
+        return False
+
+    def _apply_save(self, league: str, run_date: str, entry: Dict[str, Any]) -> bool:
+        history = self._views['history']
+        key = (league, entry.get('date', ''), str(entry.get('game_id')))
+        existing = self._index.get(key)
+        if existing is not None and existing.get('tracked_at') == entry.get('tracked_at'):
+            return False  # replayed operation already in the views
+
+        if league not in history:
+            history[league] = {
+                'league': league,
+                'runs': [],
+                'total_predictions': 0,
+                'created': entry.get('tracked_at')
+            }
+
+        league_data = history[league]
+        run = next((r for r in league_data['runs'] if r.get('date') == run_date), None)
+        if run is None:
+            run = {'date': run_date, 'predictions': [], 'created': entry.get('tracked_at')}
+            league_data['runs'].append(run)
+
+        run['predictions'].append(entry)
+        league_data['total_predictions'] = league_data.get('total_predictions', 0) + 1
+        self._index_prediction(league, entry)
+
+        # Tracked predictions for quick access
+        self._views['tracked'].setdefault(league, []).append(dict(entry))
+
+        self._update_season_progress(league)
+        return True
+
+    def _apply_result(self, op: Dict[str, Any]) -> bool:
+        league = op['league']
+        dates = self._by_game.get((league, str(op['game_id'])))
+        date = op.get('date') or (dates[0] if dates else None)
+        pred = self._index.get((league, date, str(op['game_id']))) if date is not None else None
+        if pred is None or pred.get('completed_at') == op['completed_at']:
+            return False
+
+        pred['result'] = op['result']
+        pred['correct'] = op['correct']
+        pred['status'] = 'completed'
+        pred['completed_at'] = op['completed_at']
+
+        self._update_accuracy_tracking(league, op['correct'], op['completed_at'])
+        return True
+
+    def _reconcile_views(self, operations: List[Dict[str, Any]]):
+        """🩹 Bring the derived views of replayed leagues back in line with history
+
+        The views are rewritten one file at a time, so after a crash history may
+        already hold an operation whose tracked/accuracy/progress update never
+        reached disk. History is the source of truth for all three.
+        """
+        leagues = {op.get('league') for op in operations if op.get('league')}
+        for op in operations:
+            if op.get('op') == 'save_prediction':
+                self._ensure_tracked(op['league'], op['prediction'])
+        for league in leagues:
+            if league in self._views['history']:
+                self._rebuild_accuracy_tracking(league)
+                self._update_season_progress(league)
+
+    def _ensure_tracked(self, league: str, entry: Dict[str, Any]):
+        key = (entry.get('date', ''), str(entry.get('game_id')), entry.get('tracked_at'))
+        tracked = self._views['tracked'].setdefault(league, [])
+        if not any((t.get('date', ''), str(t.get('game_id')), t.get('tracked_at')) == key for t in tracked):
+            tracked.append(dict(entry))
+
+    def _rebuild_accuracy_tracking(self, league: str):
+        results = [pred for run in self._views['history'][league].get('runs', [])
+                   for pred in run.get('predictions', [])
+                   if pred.get('status') == 'completed' and pred.get('correct') is not None]
+        if not results and league not in self._views['accuracy']:
+            return
+
+        tracking = self._views['accuracy'].setdefault(league, {})
+        correct = sum(1 for pred in results if pred['correct'])
+        tracking.update({
+            'total': len(results),
+            'correct': correct,
+            'incorrect': len(results) - correct,
+            'accuracy': correct / len(results) * 100 if results else 0.0
+        })
+        if results:
+            tracking['updated'] = max(str(pred.get('completed_at')) for pred in results)
+
+    def _update_season_progress(self, league: str):
+        league_data = self._views['history'].get(league, {})
+        runs = league_data.get('runs', [])
+        total_predictions = league_data.get('total_predictions', 0)
+        completed = sum(1 for run in runs for pred in run.get('predictions', [])
+                        if pred.get('status') == 'completed')
+
+        self._views['progress'][league] = {
+            'games_played': completed,
+            'games_remaining': total_predictions - completed,
+            'total_predictions': total_predictions,
+            'weeks_completed': len(runs),
+            'updated': datetime.now().isoformat()
+        }
+
+    def _update_accuracy_tracking(self, league: str, is_correct: bool, updated: str):
+        tracking = self._views['accuracy'].setdefault(league, {
+            'total': 0,
+            'correct': 0,
+            'incorrect': 0,
+            'accuracy': 0.0
+        })
+
+        tracking['total'] += 1
+        if is_correct:
+            tracking['correct'] += 1
+        else:
+            tracking['incorrect'] += 1
+        tracking['accuracy'] = tracking['correct'] / tracking['total'] * 100
+        tracking['updated'] = updated
+
+        logger.info(f"📊 {league} Accuracy: {tracking['accuracy']:.1f}%")
+
+# =================== SHARED INSTANCES ===================
+
+_STORES: Dict[str, MidnightSpecialStore] = {}
+_STORES_LOCK = threading.Lock()
+
+def get_midnight_special_store(data_dir: Path) -> MidnightSpecialStore:
+    """📚 One store per data directory, shared by the writer and the reader"""
+    key = str(Path(data_dir).resolve())
+    with _STORES_LOCK:
+        if key not in _STORES:
+            _STORES[key] = MidnightSpecialStore(Path(data_dir))
+        return _STORES[key]
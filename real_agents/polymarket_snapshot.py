@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+🔥💀🔥 POLYMARKET SNAPSHOT - ONE INDEXED MARKET LISTING FOR EVERY D0 LOOKUP 💀🔥💀
+
+D0 used to download up to three full /events listings and scan them linearly
+for every single game. This service keeps one snapshot of the open Polymarket
+events per process and:
+
+- Fetches the Sports listing once per refresh interval, paginated (limit/offset);
+  events tagged with another category are dropped even if the API ignores the filter
+- Revalidates each page with If-None-Match (304 = reuse the cached page)
+- Indexes events by normalized team tokens and by event date
+- Persists the snapshot on disk so a cold start has data before the first fetch
+- Serves stale data while a background refresh runs (lookups never wait on
+  the network once a snapshot exists)
+
+🎯 USAGE:
+    snapshot = get_polymarket_snapshot()
+    events = await snapshot.find_events("Real Madrid", "FC Barcelona", game_date="2025-10-26")
+
+📁 LAYOUT (data/polymarket/):
+    events_snapshot.json   - fetched_at + per-page etag and events
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+import unicodedata
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
+from urllib.parse import quote
+
+try:
+    from real_agents.http_client_service import shared_session
+except ImportError:
+    from http_client_service import shared_session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://gamma-api.polymarket.com"
+DEFAULT_SNAPSHOT_PATH = Path(__file__).parent.parent / "data" / "polymarket" / "events_snapshot.json"
+DEFAULT_REFRESH_INTERVAL = 300.0
+DEFAULT_RETRY_INTERVAL = 60.0
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_PAGES = 20
+DEFAULT_CATEGORY = "Sports"
+
+# Common abbreviations and alternative names (normalized team name -> aliases)
+TEAM_ALIASES = {
+    'real madrid': ['madrid', 'real'],
+    'fc barcelona': ['barcelona', 'barca'],
+    'manchester united': ['man united', 'united'],
+    'manchester city': ['man city', 'city'],
+    'liverpool': ['liverpool fc'],
+    'chelsea': ['chelsea fc'],
+    'arsenal': ['arsenal fc'],
+    'tottenham': ['spurs', 'tottenham hotspur'],
+    'atletico madrid': ['atletico', 'atleti'],
+    'bayern munich': ['bayern', 'munich'],
+    'borussia dortmund': ['dortmund', 'bvb'],
+    'paris saint germain': ['psg', 'paris'],
+    'ac milan': ['milan', 'ac milan'],
+    'inter milan': ['inter', 'internazionale'],
+    'juventus': ['juve', 'juventus fc'],
+    'olympiacos': ['olympiakos'],
+}
+
+# Club prefixes/suffixes and articles that are never a team on their own
+GENERIC_TOKENS = {'fc', 'cf', 'sc', 'afc', 'cd', 'ac', 'the', 'club', 'de', 'del', 'la', 'el', 'los', 'las'}
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+_ISO_DATE = re.compile(r'^(\d{4}-\d{2}-\d{2})')
+
+def normalize_text(text: str) -> str:
+    """🔤 Lowercase, strip accents and punctuation: 'Atlético-Madrid' -> 'atletico madrid'"""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(' ', text.lower()).strip()
+
+def team_patterns(team: str) -> List[str]:
+    """
+    🏷️ Normalized phrases that identify a team in a market title
+
+    Full name, first and last word (unless generic) and known aliases.
+    """
+    name = normalize_text(team)
+    if not name:
+        return []
+    words = name.split()
+    patterns = [name]
+    for word in (words[-1], words[0]):
+        if word not in GENERIC_TOKENS and len(word) >= 3 and word not in patterns:
+            patterns.append(word)
+    for alias in TEAM_ALIASES.get(name, []):
+        alias = normalize_text(alias)
+        if alias not in patterns:
+            patterns.append(alias)
+    return patterns
+
+def contains_phrase(text: str, phrase: str) -> int:
+    """📍 Word-aligned position of a normalized phrase in normalized text (-1 if absent)"""
+    return f" {text} ".find(f" {phrase} ")
+
+def _event_dates(event: Dict[str, Any]) -> Set[str]:
+    dates = set()
+    for field in ('startDate', 'endDate', 'eventDate'):
+        match = _ISO_DATE.match(str(event.get(field) or ''))
+        if match:
+            dates.add(match.group(1))
+    return dates
+
+class PolymarketSnapshot:
+    """
+    📸 Periodically refreshed, indexed snapshot of open Polymarket events
+    """
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, snapshot_path: Optional[Path] = DEFAULT_SNAPSHOT_PATH,
+                 refresh_interval: float = DEFAULT_REFRESH_INTERVAL, retry_interval: float = DEFAULT_RETRY_INTERVAL,
+                 page_size: int = DEFAULT_PAGE_SIZE, max_pages: int = DEFAULT_MAX_PAGES, timeout: float = 15,
+                 category: Optional[str] = DEFAULT_CATEGORY):
+        self.base_url = base_url
+        self.category = category
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.timeout = timeout
+
+        self.fetched_at = 0.0
+        self.last_attempt = 0.0
+        self._pages: Dict[str, Dict[str, Any]] = {}  # page url -> {'etag', 'events'}
+        self._disk_checked = False
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._background_task: Optional[asyncio.Task] = None
+
+        self.events: List[Dict[str, Any]] = []
+        self._titles: List[str] = []
+        self._descriptions: List[str] = []
+        self._token_index: Dict[str, Set[int]] = {}
+        self._date_index: Dict[str, Set[int]] = {}
+
+        self.stats = {'refreshes': 0, 'refresh_failures': 0, 'pages_downloaded': 0, 'pages_not_modified': 0,
+                      'rebuilds': 0, 'disk_loads': 0, 'lookups': 0, 'lookup_hits': 0}
+
+    # =================== PUBLIC API ===================
+
+    async def find_events(self, home_team: str, away_team: str,
+                          game_date: Union[str, date, datetime, None] = None) -> List[Dict[str, Any]]:
+        """
+        🔍 Events mentioning either team, both-team matches first
+
+        With game_date, events dated within a day of it are preferred; when none
+        are, every team match is returned (market end dates often drift).
+        """
+        await self.ensure_fresh()
+        self.stats['lookups'] += 1
+
+        home = self.positions_for_team(home_team)
+        away = self.positions_for_team(away_team)
+        positions = home | away
+        if game_date is not None and positions:
+            dated = positions & self.positions_near(game_date)
+            if dated:
+                positions = dated
+
+        both = home & away
+        ordered = sorted(positions, key=lambda position: (position not in both, position))
+        if ordered:
+            self.stats['lookup_hits'] += 1
+        return [self.events[position] for position in ordered]
+
+    def positions_for_team(self, team: str) -> Set[int]:
+        """🏷️ Snapshot rows whose title or description mentions the team"""
+        positions: Set[int] = set()
+        for pattern in team_patterns(team):
+            positions |= self._positions_for_phrase(pattern)
+        return positions
+
+    def positions_near(self, game_date: Union[str, date, datetime], days: int = 1) -> Set[int]:
+        """📅 Snapshot rows starting or ending within `days` of a date"""
+        if isinstance(game_date, datetime):
+            day = game_date.date()
+        elif isinstance(game_date, date):
+            day = game_date
+        else:
+            match = _ISO_DATE.match(str(game_date))
+            if not match:
+                return set()
+            day = date.fromisoformat(match.group(1))
+
+        positions: Set[int] = set()
+        for offset in range(-days, days + 1):
+            positions |= self._date_index.get((day + timedelta(days=offset)).isoformat(), set())
+        return positions
+
+    def market_statistics(self) -> Optional[Dict[str, float]]:
+        """📊 Average volume/liquidity across the snapshot (None when empty)"""
+        volumes = [float(e.get('volume') or 0) for e in self.events if float(e.get('volume') or 0) > 0]
+        liquidities = [float(e.get('liquidity') or 0) for e in self.events if float(e.get('liquidity') or 0) > 0]
+        if not volumes or not liquidities:
+            return None
+        return {'avg_volume': sum(volumes) / len(volumes), 'avg_liquidity': sum(liquidities) / len(liquidities)}
+
+    async def ensure_fresh(self):
+        """
+        ⏱️ Make sure a snapshot is available
+
+        Cold start: load from disk, otherwise fetch and wait. Stale snapshot:
+        keep serving it and refresh in the background.
+        """
+        if not self._disk_checked:
+            self._disk_checked = True
+            await asyncio.to_thread(self._load)
+
+        now = time.time()
+        if now - self.fetched_at < self.refresh_interval or now - self.last_attempt < self.retry_interval:
+            return
+
+        task = self._start_refresh()
+        if not self.events:
+            await asyncio.shield(task)
+
+    async def refresh(self) -> bool:
+        """🔄 Refresh now (joins a refresh already in flight)"""
+        return await asyncio.shield(self._start_refresh())
+
+    def start(self, interval: Optional[float] = None):
+        """🚀 Refresh on a fixed interval in the background (long-running services)"""
+        if interval is not None:
+            self.refresh_interval = interval
+        if self._background_task is None or self._background_task.done():
+            self._background_task = asyncio.create_task(self._refresh_loop())
+            logger.info(f"📸 Polymarket snapshot refreshing every {self.refresh_interval:.0f}s")
+
+    async def stop(self):
+        """🛑 Stop the background refresh loop"""
+        for task in (self._background_task, self._refresh_task):
+            if task and not task.done() and task.get_loop() is asyncio.get_running_loop():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._background_task = None
+        self._refresh_task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'events': len(self.events),
+            'pages': len(self._pages),
+            'tokens': len(self._token_index),
+            'dates': len(self._date_index),
+            'age_seconds': round(time.time() - self.fetched_at, 1) if self.fetched_at else None,
+        }
+
+    # =================== REFRESH ===================
+
+    def _start_refresh(self) -> asyncio.Task:
+        loop = asyncio.get_running_loop()
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = self._refresh_task = loop.create_task(self._refresh())
+        return task
+
+    async def _refresh_loop(self):
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
+
+    def _page_url(self, offset: int) -> str:
+        category = f"&category={quote(self.category)}" if self.category else ""
+        return (f"{self.base_url}/events?active=true&closed=false{category}"
+                f"&limit={self.page_size}&offset={offset}")
+
+    def _in_category(self, event: Dict[str, Any]) -> bool:
+        """🏷️ Drop events the API tagged with another category (the filter is not always honoured)"""
+        category = event.get('category')
+        return not self.category or not category or str(category).lower() == self.category.lower()
+
+    async def _refresh(self) -> bool:
+        self.last_attempt = time.time()
+        pages: Dict[str, Dict[str, Any]] = {}
+        changed = False
+
+        try:
+            async with shared_session() as session:
+                for page in range(self.max_pages):
+                    url = self._page_url(page * self.page_size)
+                    cached = self._pages.get(url)
+                    headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else {}
+
+                    async with session.get(url, headers=headers, timeout=self.timeout) as response:
+                        if response.status == 304 and cached is not None:
+                            self.stats['pages_not_modified'] += 1
+                            pages[url] = cached
+                        elif response.status == 200:
+                            events = await response.json()
+                            if not isinstance(events, list):
+                                raise ValueError(f"unexpected /events payload: {type(events).__name__}")
+                            self.stats['pages_downloaded'] += 1
+                            pages[url] = {'etag': response.headers.get('ETag'), 'events': events}
+                            changed = True
+                        else:
+                            raise ValueError(f"HTTP {response.status} for {url}")
+
+                    if len(pages[url]['events']) < self.page_size:
+                        break
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats['refresh_failures'] += 1
+            logger.warning(f"⚠️ Polymarket snapshot refresh failed ({e}); keeping {len(self.events)} cached events")
+            return False
+
+        changed = changed or set(pages) != set(self._pages)
+        self._pages = pages
+        self.fetched_at = time.time()
+        self.stats['refreshes'] += 1
+
+        if changed:
+            self._rebuild()
+            await asyncio.to_thread(self._persist)
+        logger.info(f"📸 Polymarket snapshot: {len(self.events)} events from {len(pages)} pages "
+                    f"({'updated' if changed else 'not modified'})")
+        return True
+
+    # =================== INDEX ===================
+
+    def _rebuild(self):
+        """🗂️ Rebuild the token and date indexes from the cached pages"""
+        events, seen = [], set()
+        for page in self._pages.values():
+            for event in page['events']:
+                key = event.get('id') or id(event)
+                if key in seen or event.get('closed', False) or not self._in_category(event):
+                    continue
+                seen.add(key)
+                events.append(event)
+
+        titles = [normalize_text(event.get('title', '')) for event in events]
+        descriptions = [normalize_text(event.get('description', '')) for event in events]
+        token_index: Dict[str, Set[int]] = {}
+        date_index: Dict[str, Set[int]] = {}
+        for position, event in enumerate(events):
+            for token in set(titles[position].split()) | set(descriptions[position].split()):
+                token_index.setdefault(token, set()).add(position)
+            for day in _event_dates(event):
+                date_index.setdefault(day, set()).add(position)
+
+        self.events, self._titles, self._descriptions = events, titles, descriptions
+        self._token_index, self._date_index = token_index, date_index
+        self.stats['rebuilds'] += 1
+
+    def _positions_for_phrase(self, phrase: str) -> Set[int]:
+        tokens = phrase.split()
+        if not tokens:
+            return set()
+        postings = sorted((self._token_index.get(token, set()) for token in tokens), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        if len(tokens) == 1:
+            return candidates
+        return {position for position in candidates
+                if contains_phrase(self._titles[position], phrase) >= 0
+                or contains_phrase(self._descriptions[position], phrase) >= 0}
+
+    # =================== PERSISTENCE ===================
+
+    def _load(self):
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                data = json.load(f)
+            if data.get('base_url') != self.base_url:
+                return
+            self._pages = data['pages']
+            self.fetched_at = float(data['fetched_at'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable Polymarket snapshot {self.snapshot_path}: {e}")
+            return
+        self._rebuild()
+        self.stats['disk_loads'] += 1
+        logger.info(f"💾 Loaded Polymarket snapshot: {len(self.events)} events "
+                    f"({time.time() - self.fetched_at:.0f}s old)")
+
+    def _persist(self):
+        if self.snapshot_path is None:
+            return
+        payload = json.dumps({'base_url': self.base_url, 'fetched_at': self.fetched_at, 'pages': self._pages})
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.snapshot_path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.snapshot_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+# =================== PROCESS-WIDE INSTANCE ===================
+
+POLYMARKET_SNAPSHOT = PolymarketSnapshot()
+
+def get_polymarket_snapshot() -> PolymarketSnapshot:
+    """📸 The process-wide Polymarket snapshot"""
+    return POLYMARKET_SNAPSHOT
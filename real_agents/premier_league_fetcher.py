@@ -21,6 +21,10 @@ import aiohttp
 import logging
 from datetime import datetime, timezone
 from typing import List, Dict, Any
+try:
+    from real_agents.http_client_service import shared_session
+except ImportError:
+    from http_client_service import shared_session
 
 # Import the Universal Prediction Engine for 8D analysis
 from real_agents.universal_prediction_engine import UniversalPredictionEngine
@@ -75,7 +79,7 @@ class RealPremierLeagueFetcher:
         # Check multiple dates for complete gameweek
         from datetime import datetime, timedelta
         
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             # Try multiple Premier League endpoints
             for league_id in self.premier_league_ids:
                 try:
@@ -416,7 +420,7 @@ class RealPremierLeagueFetcher:
         try:
             standings = {}
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 # Try multiple endpoints for standings
                 for league_id in self.premier_league_ids:
                     try:
@@ -452,7 +456,7 @@ class RealPremierLeagueFetcher:
             
             all_season_games = []
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 # Try multiple Premier League endpoints for season data
                 for league_id in self.premier_league_ids:
                     try:
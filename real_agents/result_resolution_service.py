@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+🔥💀🔥 RESULT RESOLUTION SERVICE - ONE SCOREBOARD PER LEAGUE-DAY 💀🔥💀
+
+Result checking used to fire one ESPN request per predicted game and rewrite the
+predictions file after each lookup. This service:
+
+- Groups pending predictions by (sport, league, date), where the date is the
+  event's local day as ESPN files it (a 20:00 ET kickoff stored as 01:00Z is
+  still on that evening's scoreboard)
+- Fetches each ESPN scoreboard ONCE (all league-days concurrently, through the
+  shared pooled session + conditional-GET cache)
+- Indexes every scoreboard by event id and by normalized (home, away) team pair
+- Hands back every match so callers settle a whole scoreboard in one write
+
+🎯 USAGE:
+    matches = await RESULT_RESOLVER.resolve_games(pending_games, default_date='2025-08-14')
+    for game, result in matches:
+        ...
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from real_agents.http_response_cache import fetch_cached_json
+    from real_agents.team_catalog import TEAM_CATALOG, fold_name
+except ImportError:
+    from http_response_cache import fetch_cached_json
+    from team_catalog import TEAM_CATALOG, fold_name
+
+logger = logging.getLogger(__name__)
+
+ESPN_API_BASE = "https://site.api.espn.com/apis/site/v2/sports"
+
+# Our league labels -> ESPN (sport, league) path
+LEAGUE_ENDPOINTS = {
+    "MLB": ("baseball", "mlb"),
+    "WNBA": ("basketball", "wnba"),
+    "NBA": ("basketball", "nba"),
+    "NFL": ("football", "nfl"),
+    "EPL": ("soccer", "eng.1"),
+    "PREMIER_LEAGUE": ("soccer", "eng.1"),
+    "LA_LIGA": ("soccer", "esp.1"),
+    "SERIE_A": ("soccer", "ita.1"),
+    "BUNDESLIGA": ("soccer", "ger.1"),
+    "LIGUE_1": ("soccer", "fra.1"),
+    "LIGUE1": ("soccer", "fra.1"),
+    "MLS": ("soccer", "usa.1"),
+    "LIGA_MX": ("soccer", "mex.1"),
+    "EREDIVISIE": ("soccer", "ned.1"),
+    "SUPERLIG": ("soccer", "tur.1"),
+    "UEFA_CHAMPIONS_LEAGUE": ("soccer", "uefa.champions"),
+    "COPA_LIBERTADORES": ("soccer", "conmebol.libertadores"),
+}
+
+# ESPN files scoreboard events under their US Eastern calendar day
+SCOREBOARD_TZ = ZoneInfo("America/New_York")
+
+ScoreboardKey = Tuple[str, str, str]  # (sport, espn_league, YYYYMMDD)
+
+@dataclass
+class EventResult:
+    """🏁 One scoreboard event, reduced to what settlement needs"""
+    event_id: str
+    sport: str
+    league: str
+    date: str
+    home_team: str
+    away_team: str
+    home_score: int
+    away_score: int
+    completed: bool
+
+    @property
+    def result(self) -> str:
+        if self.home_score > self.away_score:
+            return "home_win"
+        if self.away_score > self.home_score:
+            return "away_win"
+        return "draw"
+
+    @property
+    def winner(self) -> str:
+        outcome = self.result
+        if outcome == "home_win":
+            return self.home_team
+        if outcome == "away_win":
+            return self.away_team
+        return "draw"
+
+    @property
+    def score(self) -> str:
+        return f"{self.away_score}-{self.home_score}"
+
+def _team_key(name: str) -> str:
+    """🔑 Catalog team id when the name is known, folded name otherwise"""
+    record = TEAM_CATALOG.resolve(name)
+    return record.team_id if record else fold_name(name)
+
+def _score(value: Any) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+class ScoreboardIndex:
+    """
+    📇 One ESPN scoreboard indexed by event id and normalized team pair
+    """
+
+    def __init__(self, events: Iterable[EventResult]):
+        self.events = list(events)
+        self.by_event_id = {event.event_id: event for event in self.events if event.event_id}
+        self.by_teams = {(_team_key(event.home_team), _team_key(event.away_team)): event
+                         for event in self.events}
+
+    @classmethod
+    def from_scoreboard(cls, data: Optional[Dict], sport: str, league: str) -> 'ScoreboardIndex':
+        events = []
+        for event in (data or {}).get("events", []):
+            competitions = event.get("competitions", [])
+            if not competitions:
+                continue
+            competitors = competitions[0].get("competitors", [])
+            if len(competitors) < 2:
+                continue
+
+            home = next((c for c in competitors if c.get("homeAway") == "home"), competitors[1])
+            away = next((c for c in competitors if c is not home), competitors[0])
+            status_type = event.get("status", {}).get("type", {})
+            status_name = status_type.get("name", "").lower()
+
+            events.append(EventResult(
+                event_id=str(event.get("id", "")),
+                sport=sport,
+                league=league,
+                date=event.get("date", ""),
+                home_team=home.get("team", {}).get("displayName", "Unknown"),
+                away_team=away.get("team", {}).get("displayName", "Unknown"),
+                home_score=_score(home.get("score")),
+                away_score=_score(away.get("score")),
+                completed=bool(status_type.get("completed")) or status_name in ("final", "completed", "status_final")
+            ))
+        return cls(events)
+
+    def lookup(self, home_team: str, away_team: str, event_id: Optional[str] = None) -> Optional[EventResult]:
+        """🔍 Event id first, then the normalized pair, then alias-aware fuzzy match"""
+        if event_id and str(event_id) in self.by_event_id:
+            return self.by_event_id[str(event_id)]
+
+        event = self.by_teams.get((_team_key(home_team), _team_key(away_team)))
+        if event is not None:
+            return event
+
+        for event in self.events:
+            if TEAM_CATALOG.names_match(home_team, event.home_team) and \
+               TEAM_CATALOG.names_match(away_team, event.away_team):
+                return event
+        return None
+
+    def completed_events(self) -> List[EventResult]:
+        return [event for event in self.events if event.completed]
+
+class ResultResolutionService:
+    """
+    🏁 Batch resolver: one scoreboard request per (sport, league, date)
+    """
+
+    def __init__(self, api_base: str = ESPN_API_BASE, max_concurrent: int = 8):
+        self.api_base = api_base
+        self.max_concurrent = max_concurrent
+        self.stats = {'scoreboards_fetched': 0, 'scoreboards_failed': 0, 'games_matched': 0, 'games_unmatched': 0}
+
+    # =================== KEYS ===================
+
+    @staticmethod
+    def endpoint_for(league: str) -> Optional[Tuple[str, str]]:
+        """🗺️ ESPN (sport, league) for one of our league labels"""
+        league = (league or "").upper().replace(" ", "_")
+        if league in LEAGUE_ENDPOINTS:
+            return LEAGUE_ENDPOINTS[league]
+        for label, endpoint in LEAGUE_ENDPOINTS.items():
+            if label in league:
+                return endpoint
+        if "SOCCER" in league:
+            return LEAGUE_ENDPOINTS["EPL"]
+        return None
+
+    @staticmethod
+    def _date_key(value: Optional[str], default_date: str) -> str:
+        """
+        📅 YYYYMMDD scoreboard day from an ISO date/datetime, falling back to the default
+
+        Timezone-aware datetimes are moved to the scoreboard's local day; plain
+        dates and naive datetimes are already event-local and kept as they are.
+        """
+        for candidate in (value, default_date):
+            if candidate:
+                try:
+                    moment = datetime.fromisoformat(str(candidate).strip().replace('Z', '+00:00'))
+                except ValueError:
+                    continue
+                if moment.tzinfo is not None:
+                    moment = moment.astimezone(SCOREBOARD_TZ)
+                return moment.strftime('%Y%m%d')
+        return datetime.now(SCOREBOARD_TZ).strftime('%Y%m%d')
+
+    def key_for_game(self, game: Dict[str, Any], default_date: str) -> Optional[ScoreboardKey]:
+        endpoint = self.endpoint_for(game.get("league") or game.get("sport"))
+        if endpoint is None:
+            return None
+        return (*endpoint, self._date_key(game.get("game_date") or game.get("game_time"), default_date))
+
+    # =================== FETCHING ===================
+
+    async def fetch_scoreboards(self, keys: Iterable[ScoreboardKey]) -> Dict[ScoreboardKey, ScoreboardIndex]:
+        """📡 Fetch every distinct scoreboard once, concurrently"""
+        keys = list(dict.fromkeys(keys))
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def fetch(key: ScoreboardKey) -> Tuple[ScoreboardKey, Optional[ScoreboardIndex]]:
+            sport, league, date_str = key
+            url = f"{self.api_base}/{sport}/{league}/scoreboard?dates={date_str}"
+            async with semaphore:
+                data = await fetch_cached_json(url, timeout=10)
+            if data is None:
+                self.stats['scoreboards_failed'] += 1
+                logger.warning(f"⚠️ Scoreboard unavailable: {sport}/{league} {date_str}")
+                return key, None
+            self.stats['scoreboards_fetched'] += 1
+            return key, ScoreboardIndex.from_scoreboard(data, sport, league)
+
+        fetched = await asyncio.gather(*(fetch(key) for key in keys))
+        return {key: index for key, index in fetched if index is not None}
+
+    async def completed_events(self, endpoints: Iterable[Tuple[str, str]],
+                               dates: Iterable[str]) -> List[EventResult]:
+        """🏁 Completed events across every (endpoint, date) pair, deduplicated by event"""
+        keys = [(sport, league, date_str) for date_str in dates for sport, league in endpoints]
+        scoreboards = await self.fetch_scoreboards(keys)
+
+        unique = {}
+        for index in scoreboards.values():
+            for event in index.completed_events():
+                unique[event.event_id or (event.league, event.home_team, event.away_team, event.date)] = event
+        return list(unique.values())
+
+    # =================== MATCHING ===================
+
+    async def resolve_games(self, games: Iterable[Dict[str, Any]],
+                            default_date: str) -> List[Tuple[Dict[str, Any], EventResult]]:
+        """
+        🎯 Match predicted games against their scoreboards
+
+        Returns (game, event) pairs for every game found on a scoreboard; the
+        caller applies them and writes once.
+        """
+        groups: Dict[ScoreboardKey, List[Dict[str, Any]]] = {}
+        for game in games:
+            key = self.key_for_game(game, default_date)
+            if key is None:
+                self.stats['games_unmatched'] += 1
+                continue
+            groups.setdefault(key, []).append(game)
+
+        scoreboards = await self.fetch_scoreboards(groups)
+        logger.info(f"📡 {len(scoreboards)}/{len(groups)} scoreboards fetched for "
+                    f"{sum(len(g) for g in groups.values())} games")
+
+        matches = []
+        for key, group in groups.items():
+            index = scoreboards.get(key)
+            for game in group:
+                event = index.lookup(game.get("home_team", ""), game.get("away_team", ""),
+                                     game.get("espn_event_id")) if index else None
+                if event is None:
+                    self.stats['games_unmatched'] += 1
+                    continue
+                self.stats['games_matched'] += 1
+                matches.append((game, event))
+        return matches
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
+
+# =================== PROCESS-WIDE INSTANCE ===================
+
+RESULT_RESOLVER = ResultResolutionService()
+
+def get_result_resolver() -> ResultResolutionService:
+    """🏁 The process-wide result resolution service"""
+    return RESULT_RESOLVER
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+🔥💀🔥 SLATE CACHE - MULTI-LEAGUE ANALYZED GAMES CACHE 💀🔥💀
+
+Keeps the 8D-analyzed slate of every recently viewed league so switching
+dashboard panels doesn't re-run the whole fetch + analysis pipeline.
+
+🎯 FEATURES:
+- One entry per league, TTL per league (from leagues_registry)
+- LRU eviction against a memory budget
+- Stale-while-revalidate: stale slates are served while a background refresh runs
+- Single-flight loads: concurrent requests for the same league share one analysis
+- Explicit invalidation (one league or everything) - loads already in flight
+  are detached and their results discarded
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLATE_TTL_SECONDS = 300          # 5 minutes for leagues without a registry interval
+DEFAULT_MAX_STALE_SECONDS = 3600         # never serve a slate older than ttl + 1 hour
+DEFAULT_MEMORY_BUDGET_BYTES = 32 * 1024 * 1024
+
+@dataclass
+class SlateEntry:
+    """📦 One cached league slate"""
+    value: Any
+    size_bytes: int
+    stored_at: float
+    ttl: float
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.age <= self.ttl
+
+def estimate_size(value: Any) -> int:
+    """📏 Approximate memory footprint of a slate (its JSON size)"""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+class SlateCache:
+    """
+    🗂️ Keyed LRU cache of analyzed league slates with stale-while-revalidate
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+                 max_stale_seconds: float = DEFAULT_MAX_STALE_SECONDS,
+                 default_ttl: float = DEFAULT_SLATE_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.max_stale_seconds = max_stale_seconds
+        self.default_ttl = default_ttl
+
+        self._entries: "OrderedDict[str, SlateEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Bumped by invalidate(); a load only stores if its generation is still current
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self.total_bytes = 0
+        self.stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'coalesced': 0,
+                      'refreshes': 0, 'evictions': 0, 'invalidations': 0}
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]],
+                          ttl: Optional[float] = None) -> Any:
+        """
+        🎯 Return the cached slate for key, loading it if needed
+
+        Fresh → cached value. Stale (within max_stale_seconds) → cached value
+        and a background refresh. Missing/too old → wait for the load.
+        Empty slates are returned but never cached.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if entry.is_fresh:
+                self.stats['hits'] += 1
+                return entry.value
+            if entry.age <= entry.ttl + self.max_stale_seconds:
+                self.stats['stale_hits'] += 1
+                if key not in self._inflight:
+                    self.stats['refreshes'] += 1
+                    logger.info(f"🔄 Serving stale {key} slate ({entry.age:.0f}s old), refreshing in background")
+                self._start_load(key, loader, ttl)
+                return entry.value
+
+        if key in self._inflight:
+            self.stats['coalesced'] += 1
+        else:
+            self.stats['misses'] += 1
+        # shield: a client disconnecting must not cancel the analysis for everyone else
+        return await asyncio.shield(self._start_load(key, loader, ttl))
+
+    def _generation(self, key: str) -> tuple:
+        return self._epoch, self._generations.get(key, 0)
+
+    def _start_load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader, ttl, self._generation(key)))
+            self._inflight[key] = task
+        return task
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float,
+                    generation: tuple) -> Any:
+        try:
+            value = await loader()
+            if value and generation == self._generation(key):
+                self._store(key, value, ttl)
+            return value
+        except Exception as e:
+            logger.error(f"💀 Slate load failed for {key}: {e}")
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry.value
+            raise
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def _store(self, key: str, value: Any, ttl: float):
+        size = estimate_size(value)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= previous.size_bytes
+
+        self._entries[key] = SlateEntry(value=value, size_bytes=size, stored_at=time.monotonic(), ttl=ttl)
+        self.total_bytes += size
+
+        # LRU eviction - always keep the slate we just stored
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted.size_bytes
+            self.stats['evictions'] += 1
+            logger.info(f"🧹 Evicted {evicted_key} slate ({evicted.size_bytes} bytes) - memory budget")
+
+    def invalidate(self, key: Optional[str] = None) -> int:
+        """🧹 Drop one cached slate (or all of them); returns entries removed
+
+        In-flight loads for the key are detached: their callers still get the
+        result, but it is not stored and the next request starts a fresh load.
+        """
+        if key is None:
+            self._epoch += 1
+            self._inflight.clear()
+            removed = len(self._entries)
+            self._entries.clear()
+            self.total_bytes = 0
+        else:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._inflight.pop(key, None)
+            entry = self._entries.pop(key, None)
+            removed = 1 if entry is not None else 0
+            if entry is not None:
+                self.total_bytes -= entry.size_bytes
+        self.stats['invalidations'] += removed
+        return removed
+
+    def peek(self, key: str) -> Optional[Any]:
+        """👀 Cached slate without touching LRU order or triggering loads"""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """📊 Cache statistics"""
+        return {
+            **self.stats,
+            'entries': len(self._entries),
+            'total_bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'leagues': {
+                key: {'age_seconds': round(entry.age, 1), 'ttl': entry.ttl, 'fresh': entry.is_fresh,
+                      'size_bytes': entry.size_bytes}
+                for key, entry in self._entries.items()
+            },
+            'refreshing': list(self._inflight)
+        }
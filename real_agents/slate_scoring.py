@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+🔥💀🔥 SLATE SCORING ENGINE - WHOLE SLATES/SEASONS AS NUMPY COLUMNS 💀🔥💀
+
+The league "real_algorithm" modules score one game at a time: await every factor
+coroutine, hand-weight the sum, add bonuses, cap, calibrate, decide. For back
+tests over thousands of fixtures that per-game path dominates runtime.
+
+This engine scores a whole slate at once:
+
+- Slate: games as columnar arrays (home_team / away_team / venue)
+- Factor columns are computed once per DISTINCT matchup and gathered back to
+  every fixture with the inverse index (seasons repeat matchups constantly)
+- FactorModel: weight vector + bonus rules + cap, applied with array ops
+- Calibration and the per-league decision step plug in as callables
+
+🎯 PARITY: weights are accumulated column by column in declaration order - the
+same order as the scalar formulas - so batch confidences are bit-identical to
+apply_real_*_algorithm (tests/test_slate_scoring.py holds them to it).
+
+🎯 USAGE:
+    scores = await RealMLSAlgorithm().score_slate(games)
+    scores.predictions, scores.confidences   # numpy arrays, one entry per game
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class BonusRule:
+    """🚀 Add `bonus` when every (factor, threshold) condition has factor >= threshold"""
+    conditions: Tuple[Tuple[str, float], ...]
+    bonus: float
+
+@dataclass(frozen=True)
+class FactorModel:
+    """
+    ⚖️ Weighted factor model of one league algorithm
+
+    factors: (algorithm coroutine name, weight) in the scalar formula's order
+    """
+    factors: Tuple[Tuple[str, float], ...]
+    bonus_rules: Tuple[BonusRule, ...] = ()
+    cap: Optional[float] = None
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(name for name, _ in self.factors)
+
+    @property
+    def weights(self) -> np.ndarray:
+        return np.array([weight for _, weight in self.factors], dtype=np.float64)
+
+    def column(self, name: str) -> int:
+        return self.names.index(name)
+
+    def combine(self, factor_matrix: np.ndarray) -> np.ndarray:
+        """🧮 Weighted sum + bonuses + cap for an (n_games, n_factors) matrix"""
+        weights = self.weights
+        confidence = factor_matrix[:, 0] * weights[0]
+        for j in range(1, len(weights)):
+            confidence = confidence + factor_matrix[:, j] * weights[j]
+
+        if self.bonus_rules:
+            bonus = np.zeros(len(factor_matrix), dtype=np.float64)
+            for rule in self.bonus_rules:
+                hit = np.ones(len(factor_matrix), dtype=bool)
+                for name, threshold in rule.conditions:
+                    hit &= factor_matrix[:, self.column(name)] >= threshold
+                bonus = bonus + np.where(hit, rule.bonus, 0)
+            confidence = confidence + bonus
+
+        if self.cap is not None:
+            confidence = np.minimum(confidence, self.cap)
+        return confidence
+
+class Slate:
+    """
+    📋 A slate (or season) of games as columnar arrays
+    """
+
+    COLUMNS = ('home_team', 'away_team', 'venue')
+
+    def __init__(self, home_team: Iterable[str], away_team: Iterable[str], venue: Iterable[str] = None):
+        self.home_team = np.asarray(list(home_team), dtype=object)
+        self.away_team = np.asarray(list(away_team), dtype=object)
+        self.venue = np.asarray(list(venue) if venue is not None else [''] * len(self.home_team), dtype=object)
+        if not (len(self.home_team) == len(self.away_team) == len(self.venue)):
+            raise ValueError("Slate columns must have the same length")
+
+    @classmethod
+    def from_games(cls, games: Iterable[Dict[str, Any]]) -> 'Slate':
+        games = list(games)
+        return cls([g.get('home_team', 'Unknown') for g in games],
+                   [g.get('away_team', 'Unknown') for g in games],
+                   [g.get('venue', '') for g in games])
+
+    def __len__(self) -> int:
+        return len(self.home_team)
+
+    def distinct_games(self) -> Tuple[List[Dict[str, str]], np.ndarray]:
+        """🔑 One game dict per distinct (home, away, venue) row + the inverse index"""
+        keys = np.array(['\x1f'.join(map(str, row)) for row in zip(self.home_team, self.away_team, self.venue)], dtype=object)
+        _, first, inverse = np.unique(keys.astype(str), return_index=True, return_inverse=True)
+        games = [{column: getattr(self, column)[i] for column in self.COLUMNS} for i in first]
+        return games, inverse.reshape(-1)
+
+@dataclass
+class SlateScores:
+    """📊 Batch output - row i belongs to game i of the slate"""
+    factors: np.ndarray
+    factor_names: Tuple[str, ...]
+    raw_confidences: np.ndarray
+    confidences: np.ndarray
+    predictions: np.ndarray
+    distinct_games: int = 0
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        return [{'prediction': prediction, 'confidence': round(float(confidence), 1)}
+                for prediction, confidence in zip(self.predictions, self.confidences)]
+
+# decide(game, confidence, factors_by_name) -> (prediction, confidence)
+DecisionFn = Callable[[Dict[str, str], float, Dict[str, float]], Awaitable[Tuple[str, float]]]
+
+@dataclass
+class SlateScorer:
+    """
+    🏎️ Batch scorer for one league algorithm
+
+    algorithm: instance exposing the model's factor coroutines
+    calibrate: raw confidence array -> calibrated array (None = no calibration)
+    decide: per-game decision step (runs once per distinct game)
+    """
+    algorithm: Any
+    model: FactorModel
+    calibrate: Optional[Callable[[np.ndarray], np.ndarray]] = None
+    decide: Optional[DecisionFn] = None
+    stats: Dict[str, int] = field(default_factory=lambda: {'games': 0, 'distinct_games': 0})
+
+    async def factor_matrix(self, slate: Slate) -> Tuple[np.ndarray, List[Dict[str, str]], np.ndarray]:
+        """📐 (n_games, n_factors) matrix, computing each distinct matchup once"""
+        games, inverse = slate.distinct_games()
+        methods = [getattr(self.algorithm, name) for name in self.model.names]
+        distinct = np.empty((len(games), len(methods)), dtype=np.float64)
+        for i, game in enumerate(games):
+            for j, method in enumerate(methods):
+                distinct[i, j] = await method(dict(game))
+        return distinct[inverse], games, inverse
+
+    async def score(self, slate: Slate) -> SlateScores:
+        """🎯 Factors -> weighted confidence -> calibration -> decisions, for the whole slate"""
+        if len(slate) == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return SlateScores(np.empty((0, len(self.model.factors))), self.model.names,
+                               empty, empty, np.empty(0, dtype=object))
+
+        factors, games, inverse = await self.factor_matrix(slate)
+        raw = self.model.combine(factors)
+        calibrated = self.calibrate(raw) if self.calibrate is not None else raw
+
+        predictions = np.empty(len(slate), dtype=object)
+        confidences = np.array(calibrated, dtype=np.float64)
+        if self.decide is not None:
+            # Factors (and so confidence) are a function of the distinct game - decide each once
+            first_rows = np.unique(inverse, return_index=True)[1]
+            distinct_predictions = np.empty(len(games), dtype=object)
+            distinct_confidences = np.empty(len(games), dtype=np.float64)
+            for i, row in enumerate(first_rows):
+                named = dict(zip(self.model.names, factors[row].tolist()))
+                distinct_predictions[i], distinct_confidences[i] = await self.decide(
+                    dict(games[i]), float(calibrated[row]), named)
+            predictions = distinct_predictions[inverse]
+            confidences = distinct_confidences[inverse]
+
+        self.stats['games'] += len(slate)
+        self.stats['distinct_games'] += len(games)
+        logger.info(f"🏎️ Slate scored: {len(slate)} games ({len(games)} distinct matchups)")
+        return SlateScores(factors=factors, factor_names=self.model.names, raw_confidences=raw,
+                           confidences=confidences, predictions=predictions, distinct_games=len(games))
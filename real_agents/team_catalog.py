@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+🔥💀🔥 TEAM CATALOG - ONE COMPILED TEAM-NAME INDEX FOR EVERY ENGINE 💀🔥💀
+
+Team strength tables, region lists and name-variation tables used to be
+rebuilt (and scanned alias by alias) inside every algorithm and MCP call.
+This module is the single source of truth for team identity:
+
+- Canonical ids, display names, aliases and nicknames
+- Accent/case folding ("Club América" == "club america")
+- Static attributes: strength rating, tier, region, conference
+- ONE Aho-Corasick automaton over every alias, compiled at import:
+  a lookup costs O(len(name)) no matter how many teams are catalogued
+
+🎯 USAGE:
+    from real_agents.team_catalog import TEAM_CATALOG
+    TEAM_CATALOG.strength("FC Bayern München")       # 0.85
+    TEAM_CATALOG.resolve("Orlando City SC").region   # 'east'
+    TEAM_CATALOG.names_match("Man Utd", "Manchester United")   # True
+
+When several aliases occur in a name, the longest (most specific) one wins:
+"Real Sociedad" is Real Sociedad, not Real Madrid.
+
+Generic club words ("city", "real", "united", ...) name dozens of clubs, so
+they never identify a team on their own: they only resolve when a league is
+given and exactly one catalogued team of that league contains the word
+("City" in the EPL is Manchester City; "United" in the EPL is ambiguous).
+"""
+
+import unicodedata
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Single words shared by many club names - only meaningful inside one league
+GENERIC_ALIASES = frozenset({
+    'america', 'athletic', 'atletico', 'bayer', 'borussia', 'city', 'inter',
+    'madrid', 'paris', 'real', 'santos', 'sporting', 'united',
+})
+
+def fold_name(name: str) -> str:
+    """🔤 Accent/case folded, whitespace-collapsed form used for all matching"""
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return ' '.join(stripped.casefold().split())
+
+# =================== MULTI-PATTERN MATCHER ===================
+
+class AhoCorasickMatcher:
+    """
+    🔍 Finds every pattern occurring in a text in one pass (Aho-Corasick)
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for pattern in patterns:
+            self._add(pattern)
+        self._build()
+
+    def _add(self, pattern: str):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(len(self.patterns))
+        self.patterns.append(pattern)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt].extend(self._out[self._fail[nxt]])
+
+    def find_all(self, text: str) -> List[int]:
+        """📍 Ids of all patterns occurring in text (each id once)"""
+        found = set()
+        state = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return list(found)
+
+# =================== TEAM RECORDS ===================
+
+@dataclass(frozen=True)
+class TeamRecord:
+    """🏟️ One catalogued team"""
+    team_id: str
+    name: str
+    league: str
+    sport: str = 'soccer'
+    strength: Optional[float] = None
+    region: Optional[str] = None
+    conference: Optional[str] = None
+    aliases: Tuple[str, ...] = ()
+    nicknames: Tuple[str, ...] = ()   # short forms for name-variation matching (man utd, spurs)
+
+    @property
+    def tier(self) -> Optional[str]:
+        """🏅 Strength tier derived from the rating"""
+        if self.strength is None:
+            return None
+        if self.strength >= 0.80:
+            return 'elite'
+        if self.strength >= 0.70:
+            return 'strong'
+        if self.strength >= 0.55:
+            return 'mid'
+        return 'lower'
+
+# 🔥 CATALOG DATA: league -> [(name, strength, aliases, extra attributes)]
+# Aliases are matched as substrings of the folded name, exactly like the
+# legacy per-engine tables they replace.
+_CATALOG_DATA = {
+    # 🇩🇪 BUNDESLIGA
+    'BUNDESLIGA': [
+        ('Bayern Munich', 0.85, ('bayern', 'munich', 'bayern munchen'), {'nicknames': ('bayern',)}),
+        ('Borussia Dortmund', 0.78, ('dortmund', 'borussia', 'bvb'), {}),
+        ('RB Leipzig', 0.75, ('leipzig',), {}),
+        ('Bayer Leverkusen', 0.72, ('leverkusen', 'bayer'), {}),
+        ('Eintracht Frankfurt', 0.68, ('frankfurt', 'eintracht'), {}),
+        ('VfL Wolfsburg', 0.65, ('wolfsburg',), {}),
+        ('Borussia Monchengladbach', 0.63, ('monchengladbach', 'gladbach'), {}),
+        ('VfB Stuttgart', 0.62, ('stuttgart',), {}),
+        ('SC Freiburg', 0.60, ('freiburg',), {}),
+        ('TSG Hoffenheim', 0.58, ('hoffenheim',), {}),
+        ('Mainz', 0.55, ('mainz',), {}),
+        ('Union Berlin', 0.57, (), {}),
+        ('Werder Bremen', 0.54, (), {}),
+        ('FC Augsburg', 0.52, ('augsburg',), {}),
+        ('FC Heidenheim', 0.48, ('heidenheim',), {}),
+        ('VfL Bochum', 0.46, ('bochum',), {}),
+        ('SV Darmstadt', 0.44, ('darmstadt',), {}),
+        ('FC Koln', 0.50, ('koln', 'cologne'), {}),
+        ('Holstein Kiel', 0.47, (), {}),
+    ],
+    # 🏴󠁧󠁢󠁥󠁮󠁧󠁿 PREMIER LEAGUE
+    'EPL': [
+        ('Manchester City', 0.88, ('city', 'man city'), {'nicknames': ('man city',)}),
+        ('Arsenal', 0.82, (), {}),
+        ('Liverpool', 0.83, (), {}),
+        ('Chelsea', 0.79, (), {}),
+        ('Manchester United', 0.76, ('united', 'man united', 'man utd'), {'nicknames': ('man utd',)}),
+        ('Tottenham Hotspur', 0.74, ('tottenham', 'spurs'), {'nicknames': ('spurs',)}),
+        ('Newcastle United', 0.70, ('newcastle',), {}),
+        ('Brighton', 0.67, (), {}),
+        ('West Ham', 0.64, (), {}),
+        ('Aston Villa', 0.71, (), {}),
+        ('Crystal Palace', 0.58, (), {}),
+        ('Fulham', 0.60, (), {}),
+        ('Brentford', 0.59, (), {}),
+        ('Wolverhampton Wanderers', 0.56, ('wolves',), {}),
+        ('Everton', 0.54, (), {}),
+        ('Nottingham Forest', 0.52, ('nottingham',), {}),
+        ('Bournemouth', 0.51, (), {}),
+        ('Luton Town', 0.46, ('luton',), {}),
+        ('Burnley', 0.48, (), {}),
+        ('Sheffield United', 0.49, ('sheffield',), {}),
+    ],
+    # 🇪🇸 LA LIGA
+    'LA_LIGA': [
+        ('Real Madrid', 0.87, ('madrid', 'real'), {}),
+        ('Barcelona', 0.84, ('barca',), {'nicknames': ('barca',)}),
+        ('Atletico Madrid', 0.79, ('atletico',), {}),
+        ('Athletic Club', 0.68, ('athletic', 'bilbao'), {}),
+        ('Villarreal', 0.69, (), {}),
+        ('Real Sociedad', 0.67, ('sociedad',), {}),
+        ('Sevilla', 0.66, (), {}),
+        ('Valencia', 0.63, (), {}),
+        ('Real Betis', 0.62, ('betis',), {}),
+        ('Osasuna', 0.57, (), {}),
+        ('Celta Vigo', 0.55, ('celta',), {}),
+        ('Las Palmas', 0.53, (), {}),
+        ('Getafe', 0.54, (), {}),
+        ('Girona', 0.59, (), {}),
+        ('Mallorca', 0.56, (), {}),
+        ('Cadiz', 0.48, (), {}),
+        ('Almeria', 0.45, (), {}),
+        ('Granada', 0.47, (), {}),
+    ],
+    # 🇮🇹 SERIE A
+    'SERIE_A': [
+        ('Inter Milan', 0.85, ('inter', 'internazionale'), {}),
+        ('AC Milan', 0.81, ('milan',), {}),
+        ('Juventus', 0.79, ('juve',), {}),
+        ('Napoli', 0.77, (), {}),
+        ('Roma', 0.73, (), {}),
+        ('Lazio', 0.71, (), {}),
+        ('Atalanta', 0.74, (), {}),
+        ('Fiorentina', 0.66, (), {}),
+        ('Bologna', 0.63, (), {}),
+        ('Torino', 0.58, (), {}),
+        ('Genoa', 0.55, (), {}),
+        ('Udinese', 0.56, (), {}),
+        ('Sassuolo', 0.54, (), {}),
+        ('Hellas Verona', 0.52, ('verona',), {}),
+        ('Cagliari', 0.51, (), {}),
+        ('Lecce', 0.49, (), {}),
+        ('Frosinone', 0.47, (), {}),
+        ('Salernitana', 0.45, (), {}),
+    ],
+    # 🇫🇷 LIGUE 1
+    'LIGUE1': [
+        ('Paris Saint-Germain', 0.89, ('psg', 'paris'), {'nicknames': ('psg',)}),
+        ('Monaco', 0.73, (), {}),
+        ('Marseille', 0.70, (), {}),
+        ('Lille', 0.68, (), {}),
+        ('Lyon', 0.67, (), {}),
+        ('Nice', 0.65, (), {}),
+        ('Rennes', 0.63, (), {}),
+        ('Lens', 0.62, (), {}),
+        ('Strasbourg', 0.58, (), {}),
+        ('Montpellier', 0.56, (), {}),
+        ('Nantes', 0.55, (), {}),
+        ('Reims', 0.54, (), {}),
+        ('Brest', 0.53, (), {}),
+        ('Le Havre', 0.50, (), {}),
+        ('Metz', 0.48, (), {}),
+        ('Clermont', 0.47, (), {}),
+        ('Lorient', 0.49, (), {}),
+    ],
+    # 🇲🇽 LIGA MX
+    'LIGA_MX': [
+        ('Club America', 0.82, ('america',), {}),
+        ('Cruz Azul', 0.75, (), {}),
+        ('Guadalajara', 0.78, ('chivas',), {}),
+        ('Tigres UANL', 0.79, ('tigres',), {}),
+        ('Monterrey', 0.77, (), {}),
+        ('Pumas UNAM', 0.71, ('pumas',), {}),
+        ('Santos Laguna', 0.68, ('santos',), {}),
+        ('Leon', 0.66, (), {}),
+        ('Atlas', 0.63, (), {}),
+        ('Tijuana', 0.61, (), {}),
+        ('Toluca', 0.64, (), {}),
+        ('Pachuca', 0.65, (), {}),
+        ('Puebla', 0.57, (), {}),
+        ('Necaxa', 0.56, (), {}),
+        ('Mazatlan', 0.52, (), {}),
+        ('Queretaro', 0.51, (), {}),
+        ('FC Juarez', 0.49, ('juarez',), {}),
+    ],
+    # 🇺🇸 MLS - regions drive travel distance, conferences follow the MLS engine
+    'MLS': [
+        ('LAFC', 0.75, ('los angeles fc',), {'region': 'west', 'conference': 'western'}),
+        ('LA Galaxy', None, (), {'region': 'west', 'conference': 'western'}),
+        ('San Jose Earthquakes', 0.47, ('san jose',), {'region': 'west', 'conference': 'western'}),
+        ('Seattle Sounders', 0.71, ('seattle',), {'region': 'west', 'conference': 'western'}),
+        ('Portland Timbers', 0.63, ('portland',), {'region': 'west', 'conference': 'western'}),
+        ('Vancouver Whitecaps', 0.52, ('vancouver',), {'region': 'west', 'conference': 'western'}),
+        ('Inter Miami', 0.73, ('miami',), {'region': 'east', 'conference': 'eastern'}),
+        ('Atlanta United', 0.67, ('atlanta',), {'region': 'east', 'conference': 'eastern'}),
+        ('Orlando City', 0.59, ('orlando',), {'region': 'east', 'conference': 'eastern'}),
+        ('DC United', 0.54, ('d.c. united',), {'region': 'east', 'conference': 'eastern'}),
+        ('Philadelphia Union', 0.66, ('philadelphia',), {'region': 'east', 'conference': 'eastern'}),
+        ('New York City FC', 0.64, ('new york city', 'nycfc'), {'region': 'east', 'conference': 'eastern'}),
+        ('New York Red Bulls', 0.60, ('new york red',), {'region': 'east', 'conference': 'eastern'}),
+        ('Toronto FC', 0.51, ('toronto',), {'region': 'east', 'conference': 'eastern'}),
+        ('CF Montreal', 0.49, ('montreal',), {'region': 'east', 'conference': 'eastern'}),
+        ('New England Revolution', 0.48, ('new england',), {'region': 'east', 'conference': 'eastern'}),
+        ('Sporting Kansas City', 0.61, ('kansas city', 'sporting kc'), {'region': 'central', 'conference': 'western'}),
+        ('FC Dallas', 0.56, ('dallas',), {'region': 'central', 'conference': 'western'}),
+        ('Houston Dynamo', 0.53, ('houston',), {'region': 'central', 'conference': 'western'}),
+        ('Austin FC', 0.68, ('austin',), {'region': 'central', 'conference': 'western'}),
+        ('Colorado Rapids', 0.50, ('colorado',), {'region': 'central', 'conference': 'western'}),
+        ('Real Salt Lake', None, (), {'region': 'central', 'conference': 'western'}),
+        ('Chicago Fire', 0.55, ('chicago',), {'region': 'central', 'conference': 'eastern'}),
+        ('Columbus Crew', 0.64, ('columbus',), {'region': 'central', 'conference': 'eastern'}),
+        ('Minnesota United', 0.58, ('minnesota',), {'region': 'central', 'conference': 'eastern'}),
+        ('Nashville SC', 0.62, ('nashville',), {'region': 'central', 'conference': 'eastern'}),
+        ('FC Cincinnati', 0.65, ('cincinnati',), {'region': 'central', 'conference': 'eastern'}),
+        ('Charlotte FC', 0.57, ('charlotte',), {'region': 'central', 'conference': 'eastern'}),
+    ],
+    # 🏀 NBA - identity only (name variations)
+    'NBA': [
+        ('Los Angeles Lakers', None, (), {'sport': 'basketball', 'nicknames': ('lakers',)}),
+        ('Golden State Warriors', None, (), {'sport': 'basketball', 'nicknames': ('warriors',)}),
+        ('Boston Celtics', None, (), {'sport': 'basketball', 'nicknames': ('celtics',)}),
+        ('Miami Heat', None, (), {'sport': 'basketball', 'nicknames': ('heat',)}),
+    ],
+}
+
+def _team_id(league: str, name: str) -> str:
+    return f"{league.lower()}:{fold_name(name).replace(' ', '-')}"
+
+# =================== CATALOG ===================
+
+class TeamCatalog:
+    """
+    📚 Compiled team-name index (built once, queried in O(len(name)))
+    """
+
+    def __init__(self, records: Iterable[TeamRecord]):
+        self.records: List[TeamRecord] = list(records)
+        self.by_id: Dict[str, TeamRecord] = {record.team_id: record for record in self.records}
+
+        # folded pattern -> [(record position, is_nickname)]
+        pattern_owners: Dict[str, List[Tuple[int, bool]]] = {}
+        # league -> generic word -> the one team of that league whose names contain it
+        self._league_words: Dict[str, Dict[str, TeamRecord]] = {}
+        for position, record in enumerate(self.records):
+            aliases = {fold_name(a) for a in record.aliases}
+            for pattern in {fold_name(record.name)} | (aliases - GENERIC_ALIASES):
+                pattern_owners.setdefault(pattern, []).append((position, False))
+            for nickname in record.nicknames:
+                pattern_owners.setdefault(fold_name(nickname), []).append((position, True))
+
+        for league in {record.league for record in self.records}:
+            teams = [r for r in self.records if r.league == league]
+            words = {}
+            for word in GENERIC_ALIASES:
+                owners = [r for r in teams
+                          if any(word in fold_name(n).split() for n in (r.name, *r.aliases))]
+                if len(owners) == 1:
+                    words[word] = owners[0]
+            self._league_words[league] = words
+
+        self._owners = list(pattern_owners.values())
+        self._matcher = AhoCorasickMatcher(pattern_owners.keys())
+
+    @classmethod
+    def from_table(cls, table: Dict[str, list]) -> 'TeamCatalog':
+        """🏗️ Build a catalog from {league: [(name, strength, aliases, extras)]}"""
+        records = []
+        for league, teams in table.items():
+            for name, strength, aliases, extras in teams:
+                records.append(TeamRecord(
+                    team_id=_team_id(league, name), name=name, league=league,
+                    strength=strength, aliases=tuple(aliases), **extras
+                ))
+        return cls(records)
+
+    # =================== LOOKUPS ===================
+
+    @lru_cache(maxsize=4096)
+    def _match_folded(self, folded: str) -> Tuple[Tuple[TeamRecord, ...], Tuple[TeamRecord, ...]]:
+        """(teams ordered most specific first, teams whose nickname occurs)"""
+        ranked: Dict[int, Tuple[int, int]] = {}
+        nicknamed = set()
+        for pattern_id in self._matcher.find_all(folded):
+            length = len(self._matcher.patterns[pattern_id])
+            for position, is_nickname in self._owners[pattern_id]:
+                if is_nickname:
+                    nicknamed.add(position)
+                rank = (-length, position)
+                if rank < ranked.get(position, (1, 0)):
+                    ranked[position] = rank
+        ordered = tuple(self.records[p] for p in sorted(ranked, key=ranked.get))
+        return ordered, tuple(self.records[p] for p in sorted(nicknamed))
+
+    def matches(self, name: str) -> Tuple[TeamRecord, ...]:
+        """🔍 Every team whose alias occurs in name, most specific alias first"""
+        return self._match_folded(fold_name(name))[0]
+
+    def resolve(self, name: str, league: str = None) -> Optional[TeamRecord]:
+        """🎯 The team a name refers to (longest alias wins), optionally within one league"""
+        for record in self.matches(name):
+            if league is None or record.league == league:
+                return record
+        return self._resolve_generic(name, league)
+
+    def _resolve_generic(self, name: str, league: Optional[str]) -> Optional[TeamRecord]:
+        """🏷️ Generic club words, accepted only where the league makes them unique"""
+        if league is None:
+            return None
+        words = self._league_words.get(league, {})
+        for word in fold_name(name).split():
+            if word in words:
+                return words[word]
+        return None
+
+    def strength(self, name: str, league: str = None) -> Optional[float]:
+        """💪 Strength rating of the most specific rated team in name (optionally within one league)"""
+        for record in self.matches(name):
+            if record.strength is not None and (league is None or record.league == league):
+                return record.strength
+        record = self._resolve_generic(name, league)
+        return record.strength if record else None
+
+    def names_match(self, name_a: str, name_b: str) -> bool:
+        """
+        🤝 Whether two spellings refer to the same team
+
+        Equal or containing names match; otherwise a nickname in one name
+        ("man utd", "spurs") must belong to the team the other name resolves to.
+        """
+        folded_a, folded_b = fold_name(name_a), fold_name(name_b)
+        if folded_a == folded_b or folded_a in folded_b or folded_b in folded_a:
+            return True
+        for folded, other in ((folded_a, folded_b), (folded_b, folded_a)):
+            nicknamed = self._match_folded(folded)[1]
+            if nicknamed:
+                other_matches = self._match_folded(other)[0]
+                if other_matches and other_matches[0] in nicknamed:
+                    return True
+        return False
+
+    def league_teams(self, league: str) -> List[TeamRecord]:
+        """📋 Catalogued teams of a league"""
+        return [record for record in self.records if record.league == league]
+
+# =================== PROCESS-WIDE CATALOG ===================
+
+TEAM_CATALOG = TeamCatalog.from_table(_CATALOG_DATA)
@@ -13,9 +13,12 @@ This SINGLE ENGINE replaces ALL scattered prediction logic!
 🎯 ONE ENGINE TO PREDICT THEM ALL!
 """
 
+import asyncio
+import functools
 import hashlib
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import time
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 from datetime import datetime
 
 from real_agents.leagues_registry import (
@@ -39,11 +42,19 @@ class UniversalPredictionEngine:
     - Goddess blessed architecture
     """
     
-    def __init__(self):
+    # ⏱️ Deadline per dimension - a slow MCP degrades to its fallback value
+    DIMENSION_TIMEOUT_SECONDS = 8.0
+    # 🎯 Games of one slate analyzed at the same time by the batch API
+    MAX_CONCURRENT_GAMES = 6
+    
+    def __init__(self, dimension_timeout: float = DIMENSION_TIMEOUT_SECONDS,
+                 max_concurrent_games: int = MAX_CONCURRENT_GAMES):
         """Initialize the Universal Prediction Engine"""
         self.version = "1.0.0"
         self.created_by = "Brother #177 Nuclear Refactor"
         self.blessed_by = "Goddess of Syrup"
+        self.dimension_timeout = dimension_timeout
+        self.max_concurrent_games = max_concurrent_games
         logger.info(f"🔥💀🔥 {self.created_by}: Universal Prediction Engine v{self.version} initialized! 💀🔥💀")
         logger.info(f"🌟 Blessed by: {self.blessed_by}")
     
@@ -66,34 +77,23 @@ class UniversalPredictionEngine:
             if not config:
                 raise ValueError(f"League {league_id} not registered in leagues_registry!")
             
-            # Extract teams
+            # Extract teams (and kickoff date, used to pick the right Polymarket event)
             home_team = game_data.get('home_team', 'Unknown')
             away_team = game_data.get('away_team', 'Unknown')
+            game_date = game_data.get('date') or game_data.get('game_date')
             
-            # 🔥💀🔥 CALCULATE ALL 8 DIMENSIONS (D0-D7) - NO MORE 3D BULLSHIT! 💀🔥💀
-            # Dimension 0: Polymarket Odds - REAL D0 MCP!
-            polymarket_odds = await self._calculate_polymarket_odds_d0_mcp(home_team, away_team, league_id, config)
-            
-            # Dimension 1: Historical Matchups - REAL D1 MCP DATA!
-            historical = await self._calculate_historical_matchups(home_team, away_team, league_id, config)
-            
-            # Dimension 2: Weather/Venue - REAL D2 MCP!
-            weather_venue = await self._calculate_weather_venue(home_team, away_team, league_id, config)
-            
-            # Dimension 3: Sentiment - REAL D3 MCP!
-            sentiment = await self._calculate_sentiment(home_team, away_team, league_id, config)
-            
-            # Dimension 4: Market Efficiency - REAL D4 MCP!
-            market_eff = await self._calculate_market_efficiency(home_team, away_team, league_id, config)
-            
-            # Dimension 5: Team Performance - REAL D5 MCP!
-            team_perf = await self._calculate_team_performance_d5_mcp(home_team, away_team, league_id, config)
-            
-            # Dimension 6: Key Players - REAL D6 MCP!
-            key_players = await self._calculate_key_players_d6_mcp(home_team, away_team, league_id, config)
-            
-            # Dimension 7: X-Factor - REAL D7 MCP!
-            x_factor = await self._calculate_x_factor_d7_mcp(home_team, away_team, league_id, config)
+            # 🔥💀🔥 CALCULATE ALL 8 DIMENSIONS (D0-D7) CONCURRENTLY - NO MORE 3D BULLSHIT! 💀🔥💀
+            dimensions, dimension_latency_ms, dimension_fallbacks = await self._schedule_8d_dimensions(
+                home_team, away_team, league_id, config, game_date
+            )
+            polymarket_odds = dimensions['d0_polymarket']
+            historical = dimensions['d1_historical']
+            weather_venue = dimensions['d2_weather_venue']
+            sentiment = dimensions['d3_sentiment']
+            market_eff = dimensions['d4_market_efficiency']
+            team_perf = dimensions['d5_team_performance']
+            key_players = dimensions['d6_key_players']
+            x_factor = dimensions['d7_x_factor']
             
             # Calculate confidence using ALL 8 DIMENSIONS (D0-D7)
             confidence = self._calculate_8d_confidence(
@@ -123,6 +123,8 @@ class UniversalPredictionEngine:
                 polymarket_odds, historical, weather_venue, sentiment,
                 market_eff, team_perf, key_players, x_factor, reasoning
             )
+            unified_game['dimension_latency_ms'] = dimension_latency_ms
+            unified_game['dimension_fallbacks'] = dimension_fallbacks
             
             logger.info(f"✅ {league_id} analysis complete: {prediction} ({confidence}% confidence)")
             return unified_game
@@ -131,6 +133,51 @@ class UniversalPredictionEngine:
             logger.error(f"💀 Error analyzing {league_id} game: {e}")
             return self._create_error_game_data(game_data, league_id, str(e))
     
+    async def _schedule_8d_dimensions(self, home_team: str, away_team: str, league_id: str,
+                                      config: Dict, game_date: Optional[str] = None
+                                      ) -> Tuple[Dict[str, int], Dict[str, float], List[str]]:
+        """
+        ⚡ Run the D0-D7 calculators concurrently, each under its own deadline
+        
+        Returns:
+            (dimension values, per-dimension latency in ms, dimensions that hit
+            the deadline and were replaced by their fallback value)
+        """
+        schedule = [
+            ('d0_polymarket', functools.partial(self._calculate_polymarket_odds_d0_mcp, game_date=game_date),
+             self._calculate_polymarket_fallback),
+            ('d1_historical', self._calculate_historical_matchups, self._calculate_historical_fallback),
+            ('d2_weather_venue', self._calculate_weather_venue, self._calculate_weather_venue_fallback),
+            ('d3_sentiment', self._calculate_sentiment, self._calculate_sentiment_fallback),
+            ('d4_market_efficiency', self._calculate_market_efficiency, self._calculate_market_efficiency_fallback),
+            ('d5_team_performance', self._calculate_team_performance_d5_mcp, self._calculate_team_performance_fallback),
+            ('d6_key_players', self._calculate_key_players_d6_mcp, self._calculate_key_players_fallback),
+            ('d7_x_factor', self._calculate_x_factor_d7_mcp, self._calculate_x_factor_fallback),
+        ]
+        
+        async def run_dimension(name, calculator, fallback):
+            started = time.perf_counter()
+            fell_back = False
+            try:
+                value = await asyncio.wait_for(
+                    calculator(home_team, away_team, league_id, config),
+                    timeout=self.dimension_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"⏱️ {name} exceeded {self.dimension_timeout:.1f}s for {home_team} vs {away_team}, using fallback")
+                value, fell_back = fallback(home_team, away_team, league_id, config), True
+            except Exception as e:
+                logger.error(f"💀 {name} crashed for {home_team} vs {away_team}: {e}, using fallback")
+                value, fell_back = fallback(home_team, away_team, league_id, config), True
+            return name, value, round((time.perf_counter() - started) * 1000, 1), fell_back
+        
+        results = await asyncio.gather(*(run_dimension(*entry) for entry in schedule))
+        
+        values = {name: value for name, value, _, _ in results}
+        latency_ms = {name: elapsed for name, _, elapsed, _ in results}
+        fallbacks = [name for name, _, _, fell_back in results if fell_back]
+        return values, latency_ms, fallbacks
+    
     async def _calculate_market_efficiency(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
         """📊 Dimension 4: Market Efficiency - Sportsbook odds & sharp money analysis - REAL D4 MCP!"""
         try:
@@ -163,13 +210,16 @@ class UniversalPredictionEngine:
             
         except Exception as e:
             logger.error(f"❌ D4 MCP failed, using fallback: {e}")
-            # Fallback to hash-based calculation
-            min_val, max_val = config['market_efficiency_range']
-            hash_val = generate_league_specific_hash(league_id, home_team, away_team, 'market')
-            fallback_value = min_val + (hash_val % (max_val - min_val + 1))
+            fallback_value = self._calculate_market_efficiency_fallback(home_team, away_team, league_id, config)
             logger.info(f"🛡️ D4 Fallback: {home_team} vs {away_team} = {fallback_value}% (hash-based)")
             return fallback_value
     
+    def _calculate_market_efficiency_fallback(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
+        """Fallback market efficiency calculation when D4 MCP fails"""
+        min_val, max_val = config['market_efficiency_range']
+        hash_val = generate_league_specific_hash(league_id, home_team, away_team, 'market')
+        return min_val + (hash_val % (max_val - min_val + 1))
+    
     async def _calculate_team_performance_d5_mcp(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
         """📊 Dimension 5: Team Performance - REAL D5 MCP with ESPN team analytics!"""
         try:
@@ -274,7 +324,8 @@ class UniversalPredictionEngine:
     
     # 🔥💀🔥 NEW DIMENSIONS - LEGENDARY 8D UPGRADE (8 DIMENSIONS: D0-D7)! 💀🔥💀
     
-    async def _calculate_polymarket_odds_d0_mcp(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
+    async def _calculate_polymarket_odds_d0_mcp(self, home_team: str, away_team: str, league_id: str, config: Dict,
+                                                game_date: Optional[str] = None) -> int:
         """🔥💀🔥 Dimension 0: REAL D0 POLYMARKET MCP - ULTIMATE BETTING MARKET INTELLIGENCE! 💀🔥💀"""
         try:
             # 🔥💀🔥 CONNECT TO D0 POLYMARKET MCP - REAL BETTING ODDS! 💀🔥💀
@@ -288,7 +339,7 @@ class UniversalPredictionEngine:
                 sport = "AMERICAN_FOOTBALL"
             
             # Fetch REAL D0 Polymarket analysis
-            d0_data = await fetch_d0_polymarket_data(home_team, away_team, sport, league_id)
+            d0_data = await fetch_d0_polymarket_data(home_team, away_team, sport, league_id, game_date)
             
             if d0_data.get('success', False):
                 # Extract market confidence as 8D prediction score
@@ -306,10 +357,13 @@ class UniversalPredictionEngine:
                 
         except Exception as e:
             logger.warning(f"⚠️ D0 Polymarket MCP error: {e}, using fallback")
-            # Fallback to hash calculation
-            min_val, max_val = (45, 85)
-            hash_val = generate_league_specific_hash(league_id, home_team, away_team, 'polymarket')
-            return min_val + (hash_val % (max_val - min_val + 1))
+            return self._calculate_polymarket_fallback(home_team, away_team, league_id, config)
+    
+    def _calculate_polymarket_fallback(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
+        """Fallback Polymarket calculation when D0 MCP fails"""
+        min_val, max_val = (45, 85)
+        hash_val = generate_league_specific_hash(league_id, home_team, away_team, 'polymarket')
+        return min_val + (hash_val % (max_val - min_val + 1))
     
     async def _calculate_historical_matchups(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
         """📜 Dimension 1: Historical Matchups - REAL ESPN D1 MCP ANALYSIS"""
@@ -331,12 +385,16 @@ class UniversalPredictionEngine:
             logger.error(f"❌ D1 MCP error for {home_team} vs {away_team}: {e}")
         
         # Fallback to original hash-based calculation if D1 MCP fails
-        min_val, max_val = (40, 80)
-        hash_val = generate_league_specific_hash(league_id, home_team, away_team, 'historical')
-        fallback_value = min_val + (hash_val % (max_val - min_val + 1))
+        fallback_value = self._calculate_historical_fallback(home_team, away_team, league_id, config)
         logger.info(f"🛡️ D1 Fallback: {home_team} vs {away_team} = {fallback_value}% (hash-based)")
         return fallback_value
     
+    def _calculate_historical_fallback(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
+        """Fallback historical matchups calculation when D1 MCP fails"""
+        min_val, max_val = (40, 80)
+        hash_val = generate_league_specific_hash(league_id, home_team, away_team, 'historical')
+        return min_val + (hash_val % (max_val - min_val + 1))
+    
     async def _calculate_weather_venue(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
         """🌤️ Dimension 2: Weather/Venue - Environmental factors and home advantage - REAL D2 MCP!"""
         try:
@@ -367,11 +425,14 @@ class UniversalPredictionEngine:
             
         except Exception as e:
             logger.error(f"❌ D2 MCP failed, using fallback: {e}")
-            # Fallback to hash-based calculation
-            min_val, max_val = (50, 75)
-            hash_val = generate_league_specific_hash(league_id, home_team, away_team, 'weather')
-            home_boost = 5
-            return min(max_val, min_val + (hash_val % (max_val - min_val + 1)) + home_boost)
+            return self._calculate_weather_venue_fallback(home_team, away_team, league_id, config)
+    
+    def _calculate_weather_venue_fallback(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
+        """Fallback weather/venue calculation when D2 MCP fails"""
+        min_val, max_val = (50, 75)
+        hash_val = generate_league_specific_hash(league_id, home_team, away_team, 'weather')
+        home_boost = 5
+        return min(max_val, min_val + (hash_val % (max_val - min_val + 1)) + home_boost)
     
     async def _calculate_sentiment(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
         """💬 Dimension 3: Sentiment - Social media buzz and news analysis - REAL D3 MCP!"""
@@ -401,13 +462,16 @@ class UniversalPredictionEngine:
             
         except Exception as e:
             logger.error(f"❌ D3 MCP failed, using fallback: {e}")
-            # Fallback to hash-based calculation
-            min_val, max_val = (35, 75)
-            hash_val = generate_league_specific_hash(league_id, home_team, away_team, 'sentiment')
-            fallback_value = min_val + (hash_val % (max_val - min_val + 1))
+            fallback_value = self._calculate_sentiment_fallback(home_team, away_team, league_id, config)
             logger.info(f"🛡️ D3 Fallback: {home_team} vs {away_team} = {fallback_value}% (hash-based)")
             return fallback_value
     
+    def _calculate_sentiment_fallback(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
+        """Fallback sentiment calculation when D3 MCP fails"""
+        min_val, max_val = (35, 75)
+        hash_val = generate_league_specific_hash(league_id, home_team, away_team, 'sentiment')
+        return min_val + (hash_val % (max_val - min_val + 1))
+    
     async def _calculate_x_factor_d7_mcp(self, home_team: str, away_team: str, league_id: str, config: Dict) -> int:
         """🎲 Dimension 7: X-Factor - REAL D7 MCP with AI-powered tactical intelligence!"""
         try:
@@ -725,20 +789,76 @@ class UniversalPredictionEngine:
         logger.info(f"🔥💀🔥 Analyzing {len(games_data)} games for {league_id} with Universal Prediction Engine! 💀🔥💀")
         
         analyzed_games = []
-        for i, game_data in enumerate(games_data):
-            try:
-                analyzed_game = await self.analyze_game(game_data, league_id)
-                if validate_game_data(analyzed_game):
-                    analyzed_games.append(analyzed_game)
-                else:
-                    logger.warning(f"⚠️ Game {i} failed validation for {league_id}")
-            except Exception as e:
-                logger.error(f"💀 Failed to analyze game {i} for {league_id}: {e}")
-                continue
+        for i, analyzed_game in enumerate(await self.analyze_games_batch(games_data, league_id)):
+            if validate_game_data(analyzed_game):
+                analyzed_games.append(analyzed_game)
+            else:
+                logger.warning(f"⚠️ Game {i} failed validation for {league_id}")
         
         logger.info(f"✅ Universal Prediction Engine completed: {len(analyzed_games)}/{len(games_data)} games for {league_id}")
         return analyzed_games
     
+    async def analyze_games_stream(self, games_data: List[Dict[str, Any]], league_id: str,
+                                   max_concurrency: Optional[int] = None) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        ⚡ Analyze a whole slate concurrently, yielding results as they complete
+        
+        Args:
+            games_data: List of raw game data from league fetcher
+            league_id: League identifier
+            max_concurrency: Games analyzed at once (defaults to max_concurrent_games)
+            
+        Yields:
+            (input index, unified game) in completion order; every game carries
+            its own 'analysis_ms' timing
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrent_games)
+        
+        async def analyze_one(index: int, game_data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    analyzed_game = await self.analyze_game(game_data, league_id)
+                except Exception as e:
+                    logger.error(f"💀 Failed to analyze game {index} for {league_id}: {e}")
+                    analyzed_game = self._create_error_game_data(game_data, league_id, str(e))
+                analyzed_game['analysis_ms'] = round((time.perf_counter() - started) * 1000, 1)
+                return index, analyzed_game
+        
+        tasks = [asyncio.ensure_future(analyze_one(i, game)) for i, game in enumerate(games_data)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early - don't leave orphaned analyses running
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def analyze_games_batch(self, games_data: List[Dict[str, Any]], league_id: str,
+                                  max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        🎯 Analyze a whole slate concurrently and return results in input order
+        
+        Args:
+            games_data: List of raw game data from league fetcher
+            league_id: League identifier
+            max_concurrency: Games analyzed at once (defaults to max_concurrent_games)
+            
+        Returns:
+            Unified format games, same order as games_data
+        """
+        started = time.perf_counter()
+        analyzed_games: List[Optional[Dict[str, Any]]] = [None] * len(games_data)
+        async for index, analyzed_game in self.analyze_games_stream(games_data, league_id, max_concurrency):
+            analyzed_games[index] = analyzed_game
+        
+        if games_data:
+            slowest = max(game['analysis_ms'] for game in analyzed_games)
+            logger.info(f"⚡ {league_id} batch: {len(games_data)} games in {(time.perf_counter() - started) * 1000:.0f}ms "
+                        f"(slowest game {slowest:.0f}ms)")
+        return analyzed_games
+    
     def get_supported_leagues(self) -> List[str]:
         """Get list of supported league IDs"""
         return list(LEAGUES_REGISTRY.keys())
@@ -759,6 +879,8 @@ class UniversalPredictionEngine:
                 'Unified prediction logic',
                 'League-specific configurations', 
                 'Consistent data format output',
+                'Concurrent 8D dimension scheduling with per-dimension deadlines',
+                'Bounded concurrent slate analysis (batch + streaming)',
                 'Automatic validation',
                 'Error handling',
                 'Goddess blessed architecture'
@@ -21,6 +21,7 @@ import aiohttp
 import logging
 from datetime import datetime, timezone
 from typing import List, Dict, Any
+from real_agents.http_client_service import shared_session
 
 # Simple logging without broken imports
 logger = logging.getLogger(__name__)
@@ -58,7 +59,7 @@ class RealLigaMXFetcher:
         # BROTHER #162: Check multiple dates for complete jornada
         from datetime import datetime, timedelta
         
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             # Try multiple Liga MX endpoints
             for league_id in self.liga_mx_league_ids:
                 try:
@@ -541,7 +542,7 @@ class RealLigaMXFetcher:
         try:
             standings = {}
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 # Try multiple endpoints for standings
                 for league_id in self.liga_mx_league_ids:
                     try:
@@ -577,7 +578,7 @@ class RealLigaMXFetcher:
             
             all_season_games = []
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 # Try multiple Liga MX endpoints for season data
                 for league_id in self.liga_mx_league_ids:
                     try:
@@ -10,6 +10,7 @@ import json
 import logging
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Any, Optional
+from real_agents.http_client_service import shared_session
 
 logger = logging.getLogger(__name__)
 
@@ -96,7 +97,7 @@ class RealTodaysGamesFetcher:
             # ESPN NFL API - Free tier
             url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard?dates={self.today_str}"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.get(url, timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -144,7 +145,7 @@ class RealTodaysGamesFetcher:
             # ESPN MLB API
             url = f"https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard?dates={self.today_str}"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.get(url, timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -191,7 +192,7 @@ class RealTodaysGamesFetcher:
             # ESPN NBA API
             url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={self.today_str}"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.get(url, timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -236,7 +237,7 @@ class RealTodaysGamesFetcher:
             # ESPN WNBA API
             url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/wnba/scoreboard?dates={self.today_str}"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.get(url, timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -318,7 +319,7 @@ class RealTodaysGamesFetcher:
         try:
             url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{league_code}/scoreboard?dates={self.today_str}"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.get(url, timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -7,12 +7,14 @@ NO MORE FAKE CONFIDENCE WITHOUT REAL VALIDATION!
 
 import json
 import asyncio
-import aiohttp
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Any, Optional
 import os
 
+from real_agents.result_resolution_service import RESULT_RESOLVER, EventResult
+from real_agents.team_catalog import TEAM_CATALOG
+
 logger = logging.getLogger(__name__)
 
 class EmergencyResultsTracker:
@@ -116,21 +118,23 @@ class EmergencyResultsTracker:
                 "updated_games": []
             }
             
-            # Check each game result
-            for game in predictions["games"]:
-                result = await self._check_single_game_result(game)
-                if result:
-                    results["updated_games"].append(result)
-                    results["results_checked"] += 1
-                    
-                    if result["game_completed"]:
-                        results["games_completed"] += 1
-                        if result["prediction_correct"]:
-                            results["correct_predictions"] += 1
-                        else:
-                            results["wrong_predictions"] += 1
+            # One scoreboard request per (sport, league, date) for every pending game
+            pending = [game for game in predictions["games"] if not game.get("result_checked")]
+            matches = await RESULT_RESOLVER.resolve_games(pending, default_date=predictions["date"])
+
+            for game, event in matches:
+                result = self._apply_result(game, event)
+                results["updated_games"].append(result)
+                results["results_checked"] += 1
+
+                if result["game_completed"]:
+                    results["games_completed"] += 1
+                    if result["prediction_correct"]:
+                        results["correct_predictions"] += 1
                     else:
-                        results["pending_games"] += 1
+                        results["wrong_predictions"] += 1
+                else:
+                    results["pending_games"] += 1
             
             # Calculate win rate
             if results["games_completed"] > 0:
@@ -140,7 +144,7 @@ class EmergencyResultsTracker:
                 results["win_rate"] = 0
                 results["loss_rate"] = 0
             
-            # Save updated predictions
+            # Save updated predictions (one write for every settled scoreboard)
             with open(self.predictions_file, 'w') as f:
                 json.dump(predictions, f, indent=2)
             
@@ -155,248 +159,25 @@ class EmergencyResultsTracker:
             logger.error(f"❌ Error checking results: {e}")
             return {"error": str(e)}
     
-    async def _check_single_game_result(self, game_prediction: Dict) -> Optional[Dict]:
-        """
-        🔍 CHECK INDIVIDUAL GAME RESULT
-        """
-        try:
-            # Skip if already checked
-            if game_prediction.get("result_checked"):
-                return None
-            
-            # Check ESPN for game result based on league
-            league = game_prediction.get("league", "").upper()
-            
-            if "MLB" in league:
-                result = await self._check_mlb_result(game_prediction)
-            elif "NBA" in league or "WNBA" in league:
-                result = await self._check_basketball_result(game_prediction)
-            elif "NFL" in league:
-                result = await self._check_nfl_result(game_prediction)
-            elif "SOCCER" in league or any(soccer_league in league for soccer_league in ["EPL", "LA_LIGA", "SERIE_A", "BUNDESLIGA", "LIGUE_1", "MLS", "LIGA_MX"]):
-                result = await self._check_soccer_result(game_prediction)
-            else:
-                # Generic ESPN check
-                result = await self._check_generic_espn_result(game_prediction)
-            
-            if result:
-                # Update the prediction with result
-                game_prediction["actual_winner"] = result.get("winner")
-                game_prediction["actual_score"] = result.get("score", "")
-                game_prediction["game_completed"] = result.get("completed", False)
-                game_prediction["result_checked"] = True
-                game_prediction["result_check_time"] = datetime.now(timezone.utc).isoformat()
-                
-                # Check if prediction was correct
-                if result.get("completed") and result.get("winner"):
-                    predicted_winner = game_prediction.get("predicted_winner", "")
-                    actual_winner = result.get("winner", "")
-                    game_prediction["prediction_correct"] = (predicted_winner.lower() in actual_winner.lower() or 
-                                                           actual_winner.lower() in predicted_winner.lower())
-                
-                return game_prediction
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ Error checking game result: {e}")
-            return None
-    
-    async def _check_mlb_result(self, game_prediction: Dict) -> Optional[Dict]:
-        """
-        ⚾ CHECK MLB GAME RESULT
-        """
-        try:
-            today_str = datetime.now().strftime('%Y%m%d')
-            url = f"https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard?dates={today_str}"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Find matching game
-                        away_team = game_prediction.get("away_team", "").lower()
-                        home_team = game_prediction.get("home_team", "").lower()
-                        
-                        for event in data.get("events", []):
-                            competitions = event.get("competitions", [])
-                            if competitions:
-                                competitors = competitions[0].get("competitors", [])
-                                if len(competitors) >= 2:
-                                    event_away = competitors[0].get("team", {}).get("displayName", "").lower()
-                                    event_home = competitors[1].get("team", {}).get("displayName", "").lower()
-                                    
-                                    # Check if teams match
-                                    if (away_team in event_away or event_away in away_team) and \
-                                       (home_team in event_home or event_home in home_team):
-                                        
-                                        # Check if game is completed
-                                        status = event.get("status", {}).get("type", {}).get("name", "").lower()
-                                        completed = status in ["final", "completed"]
-                                        
-                                        if completed:
-                                            # Get winner
-                                            away_score = int(competitors[0].get("score", "0"))
-                                            home_score = int(competitors[1].get("score", "0"))
-                                            
-                                            if away_score > home_score:
-                                                winner = competitors[0].get("team", {}).get("displayName", "")
-                                            else:
-                                                winner = competitors[1].get("team", {}).get("displayName", "")
-                                            
-                                            return {
-                                                "winner": winner,
-                                                "score": f"{away_score}-{home_score}",
-                                                "completed": True
-                                            }
-                                        else:
-                                            return {"completed": False}
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ Error checking MLB result: {e}")
-            return None
-    
-    async def _check_basketball_result(self, game_prediction: Dict) -> Optional[Dict]:
-        """
-        🏀 CHECK NBA/WNBA GAME RESULT
-        """
-        try:
-            league = game_prediction.get("league", "").upper()
-            
-            if "WNBA" in league:
-                url = "https://site.api.espn.com/apis/site/v2/sports/basketball/wnba/scoreboard"
-            else:
-                url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return await self._parse_basketball_result(data, game_prediction)
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ Error checking basketball result: {e}")
-            return None
-    
-    async def _check_nfl_result(self, game_prediction: Dict) -> Optional[Dict]:
-        """
-        🏈 CHECK NFL GAME RESULT
-        """
-        try:
-            url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return await self._parse_generic_espn_result(data, game_prediction)
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ Error checking NFL result: {e}")
-            return None
-    
-    async def _check_soccer_result(self, game_prediction: Dict) -> Optional[Dict]:
-        """
-        ⚽ CHECK SOCCER GAME RESULT
-        """
-        try:
-            # Map league to ESPN endpoint
-            league = game_prediction.get("league", "").upper()
-            league_mapping = {
-                "EPL": "eng.1",
-                "PREMIER_LEAGUE": "eng.1",
-                "LA_LIGA": "esp.1",
-                "SERIE_A": "ita.1", 
-                "BUNDESLIGA": "ger.1",
-                "LIGUE_1": "fra.1",
-                "MLS": "usa.1",
-                "LIGA_MX": "mex.1"
-            }
-            
-            espn_league = league_mapping.get(league, "eng.1")  # Default to EPL
-            today_str = datetime.now().strftime('%Y%m%d')
-            url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{espn_league}/scoreboard?dates={today_str}"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return await self._parse_generic_espn_result(data, game_prediction)
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ Error checking soccer result: {e}")
-            return None
-    
-    async def _check_generic_espn_result(self, game_prediction: Dict) -> Optional[Dict]:
+    def _apply_result(self, game_prediction: Dict, event: EventResult) -> Dict:
         """
-        🔍 GENERIC ESPN RESULT CHECK
+        🏁 SETTLE ONE PREDICTION FROM ITS SCOREBOARD EVENT
         """
-        # This would try multiple ESPN endpoints based on team names
-        return None
-    
-    async def _parse_basketball_result(self, data: Dict, game_prediction: Dict) -> Optional[Dict]:
-        """
-        🏀 PARSE BASKETBALL RESULT DATA
-        """
-        return await self._parse_generic_espn_result(data, game_prediction)
-    
-    async def _parse_generic_espn_result(self, data: Dict, game_prediction: Dict) -> Optional[Dict]:
-        """
-        🔍 PARSE GENERIC ESPN RESULT DATA
-        """
-        try:
-            away_team = game_prediction.get("away_team", "").lower()
-            home_team = game_prediction.get("home_team", "").lower()
-            
-            for event in data.get("events", []):
-                competitions = event.get("competitions", [])
-                if competitions:
-                    competitors = competitions[0].get("competitors", [])
-                    if len(competitors) >= 2:
-                        event_away = competitors[0].get("team", {}).get("displayName", "").lower()
-                        event_home = competitors[1].get("team", {}).get("displayName", "").lower()
-                        
-                        # Check if teams match (fuzzy matching)
-                        if (away_team in event_away or event_away in away_team) and \
-                           (home_team in event_home or event_home in home_team):
-                            
-                            # Check if game is completed
-                            status = event.get("status", {}).get("type", {}).get("name", "").lower()
-                            completed = status in ["final", "completed"]
-                            
-                            if completed:
-                                # Get winner
-                                away_score = int(competitors[0].get("score", "0"))
-                                home_score = int(competitors[1].get("score", "0"))
-                                
-                                if away_score > home_score:
-                                    winner = competitors[0].get("team", {}).get("displayName", "")
-                                else:
-                                    winner = competitors[1].get("team", {}).get("displayName", "")
-                                
-                                return {
-                                    "winner": winner,
-                                    "score": f"{away_score}-{home_score}",
-                                    "completed": True
-                                }
-                            else:
-                                return {"completed": False}
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ Error parsing ESPN result: {e}")
-            return None
-    
+        game_prediction["game_completed"] = event.completed
+        game_prediction["espn_event_id"] = event.event_id
+        game_prediction["result_check_time"] = datetime.now(timezone.utc).isoformat()
+
+        if event.completed:
+            game_prediction["actual_winner"] = event.winner
+            game_prediction["actual_score"] = event.score
+            game_prediction["result_checked"] = True
+
+            # Check if prediction was correct
+            predicted_winner = game_prediction.get("predicted_winner", "")
+            game_prediction["prediction_correct"] = TEAM_CATALOG.names_match(predicted_winner, event.winner)
+
+        return game_prediction
+
     async def _update_performance_stats(self, results: Dict) -> None:
         """
         📊 UPDATE OVERALL PERFORMANCE STATISTICS
@@ -54,6 +54,7 @@ class AgentSystemDeployment:
             'health_check_interval': 30,
             'performance_monitoring': True,
             'fault_tolerance': True,
+            'agent_placement': {'analyzer': 'process', 'predictor': 'process'},
             'log_level': 'INFO'
         }
     
@@ -290,7 +291,8 @@ async def main():
         'scaling_threshold': 0.8,
         'health_check_interval': 30,
         'performance_monitoring': True,
-        'fault_tolerance': True
+        'fault_tolerance': True,
+        'agent_placement': {'analyzer': 'process', 'predictor': 'process'}
     }
     
     # Create deployment instance
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+🔄 ADAPTER REGISTRY TESTS 🔄
+Agent Poly Loly Double Zero: one canonical match stream for every league
+
+COVERAGE:
+- Every LEAGUES_REGISTRY league has an adapter
+- Slotted CanonicalMatch references the payload and extracts dimensions lazily
+- PROGOL D0..D7 alternates and Liga MX source detection
+- Display dicts keep the dashboard converter shape
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.adapter_registry import ADAPTERS, get_adapter, normalize_games
+from core.structure_adapter import STANDARD_DIM_KEYS, CanonicalMatch
+from real_agents.leagues_registry import LEAGUES_REGISTRY
+
+class TestRegistryCoverage:
+    """🗺️ Test registry-driven adapter coverage"""
+
+    def test_every_registered_league_has_adapter(self):
+        """✅ No registered league falls back to the generic adapter"""
+        assert set(LEAGUES_REGISTRY) <= set(ADAPTERS)
+        for league_id in LEAGUES_REGISTRY:
+            assert get_adapter(league_id.lower()) is ADAPTERS[league_id]
+
+    def test_registry_defaults_applied(self):
+        """🏳️ Country flag and data source come from the league config"""
+        match, = normalize_games('SERIE_A', [{'home': 'Inter', 'away': 'Milan', 'event_id': 401}])
+        assert (match.home_team, match.away_team, match.match_id) == ('Inter', 'Milan', '401')
+        assert match.country_code == LEAGUES_REGISTRY['SERIE_A']['country_flag']
+        assert match.source == LEAGUES_REGISTRY['SERIE_A']['data_source_name']
+
+    def test_unregistered_league_falls_back(self):
+        """🧩 Unknown leagues still normalize"""
+        match, = normalize_games('MARS_LEAGUE', [{'home_team': 'A', 'away_team': 'B'}])
+        assert match.match_id == 'MARS_LEAGUE:A-B'
+        assert match.source == 'UNKNOWN_SOURCE'
+        assert match.status == 'scheduled' and match.completed is False
+
+class TestCanonicalMatch:
+    """📦 Test the compact canonical representation"""
+
+    def test_slotted_and_references_payload(self):
+        """🪶 No per-instance __dict__; raw is the original payload object"""
+        payload = {'home_team': 'A', 'away_team': 'B', 'sentiment': 0.42, 'key_players': 150}
+        match, = normalize_games('BUNDESLIGA', [payload])
+        assert not hasattr(match, '__dict__')
+        assert match.raw is payload
+
+        assert match._dims is None  # extracted on first read
+        assert match.dimensions['sentiment'] == 42.0
+        assert match.dimensions['key_players'] == 100.0
+        assert list(match.dimensions) == list(STANDARD_DIM_KEYS)
+
+    def test_explicit_dimensions_and_record(self):
+        """💾 Explicit dimensions win; to_record is JSON-ready without raw"""
+        match = CanonicalMatch('NFL', 'g1', 'A', 'B', dimensions={'x_factor': 55})
+        record = match.to_record()
+        assert record['dimensions']['x_factor'] == 55.0
+        assert 'raw' not in record
+        assert match == CanonicalMatch('NFL', 'g1', 'A', 'B', dimensions={'x_factor': 55})
+
+class TestSpecializedAdapters:
+    """🇲🇽 Test PROGOL and Liga MX adapters"""
+
+    def test_progol_dimension_alternates(self):
+        """🎰 D0..D7 alternates and nested dimensions map to standard keys"""
+        match, = normalize_games('PROGOL_FULLWEEK', [{
+            'homeName': 'Toluca', 'awayName': 'Chivas', 'matchId': 7,
+            'D0_polymarket': 'n/a', 'D1_historical': 61, 'dimensions': {'sentiment': 0.7}
+        }])
+        assert (match.home_team, match.away_team, match.match_id) == ('Toluca', 'Chivas', '7')
+        assert match.source == 'MEXICAN_GOVERNMENT_PROGOL'
+        dims = match.dimensions
+        assert dims['polymarket_odds'] == 0.0
+        assert dims['historical_matchups'] == 61.0
+        assert dims['sentiment'] == 70.0
+
+    def test_liga_mx_source(self):
+        """📡 MedioTiempo payloads are tagged with their source"""
+        mediotiempo, espn = normalize_games('LIGA_MX', [
+            {'home_team': 'América', 'away_team': 'Pumas', 'real_mediotiempo_data': True},
+            {'home_team': 'Tigres', 'away_team': 'Monterrey'},
+        ])
+        assert mediotiempo.source == 'MEDIOTIEMPO_CESS_API_REAL'
+        assert espn.source == 'ESPN_API_REAL'
+        assert espn.country_code == '🇲🇽'
+
+    def test_display_dict_shape(self):
+        """🖥️ Display card matches the dashboard converter output"""
+        match, = normalize_games('SERIE_A', [{'home_team': 'Roma', 'away_team': 'Lazio', 'start_time': '20:45',
+                                              'completed': True}])
+        assert match.to_display_dict(3, league='Serie A', data_source='ESPN_SERIE_A_API') == {
+            'id': 'serie_a_game_3', 'sport': 'SERIE_A', 'league': 'Serie A',
+            'home_team': 'Roma', 'away_team': 'Lazio', 'time': '20:45', 'status': 'Final',
+            'matchup': 'Lazio @ Roma', 'venue': 'TBD', 'country_flag': '🇮🇹',
+            'original_league': 'SERIE_A', 'real_data': True, 'data_source': 'ESPN_SERIE_A_API'
+        }
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+🏠 AGENT HOST TESTS 🏠
+Agent Poly Loly Double Zero: in-loop vs out-of-process agent placement
+
+COVERAGE:
+- Placement policy from orchestrator config
+- Worker-process agents exchange messages through AGENT_REGISTRY
+- Per-process CPU/RSS reporting
+- Supervisor restarts crashed workers
+- Subscriber topology and task counters are mirrored across the pipe
+- Orchestrator spawns/terminates process-placed agents and wires their topology
+"""
+
+import asyncio
+import os
+
+import pytest
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.agent_host import AgentHost, AgentPlacement, HostedAgent, PlacementPolicy
+from core.autonomous_agent import AGENT_REGISTRY, AgentMessage, AutonomousAgent
+
+class EchoAgent(AutonomousAgent):
+    """🔁 Replies with its pid (and subscribers); 'crash' kills the hosting process"""
+
+    async def _agent_behavior(self):
+        await asyncio.sleep(0.05)
+
+    async def _initialize_systems(self):
+        pass
+
+    async def _agent_specific_adaptation(self):
+        pass
+
+    async def _handle_message(self, message):
+        if message.message_type == 'echo':
+            await self.send_message(message.sender_id, 'echo_reply',
+                                    {**message.payload, 'pid': os.getpid(),
+                                     'subscribers': sorted(self.subscribers)})
+        elif message.message_type == 'crash':
+            os._exit(3)
+
+async def _wait_for(predicate, timeout=10.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.05)
+
+async def _echo(agent_id, probe, n):
+    AGENT_REGISTRY.route_message(AgentMessage('probe', agent_id, 'echo', {'n': n}))
+    return await asyncio.wait_for(probe.get(), 10.0)
+
+class TestPlacementPolicy:
+    """📋 Test placement configuration"""
+
+    def test_from_config(self):
+        """⚙️ Per-type overrides on top of the default"""
+        policy = PlacementPolicy.from_config({
+            'agent_placement': {'analyzer': 'process'}, 'max_agent_restarts': 5
+        })
+        assert policy.placement_for('analyzer') == AgentPlacement.PROCESS
+        assert policy.placement_for('monitor') == AgentPlacement.IN_LOOP
+        assert policy.max_restarts == 5
+
+class TestAgentHost:
+    """🧪 Test hosting agents in worker processes"""
+
+    def _host(self, **kwargs):
+        return AgentHost(
+            PlacementPolicy(per_type={'echo': AgentPlacement.PROCESS}, restart_backoff=0.05),
+            agent_classes={'echo': EchoAgent}, heartbeat_interval=0.1, supervise_interval=0.1, **kwargs
+        )
+
+    @pytest.mark.asyncio
+    async def test_in_loop_placement(self):
+        """🔄 In-loop agents are plain instances in this process"""
+        host = self._host()
+        agent = await host.start_agent('echo', 'echo_inloop', placement=AgentPlacement.IN_LOOP)
+        try:
+            assert isinstance(agent, EchoAgent)
+            assert host.process_info('echo_inloop') is None
+            assert host.get_stats()['in_loop_agents'] == 1
+        finally:
+            await host.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_process_agent_messaging_and_stats(self):
+        """📬 Messages cross the pipe both ways; CPU/RSS come from the worker pid"""
+        host = self._host()
+        probe = asyncio.Queue()
+        AGENT_REGISTRY.message_router['probe'] = probe
+        agent = await host.start_agent('echo', 'echo_proc')
+        try:
+            assert isinstance(agent, HostedAgent)
+            assert agent.process_id != os.getpid()
+            AGENT_REGISTRY.register_agent(agent)
+            assert 'echo_proc' in AGENT_REGISTRY.get_agents_by_type('EchoAgent')
+
+            reply = await _echo('echo_proc', probe, 1)
+            assert reply.message_type == 'echo_reply'
+            assert reply.payload == {'n': 1, 'pid': agent.process_id, 'subscribers': []}
+
+            agent.subscribers.add('coordinator_001')
+            agent.subscribers.update({'predictor_001'})
+            reply = await _echo('echo_proc', probe, 2)
+            assert reply.payload['subscribers'] == ['coordinator_001', 'predictor_001']
+            assert agent.memory.total_tasks == 0
+
+            await _wait_for(lambda: host.process_info('echo_proc')['rss_mb'] > 0)
+            assert agent.health_metrics['last_heartbeat'] > 0
+        finally:
+            process = agent.process
+            await host.shutdown()
+            AGENT_REGISTRY.unregister_agent('echo_proc')
+            del AGENT_REGISTRY.message_router['probe']
+        assert not process.is_alive()
+        assert host.stats['stopped'] == 1
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_is_restarted(self):
+        """💥 Supervisor restarts a dead worker and buffered messages still arrive"""
+        host = self._host()
+        probe = asyncio.Queue()
+        AGENT_REGISTRY.message_router['probe'] = probe
+        agent = await host.start_agent('echo', 'echo_crash')
+        AGENT_REGISTRY.register_agent(agent)
+        agent.subscribers.add('probe')
+        try:
+            first_pid = agent.process_id
+            AGENT_REGISTRY.route_message(AgentMessage('probe', 'echo_crash', 'crash', {}))
+            await _wait_for(lambda: agent.restarts == 1 and agent.connected and agent.process_id != first_pid)
+
+            reply = await _echo('echo_crash', probe, 2)
+            assert reply.payload['pid'] == agent.process_id != first_pid
+            assert reply.payload['subscribers'] == ['probe']  # re-synced to the new worker
+            assert host.stats['crashes'] == 1 and host.stats['restarts'] == 1
+            assert AGENT_REGISTRY.agents['echo_crash']['process_id'] == agent.process_id
+        finally:
+            await host.shutdown()
+            AGENT_REGISTRY.unregister_agent('echo_crash')
+            del AGENT_REGISTRY.message_router['probe']
+
+class TestOrchestratorPlacement:
+    """🎯 Test orchestrator integration"""
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_process_placement(self):
+        """🚀 Orchestrator places analyzers out of process per config"""
+        from core.agent_orchestrator import AgentOrchestrator
+
+        orchestrator = AgentOrchestrator({'agent_placement': {'analyzer': 'process'}})
+        try:
+            assert await orchestrator._spawn_agent('analyzer', 'analyzer_proc')
+            details = (await orchestrator.get_agent_details())['analyzer_proc']
+            assert details['placement'] == 'process'
+            assert details['process']['pid'] != os.getpid()
+            assert 'analyzer_proc' in orchestrator.agent_processes
+
+            assert await orchestrator._terminate_agent('analyzer_proc', 'test')
+            assert orchestrator.agent_processes == {}
+            assert orchestrator.agent_host.get_stats()['process_agents'] == 0
+        finally:
+            await orchestrator.agent_host.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_initialize_system_with_process_placement(self):
+        """🌐 initialize_system wires the hybrid topology through hosted analyzers/predictors"""
+        from core.agent_orchestrator import AgentOrchestrator
+
+        orchestrator = AgentOrchestrator({'agent_placement': {'analyzer': 'process', 'predictor': 'process'}})
+        orchestrator.agent_specifications.pop('monitor')  # its baseline probes live endpoints for ~35s
+        try:
+            assert await orchestrator.initialize_system()
+            analyzer = orchestrator.active_agents['analyzer_001']
+            predictor = orchestrator.active_agents['predictor_001']
+            assert isinstance(analyzer, HostedAgent) and isinstance(predictor, HostedAgent)
+            assert analyzer.subscribers == {'coordinator_001', 'predictor_001'}
+            assert 'analyzer_001' in orchestrator.active_agents['data_collector_001'].subscribers
+            assert set(orchestrator.agent_processes) == {'analyzer_001', 'predictor_001'}
+        finally:
+            await orchestrator.shutdown_system()
+            await orchestrator.agent_host.shutdown()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -32,6 +32,8 @@ from agents.analyzer_agent import AnalyzerAgent
 from agents.predictor_agent import PredictorAgent
 from agents.coordinator_agent import CoordinatorAgent
 from agents.monitor_agent import MonitorAgent
+from core.agent_state_store import AgentStateStore, infer_agent_type
+import core.autonomous_agent as autonomous_agent_module
 
 # Configure test logging
 logging.basicConfig(level=logging.INFO)
@@ -210,6 +212,48 @@ class TestIndividualAgents:
         
         await agent.terminate()
     
+    @pytest.mark.asyncio
+    async def test_predictor_agent_trains_off_event_loop(self):
+        """Test PredictorAgent trains in worker pool without blocking the loop"""
+        agent = PredictorAgent("test_predictor_pool", {'training_workers': 2})
+        
+        agent.training_data['NFL'] = [
+            {
+                'team': f'Team {i}',
+                'avg_score': 10 + (i % 7) * 3,
+                'trend_direction': 'improving' if i % 2 else 'stable',
+                'trend_confidence': (i % 10) / 10,
+                'score_variance': (i % 5) + 1,
+                'games_count': 5
+            }
+            for i in range(40)
+        ]
+        agent.training_queue.append({'sport': 'NFL', 'priority': 1, 'trigger': 'test'})
+        agent.training_queue.append({'sport': 'NFL', 'priority': 1, 'trigger': 'duplicate'})
+        
+        ticks = 0
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        
+        heartbeat_task = asyncio.create_task(heartbeat())
+        await agent._process_training_queue()
+        
+        # Duplicate request for the same sport is coalesced
+        assert list(agent.training_jobs) == ['NFL']
+        
+        await asyncio.gather(*agent.running_tasks)
+        heartbeat_task.cancel()
+        
+        assert ticks > 0
+        assert not agent.training_jobs
+        assert set(agent.model_performance['NFL']) == {'winner', 'total_score', 'score_difference'}
+        assert len(agent.active_models['NFL']) == 3
+        
+        await agent._cleanup_resources()
+    
     @pytest.mark.asyncio
     async def test_coordinator_agent_workflow_management(self):
         """Test CoordinatorAgent workflow capabilities"""
@@ -621,6 +665,95 @@ class TestIntegrationScenarios:
         
         await orchestrator.shutdown_system()
 
+class TestAgentStateStore:
+    """💾 Test consolidated agent state store"""
+    
+    @pytest.mark.asyncio
+    async def test_agent_state_batching_and_retention(self, tmp_path, monkeypatch):
+        """Test snapshots are batched, indexed and pruned per agent id"""
+        store = AgentStateStore(str(tmp_path / "state.db"), keep_per_agent=3, batch_size=100, flush_interval=0.05)
+        monkeypatch.setattr(autonomous_agent_module, 'AGENT_STATE_STORE', store)
+        
+        agents = [TestAutonomousAgent(f"analyzer_{i:08x}") for i in range(5)]
+        for agent in agents:
+            await agent._save_agent_state()
+        await agents[0]._save_agent_state()
+        
+        # Buffered, not written yet
+        assert store.stats['flushes'] == 0
+        await asyncio.sleep(0.2)
+        assert store.stats['flushes'] == 1
+        assert store.stats['snapshots_written'] == 6
+        assert store.stats['snapshots_pruned'] == 0
+        
+        # A busy instance only trims its own history, never its siblings'
+        for _ in range(4):
+            await agents[0]._save_agent_state()
+        store.flush()
+        assert store.stats['snapshots_pruned'] == 3
+        assert len(store.history(agents[0].agent_id)) == 3
+        
+        assert infer_agent_type(agents[0].agent_id) == 'analyzer'
+        assert store.agent_types() == {'analyzer': 7}
+        assert [row['agent_id'] for row in store.by_type('analyzer', limit=3)] == [agents[0].agent_id] * 3
+        assert all(store.latest(agent.agent_id)['state']['agent_id'] == agent.agent_id for agent in agents)
+        store.close()
+    
+    def test_agent_state_migration(self, tmp_path):
+        """Test legacy state_*.json files are ingested once"""
+        state_dir = tmp_path / "agents"
+        state_dir.mkdir()
+        for agent_id in ['monitor_001', 'monitor_4862f64e', 'test_predictor']:
+            (state_dir / f"state_{agent_id}.json").write_text(json.dumps({'agent_id': agent_id, 'total_tasks': 1}))
+        (state_dir / "state_broken.json").write_text("{not json")
+        
+        store = AgentStateStore(str(tmp_path / "state.db"))
+        result = store.migrate_json_files(str(state_dir))
+        assert result['migrated'] == 3
+        assert result['failed'] == 1
+        
+        rerun = store.migrate_json_files(str(state_dir), remove_files=True)
+        assert rerun['migrated'] == 0
+        assert rerun['skipped'] == 3
+        assert rerun['removed'] == 3
+        
+        assert store.agent_types() == {'monitor': 2, 'test_predictor': 1}
+        assert store.latest('test_predictor')['state']['total_tasks'] == 1
+        store.close()
+
+    def test_agent_state_migration_prunes_existing_history(self, tmp_path):
+        """Test migrating into an id that already has snapshots applies per-id retention"""
+        state_dir = tmp_path / "agents"
+        state_dir.mkdir()
+        (state_dir / "state_monitor_001.json").write_text(json.dumps({'agent_id': 'monitor_001', 'total_tasks': 9}))
+
+        store = AgentStateStore(str(tmp_path / "state.db"), keep_per_agent=1)
+        store.save('monitor_001', {'agent_id': 'monitor_001', 'total_tasks': 1}, saved_at=1.0)
+        store.flush()
+
+        result = store.migrate_json_files(str(state_dir))
+        assert result['migrated'] == 1
+        assert len(store.history('monitor_001')) == 1
+        assert store.latest('monitor_001')['state']['total_tasks'] == 9
+        assert store.stats['snapshots_pruned'] == 1
+        store.close()
+
+    def test_agent_state_type_cap_compacts_churned_ids(self):
+        """Test one-off instances are retired by the per-type cap while a live agent keeps its history"""
+        store = AgentStateStore(":memory:", keep_per_agent=3, keep_per_type=10, batch_size=1000)
+        for i in range(50):
+            store.save(f"analyzer_{i:08x}", {'run': i}, saved_at=float(i))
+        for i in range(3):
+            store.save("analyzer_0000beef", {'run': i}, saved_at=100.0 + i)
+        store.save("monitor_001", {'run': 0}, saved_at=0.0)
+        store.flush()
+
+        assert store.agent_types() == {'analyzer': 10, 'monitor': 1}
+        assert len(store.history("analyzer_0000beef")) == 3
+        assert store.latest("analyzer_00000000") is None
+        assert store.latest(f"analyzer_{49:08x}")['state'] == {'run': 49}
+        store.close()
+
 # =================== TEST UTILITIES ===================
 
 class TestUtilities:
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+🔥💀 BUS TRANSPORT TESTS 💀🔥
+Agent Poly Loly Double Zero: AdvancedMessageBus across processes
+
+COVERAGE:
+- Binary frame round trip and size vs JSON
+- Direct/broadcast fan-out between two buses over the local UNIX-socket broker
+- Consumer-group load balancing (each message handled exactly once)
+- Ack-driven redelivery when a node cannot accept a message
+- Request/reply across buses
+"""
+
+import asyncio
+import json
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.message_bus import AdvancedMessageBus, AdvancedMessage, MessageType, MessagePriority
+from core.bus_transport import (
+    LocalSocketBroker, LocalSocketTransport, create_transport, decode_message, encode_message
+)
+
+class TestWireFormat:
+    """📦 Test binary serialization"""
+
+    def test_round_trip(self):
+        """✅ Every routed field survives encode/decode"""
+        message = AdvancedMessage(
+            sender_id="analyzer_1", message_type=MessageType.COMMAND, topic="PredictorAgent",
+            event_name="predict", payload={"games": [{"home": "Inter", "odds": 1.85}] * 3},
+            priority=MessagePriority.CRITICAL, target_agents={"a", "b"}, routing_tags={"soccer"},
+            retry_count=2, requires_ack=True, expires_at=datetime.now() + timedelta(seconds=30),
+            correlation_id="corr-1", reply_to="coordinator"
+        )
+        decoded, origin = decode_message(encode_message(message, "node-1"))
+
+        assert origin == "node-1"
+        for name in ("message_id", "sender_id", "message_type", "topic", "event_name", "payload",
+                     "priority", "target_agents", "routing_tags", "retry_count", "requires_ack",
+                     "correlation_id", "reply_to"):
+            assert getattr(decoded, name) == getattr(message, name), name
+        assert abs((decoded.expires_at - message.expires_at).total_seconds()) < 1e-3
+
+    def test_compact_and_compressed(self):
+        """🗜️ Frames are smaller than the JSON form; large payloads are compressed"""
+        message = AdvancedMessage(sender_id="s", payload={"data": "x" * 5000})
+        frame = encode_message(message)
+        assert len(frame) < len(json.dumps(message.to_dict())) / 10
+        assert decode_message(frame)[0].payload == message.payload
+
+    def test_factory(self):
+        """🏭 URL selects the backend"""
+        assert create_transport(None) is None
+        assert isinstance(create_transport("unix:///tmp/bus.sock"), LocalSocketTransport)
+        with pytest.raises(ValueError):
+            create_transport("carrier-pigeon://coop")
+
+class TestLocalSocketTransport:
+    """🧪 Two buses linked through the local broker"""
+
+    async def _cluster(self, socket_path, ack_timeout=5.0):
+        broker = LocalSocketBroker(socket_path, ack_timeout=ack_timeout)
+        await broker.start()
+        buses = []
+        for name in ("node_a", "node_b"):
+            bus = AdvancedMessageBus(name)
+            await bus.attach_transport(LocalSocketTransport(socket_path))
+            await bus.start()
+            buses.append(bus)
+        return broker, buses
+
+    async def _shutdown(self, broker, buses):
+        for bus in buses:
+            await bus.stop()
+        await broker.stop()
+
+    @pytest.mark.asyncio
+    async def test_direct_and_broadcast_cross_process(self):
+        """📬 Messages reach agents hosted by the other bus"""
+        with tempfile.TemporaryDirectory() as tmp:
+            broker, (bus_a, bus_b) = await self._cluster(os.path.join(tmp, "bus.sock"))
+            try:
+                bus_a.register_agent("coordinator")
+                bus_b.register_agent("predictor_1")
+
+                await bus_a.publish_to_agent("predictor_1", "predict", {"game": 1})
+                await bus_a.broadcast("maintenance", {"in": 5})
+
+                received = []
+                for _ in range(20):
+                    received += await bus_b.get_agent_messages("predictor_1", timeout=0.05)
+                    if len(received) == 2:
+                        break
+                assert [m.event_name for m in received] == ["predict", "maintenance"]
+                assert received[0].payload == {"game": 1}
+                # Broadcast also stays local, exactly once
+                assert len(await bus_a.get_agent_messages("coordinator", timeout=0.05)) == 1
+                assert bus_a.dead_letter_queue.qsize() == 0
+            finally:
+                await self._shutdown(broker, (bus_a, bus_b))
+
+    @pytest.mark.asyncio
+    async def test_consumer_group_load_balancing(self):
+        """⚖️ Agent-type messages are handled exactly once across nodes"""
+        with tempfile.TemporaryDirectory() as tmp:
+            broker, (bus_a, bus_b) = await self._cluster(os.path.join(tmp, "bus.sock"))
+            try:
+                bus_a.register_agent("analyzer_a", agent_type="AnalyzerAgent")
+                bus_b.register_agent("analyzer_b", agent_type="AnalyzerAgent")
+                await asyncio.sleep(0.05)
+
+                for i in range(10):
+                    await bus_a.publish(AdvancedMessage(sender_id="coordinator", message_type=MessageType.COMMAND,
+                                                        topic="AnalyzerAgent", payload={"i": i}))
+
+                got_a, got_b = [], []
+                for _ in range(20):
+                    got_a += await bus_a.get_agent_messages("analyzer_a", timeout=0.02)
+                    got_b += await bus_b.get_agent_messages("analyzer_b", timeout=0.02)
+                    if len(got_a) + len(got_b) == 10:
+                        break
+                assert sorted(m.payload["i"] for m in got_a + got_b) == list(range(10))
+                assert got_a and got_b
+                for _ in range(20):
+                    if not broker.pending:
+                        break
+                    await asyncio.sleep(0.01)
+                assert broker.pending == {}
+            finally:
+                await self._shutdown(broker, (bus_a, bus_b))
+
+    @pytest.mark.asyncio
+    async def test_unacked_delivery_is_retried(self):
+        """🔄 A node with a full mailbox does not ack; the broker re-delivers"""
+        with tempfile.TemporaryDirectory() as tmp:
+            broker, (bus_a, bus_b) = await self._cluster(os.path.join(tmp, "bus.sock"), ack_timeout=0.2)
+            try:
+                bus_b.register_agent("predictor_b", agent_type="PredictorAgent")
+                mailbox = bus_b.agent_queues["predictor_b"]
+                mailbox._maxsize = 1
+                mailbox.put_nowait(AdvancedMessage(event_name="backlog"))
+                await asyncio.sleep(0.05)
+
+                await bus_a.publish(AdvancedMessage(message_type=MessageType.COMMAND, topic="PredictorAgent",
+                                                    event_name="predict"))
+                await asyncio.sleep(0.1)
+                assert len(broker.pending) == 1
+
+                assert [m.event_name for m in await bus_b.get_agent_messages("predictor_b")] == ["backlog"]
+                received = []
+                for _ in range(20):
+                    received += await bus_b.get_agent_messages("predictor_b", timeout=0.05)
+                    if received:
+                        break
+                assert [m.event_name for m in received] == ["predict"]
+                assert broker.stats['redelivered'] >= 1
+            finally:
+                await self._shutdown(broker, (bus_a, bus_b))
+
+    @pytest.mark.asyncio
+    async def test_request_reply_across_buses(self):
+        """📞 Replies from another node resolve the requester's future"""
+        with tempfile.TemporaryDirectory() as tmp:
+            broker, (bus_a, bus_b) = await self._cluster(os.path.join(tmp, "bus.sock"))
+            bus_b.register_agent("monitor_b")
+
+            async def responder():
+                while True:
+                    for message in await bus_b.get_agent_messages("monitor_b", timeout=1.0):
+                        await bus_b.reply(message, {"healthy": True}, sender_id="monitor_b")
+
+            task = asyncio.create_task(responder())
+            try:
+                assert await bus_a.request("monitor_b", "health_check", {}, timeout=2.0) == {"healthy": True}
+                assert bus_a.pending_replies == {}
+            finally:
+                task.cancel()
+                await self._shutdown(broker, (bus_a, bus_b))
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+📊 D5 STANDINGS SNAPSHOT TESTS 📊
+Agent Poly Loly Double Zero: one standings download per league for every D5 lookup
+
+COVERAGE:
+- N team lookups in one league cost one standings fetch (concurrent callers coalesce)
+- Alias lookups resolve through the indexed snapshot
+- Expiry and invalidation trigger a fresh download
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import real_agents.d5_team_performance_mcp as d5
+from real_agents.d5_team_performance_mcp import StandingsSnapshotCache, fetch_d5_team_performance_data
+
+EPL_TEAMS = ["Arsenal", "Manchester City", "Liverpool", "Chelsea", "Tottenham Hotspur", "Newcastle United"]
+
+def _standings(teams):
+    return {'standings': [{'entries': [
+        {'team': {'displayName': name, 'shortDisplayName': name.split()[0]},
+         'stats': [{'name': 'rank', 'value': rank}, {'name': 'points', 'value': 30 - rank},
+                   {'name': 'gamesPlayed', 'value': 10}]}
+        for rank, name in enumerate(teams, 1)]}]}
+
+class FakeESPN:
+    """🌐 Stands in for fetch_cached_json, counting downloads per URL"""
+
+    def __init__(self):
+        self.requests = []
+
+    async def fetch_cached_json(self, url, **kwargs):
+        self.requests.append(url)
+        await asyncio.sleep(0.02)
+        if '/soccer/eng.1/standings' in url:
+            return _standings(EPL_TEAMS)
+        if '/soccer/mex.1/standings' in url:
+            return _standings(["Club America", "Cruz Azul"])
+        return None
+
+@pytest.fixture
+def espn(monkeypatch):
+    fake = FakeESPN()
+    monkeypatch.setattr(d5, 'fetch_cached_json', fake.fetch_cached_json)
+    monkeypatch.setattr(d5, 'STANDINGS_CACHE', StandingsSnapshotCache())
+    return fake
+
+class TestStandingsSnapshots:
+    """🗂️ Test the shared standings snapshot cache"""
+
+    @pytest.mark.asyncio
+    async def test_one_fetch_per_league(self, espn):
+        """📥 Three concurrent games plus a repeat in one league download the table once"""
+        games = [("Arsenal", "Man City"), ("Liverpool", "Chelsea"), ("Tottenham Hotspur", "Newcastle United")]
+        results = await asyncio.gather(*(fetch_d5_team_performance_data(home, away, "SOCCER", "EPL")
+                                         for home, away in games))
+        await fetch_d5_team_performance_data("Chelsea", "Arsenal", "SOCCER", "EPL")
+
+        assert len(results) == 3
+        assert espn.requests == ["https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/standings"]
+        stats = d5.STANDINGS_CACHE.stats
+        assert stats['misses'] == 1 and stats['hits'] + stats['coalesced'] == 7
+
+        await fetch_d5_team_performance_data("Club America", "Cruz Azul", "SOCCER", "LIGA_MX")
+        assert len(espn.requests) == 2 and espn.requests[-1].endswith("/soccer/mex.1/standings")
+
+    @pytest.mark.asyncio
+    async def test_alias_lookup_hits_index(self, espn):
+        """🔍 Short and aliased names find their standings entry in the same snapshot"""
+        mcp = d5.D5TeamPerformanceMCP()
+        url = "https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/standings"
+        snapshot = await mcp.standings_cache.get(url, mcp._download_espn_document)
+
+        assert snapshot.find("Tottenham", mcp._fuzzy_match_team)['team']['displayName'] == "Tottenham Hotspur"
+        assert snapshot.find("Man City", mcp._fuzzy_match_team)['team']['displayName'] == "Manchester City"
+        assert snapshot.find("Nowhere FC", mcp._fuzzy_match_team) is None
+        assert "man city" in snapshot.index  # fuzzy hit memoized
+        assert len(espn.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_expiry_and_invalidate(self, espn):
+        """⏱️ Expired or invalidated snapshots are downloaded again"""
+        cache = StandingsSnapshotCache(ttl_seconds=0.05)
+        download = espn.fetch_cached_json
+        url = "https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/standings"
+
+        await cache.get(url, download)
+        await cache.get(url, download)
+        assert len(espn.requests) == 1
+        await asyncio.sleep(0.06)
+        await cache.get(url, download)
+        assert len(espn.requests) == 2
+        cache.invalidate(url)
+        await cache.get(url, download)
+        assert len(espn.requests) == 3
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+🤖 DEEPSEEK RESPONSE CACHE TESTS 🤖
+Agent Poly Loly Double Zero: bounded LLM response cache + request coalescing
+
+COVERAGE:
+- Content-hashed keys (no collisions on shared prompt prefixes)
+- LRU eviction under a byte budget and TTL expiry
+- On-disk persistence across service instances
+- Cache hits, coalesced identical in-flight requests and get_stats metrics
+"""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from deepseek_integration_service import DeepSeekIntegrationService, LLMResponseCache
+
+class FakeModel:
+    """🤖 Local /v1/chat/completions endpoint that echoes the prompt after a delay"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = 0
+        self.server = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post('/v1/chat/completions', self._complete)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        return str(self.server.make_url('')).rstrip('/')
+
+    async def close(self):
+        await self.server.close()
+
+    async def _complete(self, request):
+        self.calls += 1
+        body = await request.json()
+        await asyncio.sleep(self.delay)
+        return web.json_response({
+            'choices': [{'message': {'content': f"echo: {body['messages'][1]['content']}"}}],
+            'usage': {'total_tokens': 7}
+        })
+
+class TestLLMResponseCache:
+    """💾 Test the cache itself"""
+
+    def test_keys_hash_full_request(self):
+        """🔑 Shared 100-char prefixes no longer collide; every knob is part of the key"""
+        prefix = "x" * 100
+        key = LLMResponseCache.make_key("m", "sys", prefix + "a", 0.5, 100)
+        assert key == LLMResponseCache.make_key("m", "sys", prefix + "a", 0.5, 100)
+        assert key != LLMResponseCache.make_key("m", "sys", prefix + "b", 0.5, 100)
+        assert key != LLMResponseCache.make_key("m", "other", prefix + "a", 0.5, 100)
+        assert key != LLMResponseCache.make_key("m", "sys", prefix + "a", 0.7, 100)
+        assert key != LLMResponseCache.make_key("m", "sys", prefix + "a", 0.5, 200)
+
+    def test_lru_byte_budget_and_ttl(self):
+        """🧹 Least-recently-used entries go first; expired entries are misses"""
+        entry = {'content': "y" * 100}
+        cache = LLMResponseCache(max_bytes=350)
+        for key in ("a", "b", "c"):
+            cache.put(key, entry)
+        cache.get("a")  # a is now most recent
+        cache.put("d", entry)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == entry and cache.get("d") == entry
+        assert cache.total_bytes <= 350 and cache.stats['evictions'] == 1
+
+        cache.put("old", entry, stored_at=time.time() - cache.ttl - 1)
+        assert cache.get("old") is None
+        assert cache.stats['expirations'] == 1
+
+    def test_persistence(self, tmp_path):
+        """💾 Unexpired entries survive a restart; expired ones are dropped from disk"""
+        cache = LLMResponseCache(cache_dir=str(tmp_path))
+        cache.put("fresh", {'content': 'hi'})
+        cache.put("stale", {'content': 'old'}, stored_at=time.time() - cache.ttl - 1)
+
+        reloaded = LLMResponseCache(cache_dir=str(tmp_path))
+        assert reloaded.get("fresh") == {'content': 'hi'}
+        assert "stale" not in reloaded
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["fresh.json"]
+
+class TestDeepSeekService:
+    """🤖 Test call_deepseek on top of the cache"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_and_coalescing(self):
+        """🔗 Identical concurrent prompts share one model call; repeats are cache hits"""
+        model = FakeModel()
+        url = await model.start()
+        try:
+            service = DeepSeekIntegrationService(deepseek_url=url, model_name="test")
+            results = await asyncio.gather(*(service.call_deepseek("hello", task_type='reasoning') for _ in range(5)))
+            assert model.calls == 1
+            assert all(r['content'] == "echo: hello" for r in results)
+
+            cached = await service.call_deepseek("hello", task_type='reasoning')
+            assert cached['cached'] is True and model.calls == 1
+
+            await service.call_deepseek("hello", task_type='reasoning', temperature=0.1)
+            assert model.calls == 2
+
+            stats = service.get_stats()
+            assert stats['total_requests'] == 7 and stats['successful_requests'] == 7
+            assert stats['model_requests'] == 2
+            assert stats['cache']['hits'] == 1 and stats['cache']['coalesced_requests'] == 4
+            assert stats['cache']['entries'] == 2
+            assert stats['cache']['latency_ms']['hit'] < stats['cache']['latency_ms']['miss']
+
+            health = await service.health_check()
+            health_again = await service.health_check()
+            assert health['status'] == health_again['status'] == 'healthy'
+            assert model.calls == 4  # health checks always reach the model
+        finally:
+            await model.close()
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_still_coalesces(self):
+        """🛑 With caching off every sequential call reaches the model"""
+        model = FakeModel()
+        url = await model.start()
+        try:
+            service = DeepSeekIntegrationService(deepseek_url=url, model_name="test", cache_enabled=False)
+            await asyncio.gather(service.call_deepseek("hi"), service.call_deepseek("hi"))
+            await service.call_deepseek("hi")
+            assert model.calls == 2
+            assert service.get_stats()['cache']['entries'] == 0
+        finally:
+            await model.close()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+⚔️ H2H FIXTURE STORE TESTS ⚔️
+Agent Poly Loly Double Zero: local head-to-head history for D1
+
+COVERAGE:
+- Team directory synced once per league, then served locally
+- H2H is an indexed local query; finished seasons are never re-fetched
+- Season completion comes from fixture dates, not the calendar year
+- Either team's synced schedule covers the pair
+- Only fixtures played since the last sync trigger a delta fetch
+- D1 historical analysis end to end on top of the store
+"""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from real_agents.h2h_fixture_store import H2HFixtureStore
+
+CURRENT = datetime.now().year
+PAST = CURRENT - 1
+
+def _iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%MZ')
+
+def _event(event_id, home_id, away_id, kickoff, score=None, season=CURRENT):
+    completed = score is not None
+    home_score, away_score = score or (0, 0)
+    return {
+        'id': event_id, 'date': _iso(kickoff), 'season': {'year': season},
+        'competitions': [{
+            'status': {'type': {'completed': completed}},
+            'competitors': [{'team': {'id': home_id}, 'score': {'value': float(home_score)}},
+                            {'team': {'id': away_id}, 'score': str(away_score)}],
+        }],
+    }
+
+class FakeESPN:
+    """🌐 Serves /teams and /schedule documents from dicts, counting requests"""
+
+    def __init__(self):
+        self.teams = {
+            'eng.1': [('359', 'Arsenal', 'Arsenal', 'Arsenal'), ('382', 'Manchester City', 'Man City', 'City')],
+            'uefa.champions': [('382', 'Manchester City', 'Man City', 'City')],
+            'esp.1': [('86', 'Real Madrid', 'Real Madrid', 'Madrid')],
+        }
+        now = time.time()
+        self.schedules = {
+            ('382', PAST): [_event('p1', '382', '359', now - 300 * 86400, (2, 1), PAST),
+                            _event('p2', '359', '382', now - 250 * 86400, (0, 0), PAST)],
+            ('382', CURRENT): [_event('c1', '382', '359', now - 30 * 86400, (3, 0)),
+                               _event('c2', '359', '382', now + 30 * 86400)],
+        }
+        self.requests = []
+
+    async def fetch_json(self, url, max_staleness=0.0, **kwargs):
+        self.requests.append(url)
+        league = url.split('/soccer/')[1].split('/')[0]
+        if url.endswith('/teams'):
+            return {'sports': [{'leagues': [{'teams': [
+                {'team': {'id': i, 'displayName': d, 'shortDisplayName': s, 'name': n}}
+                for i, d, s, n in self.teams.get(league, [])]}]}]}
+        team_id = url.split('/teams/')[1].split('/')[0]
+        season = int(url.split('season=')[1])
+        return {'events': self.schedules.get((team_id, season), [])}
+
+    def count(self, kind):
+        return sum(1 for url in self.requests if url.endswith('/teams') == (kind == '/teams'))
+
+def _store(tmp_path, espn):
+    return H2HFixtureStore(tmp_path / "h2h.db", fetch_json=espn.fetch_json)
+
+class TestTeamDirectory:
+    """📇 Test per-league team directories"""
+
+    @pytest.mark.asyncio
+    async def test_directory_synced_once(self, tmp_path):
+        """📥 One /teams download per league, persisted across store instances"""
+        espn = FakeESPN()
+        store = _store(tmp_path, espn)
+        teams = await store.get_teams('eng.1')
+        await store.get_teams('eng.1')
+        assert [t['team_id'] for t in teams] == ['359', '382']
+        assert espn.count('/teams') == 1
+
+        store.close()
+        reopened = _store(tmp_path, espn)
+        assert [t['display_name'] for t in await reopened.get_teams('eng.1')] == ['Arsenal', 'Manchester City']
+        assert espn.count('/teams') == 1
+
+class TestHeadToHead:
+    """⚔️ Test incremental fixture sync and H2H lookups"""
+
+    @pytest.mark.asyncio
+    async def test_h2h_is_local_after_first_sync(self, tmp_path):
+        """🔍 First query fetches both seasons; repeats and the reversed pair hit the index"""
+        espn = FakeESPN()
+        store = _store(tmp_path, espn)
+
+        await store.sync_head_to_head('eng.1', '382', '359', [CURRENT, PAST])
+        matches = await store.head_to_head('382', '359', [CURRENT, PAST])
+        assert [m['event_id'] for m in matches] == ['p1', 'p2', 'c1']
+        assert (matches[0]['home_id'], matches[0]['home_score'], matches[0]['away_score']) == ('382', 2, 1)
+        assert espn.count('/schedule') == 2
+
+        await store.sync_head_to_head('eng.1', '382', '359', [CURRENT, PAST])
+        await store.sync_head_to_head('eng.1', '359', '382', [CURRENT, PAST])  # opponent side covered
+        assert espn.count('/schedule') == 2
+        assert len(await store.head_to_head('359', '382', [CURRENT, PAST])) == 3
+        assert (await store.head_to_head('359', '382', [CURRENT], completed_only=False))[-1]['event_id'] == 'c2'
+
+    @pytest.mark.asyncio
+    async def test_played_fixture_triggers_delta(self, tmp_path):
+        """⏱️ Only the season with a newly played fixture is re-fetched, and only changed rows are written"""
+        espn = FakeESPN()
+        store = _store(tmp_path, espn)
+        await store.sync_head_to_head('eng.1', '382', '359', [CURRENT, PAST])
+        changed = store.stats['fixtures_changed']
+
+        # c2 kicked off three hours ago and has a result now
+        kickoff = time.time() - 3 * 3600
+        with store._connect() as conn:
+            conn.execute("UPDATE fixtures SET kickoff = ? WHERE event_id = 'c2'", (kickoff,))
+            conn.execute("UPDATE schedule_sync SET synced_at = ?", (kickoff,))
+        espn.schedules[('382', CURRENT)][1] = _event('c2', '359', '382', kickoff, (1, 1))
+
+        await store.sync_head_to_head('eng.1', '382', '359', [CURRENT, PAST])
+        assert espn.requests[-1].endswith(f"season={CURRENT}")
+        assert espn.count('/schedule') == 3
+        assert store.stats['fixtures_changed'] == changed + 1
+        assert len(await store.head_to_head('382', '359', [CURRENT])) == 2
+
+    @pytest.mark.asyncio
+    async def test_season_finished_by_fixture_dates(self, tmp_path):
+        """📅 A results-only schedule is finished only once synced long after its last fixture"""
+        espn = FakeESPN()
+        now = time.time()
+        # Aug PAST -> May CURRENT style season that is still running (results-only listing)
+        espn.schedules[('382', PAST)] = [_event('r1', '382', '359', now - 120 * 86400, (1, 0), PAST),
+                                         _event('r2', '359', '382', now - 6 * 86400, (2, 2), PAST)]
+        # Season labelled with this year whose fixtures all ended months ago
+        espn.schedules[('382', CURRENT)] = [_event('c1', '382', '359', now - 100 * 86400, (3, 0))]
+        store = _store(tmp_path, espn)
+        await store.sync_head_to_head('eng.1', '382', '359', [CURRENT, PAST])
+        assert espn.count('/schedule') == 2
+
+        with store._connect() as conn:
+            conn.execute("UPDATE schedule_sync SET synced_at = ?", (now - 2 * 86400,))
+        await store.sync_head_to_head('eng.1', '382', '359', [CURRENT, PAST])
+        assert espn.count('/schedule') == 3
+        assert espn.requests[-1].endswith(f"season={PAST}")  # still running despite the past year
+        assert len(await store.head_to_head('382', '359', [PAST])) == 2
+
+class TestD1Integration:
+    """🎯 Test D1HistoricalAnalysisMCP on top of the store"""
+
+    @pytest.mark.asyncio
+    async def test_d1_analysis_uses_store(self, tmp_path):
+        """🔥 Team ids resolve through directories (UEFA falls back to domestic ones)"""
+        from real_agents.d1_historical_analysis_mcp import D1HistoricalAnalysisMCP
+
+        espn = FakeESPN()
+        mcp = D1HistoricalAnalysisMCP()
+        mcp.fixture_store = _store(tmp_path, espn)
+
+        result = await mcp.fetch_d1_historical_analysis_data("Manchester City", "Arsenal", "eng.1")
+        assert result['historical_analysis']['total_matches'] == 3
+        assert result['historical_analysis']['home_wins'] == 2
+
+        await mcp.fetch_d1_historical_analysis_data("Manchester City", "Arsenal", "eng.1")
+        assert espn.count('/teams') == 1 and espn.count('/schedule') == 2
+
+        assert await mcp._get_team_espn_id("Real Madrid", "uefa.champions") == '86'
+        assert espn.count('/teams') == 8  # UEFA + seven domestic directories, once each
+        assert await mcp._get_team_espn_id("Real Madrid", "uefa.champions") == '86'
+        assert espn.count('/teams') == 8
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+🌐 HTTP CLIENT SERVICE TESTS 🌐
+Agent Poly Loly Double Zero: one pooled session with per-host limits
+
+COVERAGE:
+- Per-host concurrency bound holds through the body read, not just the headers
+- Token-bucket rate limit makes bursts wait
+- Host slots come back after connection errors, exceptions and cancellation
+"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from real_agents.http_client_service import HTTPClientService, HostPolicy
+
+class SlowHost:
+    """🐢 Sends headers at once, then dribbles the body, counting requests in flight"""
+
+    def __init__(self, body_delay=0.05):
+        self.body_delay = body_delay
+        self.active = 0
+        self.peak = 0
+        self.server = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/slow', self._slow)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        return str(self.server.make_url('/slow'))
+
+    async def _slow(self, request):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            response = web.StreamResponse(headers={'Content-Type': 'application/json'})
+            await response.prepare(request)
+            await response.write(b'{"events": ')
+            await asyncio.sleep(self.body_delay)
+            await response.write(b'[]}')
+            await response.write_eof()
+            return response
+        finally:
+            self.active -= 1
+
+@pytest_asyncio.fixture
+async def slow_host():
+    host = SlowHost()
+    host.url = await host.start()
+    yield host
+    await host.server.close()
+
+def _client(**policy):
+    return HTTPClientService(host_policies={}, default_policy=HostPolicy(**policy))
+
+def _free_slots(client, url):
+    return client._limiter_for(url.split('/')[2].split(':')[0]).semaphore._value
+
+class TestHostLimits:
+    """🚦 Test concurrency and rate limits"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bound_covers_body(self, slow_host):
+        """📦 No more than max_concurrent requests per host while bodies are still streaming"""
+        client = _client(max_concurrent=2, requests_per_second=1000, burst=100)
+        try:
+            results = await asyncio.gather(*(client.get_json(slow_host.url) for _ in range(6)))
+            assert results == [{'events': []}] * 6
+            assert slow_host.peak == 2
+            assert _free_slots(client, slow_host.url) == 2
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits(self, slow_host):
+        """⏱️ A burst beyond the bucket waits for tokens at requests_per_second"""
+        slow_host.body_delay = 0
+        client = _client(max_concurrent=10, requests_per_second=20, burst=1)
+        try:
+            started = time.monotonic()
+            await asyncio.gather(*(client.get_json(slow_host.url) for _ in range(4)))
+            assert time.monotonic() - started >= 0.14  # 3 tokens at 20/s
+            assert client.stats['rate_limited_waits'] >= 3 and client.stats['requests'] == 4
+        finally:
+            await client.close()
+
+class TestSlotRelease:
+    """🔓 Test that slots are returned on every exit path"""
+
+    @pytest.mark.asyncio
+    async def test_release_on_error_and_exception(self, slow_host):
+        """💥 Connection errors and exceptions inside the response block give the slot back"""
+        client = _client(max_concurrent=1, requests_per_second=1000, burst=100)
+        try:
+            assert await client.get_json('http://127.0.0.1:1/refused') is None
+            assert _free_slots(client, 'http://127.0.0.1:1/refused') == 1
+
+            with pytest.raises(ValueError):
+                async with client.get_session().get(slow_host.url):
+                    assert _free_slots(client, slow_host.url) == 0  # held while the body is unread
+                    raise ValueError("parser blew up")
+            assert _free_slots(client, slow_host.url) == 1
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_release_on_cancellation(self, slow_host):
+        """🛑 Cancelling mid-body or while queued for a slot never leaks or double-frees it"""
+        slow_host.body_delay = 0.2
+        client = _client(max_concurrent=1, requests_per_second=1000, burst=100)
+        try:
+            reading = asyncio.ensure_future(client.get_json(slow_host.url))
+            await asyncio.sleep(0.05)
+            queued = asyncio.ensure_future(client.get_json(slow_host.url))
+            await asyncio.sleep(0.02)
+            assert _free_slots(client, slow_host.url) == 0
+
+            queued.cancel()
+            reading.cancel()
+            await asyncio.gather(reading, queued, return_exceptions=True)
+            assert _free_slots(client, slow_host.url) == 1
+
+            slow_host.body_delay = 0
+            assert await client.get_json(slow_host.url) == {'events': []}
+            assert _free_slots(client, slow_host.url) == 1
+        finally:
+            await client.close()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
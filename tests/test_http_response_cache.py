@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+💾 HTTP RESPONSE CACHE TESTS 💾
+Agent Poly Loly Double Zero: conditional GETs + on-disk ESPN responses
+
+COVERAGE:
+- 304 revalidation serves the stored body without a download
+- Freshness from Cache-Control max-age plus the caller's max_staleness
+- Cached copy served when the network fails; no-store never cached
+- Fresh hits only bump the entry's mtime; eviction drops least-recently-used entries
+- Replay mode: recorded hits and misses never touch the network
+"""
+
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from real_agents.http_client_service import HTTP_CLIENT
+from real_agents.http_response_cache import HTTPResponseCache, MODE_REPLAY
+
+class FakeESPN:
+    """🌐 Local scoreboard endpoint with ETags, Cache-Control and a failure switch"""
+
+    def __init__(self):
+        self.scoreboard = {'events': [{'id': '740001', 'name': 'Arsenal at Manchester City'}]}
+        self.cache_control = 'max-age=0'
+        self.failing = False
+        self.requests = []
+        self.server = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/soccer/eng.1/scoreboard', self._scoreboard)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        return str(self.server.make_url('/soccer/eng.1/scoreboard'))
+
+    async def close(self):
+        await self.server.close()
+        await HTTP_CLIENT.close()
+
+    async def _scoreboard(self, request):
+        self.requests.append(request.headers.get('If-None-Match'))
+        if self.failing:
+            return web.Response(status=503)
+        body = json.dumps(self.scoreboard)
+        etag = f'"{abs(hash(body))}"'
+        headers = {'ETag': etag, 'Cache-Control': self.cache_control}
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers=headers)
+        return web.Response(text=body, content_type='application/json', headers=headers)
+
+@pytest_asyncio.fixture
+async def espn():
+    fake = FakeESPN()
+    fake.url = await fake.start()
+    yield fake
+    await fake.close()
+
+def _age_entry(cache, url, seconds):
+    """⏪ Pretend the stored response is older than it is"""
+    entry = cache._read_entry(url)
+    entry['stored_at'] -= seconds
+    cache._atomic_write(cache._entry_path(url), json.dumps(entry).encode('utf-8'))
+
+class TestRevalidation:
+    """🏷️ Test conditional GETs and staleness"""
+
+    @pytest.mark.asyncio
+    async def test_304_serves_stored_body(self, espn, tmp_path):
+        """🔁 An expired entry revalidates with If-None-Match and a 304 reuses the body"""
+        cache = HTTPResponseCache(cache_dir=tmp_path)
+        first = await cache.fetch_json(espn.url)
+        second = await cache.fetch_json(espn.url)
+
+        assert first == second == espn.scoreboard
+        assert espn.requests[0] is None and espn.requests[1] is not None
+        assert cache.stats['downloads'] == 1 and cache.stats['revalidated'] == 1
+
+        espn.scoreboard = {'events': []}
+        assert await cache.fetch_json(espn.url) == {'events': []}
+        assert cache.stats['downloads'] == 2
+
+    @pytest.mark.asyncio
+    async def test_max_age_and_staleness(self, espn, tmp_path):
+        """⏱️ max-age + max_staleness decide whether the network is touched at all"""
+        espn.cache_control = 'max-age=60'
+        cache = HTTPResponseCache(cache_dir=tmp_path)
+        await cache.fetch_json(espn.url)
+        await cache.fetch_json(espn.url)
+        assert len(espn.requests) == 1 and cache.stats['fresh_hits'] == 1
+
+        _age_entry(cache, espn.url, 90)
+        await cache.fetch_json(espn.url, max_staleness=60)  # 90s old <= 60 + 60
+        assert len(espn.requests) == 1 and cache.stats['fresh_hits'] == 2
+        await cache.fetch_json(espn.url)
+        assert len(espn.requests) == 2 and cache.stats['revalidated'] == 1
+
+    @pytest.mark.asyncio
+    async def test_network_failure_and_no_store(self, espn, tmp_path):
+        """🛟 Failures fall back to the cached copy; no-store bodies are never written"""
+        cache = HTTPResponseCache(cache_dir=tmp_path)
+        await cache.fetch_json(espn.url)
+        espn.failing = True
+        assert await cache.fetch_json(espn.url) == espn.scoreboard
+        assert cache.stats['stale_served'] == 1
+
+        espn.failing = False
+        espn.cache_control = 'no-store'
+        other = HTTPResponseCache(cache_dir=tmp_path / "other")
+        assert await other.fetch_json(espn.url) == espn.scoreboard
+        assert other._read_entry(espn.url) is None
+        espn.failing = True
+        assert await other.fetch_json(espn.url) is None
+
+class TestEviction:
+    """🧹 Test LRU bookkeeping and the size budget"""
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit_does_not_rewrite_entry(self, espn, tmp_path):
+        """👆 A fresh hit bumps the entry file's mtime without rewriting it"""
+        espn.cache_control = 'max-age=60'
+        cache = HTTPResponseCache(cache_dir=tmp_path)
+        await cache.fetch_json(espn.url)
+        path = cache._entry_path(espn.url)
+        before = path.read_bytes(), path.stat().st_ino
+        os.utime(path, (1, 1))
+
+        await cache.fetch_json(espn.url)
+        assert cache.stats['fresh_hits'] == 1
+        assert (path.read_bytes(), path.stat().st_ino) == before
+        assert path.stat().st_mtime > 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """📏 Over budget, the entry touched longest ago goes first"""
+        cache = HTTPResponseCache(cache_dir=tmp_path)
+        meta = {'etag': None, 'last_modified': None, 'max_age': 0}
+        cache._store('https://espn/a', b'{"v": 1}', meta)
+        cache._store('https://espn/b', b'{"v": 2}', meta)
+        os.utime(cache._entry_path('https://espn/a'), (100, 100))
+        os.utime(cache._entry_path('https://espn/b'), (200, 200))
+        cache._touch('https://espn/a')
+
+        cache.max_bytes = int(cache._total_bytes * 1.2)
+        cache._store('https://espn/c', b'{"v": 3}', meta)
+
+        assert cache.stats['evictions'] == 1
+        assert cache._read_entry('https://espn/b') is None
+        assert cache._read_entry('https://espn/a') is not None
+        assert cache._read_entry('https://espn/c') is not None
+
+class TestReplayMode:
+    """📼 Test offline replay"""
+
+    @pytest.mark.asyncio
+    async def test_replay_hits_and_misses(self, espn, tmp_path):
+        """📼 Recorded URLs are served from disk regardless of age; unknown URLs miss"""
+        recorder = HTTPResponseCache(cache_dir=tmp_path)
+        await recorder.fetch_json(espn.url)
+        _age_entry(recorder, espn.url, 30 * 86400)
+
+        replay = HTTPResponseCache(cache_dir=tmp_path, mode=MODE_REPLAY)
+        assert await replay.fetch_json(espn.url) == espn.scoreboard
+        assert await replay.fetch_json(espn.url + '?dates=20251020') is None
+        assert len(espn.requests) == 1
+        assert replay.stats['replay_hits'] == 1 and replay.stats['replay_misses'] == 1
+
+        with pytest.raises(ValueError):
+            replay.set_mode('offline')
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+🧠 INTELLIGENT WORKFLOW TESTS 🧠
+Agent Poly Loly Double Zero: event-driven DAG execution
+
+COVERAGE:
+- Workflow latency equals the critical path of actual task times (no polling ticks)
+- Critical-path-first dispatch and per-workflow parallel limits
+- Retries, 'stop' failures and skipping downstream of failures under 'continue'
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.intelligent_workflows import (
+    IntelligentWorkflowOrchestrator, TaskStatus, TaskType, WorkflowDefinition, WorkflowStatus, WorkflowTask
+)
+
+class FakeSwarm:
+    """🐝 Swarm with a few idle agents"""
+
+    async def get_swarm_status(self):
+        return {'agents': {f"agent_{i}": {'capabilities': [], 'status': 'idle'} for i in range(4)}}
+
+class FakeBus:
+    """📬 Completes each dispatched task after payload['duration'] seconds"""
+
+    def __init__(self, failures=None):
+        self.orchestrator = None
+        self.dispatched = []
+        self.running = 0
+        self.max_running = 0
+        self.failures = dict(failures or {})  # task_id -> remaining failures
+
+    async def publish_to_agent(self, target_agent, event_name, payload):
+        self.dispatched.append(payload['task_id'])
+        asyncio.create_task(self._run(payload))
+
+    async def _run(self, payload):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(payload['payload'].get('duration', 0.02))
+        self.running -= 1
+        task_id = payload['task_id']
+        success = self.failures.get(task_id, 0) == 0
+        if not success:
+            self.failures[task_id] -= 1
+        await self.orchestrator.handle_task_completion(
+            task_id, payload['workflow_id'], payload['execution_id'],
+            {'value': task_id} if success else {'error': 'boom'}, success=success
+        )
+
+def _orchestrator(**bus_kwargs):
+    bus = FakeBus(**bus_kwargs)
+    orchestrator = IntelligentWorkflowOrchestrator(bus, FakeSwarm())
+    bus.orchestrator = orchestrator
+    return orchestrator, bus
+
+def _workflow(workflow_id, graph, durations=None, **kwargs):
+    durations = durations or {}
+    return WorkflowDefinition(
+        workflow_id=workflow_id, name=workflow_id, description="test",
+        tasks={
+            task_id: WorkflowTask(task_id, TaskType.SEQUENTIAL, dependencies=set(deps),
+                                  payload={'duration': durations.get(task_id, 0.02)}, retry_count=2)
+            for task_id, deps in graph.items()
+        },
+        **kwargs
+    )
+
+async def _run(orchestrator, workflow):
+    await orchestrator.create_workflow(workflow)
+    execution_id = await orchestrator.execute_workflow(workflow.workflow_id)
+    return await orchestrator.wait_for_execution(execution_id, timeout=5.0)
+
+class TestEventDrivenExecution:
+    """⚡ Test latency and ordering"""
+
+    @pytest.mark.asyncio
+    async def test_latency_is_critical_path(self):
+        """⏱️ Diamond DAG finishes in ~sum of the longest chain, not polling ticks"""
+        orchestrator, bus = _orchestrator()
+        workflow = _workflow("diamond", {
+            'fetch': [], 'analyze': ['fetch'], 'sentiment': ['fetch'], 'predict': ['analyze', 'sentiment']
+        }, durations={'fetch': 0.05, 'analyze': 0.05, 'sentiment': 0.02, 'predict': 0.05})
+
+        started = time.perf_counter()
+        result = await _run(orchestrator, workflow)
+        elapsed = time.perf_counter() - started
+
+        assert result['status'] == WorkflowStatus.COMPLETED
+        assert result['completed_tasks'] == 4
+        assert set(result['task_results']) == {'fetch', 'analyze', 'sentiment', 'predict'}
+        assert 0.15 <= elapsed < 0.4
+        assert orchestrator.execution_stats['diamond']['executions'] == 1
+        assert orchestrator.execution_contexts == {}
+
+    @pytest.mark.asyncio
+    async def test_critical_path_first_and_parallel_limit(self):
+        """🛤️ With one slot, the head of the longest chain runs first"""
+        orchestrator, bus = _orchestrator()
+        workflow = _workflow("chains", {
+            'short': [], 'long_1': [], 'long_2': ['long_1'], 'long_3': ['long_2']
+        }, parallel_limit=1)
+
+        result = await _run(orchestrator, workflow)
+
+        assert result['status'] == WorkflowStatus.COMPLETED
+        assert bus.dispatched[0] == 'long_1'
+        assert bus.max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_parallel_limit_caps_concurrency(self):
+        """🚦 Independent tasks never exceed the workflow's parallel limit"""
+        orchestrator, bus = _orchestrator()
+        workflow = _workflow("fanout", {f"t{i}": [] for i in range(8)}, parallel_limit=3)
+
+        result = await _run(orchestrator, workflow)
+
+        assert result['status'] == WorkflowStatus.COMPLETED
+        assert bus.max_running == 3
+
+class TestFailureHandling:
+    """❌ Test retries and failure strategies"""
+
+    @pytest.mark.asyncio
+    async def test_retry_then_succeed(self):
+        """🔄 A failed attempt is re-queued and dependents still run"""
+        orchestrator, bus = _orchestrator(failures={'a': 1})
+        workflow = _workflow("retry", {'a': [], 'b': ['a']})
+
+        result = await _run(orchestrator, workflow)
+
+        assert result['status'] == WorkflowStatus.COMPLETED
+        assert bus.dispatched == ['a', 'a', 'b']
+        assert workflow.tasks['a'].attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_strategy_fails_fast(self):
+        """🛑 Permanent failure stops the workflow"""
+        orchestrator, bus = _orchestrator(failures={'a': 5})
+        result = await _run(orchestrator, _workflow("stop", {'a': [], 'b': ['a']}))
+
+        assert result['status'] == WorkflowStatus.FAILED
+        assert 'b' not in bus.dispatched
+
+    @pytest.mark.asyncio
+    async def test_continue_strategy_skips_downstream(self):
+        """⏭️ Under 'continue', descendants of a failure are skipped, others finish"""
+        orchestrator, bus = _orchestrator(failures={'a': 5})
+        workflow = _workflow("continue", {'a': [], 'b': ['a'], 'c': []},
+                             failure_strategy="continue", completion_threshold=0.3)
+
+        result = await _run(orchestrator, workflow)
+
+        assert result['status'] == WorkflowStatus.COMPLETED
+        assert workflow.tasks['b'].status == TaskStatus.SKIPPED
+        assert workflow.tasks['c'].status == TaskStatus.COMPLETED
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+⏰ ASYNC JOB SCHEDULER TESTS ⏰
+Agent Poly Loly Double Zero: event-loop native cron for the automation
+
+COVERAGE:
+- Next-run computation for cron fields, weekdays and timezones
+- Catch-up of a run missed while the process was down
+- Last fire times persisted atomically and reloaded on start
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from real_agents.job_scheduler import AsyncJobScheduler, CronTrigger
+
+MEXICO = ZoneInfo('America/Mexico_City')
+
+class TestCronTrigger:
+    """📅 Test next-run computation"""
+
+    def test_next_after(self):
+        """⏭️ Fire times are strictly after the moment, in the trigger's timezone"""
+        trigger = CronTrigger(minute=1, hour=0, tz=MEXICO)
+        moment = datetime(2025, 10, 20, 0, 1, tzinfo=MEXICO)
+        assert trigger.next_after(moment) == datetime(2025, 10, 21, 0, 1, tzinfo=MEXICO)
+        assert trigger.next_after(moment - timedelta(seconds=1)) == moment
+
+        utc_moment = datetime(2025, 10, 20, 5, 30, tzinfo=ZoneInfo('UTC'))  # 23:30 in Mexico City
+        assert trigger.next_after(utc_moment) == datetime(2025, 10, 20, 0, 1, tzinfo=MEXICO)
+
+    def test_fields_and_weekdays(self):
+        """🗓️ Steps, lists and ranges; day_of_week 0 is Sunday"""
+        every_quarter = CronTrigger(minute='*/15', tz=MEXICO)
+        assert every_quarter.next_after(datetime(2025, 10, 20, 9, 16, tzinfo=MEXICO)).minute == 30
+
+        weekly = CronTrigger(minute=0, hour=9, day_of_week=0, tz=MEXICO)
+        fire = weekly.next_after(datetime(2025, 10, 20, 12, 0, tzinfo=MEXICO))  # a Monday
+        assert fire == datetime(2025, 10, 26, 9, 0, tzinfo=MEXICO) and fire.strftime('%A') == 'Sunday'
+
+        weekdays = CronTrigger(minute='0,30', hour='8-9', day_of_week='1-5', tz=MEXICO)
+        assert weekdays.next_after(datetime(2025, 10, 24, 9, 30, tzinfo=MEXICO)) == \
+            datetime(2025, 10, 27, 8, 0, tzinfo=MEXICO)
+
+        with pytest.raises(ValueError):
+            CronTrigger(hour=24)
+
+class TestScheduler:
+    """⚙️ Test catch-up and persistence"""
+
+    @pytest.mark.asyncio
+    async def test_missed_run_catch_up(self, tmp_path):
+        """⏪ A fire time that passed while down runs once on start and is persisted"""
+        state_path = tmp_path / "state.json"
+        last = (datetime.now(MEXICO) - timedelta(days=2)).replace(second=0, microsecond=0)
+        state_path.write_text(json.dumps({'midnight_update': last.isoformat()}))
+
+        runs = []
+
+        async def job():
+            runs.append(datetime.now(MEXICO))
+
+        scheduler = AsyncJobScheduler(tz=MEXICO, state_path=state_path)
+        scheduler.add_job('midnight_update', job, CronTrigger(minute=1, hour=0))
+        scheduler.start()
+        for _ in range(50):
+            if runs:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+        await scheduler.shutdown()
+
+        job_state = scheduler.jobs['midnight_update']
+        missed = CronTrigger(minute=1, hour=0, tz=MEXICO).next_after(last)
+        assert len(runs) == 1 and job_state.stats['catch_ups'] == 1
+        assert job_state.history[0].trigger == 'catch_up'
+        assert job_state.last_scheduled_for == missed
+        assert json.loads(state_path.read_text()) == {'midnight_update': missed.isoformat()}
+
+    @pytest.mark.asyncio
+    async def test_no_catch_up_without_missed_run(self, tmp_path):
+        """😴 A job whose next fire time is still ahead does not run on start"""
+        state_path = tmp_path / "state.json"
+        trigger = CronTrigger(minute=1, hour=0, tz=MEXICO)
+        last = trigger.next_after(datetime.now(MEXICO)) - timedelta(days=1)  # most recent fire time
+        state_path.write_text(json.dumps({'midnight_update': last.isoformat()}))
+        runs = []
+
+        async def job():
+            runs.append(1)
+
+        scheduler = AsyncJobScheduler(tz=MEXICO, state_path=state_path)
+        scheduler.add_job('midnight_update', job, trigger)
+        scheduler.start()
+        await asyncio.sleep(0.05)
+        assert scheduler.jobs['midnight_update'].next_run_at > datetime.now(MEXICO)
+        await scheduler.shutdown()
+        assert runs == [] and scheduler.jobs['midnight_update'].stats['catch_ups'] == 0
+
+    @pytest.mark.asyncio
+    async def test_state_persistence(self, tmp_path, monkeypatch):
+        """💾 State reloads in a new scheduler; a failed write keeps the previous file intact"""
+        state_path = tmp_path / "nested" / "state.json"
+        scheduler = AsyncJobScheduler(tz=MEXICO, state_path=state_path)
+
+        async def job():
+            pass
+
+        scheduler.add_job('daily_check', job, CronTrigger(minute=0, hour=8))
+        fired = datetime(2025, 10, 20, 8, 0, tzinfo=MEXICO)
+        await scheduler._execute(scheduler.jobs['daily_check'], fired, 'schedule')
+        saved = state_path.read_text()
+        assert json.loads(saved) == {'daily_check': fired.isoformat()}
+
+        reloaded = AsyncJobScheduler(tz=MEXICO, state_path=state_path)
+        assert reloaded._load_state() == {'daily_check': fired}
+
+        def broken_dump(*args, **kwargs):
+            raise OSError("disk full")
+
+        import real_agents.job_scheduler as job_scheduler
+        monkeypatch.setattr(job_scheduler.json, 'dump', broken_dump)
+        scheduler.jobs['daily_check'].last_scheduled_for = fired + timedelta(days=1)
+        scheduler._save_state()
+        assert state_path.read_text() == saved
+        assert [p.name for p in state_path.parent.iterdir()] == ['state.json']
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+🚀 LEAGUE FAN-OUT TESTS 🚀
+Agent Poly Loly Double Zero: concurrent league fetches in UltimateSportsIntegrator
+
+COVERAGE:
+- Concurrent fan-out returns exactly what the old serial chain built (alias precedence)
+- A failing or slow source is isolated; every other league still arrives
+- The shared concurrency cap is honoured
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ultimate_sports_integrator import UltimateSportsIntegrator
+
+def _games(league, count):
+    return [{'home_team': f"{league} home {i}", 'away_team': f"{league} away {i}"} for i in range(count)]
+
+class Tracker:
+    """📈 Counts sources in flight to check the concurrency cap"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    def source(self, delay, data):
+        async def fetch(all_data):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(delay)
+                for league, games in data.items():
+                    all_data[league] = games
+            finally:
+                self.active -= 1
+        return fetch
+
+def _sources(tracker):
+    shared_cfb = _games('CFB', 2)
+    return [
+        ('NFL', tracker.source(0.05, {'NFL': _games('NFL', 3)})),
+        ('CFB', tracker.source(0.02, {'CFB': shared_cfb, 'NCAAF': shared_cfb})),
+        ('EPL', tracker.source(0.04, {'EPL': _games('EPL', 4)})),
+        ('ESPN_PREMIER_LEAGUE', tracker.source(0.01, {'EPL': _games('ESPN EPL', 5)})),  # later source wins
+        ('MLS', tracker.source(0.03, {})),
+    ]
+
+async def _serial(sources):
+    """🐢 The pre-fan-out behaviour: one shared dict filled source by source"""
+    all_data = {}
+    for _, fetcher in sources:
+        await fetcher(all_data)
+    return all_data
+
+class TestLeagueFanOut:
+    """🚀 Test _fan_out_league_sources with stubbed fetchers"""
+
+    @pytest.mark.asyncio
+    async def test_parity_with_serial_chain(self):
+        """🔁 Same keys, same order, same alias precedence as the serial loop - in less time"""
+        integrator = UltimateSportsIntegrator(polymarket_oracle=None)
+        expected = await _serial(_sources(Tracker()))
+
+        started = time.perf_counter()
+        all_data = await integrator._fan_out_league_sources(_sources(Tracker()))
+        elapsed = time.perf_counter() - started
+
+        assert all_data == expected
+        assert list(all_data) == list(expected) == ['NFL', 'CFB', 'NCAAF', 'EPL']
+        assert all_data['EPL'][0]['home_team'].startswith('ESPN EPL')
+        assert elapsed < 0.12  # serial would be 0.15s
+
+        outcomes = integrator.last_fetch_outcomes
+        assert list(outcomes) == ['NFL', 'CFB', 'EPL', 'ESPN_PREMIER_LEAGUE', 'MLS']
+        assert outcomes['CFB'].games == 2 and outcomes['CFB'].league_keys == ['CFB', 'NCAAF']
+        assert outcomes['MLS'].status == 'empty'
+
+    @pytest.mark.asyncio
+    async def test_failure_isolation(self):
+        """🛡️ A raising source and a hung source cost only their own leagues"""
+        integrator = UltimateSportsIntegrator(polymarket_oracle=None, source_timeout=0.1)
+        tracker = Tracker()
+
+        async def broken(all_data):
+            raise RuntimeError("ESPN 503")
+
+        sources = _sources(tracker) + [('NHL', broken), ('TENNIS', tracker.source(5.0, {'TENNIS': _games('T', 1)}))]
+        started = time.perf_counter()
+        all_data = await integrator._fan_out_league_sources(sources)
+
+        assert time.perf_counter() - started < 1.0
+        assert set(all_data) == {'NFL', 'CFB', 'NCAAF', 'EPL'}
+        outcomes = integrator.last_fetch_outcomes
+        assert (outcomes['NHL'].status, outcomes['NHL'].error) == ('error', "ESPN 503")
+        assert outcomes['TENNIS'].status == 'timeout'
+        assert all(outcomes[name].status == 'ok' for name in ('NFL', 'CFB', 'EPL', 'ESPN_PREMIER_LEAGUE'))
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        """🚦 No more than max_concurrent_sources fetchers run at once"""
+        integrator = UltimateSportsIntegrator(polymarket_oracle=None, max_concurrent_sources=2)
+        tracker = Tracker()
+        sources = [(f"L{i}", tracker.source(0.01, {f"L{i}": _games(f"L{i}", 1)})) for i in range(8)]
+
+        all_data = await integrator._fan_out_league_sources(sources)
+        assert list(all_data) == [f"L{i}" for i in range(8)]
+        assert tracker.peak == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+🔥 LEGENDARY BACK TESTER TESTS 🔥
+Agent Poly Loly Double Zero: checkpointed, sharded back testing
+
+COVERAGE:
+- max_games picks the window before sharding, so shards cover one unsharded run
+- Checkpointed games are not re-tested on resume; --fresh starts over
+- Merging shard results (including leagues that failed in some shards)
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from legendary_back_tester import LegendaryBackTester, merge_back_test_results
+
+AS_OF = datetime(2025, 10, 20)
+DAYS_BACK = 14
+
+class FakeAlgorithm:
+    """🤖 Always backs the home team; can be told to fail on some matchups"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    async def predict(self, game_data):
+        self.calls.append(game_data['home_team'])
+        if game_data['home_team'] in self.failing:
+            raise RuntimeError("model unavailable")
+        return {'prediction': f"🏠 {game_data['home_team']}", 'confidence': 60.0}
+
+def _games(count=10):
+    return [{'home_team': f"Home{i}", 'away_team': f"Away{i}", 'home_score': i % 3, 'away_score': 1,
+             'venue': 'Stadium', 'date': f"2025-10-{i + 1:02d}T19:00Z", 'espn_id': str(1000 + i)}
+            for i in range(count)]
+
+def _tester(tmp_path, algorithm, **kwargs):
+    fixture_path = tmp_path / "fixtures" / f"usa.1_{AS_OF.strftime('%Y%m%d')}_{DAYS_BACK}d.json"
+    if not fixture_path.exists():
+        fixture_path.parent.mkdir(parents=True, exist_ok=True)
+        fixture_path.write_text(json.dumps({'games': _games()}))
+
+    tester = LegendaryBackTester(as_of=AS_OF, output_dir=tmp_path, **kwargs)
+    tester.leagues = {'MLS': {'espn_id': 'usa.1', 'algorithm': algorithm,
+                              'algorithm_method': 'predict', 'name': 'Fake MLS'}}
+    return tester
+
+class TestSharding:
+    """🧩 Test shard assignment and merging"""
+
+    @pytest.mark.asyncio
+    async def test_shards_cover_the_unsharded_window(self, tmp_path):
+        """🎯 Merged shards reproduce one unsharded run over the same max_games window"""
+        single = await _tester(tmp_path, FakeAlgorithm(), max_games=6).back_test_all_leagues(DAYS_BACK)
+        expected = [record['espn_id'] for record in single['MLS']['predictions']]
+        assert expected == [str(1000 + i) for i in range(4, 10)]
+
+        shard_files = []
+        for index in range(3):
+            tester = _tester(tmp_path, FakeAlgorithm(), max_games=6, shard=(index, 3))
+            await tester.back_test_all_leagues(DAYS_BACK)
+            shard_files.append(tester.results_file)
+
+        merged = merge_back_test_results(shard_files)
+        assert merged['run_id'] == f"{AS_OF.strftime('%Y%m%d')}_{DAYS_BACK}d_max6"
+        assert [record['espn_id'] for record in merged['leagues']['MLS']['predictions']] == expected
+        for key in ('games_tested', 'correct_predictions', 'accuracy_percentage', 'average_confidence'):
+            assert merged['leagues']['MLS'][key] == single['MLS'][key]
+
+    def test_merge_keeps_partial_leagues(self, tmp_path):
+        """⚠️ A league that failed in one shard keeps the other shards' games, flagged partial"""
+        record = {'game_number': 3, 'espn_id': '1002', 'confidence': 60.0, 'correct': True}
+        documents = [
+            {'run_id': 'r_shard0of2', 'as_of': '2025-10-20', 'days_back': DAYS_BACK, 'shard': {'index': 0, 'count': 2},
+             'leagues': {'MLS': {'algorithm_name': 'Fake MLS', 'predictions': [record]},
+                         'LIGUE1': {'error': 'timeout'}}},
+            {'run_id': 'r_shard1of2', 'as_of': '2025-10-20', 'days_back': DAYS_BACK, 'shard': {'index': 1, 'count': 2},
+             'leagues': {'MLS': {'error': 'boom'}, 'LIGUE1': {'error': 'timeout'}}},
+        ]
+        paths = []
+        for i, document in enumerate(documents):
+            paths.append(tmp_path / f"shard{i}.json")
+            paths[-1].write_text(json.dumps(document))
+
+        merged = merge_back_test_results(paths)
+        mls = merged['leagues']['MLS']
+        assert mls['games_tested'] == 1 and mls['partial'] is True
+        assert mls['shard_errors'] == [{'shard': 1, 'error': 'boom'}]
+        assert merged['leagues']['LIGUE1']['error'] == 'timeout'
+        assert len(merged['leagues']['LIGUE1']['shard_errors']) == 2
+
+class TestCheckpointing:
+    """♻️ Test resuming a crashed run"""
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_checkpointed_games(self, tmp_path):
+        """💾 Only games without a checkpoint record are re-tested"""
+        flaky = FakeAlgorithm(failing={'Home7', 'Home8'})
+        first = await _tester(tmp_path, flaky).back_test_all_leagues(DAYS_BACK)
+        assert first['MLS']['games_tested'] == 8
+        assert len(flaky.calls) == 10
+
+        healthy = FakeAlgorithm()
+        resumed = await _tester(tmp_path, healthy).back_test_all_leagues(DAYS_BACK)
+        assert sorted(healthy.calls) == ['Home7', 'Home8']
+        assert resumed['MLS']['games_tested'] == 10
+        assert [record['game_number'] for record in resumed['MLS']['predictions']] == list(range(1, 11))
+
+        fresh = FakeAlgorithm()
+        await _tester(tmp_path, fresh, resume=False).back_test_all_leagues(DAYS_BACK)
+        assert len(fresh.calls) == 10
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
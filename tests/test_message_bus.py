@@ -15,6 +15,7 @@ COMPREHENSIVE TEST COVERAGE:
 
 import asyncio
 import pytest
+import pytest_asyncio
 import time
 import uuid
 from datetime import datetime, timedelta
@@ -491,6 +492,144 @@ class TestPerformance:
         assert stats['registered_agents'] == agent_count
         assert stats['performance']['total_sent'] > 0
 
+class TestPriorityMailboxes:
+    """🚦 Test priority lanes, batched draining and fan-out caching"""
+    
+    @pytest_asyncio.fixture
+    async def message_bus(self):
+        """🏭 Create test message bus"""
+        bus = AdvancedMessageBus("priority_test")
+        await bus.start()
+        yield bus
+        await bus.stop()
+    
+    @pytest.mark.asyncio
+    async def test_critical_overtakes_telemetry(self, message_bus):
+        """🚨 CRITICAL is served before earlier LOW/NORMAL messages"""
+        message_bus.register_agent("worker")
+        for priority in (MessagePriority.LOW, MessagePriority.NORMAL, MessagePriority.LOW,
+                         MessagePriority.CRITICAL, MessagePriority.HIGH):
+            await message_bus.publish_to_agent("worker", priority.name, {}, priority=priority)
+        
+        received = await message_bus.get_agent_messages("worker", max_messages=10)
+        assert [m.priority for m in received] == [
+            MessagePriority.CRITICAL, MessagePriority.HIGH, MessagePriority.NORMAL,
+            MessagePriority.LOW, MessagePriority.LOW
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_batched_drain_and_wakeup(self, message_bus):
+        """📦 Batches respect max_messages; a waiting consumer wakes on enqueue"""
+        message_bus.register_agent("worker")
+        for i in range(5):
+            await message_bus.publish_to_agent("worker", "tick", {"i": i})
+        
+        first = await message_bus.get_agent_messages("worker", max_messages=3)
+        rest = await message_bus.get_agent_messages("worker", max_messages=3)
+        assert [m.payload["i"] for m in first + rest] == [0, 1, 2, 3, 4]
+        assert await message_bus.get_agent_messages("worker", timeout=0.01) == []
+        
+        waiter = asyncio.create_task(message_bus.get_agent_message("worker", timeout=1.0))
+        await asyncio.sleep(0)
+        await message_bus.publish_to_agent("worker", "late", {})
+        assert (await waiter).event_name == "late"
+    
+    @pytest.mark.asyncio
+    async def test_full_mailbox_goes_to_retry(self, message_bus):
+        """🛑 A full mailbox rejects without blocking and queues a retry"""
+        message_bus.register_agent("worker")
+        message_bus.agent_queues["worker"]._maxsize = 1
+        await message_bus.publish_to_agent("worker", "a", {})
+        await message_bus.publish_to_agent("worker", "b", {})
+        
+        assert message_bus.agent_queues["worker"].qsize() == 1
+        assert message_bus.retry_queue.qsize() + message_bus.stats.messages_retried >= 1
+    
+    @pytest.mark.asyncio
+    async def test_topic_fanout_tracks_subscriptions(self, message_bus):
+        """📡 Cached fan-out is refreshed on subscribe/unregister"""
+        for agent_id in ("a", "b"):
+            message_bus.register_agent(agent_id)
+        message_bus.subscribe_to_topic("a", "odds")
+        await message_bus.publish(AdvancedMessage(message_type=MessageType.PUBLISH, topic="odds"))
+        message_bus.subscribe_to_topic("b", "odds")
+        message_bus.unregister_agent("a")
+        await message_bus.publish(AdvancedMessage(message_type=MessageType.PUBLISH, topic="odds"))
+        
+        assert len(await message_bus.get_agent_messages("b")) == 1
+        stats = message_bus.get_stats()
+        assert stats['queue_depth_by_priority'] == {}
+        assert 'p95_ms' in stats['queue_wait_percentiles']['NORMAL']
+
+class TestRequestReply:
+    """📞 Test correlation-id request/reply and scatter-gather"""
+    
+    @pytest_asyncio.fixture
+    async def message_bus(self):
+        """🏭 Create test message bus"""
+        bus = AdvancedMessageBus("request_test")
+        await bus.start()
+        yield bus
+        await bus.stop()
+    
+    async def _responder(self, bus, agent_id, delay=0.0, answer=None):
+        """🤖 Minimal agent loop answering every request"""
+        while True:
+            for message in await bus.get_agent_messages(agent_id, timeout=1.0):
+                await asyncio.sleep(delay)
+                await bus.reply(message, answer or {'from': agent_id, 'echo': message.payload}, sender_id=agent_id)
+    
+    @pytest.mark.asyncio
+    async def test_request_round_trip(self, message_bus):
+        """⚡ Reply resolves the waiting future without a fixed delay"""
+        message_bus.register_agent("worker")
+        responder = asyncio.create_task(self._responder(message_bus, "worker"))
+        try:
+            start = time.perf_counter()
+            response = await message_bus.request("worker", "ping", {"n": 1}, timeout=2.0)
+            assert response == {'from': 'worker', 'echo': {"n": 1}}
+            assert time.perf_counter() - start < 0.1
+            assert message_bus.pending_replies == {}
+            assert message_bus.stats.replies_matched == 1
+        finally:
+            responder.cancel()
+    
+    @pytest.mark.asyncio
+    async def test_request_timeout_cleans_up(self, message_bus):
+        """⏰ Unanswered requests return None and leave no waiter behind"""
+        message_bus.register_agent("silent")
+        assert await message_bus.request("silent", "ping", {}, timeout=0.05) is None
+        assert message_bus.pending_replies == {}
+        assert message_bus.stats.requests_timed_out == 1
+    
+    @pytest.mark.asyncio
+    async def test_scatter_gather_first_n(self, message_bus):
+        """📡 Scatter-gather returns as soon as the first N replies arrive"""
+        delays = {"fast_1": 0.0, "fast_2": 0.0, "slow": 1.0}
+        responders = []
+        for agent_id, delay in delays.items():
+            message_bus.register_agent(agent_id)
+            responders.append(asyncio.create_task(self._responder(message_bus, agent_id, delay)))
+        try:
+            start = time.perf_counter()
+            replies = await message_bus.scatter_gather(set(delays), "quote", {}, min_replies=2, timeout=2.0)
+            assert set(replies) == {"fast_1", "fast_2"}
+            assert time.perf_counter() - start < 0.5
+        finally:
+            for responder in responders:
+                responder.cancel()
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_response_claims_early_reply(self, message_bus):
+        """📬 A reply that beats wait_for_response is parked, then claimed"""
+        message_bus.register_agent("requester")
+        request = AdvancedMessage(sender_id="requester", correlation_id="decision-1")
+        await message_bus.reply(request, {'vote': 'home'}, sender_id="voter")
+        
+        assert await message_bus.wait_for_response("voter", "decision-1", timeout=0.5) == {'vote': 'home'}
+        assert "decision-1" not in message_bus.unclaimed_replies
+        assert await message_bus.get_agent_messages("requester", timeout=0.01) != []
+
 class TestIntegration:
     """🔗 Test integration scenarios"""
     
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+🌙 MIDNIGHT SPECIAL STORE TESTS 🌙
+Agent Poly Loly Double Zero: journaled, crash-safe prediction storage
+
+COVERAGE:
+- Leftover journal operations are replayed once on reopen (no duplicates, torn lines ignored)
+- A crash after only automation_history was replaced is reconciled into the derived views
+- Batched commits write every view once and leave an empty journal
+- update_prediction_result finds games through the (league, date, game_id) index
+"""
+
+import json
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from real_agents.midnight_special_store import MidnightSpecialStore, JOURNAL_FILENAME
+
+def _prediction(game_id, date, tracked_at, home="Arsenal", away="Chelsea"):
+    return {'game_id': game_id, 'home_team': home, 'away_team': away, 'prediction': home,
+            'confidence': 70, 'date': date, 'tracked_at': tracked_at,
+            'status': 'pending', 'correct': None, 'result': None}
+
+def _save_op(game_id, date, tracked_at, league='EPL'):
+    return {'op': 'save_prediction', 'league': league, 'run_date': date,
+            'prediction': _prediction(game_id, date, tracked_at)}
+
+def _result_op(game_id, date, correct=True, league='EPL'):
+    return {'op': 'update_result', 'league': league, 'game_id': game_id, 'date': date,
+            'result': 'home_win', 'correct': correct, 'completed_at': f"{date}T23:00:00"}
+
+def _write_journal(data_dir, operations, torn_tail=False):
+    text = ''.join(json.dumps(op) + '\n' for op in operations)
+    if torn_tail:
+        text += '{"op": "save_predic'
+    (data_dir / JOURNAL_FILENAME).write_text(text)
+
+def _game_ids(store, league='EPL'):
+    return [pred['game_id'] for run in store.history[league]['runs'] for pred in run['predictions']]
+
+class TestJournalReplay:
+    """🩹 Test recovery from leftover journal operations"""
+
+    def test_replay_rebuilds_each_view_once(self, tmp_path):
+        """📜 A journal with no views behind it replays once; replaying it again adds nothing"""
+        operations = [_save_op('g1', '2025-10-20', 't1'), _save_op('g2', '2025-10-20', 't2'),
+                      _result_op('g1', '2025-10-20', correct=True)]
+        _write_journal(tmp_path, operations, torn_tail=True)
+
+        store = MidnightSpecialStore(tmp_path)
+        assert _game_ids(store) == ['g1', 'g2']
+        assert [t['game_id'] for t in store.tracked['EPL']] == ['g1', 'g2']
+        assert (store.accuracy['EPL']['total'], store.accuracy['EPL']['correct']) == (1, 1)
+        assert store.progress['EPL']['total_predictions'] == 2 and store.progress['EPL']['games_played'] == 1
+        assert (tmp_path / JOURNAL_FILENAME).read_text() == ''
+
+        # Crash right after the views were rewritten but before the journal was truncated
+        _write_journal(tmp_path, operations)
+        reopened = MidnightSpecialStore(tmp_path)
+        assert _game_ids(reopened) == ['g1', 'g2']
+        assert reopened.history['EPL']['total_predictions'] == 2
+        assert len(reopened.tracked['EPL']) == 2
+        assert reopened.accuracy['EPL']['total'] == 1
+        assert reopened.progress['EPL']['total_predictions'] == 2
+
+    def test_crash_after_history_only(self, tmp_path):
+        """💥 History already holds the batch; tracked/accuracy/progress are brought back in line"""
+        store = MidnightSpecialStore(tmp_path)
+        store.record(_save_op('g1', '2025-10-20', 't1'))
+        stale = {view: store.paths[view].read_text() for view in ('tracked', 'accuracy', 'progress')}
+
+        operations = [_save_op('g2', '2025-10-21', 't2'), _result_op('g1', '2025-10-20', correct=False)]
+        with store.batch():
+            for op in operations:
+                store.record(op)
+
+        # Disk as a crash would leave it: journal + new history, every other view still old
+        for view, text in stale.items():
+            store.paths[view].write_text(text)
+        _write_journal(tmp_path, operations)
+
+        recovered = MidnightSpecialStore(tmp_path)
+        assert _game_ids(recovered) == ['g1', 'g2']
+        assert [t['game_id'] for t in recovered.tracked['EPL']] == ['g1', 'g2']
+        assert recovered.accuracy['EPL'] | {'updated': None} == \
+            {'total': 1, 'correct': 0, 'incorrect': 1, 'accuracy': 0.0, 'updated': None}
+        assert recovered.progress['EPL']['total_predictions'] == 2
+        assert recovered.progress['EPL']['games_played'] == 1
+        assert recovered.progress['EPL']['weeks_completed'] == 2
+
+    def test_batch_commits_once(self, tmp_path, monkeypatch):
+        """📦 A batch of operations rewrites each view once and truncates the journal"""
+        store = MidnightSpecialStore(tmp_path)
+        writes = []
+        original = store._atomic_write_text
+
+        def counting_write(path, text):
+            writes.append(path.name)
+            original(path, text)
+
+        monkeypatch.setattr(store, '_atomic_write_text', counting_write)
+        with store.batch():
+            for i in range(10):
+                store.record(_save_op(f"g{i}", '2025-10-20', f"t{i}"))
+
+        assert sorted(writes) == sorted(list(MidnightSpecialStore.VIEW_FILES.values()) + [JOURNAL_FILENAME])
+        assert (tmp_path / JOURNAL_FILENAME).read_text() == ''
+        assert len(_game_ids(MidnightSpecialStore(tmp_path))) == 10
+
+class TestResultUpdates:
+    """🎯 Test update_prediction_result through the writer"""
+
+    def test_update_by_index_with_and_without_date(self, tmp_path, monkeypatch):
+        """🔍 With a date the exact game is updated; without one the oldest match wins"""
+        from real_agents.midnight_special_data_writer import MidnightSpecialDataWriter
+
+        monkeypatch.chdir(tmp_path)
+        writer = MidnightSpecialDataWriter()
+        for date in ('2025-10-20', '2025-10-27'):
+            writer.save_prediction('epl', {'id': 'derby', 'home_team': 'Arsenal', 'away_team': 'Tottenham',
+                                           'date': date}, {'prediction': 'Arsenal', 'confidence': 72})
+        store = writer.store
+        first = store.find_prediction('EPL', 'derby', '2025-10-20')
+        second = store.find_prediction('EPL', 'derby', '2025-10-27')
+        assert first is not second and store.find_prediction('EPL', 'derby') is first
+
+        assert writer.update_prediction_result('EPL', 'derby', 'home_win', True, date='2025-10-27')
+        assert (first['status'], second['status']) == ('pending', 'completed')
+
+        assert writer.update_prediction_result('EPL', 'derby', 'draw', False)
+        assert (first['status'], first['result']) == ('completed', 'draw')
+        assert store.accuracy['EPL']['total'] == 2
+
+        assert not writer.update_prediction_result('EPL', 'derby', 'draw', False, date='2025-11-03')
+        assert not writer.update_prediction_result('EPL', 'unknown', 'draw', False)
+
+        reopened = MidnightSpecialStore(tmp_path / "midnight_special_data")
+        assert reopened.find_prediction('EPL', 'derby', '2025-10-27')['correct'] is True
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+📸 POLYMARKET SNAPSHOT TESTS 📸
+Agent Poly Loly Double Zero: one indexed market listing for every D0 lookup
+
+COVERAGE:
+- Paginated Sports-category fetch and team-token / date index lookups
+- ETag revalidation (304 pages reuse the cached events, no rebuild)
+- Cold start from the persisted snapshot without touching the network
+- D0 per-game lookups are index hits on a single shared listing
+"""
+
+import hashlib
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from real_agents.polymarket_snapshot import PolymarketSnapshot, normalize_text, team_patterns
+
+def _event(event_id, title, start_date="2025-10-20T19:00:00Z", prices='["0.62", "0.38"]', volume=25000,
+           category="Sports"):
+    return {'id': event_id, 'title': title, 'description': '', 'startDate': start_date, 'endDate': start_date,
+            'active': True, 'closed': False, 'volume': volume, 'liquidity': volume / 2, 'category': category,
+            'markets': [{'outcomePrices': prices}]}
+
+def _events():
+    events = [_event(f"filler_{i}", f"Will club {i} win the title?", start_date="2025-11-05T00:00:00Z")
+              for i in range(230)]
+    events[40] = _event("clasico", "Real Madrid vs FC Barcelona: who will win?")
+    events[150] = _event("atleti", "Atlético Madrid vs Sevilla", start_date="2025-10-21T18:00:00Z")
+    events[151] = _event("atleti_cup", "Atlético Madrid vs Sevilla (Copa)", start_date="2025-12-02T18:00:00Z")
+    events[220] = _event("lakers", "Lakers beat Celtics?", prices='["0.55", "0.45"]')
+    # Politics markets mentioning club names; this fake API ignores ?category= like the real one sometimes does
+    events += [_event(f"politics_{i}", f"Will Madrid's mayor visit Barcelona? ({i})", volume=9_000_000,
+                      category="Politics") for i in range(20)]
+    return events
+
+class FakeGammaAPI:
+    """🌐 Local /events endpoint with limit/offset pagination and ETags"""
+
+    def __init__(self, events):
+        self.events = events
+        self.requests = []
+        self.categories = []
+        self.server = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/events', self._events)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        return str(self.server.make_url('')).rstrip('/')
+
+    async def close(self):
+        if not self.server.closed:
+            await self.server.close()
+
+    async def _events(self, request):
+        offset = int(request.query['offset'])
+        page = self.events[offset:offset + int(request.query['limit'])]
+        body = json.dumps(page)
+        etag = '"' + hashlib.sha256(body.encode()).hexdigest()[:16] + '"'
+        self.requests.append((offset, request.headers.get('If-None-Match')))
+        self.categories.append(request.query.get('category'))
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        return web.Response(text=body, content_type='application/json', headers={'ETag': etag})
+
+@asynccontextmanager
+async def _gamma_api():
+    api = FakeGammaAPI(_events())
+    api.base_url = await api.start()
+    try:
+        yield api
+    finally:
+        await api.close()
+
+def _snapshot(api, tmp_path, **kwargs):
+    return PolymarketSnapshot(base_url=api.base_url, snapshot_path=tmp_path / "snapshot.json",
+                              page_size=100, **kwargs)
+
+class TestNormalization:
+    """🔤 Test team name normalization"""
+
+    def test_patterns(self):
+        """🏷️ Accents/punctuation stripped, generic club words dropped, aliases added"""
+        assert normalize_text("Atlético-Madrid") == "atletico madrid"
+        assert team_patterns("FC Barcelona") == ["fc barcelona", "barcelona", "barca"]
+        assert team_patterns("Paris Saint-Germain") == ["paris saint germain", "germain", "paris", "psg"]
+
+class TestPolymarketSnapshot:
+    """📸 Test fetching, indexing and persistence"""
+
+    @pytest.mark.asyncio
+    async def test_paginated_fetch_and_lookup(self, tmp_path):
+        """🔍 One paginated listing; lookups are index hits, both-team matches first"""
+        async with _gamma_api() as gamma_api:
+            snapshot = _snapshot(gamma_api, tmp_path)
+
+            events = await snapshot.find_events("Real Madrid", "FC Barcelona")
+            assert [offset for offset, _ in gamma_api.requests] == [0, 100, 200]
+            assert events[0]['id'] == "clasico"
+
+            await snapshot.find_events("Los Angeles Lakers", "Boston Celtics")
+            assert len(gamma_api.requests) == 3  # served from the index
+            assert set(gamma_api.categories) == {"Sports"}
+            assert snapshot.get_stats()['events'] == 230  # politics markets dropped
+            assert not any(event['id'].startswith("politics") for event in events)
+            assert snapshot.market_statistics()['avg_volume'] == pytest.approx(25000)
+
+            dated = await snapshot.find_events("Atletico Madrid", "Sevilla", game_date="2025-10-22")
+            assert [event['id'] for event in dated] == ["atleti"]
+            undated = await snapshot.find_events("Atletico Madrid", "Sevilla", game_date="2026-03-01")
+            assert {event['id'] for event in undated[:2]} == {"atleti", "atleti_cup"}
+
+    @pytest.mark.asyncio
+    async def test_etag_revalidation(self, tmp_path):
+        """🏷️ Unchanged pages come back 304 and the index is not rebuilt"""
+        async with _gamma_api() as gamma_api:
+            snapshot = _snapshot(gamma_api, tmp_path)
+            assert await snapshot.refresh()
+            assert await snapshot.refresh()
+
+            assert all(etag is not None for _, etag in gamma_api.requests[3:])
+            assert snapshot.stats['pages_not_modified'] == 3
+            assert snapshot.stats['rebuilds'] == 1
+
+            gamma_api.events[10] = _event("derby", "Arsenal vs Tottenham")
+            assert await snapshot.refresh()
+            assert snapshot.stats['rebuilds'] == 2
+            assert (await snapshot.find_events("Arsenal", "Tottenham"))[0]['id'] == "derby"
+
+    @pytest.mark.asyncio
+    async def test_cold_start_from_disk(self, tmp_path):
+        """💾 A fresh process serves lookups from the persisted snapshot"""
+        async with _gamma_api() as gamma_api:
+            await _snapshot(gamma_api, tmp_path).refresh()
+            await gamma_api.close()
+
+            cold = _snapshot(gamma_api, tmp_path)
+            events = await cold.find_events("Real Madrid", "FC Barcelona")
+            assert events[0]['id'] == "clasico"
+            assert cold.stats['disk_loads'] == 1 and cold.stats['refreshes'] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_serving(self, tmp_path):
+        """🛟 A failing refresh keeps the cached events and backs off"""
+        async with _gamma_api() as gamma_api:
+            snapshot = _snapshot(gamma_api, tmp_path, refresh_interval=0)
+            await snapshot.refresh()
+            await gamma_api.close()
+
+            assert not await snapshot.refresh()
+            assert snapshot.stats['refresh_failures'] == 1
+            assert (await snapshot.find_events("Real Madrid", "FC Barcelona"))[0]['id'] == "clasico"
+            assert snapshot.stats['refresh_failures'] == 1  # retry interval not yet elapsed
+
+class TestD0Lookups:
+    """🎯 Test D0PolymarketMCP on top of the snapshot"""
+
+    @pytest.mark.asyncio
+    async def test_slate_uses_one_listing(self, tmp_path):
+        """📊 A slate of games costs one listing; odds keep their home/away order"""
+        from real_agents.d0_polymarket_mcp import D0PolymarketMCP
+
+        async with _gamma_api() as gamma_api:
+            mcp = D0PolymarketMCP()
+            mcp.market_snapshot = _snapshot(gamma_api, tmp_path)
+
+            clasico = await mcp._fetch_real_polymarket_data("Real Madrid", "FC Barcelona", "SOCCER", "UEFA")
+            reversed_clasico = await mcp._fetch_real_polymarket_data("FC Barcelona", "Real Madrid", "SOCCER", "UEFA")
+            lakers = await mcp._fetch_real_polymarket_data("Los Angeles Lakers", "Boston Celtics", "BASKETBALL", "NBA")
+            unknown = await mcp._fetch_real_polymarket_data("Nowhere FC", "Atlantis United", "SOCCER", "MLS")
+
+            assert len(gamma_api.requests) == 3
+            assert (clasico.event_id, clasico.home_odds, clasico.away_odds) == ("clasico", 0.62, 0.38)
+            assert (reversed_clasico.home_odds, reversed_clasico.away_odds) == (0.38, 0.62)
+            assert (lakers.event_id, lakers.home_odds) == ("lakers", 0.55)
+            assert unknown.event_id.startswith("poly_real_")  # calibrated from snapshot statistics
+
+    @pytest.mark.asyncio
+    async def test_engine_passes_game_date(self, monkeypatch):
+        """📅 analyze_game hands the game's date to D0 so dated events win"""
+        import real_agents.d0_polymarket_mcp as d0
+        from real_agents.universal_prediction_engine import UniversalPredictionEngine
+
+        seen = []
+
+        async def fake_fetch(home_team, away_team, sport, league, game_date=None):
+            seen.append(game_date)
+            return {'success': False}
+
+        async def constant(*args, **kwargs):
+            return 60
+
+        monkeypatch.setattr(d0, 'fetch_d0_polymarket_data', fake_fetch)
+        engine = UniversalPredictionEngine()
+        for name in ('_calculate_historical_matchups', '_calculate_weather_venue', '_calculate_sentiment',
+                     '_calculate_market_efficiency', '_calculate_team_performance_d5_mcp',
+                     '_calculate_key_players_d6_mcp', '_calculate_x_factor_d7_mcp'):
+            monkeypatch.setattr(engine, name, constant)
+
+        await engine.analyze_game({'home_team': "Real Madrid", 'away_team': "FC Barcelona",
+                                   'date': "2025-10-26"}, "UEFA")
+        assert seen == ["2025-10-26"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+🎯 UNIVERSAL PREDICTION ENGINE TESTS 🎯
+Agent Poly Loly Double Zero: concurrent D0-D7 evaluation
+
+COVERAGE:
+- The eight dimensions run concurrently
+- A crashing or hung dimension falls back; the other seven keep their values
+- Slate batches honour the concurrency bound and return results in input order
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from real_agents.universal_prediction_engine import UniversalPredictionEngine
+
+CALCULATORS = {
+    'd0_polymarket': '_calculate_polymarket_odds_d0_mcp',
+    'd1_historical': '_calculate_historical_matchups',
+    'd2_weather_venue': '_calculate_weather_venue',
+    'd3_sentiment': '_calculate_sentiment',
+    'd4_market_efficiency': '_calculate_market_efficiency',
+    'd5_team_performance': '_calculate_team_performance_d5_mcp',
+    'd6_key_players': '_calculate_key_players_d6_mcp',
+    'd7_x_factor': '_calculate_x_factor_d7_mcp',
+}
+
+def _stub(value, delay=0.05):
+    async def calculator(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return value
+    return calculator
+
+async def _crash(*args, **kwargs):
+    raise RuntimeError("MCP offline")
+
+def _stub_engine(monkeypatch, engine, overrides=None):
+    """🔧 Every dimension returns 60 + its index after 50ms unless overridden"""
+    for index, (name, method) in enumerate(CALCULATORS.items()):
+        monkeypatch.setattr(engine, method, (overrides or {}).get(name, _stub(60 + index)))
+
+GAME = {'home_team': "Real Madrid", 'away_team': "FC Barcelona", 'date': "2025-10-26"}
+
+class TestDimensionScheduling:
+    """⚡ Test _schedule_8d_dimensions / analyze_game"""
+
+    @pytest.mark.asyncio
+    async def test_dimensions_run_concurrently(self, monkeypatch):
+        """⏱️ Eight 50ms dimensions take about 50ms, not 400ms"""
+        engine = UniversalPredictionEngine()
+        _stub_engine(monkeypatch, engine)
+
+        started = time.perf_counter()
+        result = await engine.analyze_game(GAME, "UEFA")
+        assert time.perf_counter() - started < 0.3
+        assert result['dimension_fallbacks'] == []
+        assert set(result['dimension_latency_ms']) == set(CALCULATORS)
+
+    @pytest.mark.asyncio
+    async def test_failing_and_slow_dimensions_fall_back(self, monkeypatch):
+        """🛡️ A crash and a hang cost only their own dimension; the other seven keep their values"""
+        engine = UniversalPredictionEngine(dimension_timeout=0.2)
+        _stub_engine(monkeypatch, engine, {'d1_historical': _crash, 'd6_key_players': _stub(99, delay=10)})
+        config = {'team_performance_range': (40, 80), 'key_players_range': (40, 80)}
+
+        started = time.perf_counter()
+        values, latency_ms, fallbacks = await engine._schedule_8d_dimensions(
+            "Real Madrid", "FC Barcelona", "UEFA", config)
+        assert time.perf_counter() - started < 1.0
+
+        assert fallbacks == ['d1_historical', 'd6_key_players']
+        assert values['d1_historical'] == engine._calculate_historical_fallback("Real Madrid", "FC Barcelona", "UEFA", config)
+        assert values['d6_key_players'] == engine._calculate_key_players_fallback("Real Madrid", "FC Barcelona", "UEFA", config)
+        for index, name in enumerate(CALCULATORS):
+            if name not in fallbacks:
+                assert values[name] == 60 + index, name
+        assert latency_ms['d6_key_players'] >= 200
+
+        result = await engine.analyze_game(GAME, "UEFA")
+        assert result['dimension_fallbacks'] == ['d1_historical', 'd6_key_players']
+        assert result['status'] != 'error'
+
+class TestSlateBatches:
+    """📋 Test analyze_games_batch / analyze_games_stream"""
+
+    @staticmethod
+    def _stub_analyze(monkeypatch, engine):
+        """🔧 Later games finish first; game 'boom' raises; tracks games in flight"""
+        tracker = {'active': 0, 'peak': 0}
+
+        async def analyze_game(game_data, league_id):
+            tracker['active'] += 1
+            tracker['peak'] = max(tracker['peak'], tracker['active'])
+            try:
+                await asyncio.sleep(0.01 * (10 - game_data['n']))
+                if game_data.get('boom'):
+                    raise RuntimeError("boom")
+                return {'id': f"game_{game_data['n']}", 'home_team': game_data['home_team']}
+            finally:
+                tracker['active'] -= 1
+
+        monkeypatch.setattr(engine, 'analyze_game', analyze_game)
+        return tracker
+
+    @staticmethod
+    def _slate(size=10):
+        return [{'n': n, 'home_team': f"Home {n}", 'away_team': f"Away {n}", 'boom': n == 4} for n in range(size)]
+
+    @pytest.mark.asyncio
+    async def test_bound_and_input_order(self, monkeypatch):
+        """🚦 At most max_concurrency games at once; output order matches the input"""
+        engine = UniversalPredictionEngine(max_concurrent_games=3)
+        tracker = self._stub_analyze(monkeypatch, engine)
+
+        results = await engine.analyze_games_batch(self._slate(), "UEFA")
+        assert tracker['peak'] == 3
+        assert [r['home_team'] for r in results] == [f"Home {n}" for n in range(10)]
+        assert results[4]['status'] == 'error' and results[5]['id'] == "game_5"
+        assert all(r['analysis_ms'] >= 0 for r in results)
+
+        results = await engine.analyze_games_batch(self._slate(), "UEFA", max_concurrency=5)
+        assert tracker['peak'] == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_in_completion_order(self, monkeypatch):
+        """🌊 The stream yields (input index, game) as games finish"""
+        engine = UniversalPredictionEngine()
+        self._stub_analyze(monkeypatch, engine)
+
+        order = [index async for index, _ in engine.analyze_games_stream(self._slate(4), "UEFA", max_concurrency=4)]
+        assert order == [3, 2, 1, 0]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
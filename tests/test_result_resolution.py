@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+🏁 RESULT RESOLUTION SERVICE TESTS 🏁
+Agent Poly Loly Double Zero: one scoreboard per league-day
+
+COVERAGE:
+- Scoreboard day keys follow the event's local date, not the UTC date
+- A slate of games costs one scoreboard request per (league, day)
+- Event id, team pair and alias matches against recorded scoreboards
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import real_agents.result_resolution_service as resolution
+from real_agents.result_resolution_service import ResultResolutionService
+
+def _competitor(name, home_away, score):
+    return {'homeAway': home_away, 'score': str(score), 'team': {'displayName': name}}
+
+def _event(event_id, date, home, away, home_score, away_score, completed=True):
+    return {
+        'id': event_id, 'date': date,
+        'status': {'type': {'completed': completed, 'name': 'STATUS_FINAL' if completed else 'STATUS_SCHEDULED'}},
+        'competitions': [{'competitors': [_competitor(home, 'home', home_score),
+                                          _competitor(away, 'away', away_score)]}],
+    }
+
+# Scoreboards as ESPN served them, keyed by the request URL's league path and date
+RECORDED_SCOREBOARDS = {
+    ('eng.1', '20251020'): {'events': [
+        _event('740001', '2025-10-20T19:00Z', 'Manchester City', 'Arsenal', 2, 1),
+        _event('740002', '2025-10-20T19:00Z', 'Liverpool', 'Chelsea', 1, 1),
+    ]},
+    ('usa.1', '20251020'): {'events': [
+        # 20:30 Eastern on the 20th - the UTC timestamp is already the 21st
+        _event('710001', '2025-10-21T00:30Z', 'Inter Miami CF', 'LAFC', 0, 3),
+        _event('710002', '2025-10-21T02:30Z', 'Seattle Sounders FC', 'Portland Timbers', 1, 0, completed=False),
+    ]},
+}
+
+class RecordedESPN:
+    """📼 Serves RECORDED_SCOREBOARDS in place of fetch_cached_json, counting requests"""
+
+    def __init__(self):
+        self.requests = []
+
+    async def fetch_cached_json(self, url, **kwargs):
+        self.requests.append(url)
+        league = url.split('/scoreboard')[0].rsplit('/', 1)[1]
+        return RECORDED_SCOREBOARDS.get((league, url.split('dates=')[1]))
+
+@pytest.fixture
+def espn(monkeypatch):
+    recorded = RecordedESPN()
+    monkeypatch.setattr(resolution, 'fetch_cached_json', recorded.fetch_cached_json)
+    return recorded
+
+class TestDateKeys:
+    """📅 Test scoreboard day keys"""
+
+    def test_event_local_date(self):
+        """🌙 Evening kickoffs stored in UTC stay on their local scoreboard day"""
+        date_key = ResultResolutionService._date_key
+        assert date_key('2025-10-21T00:30Z', '2025-10-19') == '20251020'
+        assert date_key('2025-10-21T02:30:00+00:00', '2025-10-19') == '20251020'
+        assert date_key('2025-10-20T19:00Z', '2025-10-19') == '20251020'
+        assert date_key('2025-10-20T21:30', '2025-10-19') == '20251020'  # naive: already local
+        assert date_key('2025-10-20', '2025-10-19') == '20251020'
+        assert date_key(None, '2025-10-19') == date_key('not a date', '2025-10-19') == '20251019'
+
+class TestResolveGames:
+    """🎯 Test batch resolution against recorded scoreboards"""
+
+    @pytest.mark.asyncio
+    async def test_one_scoreboard_per_league_day(self, espn):
+        """📡 Four games in two league-days cost two requests; late UTC kickoffs still match"""
+        games = [
+            {'league': 'EPL', 'home_team': 'Man City', 'away_team': 'Arsenal', 'game_time': '2025-10-20T19:00Z'},
+            {'league': 'EPL', 'home_team': 'Liverpool', 'away_team': 'Chelsea', 'game_date': '2025-10-20'},
+            {'league': 'MLS', 'home_team': 'Inter Miami', 'away_team': 'LAFC', 'game_time': '2025-10-21T00:30Z'},
+            {'league': 'MLS', 'home_team': 'Seattle Sounders FC', 'away_team': 'Portland Timbers',
+             'game_time': '2025-10-21T02:30Z'},
+        ]
+        service = ResultResolutionService(api_base='https://espn.test')
+        matches = await service.resolve_games(games, default_date='2025-10-19')
+
+        assert sorted(espn.requests) == ['https://espn.test/soccer/eng.1/scoreboard?dates=20251020',
+                                         'https://espn.test/soccer/usa.1/scoreboard?dates=20251020']
+        by_home = {game['home_team']: event for game, event in matches}
+        assert by_home['Man City'].event_id == '740001' and by_home['Man City'].result == 'home_win'
+        assert by_home['Liverpool'].result == 'draw'
+        assert by_home['Inter Miami'].winner == 'LAFC'
+        assert not by_home['Seattle Sounders FC'].completed
+        assert service.get_stats()['scoreboards_fetched'] == 2 and service.get_stats()['games_matched'] == 4
+
+    @pytest.mark.asyncio
+    async def test_event_id_and_missing_scoreboards(self, espn):
+        """🔍 Event ids win over names; unknown days and leagues stay unmatched"""
+        games = [
+            {'league': 'EPL', 'home_team': 'Somebody', 'away_team': 'Else', 'espn_event_id': 740002,
+             'game_date': '2025-10-20'},
+            {'league': 'EPL', 'home_team': 'Manchester City', 'away_team': 'Arsenal', 'game_date': '2025-10-21'},
+            {'league': 'CRICKET', 'home_team': 'A', 'away_team': 'B'},
+        ]
+        service = ResultResolutionService(api_base='https://espn.test')
+        matches = await service.resolve_games(games, default_date='2025-10-20')
+
+        assert [(game['home_team'], event.home_team) for game, event in matches] == [('Somebody', 'Liverpool')]
+        assert len(espn.requests) == 2
+        assert service.get_stats()['scoreboards_failed'] == 1 and service.get_stats()['games_unmatched'] == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+🗂️ SLATE CACHE TESTS 🗂️
+Agent Poly Loly Double Zero: analyzed league slates for /api/games
+
+COVERAGE:
+- Fresh hits, stale-while-revalidate and hard expiry past max_stale_seconds
+- Single-flight loads; empty slates are never cached
+- Invalidation of one league or every league, including loads already in flight
+- LRU eviction against the memory budget
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from real_agents.slate_cache import SlateCache, estimate_size
+
+class SlateLoader:
+    """🎯 Stands in for the fetch + 8D analysis pipeline, counting runs"""
+
+    def __init__(self, league, delay=0.01):
+        self.league = league
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        version = self.calls
+        await asyncio.sleep(self.delay)
+        return [{'league': self.league, 'version': version}]
+
+class TestExpiry:
+    """⏱️ Test TTL, stale serving and hard expiry"""
+
+    @pytest.mark.asyncio
+    async def test_fresh_then_stale_then_expired(self):
+        """🔄 Fresh → cached; stale → cached + background refresh; too old → wait for a new load"""
+        cache = SlateCache(max_stale_seconds=0.1)
+        loader = SlateLoader('EPL')
+
+        assert (await cache.get_or_load('EPL', loader, ttl=0.05))[0]['version'] == 1
+        assert (await cache.get_or_load('EPL', loader, ttl=0.05))[0]['version'] == 1
+        assert loader.calls == 1 and cache.stats['hits'] == 1
+
+        await asyncio.sleep(0.06)
+        stale = await cache.get_or_load('EPL', loader, ttl=0.05)
+        assert stale[0]['version'] == 1  # served immediately
+        assert cache.stats['stale_hits'] == 1 and cache.stats['refreshes'] == 1
+        await asyncio.sleep(0.03)
+        assert cache.peek('EPL')[0]['version'] == 2  # refreshed in the background
+
+        await asyncio.sleep(0.2)  # past ttl + max_stale_seconds
+        expired = await cache.get_or_load('EPL', loader, ttl=0.05)
+        assert expired[0]['version'] == 3 and cache.stats['misses'] == 2
+
+    @pytest.mark.asyncio
+    async def test_single_flight_and_empty_slates(self):
+        """🔗 Concurrent misses share one load; empty results are returned but not cached"""
+        cache = SlateCache()
+        loader = SlateLoader('NBA', delay=0.05)
+        results = await asyncio.gather(*(cache.get_or_load('NBA', loader) for _ in range(5)))
+        assert loader.calls == 1 and all(r == results[0] for r in results)
+        assert cache.stats['misses'] == 1 and cache.stats['coalesced'] == 4
+
+        async def empty():
+            return []
+
+        assert await cache.get_or_load('MLS', empty) == []
+        assert cache.peek('MLS') is None
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_slate(self):
+        """🛟 A failing refresh keeps serving the cached slate; a failing cold load raises"""
+        cache = SlateCache()
+        await cache.get_or_load('EPL', SlateLoader('EPL'), ttl=0)
+
+        async def broken():
+            raise RuntimeError("ESPN down")
+
+        await asyncio.sleep(0.01)
+        assert (await cache.get_or_load('EPL', broken, ttl=0))[0]['league'] == 'EPL'
+        await asyncio.sleep(0.01)
+        assert cache.peek('EPL')[0]['version'] == 1
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load('NFL', broken)
+
+class TestInvalidation:
+    """🧹 Test invalidation and eviction"""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_one_and_all(self):
+        """🧹 Invalidated leagues reload on the next request; others stay cached"""
+        cache = SlateCache()
+        loaders = {league: SlateLoader(league) for league in ('EPL', 'NBA', 'MLS')}
+        for league, loader in loaders.items():
+            await cache.get_or_load(league, loader)
+
+        assert cache.invalidate('EPL') == 1
+        assert cache.invalidate('EPL') == 0
+        await cache.get_or_load('EPL', loaders['EPL'])
+        await cache.get_or_load('NBA', loaders['NBA'])
+        assert (loaders['EPL'].calls, loaders['NBA'].calls) == (2, 1)
+
+        assert cache.invalidate() == 3
+        assert cache.get_stats()['entries'] == 0 and cache.total_bytes == 0
+        assert cache.stats['invalidations'] == 4
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_load(self):
+        """🚫 A load started before invalidate() never stores its old slate; the next request reloads"""
+        for key in ('EPL', None):
+            cache = SlateCache()
+            loader = SlateLoader('EPL', delay=0.05)
+
+            old_load = asyncio.ensure_future(cache.get_or_load('EPL', loader))
+            await asyncio.sleep(0.01)
+            cache.invalidate(key)
+            fresh = await cache.get_or_load('EPL', loader)
+
+            assert (await old_load)[0]['version'] == 1  # its caller still gets an answer
+            assert fresh[0]['version'] == 2 and loader.calls == 2
+            assert cache.peek('EPL')[0]['version'] == 2
+            assert cache.get_stats()['refreshing'] == []
+
+    @pytest.mark.asyncio
+    async def test_lru_memory_budget(self):
+        """📏 Least recently used slates are evicted once the budget is exceeded"""
+        size = estimate_size([{'league': 'EPL', 'version': 1}])
+        cache = SlateCache(max_bytes=size * 2)
+        for league in ('EPL', 'NBA'):
+            await cache.get_or_load(league, SlateLoader(league))
+        await cache.get_or_load('EPL', SlateLoader('EPL'))  # EPL is now most recent
+        await cache.get_or_load('MLS', SlateLoader('MLS'))
+
+        assert cache.peek('NBA') is None
+        assert cache.peek('EPL') is not None and cache.peek('MLS') is not None
+        assert cache.stats['evictions'] == 1 and cache.total_bytes <= cache.max_bytes
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+🔥💀 SLATE SCORING PARITY TESTS 💀🔥
+Agent Poly Loly Double Zero: batch (NumPy) scoring must equal the per-game path
+
+COVERAGE:
+- FactorModel weights, bonus rules and cap
+- Batch confidence calibration vs calibrate_confidence
+- score_slate vs apply_real_*_algorithm for MLS, Ligue 1 and Bundesliga
+- Distinct-matchup deduplication
+"""
+
+import logging
+
+import numpy as np
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from real_agents.slate_scoring import BonusRule, FactorModel, Slate
+from confidence_calibration_system import ConfidenceCalibrationSystem
+from mls_real_algorithm import RealMLSAlgorithm
+from ligue1_real_algorithm import RealLigue1Algorithm
+from bundesliga_real_algorithm import RealBundesligaAlgorithm
+
+logging.getLogger().setLevel(logging.WARNING)
+
+MLS_TEAMS = ['LAFC', 'LA Galaxy', 'Inter Miami CF', 'Seattle Sounders FC', 'Portland Timbers',
+             'Vancouver Whitecaps', 'FC Dallas', 'Houston Dynamo', 'Austin FC', 'Atlanta United',
+             'New York City FC', 'Toronto FC', 'CF Montreal', 'Orlando City', 'Real Salt Lake']
+LIGUE1_TEAMS = ['Paris Saint-Germain', 'Marseille', 'Lyon', 'Monaco', 'Lille', 'Nice', 'Rennes',
+                'Lens', 'Nantes', 'Strasbourg']
+BUNDESLIGA_TEAMS = ['Bayern Munich', 'Borussia Dortmund', 'Bayer Leverkusen', 'RB Leipzig',
+                    'Eintracht Frankfurt', 'Union Berlin', 'Freiburg', 'VfB Stuttgart', 'Schalke 04',
+                    'Borussia Monchengladbach', 'FC Koln', 'Augsburg']
+VENUES = ['', 'Signal Iduna Park', 'Allianz Arena', 'Parc des Princes', 'Stade Velodrome', 'BMO Stadium']
+
+def season(teams):
+    """📅 Double round robin plus repeated fixtures (as multi-season back tests have)"""
+    games = []
+    for i, home in enumerate(teams):
+        for j, away in enumerate(teams):
+            if home != away:
+                games.append({'home_team': home, 'away_team': away, 'venue': VENUES[(i + j) % len(VENUES)]})
+    return games + games[:len(games) // 3]
+
+async def assert_parity(algorithm, scalar_method, games):
+    scores = await algorithm.score_slate(games)
+    assert len(scores.predictions) == len(games)
+    for i, game in enumerate(games):
+        expected = await scalar_method(dict(game))
+        assert scores.predictions[i] == expected['prediction'], game
+        assert round(float(scores.confidences[i]), 1) == expected['confidence'], game
+    return scores
+
+class TestFactorModel:
+    """🧮 Test array weights, bonuses and cap"""
+
+    def test_combine_matches_scalar_formula(self):
+        """✅ Weighted sum + bonus + cap equals the hand-written scalar formula"""
+        model = FactorModel(factors=(('a', 0.5), ('b', 0.3), ('c', 0.2)),
+                            bonus_rules=(BonusRule((('a', 90),), 5), BonusRule((('b', 80), ('c', 70)), 3)),
+                            cap=95)
+        rng = np.random.default_rng(7)
+        matrix = rng.uniform(40, 100, size=(500, 3))
+
+        combined = model.combine(matrix)
+        for row, value in zip(matrix, combined):
+            a, b, c = row
+            bonus = (5 if a >= 90 else 0) + (3 if b >= 80 and c >= 70 else 0)
+            assert value == min((a * 0.5) + (b * 0.3) + (c * 0.2) + bonus, 95)
+
+    def test_calibration_array_matches_scalar(self):
+        """🎯 Batch calibration equals calibrate_confidence element by element"""
+        calibrator = ConfidenceCalibrationSystem()
+        raw = np.concatenate([np.linspace(0, 100, 2001), [79.999, 80.0, 89.999, 90.0]])
+        for league in ('MLS', 'LIGUE1', 'UEFA_EUROPA'):
+            batch = calibrator.calibrate_confidence_array(raw, league)
+            scalar = [calibrator.calibrate_confidence(float(value), league)[0] for value in raw]
+            assert np.array_equal(batch, np.array(scalar))
+
+    def test_slate_distinct_games(self):
+        """🔑 Repeated fixtures collapse to one distinct game"""
+        slate = Slate(['A', 'B', 'A', 'A'], ['B', 'A', 'B', 'B'], ['X', 'Y', 'X', 'Z'])
+        games, inverse = slate.distinct_games()
+
+        assert len(games) == 3
+        assert inverse[0] == inverse[2] != inverse[3]
+        for row, distinct in enumerate(inverse):
+            assert games[distinct]['home_team'] == slate.home_team[row]
+            assert games[distinct]['venue'] == slate.venue[row]
+
+class TestSlateParity:
+    """🏎️ score_slate must reproduce apply_real_*_algorithm game by game"""
+
+    @pytest.mark.asyncio
+    async def test_mls_parity(self):
+        algorithm = RealMLSAlgorithm()
+        games = season(MLS_TEAMS)
+        scores = await assert_parity(algorithm, algorithm.apply_real_mls_algorithm, games)
+        assert scores.distinct_games < len(games)
+
+    @pytest.mark.asyncio
+    async def test_ligue1_parity(self):
+        algorithm = RealLigue1Algorithm()
+        await assert_parity(algorithm, algorithm.apply_real_ligue1_algorithm, season(LIGUE1_TEAMS))
+
+    @pytest.mark.asyncio
+    async def test_bundesliga_parity(self):
+        algorithm = RealBundesligaAlgorithm()
+        await assert_parity(algorithm, algorithm.apply_real_bundesliga_algorithm, season(BUNDESLIGA_TEAMS))
+
+    @pytest.mark.asyncio
+    async def test_empty_slate(self):
+        scores = await RealMLSAlgorithm().score_slate([])
+        assert len(scores.predictions) == 0
+        assert scores.confidences.shape == (0,)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+🐝 SWARM INTELLIGENCE TESTS 🐝
+Agent Poly Loly Double Zero: indexed, vectorized task distribution
+
+COVERAGE:
+- Capability index add/remove/slot recycling/growth
+- Batch distribution honours capabilities and spreads load
+- Unregister drops agents from routing; pheromone trails and evaporation
+- CoordinatorAgent best-agent lookup through the index
+- Consensus votes answered by enhanced agents over request/reply
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.autonomous_agent import AgentState
+from core.capability_index import DEFAULT_PHEROMONE, CapabilityIndex
+from core.enhanced_agent import EnhancedAutonomousAgent
+from core.message_bus import AdvancedMessageBus
+from core.swarm_intelligence import SwarmIntelligenceCoordinator
+
+class FakeBus:
+    """📬 Records swarm dispatches"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def publish_to_agent(self, target_agent, event_name, payload):
+        self.sent.append((target_agent, payload['task_id']))
+
+    async def broadcast(self, event_name, payload):
+        pass
+
+class VoterAgent(EnhancedAutonomousAgent):
+    """🗳️ Enhanced agent with a fixed preference"""
+
+    def __init__(self, agent_id, preference=None):
+        super().__init__(agent_id, "Voter")
+        self.preference = preference
+
+    async def _cast_vote(self, decision_id, options):
+        return self.preference if self.preference in options else await super()._cast_vote(decision_id, options)
+
+    async def _agent_behavior(self):
+        pass
+
+    async def _initialize_systems(self):
+        pass
+
+    async def _agent_specific_adaptation(self):
+        pass
+
+class TestCapabilityIndex:
+    """📇 Test the inverted index"""
+
+    def test_candidates_and_recycling(self):
+        """🔍 AND over capability columns; removed rows are reused"""
+        index = CapabilityIndex(initial_capacity=2)
+        index.add("a", {"analysis", "prediction"})
+        index.add("b", {"analysis"})
+        index.add("c", {"prediction"})  # forces growth
+
+        assert index.capacity == 4
+        assert index.candidates({"analysis"}) == ["a", "b"]
+        assert index.candidates({"analysis", "prediction"}) == ["a"]
+        assert index.candidates({"telepathy"}) == []
+        assert index.candidates() == ["a", "b", "c"]
+
+        slot = index.slot_of("a")
+        index.remove("a")
+        assert index.candidates({"prediction"}) == ["c"]
+        index.add("d", {"prediction"})
+        assert index.slot_of("d") == slot
+        assert index.agents_with("analysis") == ["b"]
+
+    def test_pheromone_evaporation(self):
+        """🐜 Trails decay and fall back to the default below the floor"""
+        index = CapabilityIndex()
+        index.add("a")
+        index.deposit("analysis", "a", 0.1)
+        assert index.trails() == {"analysis:a": pytest.approx(0.6)}
+        index.evaporate(rate=0.9, floor=0.1)
+        assert index.trails() == {}
+        assert index.pheromone("analysis")[index.slot_of("a")] == DEFAULT_PHEROMONE
+
+    def test_evaporation_skips_unpicked_agents(self):
+        """🐜 Agents that never received a deposit stay exactly at the default"""
+        index = CapabilityIndex()
+        index.add("picked")
+        index.add("idle")
+        index.deposit("analysis", "picked", 0.5)
+        for _ in range(3):
+            index.evaporate(rate=0.05, floor=0.1)
+
+        column = index.pheromone("analysis")
+        assert column[index.slot_of("idle")] == DEFAULT_PHEROMONE
+        assert column[index.slot_of("picked")] == pytest.approx(1.0 * 0.95 ** 3)
+        assert list(index.trails()) == ["analysis:picked"]
+
+        index.add("picked")  # re-registering resets the row's trail
+        assert index.trails() == {}
+
+class TestSwarmDistribution:
+    """📦 Test batched task distribution"""
+
+    async def _swarm(self):
+        swarm = SwarmIntelligenceCoordinator(FakeBus(), "test_swarm")
+        for i in range(4):
+            await swarm.register_agent(f"analyst_{i}", "AnalyzerAgent", {"analysis"})
+            swarm.update_agent_performance(f"analyst_{i}", 0.9)
+        await swarm.register_agent("predictor_0", "PredictorAgent", {"analysis", "prediction"})
+        swarm.update_agent_performance("predictor_0", 0.9)
+        return swarm
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_capabilities_and_spreads_load(self):
+        """⚖️ Many tasks in one pass, capability-filtered and load-balanced"""
+        np.random.seed(7)
+        swarm = await self._swarm()
+        batch = [{'task_id': f"t{i}", 'task_type': 'analysis', 'payload': {'i': i},
+                  'required_capabilities': {'analysis'}} for i in range(50)]
+        batch.append({'task_id': 'p', 'task_type': 'prediction', 'payload': {},
+                      'required_capabilities': {'prediction'}})
+        batch.append({'task_id': 'x', 'task_type': 'magic', 'payload': {},
+                      'required_capabilities': {'telepathy'}})
+
+        assignments = await swarm.distribute_tasks(batch)
+
+        assert assignments['p'] == 'predictor_0'
+        assert assignments['x'] is None
+        counts = {agent_id: agent.task_count for agent_id, agent in swarm.agents.items()}
+        assert sum(counts.values()) == 51
+        assert min(counts.values()) >= 5  # load factor spreads the batch
+        assert [task_id for _, task_id in swarm.message_bus.sent] == [f"t{i}" for i in range(50)] + ['p']
+        assert len(swarm.active_tasks) == 51
+
+        await swarm.complete_task('p')
+        assert swarm.agents['predictor_0'].task_count == counts['predictor_0'] - 1
+        assert swarm.completed_tasks[-1]['status'] == 'completed'
+
+    @pytest.mark.asyncio
+    async def test_unregister_and_single_task(self):
+        """👋 Unregistered agents stop receiving work"""
+        swarm = await self._swarm()
+        assert await swarm.unregister_agent("predictor_0")
+        assert not await swarm.distribute_task("p", "prediction", {}, {"prediction"})
+        assert await swarm.distribute_task("a", "analysis", {}, {"analysis"})
+        assert swarm.active_tasks["a"]['assigned_agent'].startswith("analyst_")
+        assert swarm.pheromone_trails == {f"analysis:{swarm.active_tasks['a']['assigned_agent']}": pytest.approx(0.6)}
+
+class TestCoordinatorLookup:
+    """🎯 Test CoordinatorAgent best-agent selection"""
+
+    @pytest.mark.asyncio
+    async def test_find_best_agent_uses_index(self):
+        """📢 Announced capabilities feed the index; overloaded agents are skipped"""
+        from agents.coordinator_agent import CoordinatorAgent
+        from core.autonomous_agent import AgentMessage
+
+        coordinator = CoordinatorAgent("coordinator_test")
+        for agent_id, capabilities in (("a1", ["analysis", "pattern_recognition"]),
+                                       ("a2", ["analysis", "pattern_recognition"]),
+                                       ("c1", ["data_collection", "api_access"])):
+            await coordinator._handle_capability_announcement(
+                AgentMessage(agent_id, coordinator.agent_id, "capability_announcement",
+                             {'capabilities': capabilities}))
+
+        coordinator.agent_performance["a2"] = {'success_rate': 0.9, 'avg_completion_time': 10.0}
+        assert await coordinator._find_best_agent_for_task({'task_type': 'sports_analysis'}) == "a2"
+
+        coordinator.agent_workload["a2"] = coordinator.max_agent_workload
+        assert await coordinator._find_best_agent_for_task({'task_type': 'sports_analysis'}) == "a1"
+        assert await coordinator._find_best_agent_for_task({'task_type': 'prediction'}) is None
+
+class TestConsensusVoting:
+    """🗳️ Test consensus_decision against real agents on a real bus"""
+
+    @pytest.mark.asyncio
+    async def test_vote_round_trip(self):
+        """📞 vote_request is answered by the agents' communication loops, not the timeout"""
+        bus = AdvancedMessageBus("vote_test")
+        await bus.start()
+        swarm = SwarmIntelligenceCoordinator(bus, "vote_swarm")
+        voters = [VoterAgent("voter_0", "hold"), VoterAgent("voter_1", "hold"), VoterAgent("voter_2")]
+        loops = []
+        try:
+            for voter in voters:
+                voter.message_bus = bus
+                voter.state = AgentState.RUNNING
+                await voter._register_with_message_bus()
+                await voter._register_event_handlers()
+                await swarm.register_agent(voter.agent_id, voter.agent_type, {"voting"})
+                loops.append(asyncio.create_task(voter._communication_loop()))
+
+            start = time.perf_counter()
+            decision = await swarm.consensus_decision("d1", ["buy", "hold"])
+            assert time.perf_counter() - start < 2.0
+            assert decision == "hold"
+            assert swarm.swarm_metrics['consensus_decisions'] == 1
+            assert bus.stats.replies_matched == 3
+            assert bus.pending_replies == {}
+            assert all(voter.message_stats['sent'] == 1 for voter in voters)
+        finally:
+            for voter in voters:
+                voter.state = AgentState.TERMINATED
+            await asyncio.gather(*loops, return_exceptions=True)
+            await bus.stop()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+🏷️ TEAM CATALOG TESTS 🏷️
+Agent Poly Loly Double Zero: one Aho-Corasick pass for every team lookup
+
+COVERAGE:
+- Longest alias wins ("Real Sociedad" is not Real Madrid)
+- Generic club words never name a club on their own
+- Generic words resolve only where the league makes them unique
+- names_match / strength on top of the same resolution
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from real_agents.team_catalog import TEAM_CATALOG, GENERIC_ALIASES
+
+class TestResolution:
+    """🎯 Test resolve()"""
+
+    def test_specific_aliases(self):
+        """🔍 Full names and specific aliases resolve to the right club"""
+        assert TEAM_CATALOG.resolve("Man City").name == "Manchester City"
+        assert TEAM_CATALOG.resolve("Manchester United FC").name == "Manchester United"
+        assert TEAM_CATALOG.resolve("Real Sociedad").name == "Real Sociedad"
+        assert TEAM_CATALOG.resolve("Atlético Madrid").name == "Atletico Madrid"
+        assert TEAM_CATALOG.resolve("Real Madrid CF").name == "Real Madrid"
+
+    def test_generic_words_do_not_resolve(self):
+        """🚫 Uncatalogued clubs sharing a generic word resolve to nothing"""
+        for name in ("Hull City", "Leeds United", "Real Valladolid", "City", "United"):
+            assert TEAM_CATALOG.resolve(name) is None, name
+        assert {'city', 'real', 'united'} <= GENERIC_ALIASES
+
+    def test_generic_words_in_league_context(self):
+        """🏟️ A generic word counts only when one team of the league owns it"""
+        assert TEAM_CATALOG.resolve("City", league='EPL').name == "Manchester City"
+        assert TEAM_CATALOG.resolve("United", league='EPL') is None  # shared within the EPL
+        assert TEAM_CATALOG.resolve("Real", league='LA_LIGA') is None
+        assert TEAM_CATALOG.resolve("City", league='LA_LIGA') is None
+
+class TestMatching:
+    """⚔️ Test names_match() and strength()"""
+
+    def test_names_match(self):
+        """🤝 Aliases match their club; a shared generic word does not"""
+        assert TEAM_CATALOG.names_match("Man Utd", "Manchester United")
+        assert not TEAM_CATALOG.names_match("Real Betis", "Real Madrid")
+        assert not TEAM_CATALOG.names_match("Hull City", "Manchester City")
+
+    def test_strength(self):
+        """💪 Ratings come from the resolved club, never from a generic word"""
+        assert TEAM_CATALOG.strength("Hull City") is None
+        assert TEAM_CATALOG.strength("City", league='EPL') == TEAM_CATALOG.strength("Manchester City")
+        assert TEAM_CATALOG.strength("Manchester City") is not None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -16,6 +16,8 @@ Integrates all existing sports intelligence from the original Poly Sports Agent:
 import asyncio
 import aiohttp
 import json
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import logging
@@ -203,8 +205,21 @@ except ImportError as e:
 # Import our new Dimension 6
 from dimension_six_key_players import KeyPlayersIntelligence
 
+# 📚 Compiled team catalog (strengths, aliases) shared by every engine
+from real_agents.team_catalog import TEAM_CATALOG
+
 logger = logging.getLogger(__name__)
 
+@dataclass
+class LeagueFetchOutcome:
+    """📋 Per-source record from the league fan-out (status, keys, timing)"""
+    source: str
+    status: str  # ok | empty | timeout | error
+    elapsed_seconds: float
+    league_keys: List[str] = field(default_factory=list)
+    games: int = 0
+    error: Optional[str] = None
+
 class UltimateSportsIntegrator:
     """
     🔥 ULTIMATE SPORTS INTEGRATOR - 7D ENGINE
@@ -218,9 +233,17 @@ class UltimateSportsIntegrator:
     - Dimension 6: Key Players Intelligence (Individual player analysis)
     """
     
-    def __init__(self, polymarket_oracle):
+    # 🚀 League fan-out limits - one slow upstream must not stall the refresh
+    MAX_CONCURRENT_SOURCES = 12
+    SOURCE_TIMEOUT_SECONDS = 20.0
+    
+    def __init__(self, polymarket_oracle, max_concurrent_sources: int = MAX_CONCURRENT_SOURCES,
+                 source_timeout: float = SOURCE_TIMEOUT_SECONDS):
         self.polymarket_oracle = polymarket_oracle
         self.sports_agents = {}
+        self.max_concurrent_sources = max_concurrent_sources
+        self.source_timeout = source_timeout
+        self.last_fetch_outcomes: Dict[str, LeagueFetchOutcome] = {}
         self.initialize_sports_modules()
         
     def initialize_sports_modules(self):
@@ -260,39 +283,44 @@ class UltimateSportsIntegrator:
             })
             
     async def get_all_sports_data_REAL(self) -> Dict[str, List[Dict]]:
-        """🔥 GET ALL SPORTS DATA FROM REAL MCP SERVERS - COMPLETE COVERAGE!"""
-        all_data = {}
+        """🔥 GET ALL SPORTS DATA FROM REAL MCP SERVERS - COMPLETE COVERAGE!
         
+        Each league source fills its own dict and runs concurrently through
+        _fan_out_league_sources; per-source outcomes land in
+        self.last_fetch_outcomes.
+        """
+
         try:
             if REAL_MCP_AVAILABLE:
                 # 🎯 LIVE PROGOL DATA from quinielaposible.com - SPLIT INTO MIDWEEK AND FULLWEEK
-                try:
-                    logger.info("🎯 PROGOL: Attempting LIVE data fetch from quinielaposible.com")
-                    progol_data = await fetch_live_progol_data()
-                    logger.info(f"✅ LIVE PROGOL SUCCESS: {progol_data.get('data_source', 'unknown')} - Challenge {progol_data.get('full_week_challenge', {}).get('challenge_number', 'unknown')}")
-                except Exception as live_error:
-                    logger.warning(f"⚠️ LIVE PROGOL FAILED: {live_error}, falling back to static data")
-                    progol_data = await fetch_real_progol_data()
-                if progol_data and progol_data.get('all_games'):
-                    all_progol_games = progol_data['all_games']
+                async def fetch_progol(all_data):
+                    try:
+                        logger.info("🎯 PROGOL: Attempting LIVE data fetch from quinielaposible.com")
+                        progol_data = await fetch_live_progol_data()
+                        logger.info(f"✅ LIVE PROGOL SUCCESS: {progol_data.get('data_source', 'unknown')} - Challenge {progol_data.get('full_week_challenge', {}).get('challenge_number', 'unknown')}")
+                    except Exception as live_error:
+                        logger.warning(f"⚠️ LIVE PROGOL FAILED: {live_error}, falling back to static data")
+                        progol_data = await fetch_real_progol_data()
+                    if progol_data and progol_data.get('all_games'):
+                        all_progol_games = progol_data['all_games']
                     
-                    # Split PROGOL games: First 9 = MIDWEEK, Next 21 = FULLWEEK
-                    midweek_games = all_progol_games[:9]
-                    fullweek_games = all_progol_games[9:30]
+                        # Split PROGOL games: First 9 = MIDWEEK, Next 21 = FULLWEEK
+                        midweek_games = all_progol_games[:9]
+                        fullweek_games = all_progol_games[9:30]
                     
-                    if midweek_games:
-                        all_data['PROGOL_MIDWEEK'] = midweek_games
-                        logger.info(f"✅ REAL PROGOL MIDWEEK: {len(midweek_games)} games")
+                        if midweek_games:
+                            all_data['PROGOL_MIDWEEK'] = midweek_games
+                            logger.info(f"✅ REAL PROGOL MIDWEEK: {len(midweek_games)} games")
                     
-                    if fullweek_games:
-                        all_data['PROGOL_FULLWEEK'] = fullweek_games  
-                        logger.info(f"✅ REAL PROGOL FULLWEEK: {len(fullweek_games)} games")
+                        if fullweek_games:
+                            all_data['PROGOL_FULLWEEK'] = fullweek_games  
+                            logger.info(f"✅ REAL PROGOL FULLWEEK: {len(fullweek_games)} games")
                         
-                    logger.info(f"✅ TOTAL REAL PROGOL DATA: {len(all_progol_games)} games split into midweek/fullweek")
-                
+                        logger.info(f"✅ TOTAL REAL PROGOL DATA: {len(all_progol_games)} games split into midweek/fullweek")
+
                 # REAL NBA DATA - TRY MULTIPLE SOURCES!
                 # Try Balldontlie first (more reliable for NBA)
-                try:
+                async def fetch_nba_balldontlie(all_data):
                     nba_balldontlie_data = await fetch_real_nba_balldontlie_data()
                     if nba_balldontlie_data and nba_balldontlie_data.get('nba_games'):
                         all_data['NBA'] = nba_balldontlie_data['nba_games']
@@ -303,12 +331,10 @@ class UltimateSportsIntegrator:
                         if nba_data and nba_data.get('nba_games'):
                             all_data['NBA'] = nba_data['nba_games']
                             logger.info(f"✅ REAL NBA DATA (ESPN): {len(nba_data['nba_games'])} games")
-                except Exception as e:
-                    logger.warning(f"NBA data fetch error: {e}")
-                
+
                 # REAL NFL DATA - TRY MULTIPLE SOURCES!
                 # Try Balldontlie first (more reliable for NFL)
-                try:
+                async def fetch_nfl(all_data):
                     nfl_balldontlie_data = await fetch_real_nfl_balldontlie_data()
                     if nfl_balldontlie_data and nfl_balldontlie_data.get('nfl_games'):
                         all_data['NFL'] = nfl_balldontlie_data['nfl_games']
@@ -319,11 +345,9 @@ class UltimateSportsIntegrator:
                         if nfl_data and nfl_data.get('nfl_games'):
                             all_data['NFL'] = nfl_data['nfl_games']
                             logger.info(f"✅ REAL NFL DATA (ESPN): {len(nfl_data['nfl_games'])} games")
-                except Exception as e:
-                    logger.warning(f"NFL data fetch error: {e}")
-                
+
                 # 🏈🎓 REAL CFB DATA - COLLEGE FOOTBALL POWER!
-                try:
+                async def fetch_cfb(all_data):
                     from cfb_team_performance_mcp import fetch_cfb_team_performance_data
                     cfb_data = await fetch_cfb_team_performance_data()
                     if cfb_data:
@@ -335,11 +359,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   CFB GAME: {game.get('away_team')} @ {game.get('home_team')} (Week {game.get('week', 1)})")
                     else:
                         logger.info("ℹ️ CFB: No games today (off-season)")
-                except Exception as e:
-                    logger.warning(f"CFB data fetch error: {e}")
-                
+
                 # 🥊 REAL BOXING DATA - APPLYING CFB PATTERN!
-                try:
+                async def fetch_boxing(all_data):
                     boxing_data = await fetch_boxing_market_efficiency_data()
                     if boxing_data and boxing_data.get('boxing_games'):
                         boxing_games = boxing_data['boxing_games']
@@ -351,11 +373,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   BOXING FIGHT: {fight.get('away_team')} vs {fight.get('home_team')} ({fight.get('weight_class', 'Unknown')})")
                     else:
                         logger.info("ℹ️ BOXING: No fights today")
-                except Exception as e:
-                    logger.warning(f"Boxing data fetch error: {e}")
-                
+
                 # 🏆 REAL EUROPA LEAGUE DATA - APPLYING CFB PATTERN!
-                try:
+                async def fetch_europa_league(all_data):
                     europa_data = await fetch_uefa_europa_league_data()
                     if europa_data:
                         all_data['EUROPA_LEAGUE'] = europa_data
@@ -367,11 +387,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   EUROPA MATCH: {match.get('away_team')} @ {match.get('home_team')} ({match.get('round', 'Unknown')})")
                     else:
                         logger.info("ℹ️ EUROPA LEAGUE: No matches today")
-                except Exception as e:
-                    logger.warning(f"Europa League data fetch error: {e}")
-                
+
                 # 🎾 REAL TENNIS DATA - APPLYING CFB FIX WITH ALL KEYS!
-                try:
+                async def fetch_tennis(all_data):
                     from tennis_market_efficiency_mcp import fetch_tennis_market_efficiency_data
                     tennis_data = await fetch_tennis_market_efficiency_data()
                     if tennis_data:
@@ -387,11 +405,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   TENNIS MATCH: {match.get('player1')} vs {match.get('player2')} ({match.get('round')})")
                     else:
                         logger.info("ℹ️ TENNIS: No matches today")
-                except Exception as e:
-                    logger.warning(f"Tennis data fetch error: {e}")
-                
+
                 # 🥊 REAL UFC DATA - APPLYING CFB FIX!
-                try:
+                async def fetch_ufc(all_data):
                     from ufc_market_efficiency_mcp import fetch_ufc_market_efficiency_data
                     ufc_data = await fetch_ufc_market_efficiency_data()
                     if ufc_data:
@@ -402,29 +418,10 @@ class UltimateSportsIntegrator:
                             logger.info(f"   UFC FIGHT: {fight.get('fighter1')} vs {fight.get('fighter2')} ({fight.get('weight_class')})")
                     else:
                         logger.info("ℹ️ UFC: No events today")
-                except Exception as e:
-                    logger.warning(f"UFC data fetch error: {e}")
-                
-                # 🇮🇹 REAL SERIE A DATA - APPLYING CFB FIX!
-                try:
-                    from serie_a_market_efficiency_mcp import fetch_serie_a_market_efficiency_data
-                    serie_a_data = await fetch_serie_a_market_efficiency_data()
-                    if serie_a_data:
-                        all_data['SERIE_A'] = serie_a_data
-                        all_data['ITALIAN_SERIE_A'] = serie_a_data  # 🔥 DUAL NAMING - SERIE_A AND ITALIAN_SERIE_A FOR PANEL COMPATIBILITY!
-                        logger.info(f"✅ REAL SERIE A DATA: {len(serie_a_data)} Italian matches")
-                        for match in serie_a_data[:2]:
-                            logger.info(f"   SERIE A MATCH: {match.get('home_team')} vs {match.get('away_team')} ({match.get('venue')})")
-                    else:
-                        logger.info("ℹ️ SERIE A: No matches today")
-                except Exception as e:
-                    logger.warning(f"Serie A data fetch error: {e}")
-                
-# 🔥 CUSTOM SOCCER LEAGUES MOVED EARLIER - REMOVED DUPLICATES!
-                
+
                 # 🔥 REAL ESPN MLB DATA ONLY - NO MORE CORRUPT SOURCES!
                 # Force use of ESPN API which shows correct today's games
-                try:
+                async def fetch_mlb(all_data):
                     from mlb_real_mcp import RealMLBMCP
                     mlb_mcp = RealMLBMCP()
                     mlb_raw = await mlb_mcp.get_todays_mlb_games()
@@ -436,11 +433,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   MLB GAME: {game.get('away_team')} @ {game.get('home_team')}")
                     else:
                         logger.warning("❌ ESPN MLB MCP returned no games!")
-                except Exception as e:
-                    logger.error(f"❌ ESPN MLB MCP ERROR: {e}")
-                
+
                 # 🇲🇽 REAL LIGA MEXICANA DE BÉISBOL (LMB) DATA - COMPLETE BASEBALL COVERAGE!
-                try:
+                async def fetch_lmb(all_data):
                     from lmb_real_mcp import fetch_lmb_real_data
                     lmb_data = await fetch_lmb_real_data()
                     if lmb_data:
@@ -452,11 +447,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   LMB GAME: {game.get('away_team')} @ {game.get('home_team')} (Confidence: {game.get('confidence', 0.0)})")
                     else:
                         logger.info("ℹ️ LMB: No games today (off-season)")
-                except Exception as e:
-                    logger.warning(f"LMB data fetch error: {e}")
-                
+
                 # 🏀 REAL NBA DATA - MEN'S PROFESSIONAL BASKETBALL!
-                try:
+                async def fetch_nba(all_data):
                     from nba_market_efficiency_mcp import fetch_nba_market_efficiency_data
                     nba_data = await fetch_nba_market_efficiency_data()
                     if nba_data:
@@ -468,11 +461,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   NBA GAME: {game.get('away_team')} @ {game.get('home_team')} (Confidence: {game.get('confidence', 0.0)})")
                     else:
                         logger.info("ℹ️ NBA: No games today (off-season)")
-                except Exception as e:
-                    logger.warning(f"NBA data fetch error: {e}")
-                
+
                 # 🏀 REAL WNBA DATA - WOMEN'S BASKETBALL ESPN API!
-                try:
+                async def fetch_wnba(all_data):
                     wnba_data = await fetch_real_wnba_data()
                     if wnba_data and wnba_data.get('success') and wnba_data.get('games'):
                         all_data['WNBA'] = wnba_data['games']
@@ -482,11 +473,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   WNBA GAME: {game.get('away_team')} @ {game.get('home_team')} ({game.get('venue')})")
                     else:
                         logger.info("ℹ️ WNBA: No games today (off-season)")
-                except Exception as e:
-                    logger.error(f"❌ WNBA MCP ERROR: {e}")
-                
+
                 # 🏒 REAL NHL DATA - APPLYING CFB PATTERN!
-                try:
+                async def fetch_nhl(all_data):
                     from nhl_market_efficiency_mcp import fetch_nhl_market_efficiency_data
                     nhl_data = await fetch_nhl_market_efficiency_data()
                     if nhl_data:
@@ -498,15 +487,12 @@ class UltimateSportsIntegrator:
                             logger.info(f"   NHL GAME: {game.get('away_team')} @ {game.get('home_team')} (Confidence: {game.get('confidence', 0.0)})")
                     else:
                         logger.info("ℹ️ NHL: No games today (off-season)")
-                except Exception as e:
-                    logger.warning(f"NHL data fetch error: {e}")
-                
+
                 # 🔥 CUSTOM SOCCER LEAGUES FIRST - HIGHER PRECEDENCE THAN COMPREHENSIVE!
                 # Load our custom EPL, La Liga, Serie A, etc. BEFORE comprehensive soccer
                 # so they don't get overwritten with 0 games!
-                
                 # ⚽ REAL EPL DATA - APPLYING CFB FIX!
-                try:
+                async def fetch_epl(all_data):
                     from epl_transfer_market_mcp import fetch_epl_transfer_market_data
                     epl_data = await fetch_epl_transfer_market_data()
                     if epl_data:
@@ -518,11 +504,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   EPL MATCH: {match.get('home_team')} vs {match.get('away_team')} ({match.get('venue')})")
                     else:
                         logger.info("ℹ️ EPL: No matches today")
-                except Exception as e:
-                    logger.warning(f"EPL data fetch error: {e}")
-                
+
                 # 🇪🇸 REAL LA LIGA DATA - WORKING ESPN FETCHER!
-                try:
+                async def fetch_la_liga(all_data):
                     la_liga_data = await fetch_real_la_liga_games()
                     if la_liga_data:
                         all_data['LALIGA'] = la_liga_data  # 🔥 CORRECT KEY - Frontend expects LALIGA not LA_LIGA!
@@ -534,11 +518,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   LA LIGA MATCH: {match.get('home_team')} vs {match.get('away_team')} ({match.get('venue')})")
                     else:
                         logger.info("ℹ️ LA LIGA: No matches today")
-                except Exception as e:
-                    logger.warning(f"La Liga data fetch error: {e}")
-                
+
                 # 🇮🇹 REAL SERIE A DATA - APPLYING CFB FIX!
-                try:
+                async def fetch_serie_a(all_data):
                     from serie_a_market_efficiency_mcp import fetch_serie_a_market_efficiency_data
                     serie_a_data = await fetch_serie_a_market_efficiency_data()
                     if serie_a_data:
@@ -549,11 +531,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   SERIE A MATCH: {match.get('home_team')} vs {match.get('away_team')} ({match.get('venue')})")
                     else:
                         logger.info("ℹ️ SERIE A: No matches today")
-                except Exception as e:
-                    logger.warning(f"Serie A data fetch error: {e}")
-                
+
                 # 🇩🇪 REAL BUNDESLIGA DATA - APPLYING CFB FIX!
-                try:
+                async def fetch_bundesliga(all_data):
                     from bundesliga_market_efficiency_mcp import fetch_bundesliga_market_efficiency_data
                     bundesliga_data = await fetch_bundesliga_market_efficiency_data()
                     if bundesliga_data:
@@ -564,11 +544,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   BUNDESLIGA MATCH: {match.get('home_team')} vs {match.get('away_team')} ({match.get('venue')})")
                     else:
                         logger.info("ℹ️ BUNDESLIGA: No matches today")
-                except Exception as e:
-                    logger.warning(f"Bundesliga data fetch error: {e}")
-                
+
                 # 🇫🇷 REAL LIGUE 1 DATA - APPLYING CFB FIX!
-                try:
+                async def fetch_ligue_1(all_data):
                     from ligue_1_le_classique_special_mcp import fetch_ligue_1_le_classique_special_data
                     ligue_1_data = await fetch_ligue_1_le_classique_special_data()
                     if ligue_1_data:
@@ -579,11 +557,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   LIGUE 1 MATCH: {match.get('home_team')} vs {match.get('away_team')} ({match.get('venue')})")
                     else:
                         logger.info("ℹ️ LIGUE 1: No matches today")
-                except Exception as e:
-                    logger.warning(f"Ligue 1 data fetch error: {e}")
-                
+
                 # ⚽🇺🇸 REAL MLS DATA - AMERICAN SOCCER WITH MESSI!
-                try:
+                async def fetch_mls(all_data):
                     from mls_market_efficiency_mcp import fetch_mls_market_efficiency_data
                     mls_data = await fetch_mls_market_efficiency_data()
                     if mls_data:
@@ -595,11 +571,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   MLS GAME: {game.get('away_team')} @ {game.get('home_team')} (Confidence: {game.get('confidence', 0.0)})")
                     else:
                         logger.info("ℹ️ MLS: No games today (off-season)")
-                except Exception as e:
-                    logger.warning(f"MLS data fetch error: {e}")
-                
+
                 # ⚽🇲🇽 REAL LIGA MX DATA - MEXICAN SOCCER POWER!
-                try:
+                async def fetch_liga_mx(all_data):
                     from liga_mx_market_efficiency_mcp import fetch_liga_mx_market_efficiency_data
                     liga_mx_data = await fetch_liga_mx_market_efficiency_data()
                     if liga_mx_data:
@@ -611,11 +585,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   LIGA MX GAME: {game.get('away_team')} @ {game.get('home_team')} (Confidence: {game.get('confidence', 0.0)})")
                     else:
                         logger.info("ℹ️ Liga MX: No games today")
-                except Exception as e:
-                    logger.warning(f"Liga MX data fetch error: {e}")
-                
+
                 # 🏆 REAL CHAMPIONS LEAGUE DATA - ELITE EUROPEAN COMPETITION!
-                try:
+                async def fetch_champions_league(all_data):
                     from uefa_champions_league_market_efficiency_mcp import fetch_uefa_champions_league_market_efficiency_data
                     ucl_data = await fetch_uefa_champions_league_market_efficiency_data()
                     if ucl_data:
@@ -628,11 +600,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"   UCL GAME: {game.get('away_team')} @ {game.get('home_team')} (Confidence: {game.get('confidence', 0.0)})")
                     else:
                         logger.info("ℹ️ Champions League: No games today")
-                except Exception as e:
-                    logger.warning(f"Champions League data fetch error: {e}")
-                
+
                 # 🦁 CAF AFRICAN FOOTBALL - REAL CONFEDERATION DATA!
-                try:
+                async def fetch_caf(all_data):
                     from caf_african_football_mcp import fetch_caf_african_football
                     caf_data = await fetch_caf_african_football()
                     if caf_data and caf_data.get('success'):
@@ -647,11 +617,9 @@ class UltimateSportsIntegrator:
                         if afcon_qualifiers_games:
                             all_data['AFCON_QUALIFIERS'] = afcon_qualifiers_games
                             logger.info(f"✅ AFCON QUALIFIERS: {len(afcon_qualifiers_games)} games")
-                except Exception as e:
-                    logger.warning(f"CAF data fetch error: {e}")
-                
+
                 # 🌍 FIFA FRIENDLIES - REAL INTERNATIONAL GAMES!
-                try:
+                async def fetch_fifa_friendlies(all_data):
                     from fifa_friendlies_mcp import fetch_fifa_friendlies
                     fifa_data = await fetch_fifa_friendlies()
                     if fifa_data and fifa_data.get('success'):
@@ -662,11 +630,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"✅ FIFA FRIENDLIES: {len(fifa_games)} games")
                             for game in fifa_games[:2]:
                                 logger.info(f"   FIFA: {game.get('away_team')} @ {game.get('home_team')}")
-                except Exception as e:
-                    logger.warning(f"FIFA Friendlies data fetch error: {e}")
-                
+
                 # 🏆 UEFA NATIONS LEAGUE - REAL EUROPEAN FOOTBALL!
-                try:
+                async def fetch_uefa_nations_league(all_data):
                     from uefa_nations_league_mcp import fetch_uefa_nations_league
                     uefa_data = await fetch_uefa_nations_league()
                     if uefa_data and uefa_data.get('success'):
@@ -677,11 +643,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"✅ UEFA NATIONS LEAGUE: {len(uefa_games)} games")
                             for game in uefa_games[:2]:
                                 logger.info(f"   UEFA: {game.get('away_team')} @ {game.get('home_team')}")
-                except Exception as e:
-                    logger.warning(f"UEFA Nations League data fetch error: {e}")
-                
+
                 # 🌎 CONCACAF NATIONS LEAGUE - REAL CENTRAL AMERICAN FOOTBALL!
-                try:
+                async def fetch_concacaf_nations_league(all_data):
                     from concacaf_nations_league_mcp import fetch_concacaf_nations_league
                     concacaf_data = await fetch_concacaf_nations_league()
                     if concacaf_data and concacaf_data.get('success'):
@@ -691,12 +655,9 @@ class UltimateSportsIntegrator:
                             logger.info(f"✅ CONCACAF NATIONS LEAGUE: {len(concacaf_games)} games")
                             for game in concacaf_games[:2]:
                                 logger.info(f"   CONCACAF: {game.get('away_team')} @ {game.get('home_team')}")
-                except Exception as e:
-                    logger.warning(f"CONCACAF Nations League data fetch error: {e}")
-                
+
                 # 🏈 LEAGUES CUP - MLS vs Liga MX battles
-                try:
-                    # Leagues Cup - MLS vs Liga MX battles
+                async def fetch_leagues_cup(all_data):
                     leagues_cup_data = await fetch_leagues_cup_data()
                     if leagues_cup_data:
                         all_data['LEAGUES_CUP'] = leagues_cup_data
@@ -704,13 +665,25 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL LEAGUES CUP DATA: {len(leagues_cup_data)} MLS vs Liga MX battles")
                         for match in leagues_cup_data[:2]:  # Only debug first 2 games
                             logger.info(f"    Leagues Cup: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')}")
-                
-                    # 🌍 WORLD CUP QUALIFIERS - ALL 6 REGIONAL CONFEDERATIONS! 🌍
-                    # Collect ALL World Cup Qualifiers from 6 regions
+
+                # 🌍 WORLD CUP QUALIFIERS - ALL 6 REGIONAL CONFEDERATIONS! 🌍
+                # Collect ALL World Cup Qualifiers from 6 regions
+                async def fetch_wc_qualifiers(all_data):
+                    regions = await asyncio.gather(
+                        fetch_asia_wc_qualifiers_data(),
+                        fetch_europe_wc_qualifiers_data(),
+                        fetch_south_america_wc_qualifiers_data(),
+                        fetch_north_america_wc_qualifiers_data(),
+                        fetch_africa_wc_qualifiers_data(),
+                        fetch_oceania_wc_qualifiers_data(),
+                        return_exceptions=True
+                    )
+                    asia_wc_data, europe_wc_data, south_america_wc_data, north_america_wc_data, africa_wc_data, oceania_wc_data = [
+                        None if isinstance(region, Exception) else region for region in regions
+                    ]
                     all_wc_matches = []
-                    
+
                     # Asia WC Qualifiers - Japan vs Australia classic
-                    asia_wc_data = await fetch_asia_wc_qualifiers_data()
                     if asia_wc_data and asia_wc_data.get('matches'):
                         all_data['WC_QUALIFIERS_ASIA'] = asia_wc_data['matches']
                         all_data['ASIA_WC_QUALIFIERS'] = asia_wc_data['matches']  # Alternative naming
@@ -718,7 +691,6 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL ASIA WC QUALIFIERS: {len(asia_wc_data['matches'])} qualification matches")
                 
                     # Europe WC Qualifiers - Italy vs England classic
-                    europe_wc_data = await fetch_europe_wc_qualifiers_data()
                     if europe_wc_data and europe_wc_data.get('matches'):
                         all_data['WC_QUALIFIERS_EUROPE'] = europe_wc_data['matches']
                         all_data['EUROPE_WC_QUALIFIERS'] = europe_wc_data['matches']  # Alternative naming
@@ -726,7 +698,6 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL EUROPE WC QUALIFIERS: {len(europe_wc_data['matches'])} qualification matches")
                 
                     # South America WC Qualifiers - Brazil vs Argentina superclásico
-                    south_america_wc_data = await fetch_south_america_wc_qualifiers_data()
                     if south_america_wc_data and south_america_wc_data.get('matches'):
                         all_data['WC_QUALIFIERS_SOUTH_AMERICA'] = south_america_wc_data['matches']
                         all_data['SOUTH_AMERICA_WC_QUALIFIERS'] = south_america_wc_data['matches']  # Alternative naming
@@ -734,7 +705,6 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL SOUTH AMERICA WC QUALIFIERS: {len(south_america_wc_data['matches'])} qualification matches")
                 
                     # North America WC Qualifiers - USA vs Mexico El Clásico
-                    north_america_wc_data = await fetch_north_america_wc_qualifiers_data()
                     if north_america_wc_data and north_america_wc_data.get('matches'):
                         all_data['WC_QUALIFIERS_NORTH_AMERICA'] = north_america_wc_data['matches']
                         all_data['NORTH_AMERICA_WC_QUALIFIERS'] = north_america_wc_data['matches']  # Alternative naming
@@ -742,7 +712,6 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL NORTH AMERICA WC QUALIFIERS: {len(north_america_wc_data['matches'])} qualification matches")
                 
                     # Africa WC Qualifiers - Nigeria vs Egypt clash
-                    africa_wc_data = await fetch_africa_wc_qualifiers_data()
                     if africa_wc_data and africa_wc_data.get('matches'):
                         all_data['WC_QUALIFIERS_AFRICA'] = africa_wc_data['matches']
                         all_data['AFRICA_WC_QUALIFIERS'] = africa_wc_data['matches']  # Alternative naming
@@ -750,14 +719,20 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL AFRICA WC QUALIFIERS: {len(africa_wc_data['matches'])} qualification matches")
                 
                     # Oceania WC Qualifiers - Australia vs New Zealand Trans-Tasman
-                    oceania_wc_data = await fetch_oceania_wc_qualifiers_data()
                     if oceania_wc_data and oceania_wc_data.get('matches'):
                         all_data['WC_QUALIFIERS_OCEANIA'] = oceania_wc_data['matches']
                         all_data['OCEANIA_WC_QUALIFIERS'] = oceania_wc_data['matches']  # Alternative naming
                         all_wc_matches.extend(oceania_wc_data['matches'])
                         logger.info(f"✅ REAL OCEANIA WC QUALIFIERS: {len(oceania_wc_data['matches'])} qualification matches")
-                
-                    # 🏁 FORMULA 1 RACING - MONACO, SILVERSTONE, MONZA! 🏁
+
+                    # 🔥 COMBINE ALL WORLD CUP QUALIFIERS INTO FRONTEND KEY!
+                    if all_wc_matches:
+                        all_data['WORLD_CUP'] = all_wc_matches  # 🔥 EXACT FRONTEND KEY!
+                        all_data['World Cup Qualifying'] = all_wc_matches  # Alternative naming
+                        logger.info(f"✅ COMBINED WORLD CUP QUALIFIERS: {len(all_wc_matches)} total matches from all 6 confederations!")
+
+                # 🏁 FORMULA 1 RACING - MONACO, SILVERSTONE, MONZA! 🏁
+                async def fetch_f1(all_data):
                     f1_data = await fetch_f1_market_efficiency_data()
                     if f1_data and f1_data.get('matches'):
                         all_data['FORMULA_1'] = f1_data['matches']
@@ -765,9 +740,10 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL F1 RACING: {len(f1_data['matches'])} Formula 1 races")
                         for race in f1_data['matches'][:2]:  # Only debug first 2 races
                             logger.info(f"    F1 Race: {race.get('home_team', 'TBD')} vs {race.get('away_team', 'TBD')} at {race.get('venue', 'TBD')}")
-                
-                    # 🚀 NEW MAJOR LEAGUES - CFB PATTERN DEPLOYED! 🚀
-                    # J1 League Japan - Kawasaki Frontale vs Cerezo Osaka
+
+                # 🚀 NEW MAJOR LEAGUES - CFB PATTERN DEPLOYED! 🚀
+                # J1 League Japan - Kawasaki Frontale vs Cerezo Osaka
+                async def fetch_j1_league(all_data):
                     j1_japan_data = await fetch_j1_league_japan_data()
                     if j1_japan_data and j1_japan_data.get('matches'):
                         all_data['J1_LEAGUE_JAPAN'] = j1_japan_data['matches']
@@ -777,8 +753,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL J1 LEAGUE JAPAN: {len(j1_japan_data['matches'])} Japanese matches")
                         for match in j1_japan_data['matches'][:2]:  # Only debug first 2 matches
                             logger.info(f"    J1 Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} at {match.get('venue', 'TBD')}")
-                
-                    # Turkish Super League - Galatasaray vs Fenerbahçe Intercontinental Derby
+
+                # Turkish Super League - Galatasaray vs Fenerbahçe Intercontinental Derby
+                async def fetch_turkish_super_league(all_data):
                     turkish_data = await fetch_turkish_super_league_data()
                     if turkish_data and turkish_data.get('matches'):
                         all_data['TURKISH_SUPER_LEAGUE'] = turkish_data['matches']
@@ -788,8 +765,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL TURKISH SUPER LEAGUE: {len(turkish_data['matches'])} Turkish matches")
                         for match in turkish_data['matches'][:2]:  # Only debug first 2 matches
                             logger.info(f"    Turkish Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} at {match.get('venue', 'TBD')}")
-                
-                    # Brazilian Serie A - Flamengo vs Palmeiras Brasileirão
+
+                # Brazilian Serie A - Flamengo vs Palmeiras Brasileirão
+                async def fetch_brazilian_serie_a(all_data):
                     brazilian_data = await fetch_brazilian_serie_a_data()
                     if brazilian_data and brazilian_data.get('matches'):
                         all_data['BRAZILIAN_SERIE_A'] = brazilian_data['matches']
@@ -800,182 +778,186 @@ class UltimateSportsIntegrator:
                         for match in brazilian_data['matches'][:2]:  # Only debug first 2 matches
                             logger.info(f"    Brazilian Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} at {match.get('venue', 'TBD')}")
 
-                    # 🔥 REAL ESPN SOCCER DATA - GLOBAL LEAGUES COVERAGE!
-                    try:
-                        from real_todays_games_fetcher import RealTodaysGamesFetcher
-                        espn_fetcher = RealTodaysGamesFetcher()
-                        
-                        # 🏴󠁧󠁢󠁥󠁮󠁧󠁿 Premier League - Real ESPN Data!
-                        premier_games = await espn_fetcher._get_espn_soccer('eng.1', 'Premier League')
-                        if premier_games:
-                            all_data['PREMIER_LEAGUE'] = premier_games
-                            all_data['Premier League'] = premier_games  # 🔥 EXACT FRONTEND KEY!
-                            logger.info(f"✅ REAL ESPN PREMIER LEAGUE: {len(premier_games)} English matches")
-                        
-                        # 🇪🇸 La Liga - Real ESPN Data!
-                        laliga_games = await espn_fetcher._get_espn_soccer('esp.1', 'La Liga')
-                        if laliga_games:
-                            all_data['LA_LIGA'] = laliga_games
-                            all_data['La Liga'] = laliga_games  # 🔥 EXACT FRONTEND KEY!
-                            logger.info(f"✅ REAL ESPN LA LIGA: {len(laliga_games)} Spanish matches")
-                        
-                        # 🇩🇪 Bundesliga - Real ESPN Data!
-                        bundesliga_games = await espn_fetcher._get_espn_soccer('ger.1', 'Bundesliga')
-                        if bundesliga_games:
-                            all_data['BUNDESLIGA'] = bundesliga_games
-                            all_data['Bundesliga'] = bundesliga_games  # 🔥 EXACT FRONTEND KEY!
-                            logger.info(f"✅ REAL ESPN BUNDESLIGA: {len(bundesliga_games)} German matches")
-                        
-                        # 🇮🇹 Serie A - Real ESPN Data!
-                        seriea_games = await espn_fetcher._get_espn_soccer('ita.1', 'Serie A')
-                        if seriea_games:
-                            all_data['SERIE_A_ESPN'] = seriea_games
-                            all_data['Serie A'] = seriea_games  # 🔥 EXACT FRONTEND KEY!
-                            logger.info(f"✅ REAL ESPN SERIE A: {len(seriea_games)} Italian matches")
-                        
-                        # 🇫🇷 Ligue 1 - Real ESPN Data!
-                        ligue1_games = await espn_fetcher._get_espn_soccer('fra.1', 'Ligue 1')
-                        if ligue1_games:
-                            all_data['LIGUE_1'] = ligue1_games
-                            all_data['Ligue 1'] = ligue1_games  # 🔥 EXACT FRONTEND KEY!
-                            logger.info(f"✅ REAL ESPN LIGUE 1: {len(ligue1_games)} French matches")
-                        
-                        # 🇳🇱 Eredivisie - Real ESPN Data!
-                        eredivisie_games = await espn_fetcher._get_espn_soccer('ned.1', 'Eredivisie')
-                        if eredivisie_games:
-                            all_data['EREDIVISIE'] = eredivisie_games
-                            all_data['Eredivisie'] = eredivisie_games  # 🔥 EXACT FRONTEND KEY!
-                            logger.info(f"✅ REAL ESPN EREDIVISIE: {len(eredivisie_games)} Dutch matches")
-                        
-                        # 🇵🇹 Primeira Liga - Real ESPN Data!
-                        primeira_games = await espn_fetcher._get_espn_soccer('por.1', 'Primeira Liga')
-                        if primeira_games:
-                            all_data['PRIMEIRA_LIGA'] = primeira_games
-                            all_data['Primeira Liga'] = primeira_games  # 🔥 EXACT FRONTEND KEY!
-                            logger.info(f"✅ REAL ESPN PRIMEIRA LIGA: {len(primeira_games)} Portuguese matches")
-                        
-                        # 🇧🇷 Brasileirão - Real ESPN Data!
-                        brasileirao_games = await espn_fetcher._get_espn_soccer('bra.1', 'Brasileirão')
-                        if brasileirao_games:
-                            all_data['BRASILEIRAO_ESPN'] = brasileirao_games
-                            all_data['Brasileirão'] = brasileirao_games  # 🔥 EXACT FRONTEND KEY!
-                            logger.info(f"✅ REAL ESPN BRASILEIRÃO: {len(brasileirao_games)} Brazilian matches")
-                        
-                        # 🇦🇷 PRIMERA DIVISIÓN ARGENTINA - REAL ESPN DATA!
-                        argentina_games = await espn_fetcher._get_espn_soccer('arg.1', 'Primera División Argentina')
-                        if argentina_games:
-                            all_data['PRIMERA_DIVISION_ARGENTINA'] = argentina_games
-                            all_data['Primera División Argentina'] = argentina_games  # 🔥 EXACT FRONTEND KEY!
-                            all_data['Argentine League'] = argentina_games  # Alternative naming
-                            all_data['🇦🇷 Primera División Argentina'] = argentina_games  # 🔥 WITH FLAG!
-                            logger.info(f"✅ REAL ESPN PRIMERA DIVISIÓN ARGENTINA: {len(argentina_games)} Argentine matches - SUPERCLÁSICO READY!")
-                            # Debug: Log actual Argentine games to verify correctness
-                            for match in argentina_games[:2]:
-                                logger.info(f"    🇦🇷 Argentine Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                        
-                        # 🇨🇱 CHILEAN PRIMERA DIVISIÓN - REAL ESPN DATA!
-                        chile_games = await espn_fetcher._get_espn_soccer('chi.1', 'Chilean Primera División')
-                        if chile_games:
-                            all_data['CHILEAN_PRIMERA_DIVISION'] = chile_games
-                            all_data['Chilean Primera División'] = chile_games  # 🔥 EXACT FRONTEND KEY!
-                            all_data['Chilean League'] = chile_games  # Alternative naming
-                            all_data['Primera División Chile'] = chile_games  # Alternative naming
-                            all_data['🇨🇱 Chilean Primera División'] = chile_games  # 🔥 WITH FLAG!
-                            logger.info(f"✅ REAL ESPN CHILEAN PRIMERA DIVISIÓN: {len(chile_games)} Chilean matches - COLO-COLO vs UNIVERSIDAD DE CHILE READY!")
-                            # Debug: Log actual Chilean games to verify correctness
-                            for match in chile_games[:2]:
-                                logger.info(f"    🇨🇱 Chilean Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                        
-                        # 🇨🇴 COLOMBIAN PRIMERA A - REAL ESPN DATA!
-                        colombia_games = await espn_fetcher._get_espn_soccer('col.1', 'Colombian Primera A')
-                        if colombia_games:
-                            all_data['COLOMBIAN_PRIMERA_A'] = colombia_games
-                            all_data['Colombian Primera A'] = colombia_games  # 🔥 EXACT FRONTEND KEY!
-                            all_data['Colombian League'] = colombia_games  # Alternative naming
-                            all_data['Primera A Colombia'] = colombia_games  # Alternative naming
-                            all_data['🇨🇴 Colombian Primera A'] = colombia_games  # 🔥 WITH FLAG!
-                            logger.info(f"✅ REAL ESPN COLOMBIAN PRIMERA A: {len(colombia_games)} Colombian matches - MILLONARIOS vs AMÉRICA DE CALI READY!")
-                            # Debug: Log actual Colombian games to verify correctness
-                            for match in colombia_games[:2]:
-                                logger.info(f"    🇨🇴 Colombian Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                        
-                        # 🇺🇸 MLS - REAL ESPN DATA!
-                        mls_games = await espn_fetcher._get_espn_soccer('usa.1', 'MLS')
-                        if mls_games:
-                            all_data['MLS'] = mls_games
-                            all_data['Major League Soccer'] = mls_games  # 🔥 EXACT FRONTEND KEY!
-                            all_data['MLS Soccer'] = mls_games  # Alternative naming
-                            all_data['🇺🇸 MLS'] = mls_games  # 🔥 WITH FLAG!
-                            logger.info(f"✅ REAL ESPN MLS: {len(mls_games)} American matches - LAFC vs SEATTLE SOUNDERS READY!")
-                            # Debug: Log actual MLS games to verify correctness
-                            for match in mls_games[:2]:
-                                logger.info(f"    🇺🇸 MLS Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                        
-                        # 🇲🇽 LIGA MX - REAL ESPN DATA!
-                        ligamx_games = await espn_fetcher._get_espn_soccer('mex.1', 'Liga MX')
-                        if ligamx_games:
-                            # 🚨 CRITICAL FIX: Ensure Liga MX games have proper sport field for MCP routing
-                            for game in ligamx_games:
-                                game['sport'] = 'LIGA_MX'  # Force correct sport field for MCP routing
-                                game['league'] = 'LIGA_MX'  # Normalize league field too
+                # 🔥 REAL ESPN SOCCER DATA - GLOBAL LEAGUES COVERAGE!
+                async def espn_soccer(league_code, league_name):
+                    from real_todays_games_fetcher import RealTodaysGamesFetcher
+                    return await RealTodaysGamesFetcher()._get_espn_soccer(league_code, league_name)
+
+                # 🏴󠁧󠁢󠁥󠁮󠁧󠁿 Premier League - Real ESPN Data!
+                async def fetch_espn_premier_league(all_data):
+                    premier_games = await espn_soccer('eng.1', 'Premier League')
+                    if premier_games:
+                        all_data['PREMIER_LEAGUE'] = premier_games
+                        all_data['Premier League'] = premier_games  # 🔥 EXACT FRONTEND KEY!
+                        logger.info(f"✅ REAL ESPN PREMIER LEAGUE: {len(premier_games)} English matches")
+
+                # 🇪🇸 La Liga - Real ESPN Data!
+                async def fetch_espn_la_liga(all_data):
+                    laliga_games = await espn_soccer('esp.1', 'La Liga')
+                    if laliga_games:
+                        all_data['LA_LIGA'] = laliga_games
+                        all_data['La Liga'] = laliga_games  # 🔥 EXACT FRONTEND KEY!
+                        logger.info(f"✅ REAL ESPN LA LIGA: {len(laliga_games)} Spanish matches")
+
+                # 🇩🇪 Bundesliga - Real ESPN Data!
+                async def fetch_espn_bundesliga(all_data):
+                    bundesliga_games = await espn_soccer('ger.1', 'Bundesliga')
+                    if bundesliga_games:
+                        all_data['BUNDESLIGA'] = bundesliga_games
+                        all_data['Bundesliga'] = bundesliga_games  # 🔥 EXACT FRONTEND KEY!
+                        logger.info(f"✅ REAL ESPN BUNDESLIGA: {len(bundesliga_games)} German matches")
+
+                # 🇮🇹 Serie A - Real ESPN Data!
+                async def fetch_espn_serie_a(all_data):
+                    seriea_games = await espn_soccer('ita.1', 'Serie A')
+                    if seriea_games:
+                        all_data['SERIE_A_ESPN'] = seriea_games
+                        all_data['Serie A'] = seriea_games  # 🔥 EXACT FRONTEND KEY!
+                        logger.info(f"✅ REAL ESPN SERIE A: {len(seriea_games)} Italian matches")
+
+                # 🇫🇷 Ligue 1 - Real ESPN Data!
+                async def fetch_espn_ligue_1(all_data):
+                    ligue1_games = await espn_soccer('fra.1', 'Ligue 1')
+                    if ligue1_games:
+                        all_data['LIGUE_1'] = ligue1_games
+                        all_data['Ligue 1'] = ligue1_games  # 🔥 EXACT FRONTEND KEY!
+                        logger.info(f"✅ REAL ESPN LIGUE 1: {len(ligue1_games)} French matches")
+
+                # 🇳🇱 Eredivisie - Real ESPN Data!
+                async def fetch_espn_eredivisie(all_data):
+                    eredivisie_games = await espn_soccer('ned.1', 'Eredivisie')
+                    if eredivisie_games:
+                        all_data['EREDIVISIE'] = eredivisie_games
+                        all_data['Eredivisie'] = eredivisie_games  # 🔥 EXACT FRONTEND KEY!
+                        logger.info(f"✅ REAL ESPN EREDIVISIE: {len(eredivisie_games)} Dutch matches")
+
+                # 🇵🇹 Primeira Liga - Real ESPN Data!
+                async def fetch_espn_primeira_liga(all_data):
+                    primeira_games = await espn_soccer('por.1', 'Primeira Liga')
+                    if primeira_games:
+                        all_data['PRIMEIRA_LIGA'] = primeira_games
+                        all_data['Primeira Liga'] = primeira_games  # 🔥 EXACT FRONTEND KEY!
+                        logger.info(f"✅ REAL ESPN PRIMEIRA LIGA: {len(primeira_games)} Portuguese matches")
+
+                # 🇧🇷 Brasileirão - Real ESPN Data!
+                async def fetch_espn_brasileirao(all_data):
+                    brasileirao_games = await espn_soccer('bra.1', 'Brasileirão')
+                    if brasileirao_games:
+                        all_data['BRASILEIRAO_ESPN'] = brasileirao_games
+                        all_data['Brasileirão'] = brasileirao_games  # 🔥 EXACT FRONTEND KEY!
+                        logger.info(f"✅ REAL ESPN BRASILEIRÃO: {len(brasileirao_games)} Brazilian matches")
+
+                # 🇦🇷 PRIMERA DIVISIÓN ARGENTINA - REAL ESPN DATA!
+                async def fetch_espn_argentina(all_data):
+                    argentina_games = await espn_soccer('arg.1', 'Primera División Argentina')
+                    if argentina_games:
+                        all_data['PRIMERA_DIVISION_ARGENTINA'] = argentina_games
+                        all_data['Primera División Argentina'] = argentina_games  # 🔥 EXACT FRONTEND KEY!
+                        all_data['Argentine League'] = argentina_games  # Alternative naming
+                        all_data['🇦🇷 Primera División Argentina'] = argentina_games  # 🔥 WITH FLAG!
+                        logger.info(f"✅ REAL ESPN PRIMERA DIVISIÓN ARGENTINA: {len(argentina_games)} Argentine matches - SUPERCLÁSICO READY!")
+                        # Debug: Log actual Argentine games to verify correctness
+                        for match in argentina_games[:2]:
+                            logger.info(f"    🇦🇷 Argentine Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
+
+                # 🇨🇱 CHILEAN PRIMERA DIVISIÓN - REAL ESPN DATA!
+                async def fetch_espn_chile(all_data):
+                    chile_games = await espn_soccer('chi.1', 'Chilean Primera División')
+                    if chile_games:
+                        all_data['CHILEAN_PRIMERA_DIVISION'] = chile_games
+                        all_data['Chilean Primera División'] = chile_games  # 🔥 EXACT FRONTEND KEY!
+                        all_data['Chilean League'] = chile_games  # Alternative naming
+                        all_data['Primera División Chile'] = chile_games  # Alternative naming
+                        all_data['🇨🇱 Chilean Primera División'] = chile_games  # 🔥 WITH FLAG!
+                        logger.info(f"✅ REAL ESPN CHILEAN PRIMERA DIVISIÓN: {len(chile_games)} Chilean matches - COLO-COLO vs UNIVERSIDAD DE CHILE READY!")
+                        # Debug: Log actual Chilean games to verify correctness
+                        for match in chile_games[:2]:
+                            logger.info(f"    🇨🇱 Chilean Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
+
+                # 🇨🇴 COLOMBIAN PRIMERA A - REAL ESPN DATA!
+                async def fetch_espn_colombia(all_data):
+                    colombia_games = await espn_soccer('col.1', 'Colombian Primera A')
+                    if colombia_games:
+                        all_data['COLOMBIAN_PRIMERA_A'] = colombia_games
+                        all_data['Colombian Primera A'] = colombia_games  # 🔥 EXACT FRONTEND KEY!
+                        all_data['Colombian League'] = colombia_games  # Alternative naming
+                        all_data['Primera A Colombia'] = colombia_games  # Alternative naming
+                        all_data['🇨🇴 Colombian Primera A'] = colombia_games  # 🔥 WITH FLAG!
+                        logger.info(f"✅ REAL ESPN COLOMBIAN PRIMERA A: {len(colombia_games)} Colombian matches - MILLONARIOS vs AMÉRICA DE CALI READY!")
+                        # Debug: Log actual Colombian games to verify correctness
+                        for match in colombia_games[:2]:
+                            logger.info(f"    🇨🇴 Colombian Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
+
+                # 🇺🇸 MLS - REAL ESPN DATA!
+                async def fetch_espn_mls(all_data):
+                    mls_games = await espn_soccer('usa.1', 'MLS')
+                    if mls_games:
+                        all_data['MLS'] = mls_games
+                        all_data['Major League Soccer'] = mls_games  # 🔥 EXACT FRONTEND KEY!
+                        all_data['MLS Soccer'] = mls_games  # Alternative naming
+                        all_data['🇺🇸 MLS'] = mls_games  # 🔥 WITH FLAG!
+                        logger.info(f"✅ REAL ESPN MLS: {len(mls_games)} American matches - LAFC vs SEATTLE SOUNDERS READY!")
+                        # Debug: Log actual MLS games to verify correctness
+                        for match in mls_games[:2]:
+                            logger.info(f"    🇺🇸 MLS Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
+
+                # 🇲🇽 LIGA MX - REAL ESPN DATA!
+                async def fetch_espn_liga_mx(all_data):
+                    ligamx_games = await espn_soccer('mex.1', 'Liga MX')
+                    if ligamx_games:
+                        # 🚨 CRITICAL FIX: Ensure Liga MX games have proper sport field for MCP routing
+                        for game in ligamx_games:
+                            game['sport'] = 'LIGA_MX'  # Force correct sport field for MCP routing
+                            game['league'] = 'LIGA_MX'  # Normalize league field too
                             
-                            all_data['LIGA_MX'] = ligamx_games
-                            all_data['Liga MX'] = ligamx_games  # 🔥 EXACT FRONTEND KEY!
-                            all_data['Liga Mexicana'] = ligamx_games  # Alternative naming
-                            all_data['Mexican League'] = ligamx_games  # Alternative naming
-                            logger.info(f"✅ REAL ESPN LIGA MX: {len(ligamx_games)} Mexican matches - AMÉRICA vs CHIVAS GUADALAJARA READY!")
-                            # Debug: Log actual Liga MX games to verify correctness
-                            for match in ligamx_games[:2]:
-                                logger.info(f"    🇲🇽 Liga MX Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                        
-                        # 🌏 SEA LEAGUE - REAL ESPN DATA FROM ALL SOUTHEAST ASIAN LEAGUES!
-                        try:
-                            from real_sea_league_fetcher import RealSEALeagueFetcher
-                            sea_fetcher = RealSEALeagueFetcher()
-                            sea_games = await sea_fetcher.fetch_todays_real_sea_league_games()
-                            if sea_games:
-                                # 🚨 CRITICAL FIX: Ensure SEA League games have proper sport field for MCP routing
-                                for game in sea_games:
-                                    game['sport'] = 'SEA_LEAGUE'  # Force correct sport field for MCP routing
-                                    game['league'] = 'SEA_LEAGUE'  # Normalize league field too
+                        all_data['LIGA_MX'] = ligamx_games
+                        all_data['Liga MX'] = ligamx_games  # 🔥 EXACT FRONTEND KEY!
+                        all_data['Liga Mexicana'] = ligamx_games  # Alternative naming
+                        all_data['Mexican League'] = ligamx_games  # Alternative naming
+                        logger.info(f"✅ REAL ESPN LIGA MX: {len(ligamx_games)} Mexican matches - AMÉRICA vs CHIVAS GUADALAJARA READY!")
+                        # Debug: Log actual Liga MX games to verify correctness
+                        for match in ligamx_games[:2]:
+                            logger.info(f"    🇲🇽 Liga MX Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
+
+                # 🌏 SEA LEAGUE - REAL ESPN DATA FROM ALL SOUTHEAST ASIAN LEAGUES!
+                async def fetch_sea_league(all_data):
+                    from real_sea_league_fetcher import RealSEALeagueFetcher
+                    sea_fetcher = RealSEALeagueFetcher()
+                    sea_games = await sea_fetcher.fetch_todays_real_sea_league_games()
+                    if sea_games:
+                        # 🚨 CRITICAL FIX: Ensure SEA League games have proper sport field for MCP routing
+                        for game in sea_games:
+                            game['sport'] = 'SEA_LEAGUE'  # Force correct sport field for MCP routing
+                            game['league'] = 'SEA_LEAGUE'  # Normalize league field too
                                 
-                                all_data['SEA_LEAGUE'] = sea_games
-                                all_data['Southeast Asian Football'] = sea_games  # 🔥 EXACT FRONTEND KEY!
-                                all_data['SEA League'] = sea_games  # Alternative naming
-                                all_data['Asian Football'] = sea_games  # Alternative naming
-                                all_data['🌏 SEA League'] = sea_games  # 🔥 WITH GLOBE EMOJI!
-                                logger.info(f"✅ REAL ESPN SEA LEAGUE: {len(sea_games)} Southeast Asian matches - JOHOR DARUL TA'ZIM vs LION CITY SAILORS READY!")
-                                # Debug: Log actual SEA League games to verify correctness
-                                for match in sea_games[:3]:
-                                    country = match.get('country_code', '🌏')
-                                    logger.info(f"    {country} SEA League Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                        except Exception as sea_e:
-                            logger.warning(f"SEA League data fetch error: {sea_e}")
-                        
-                        # 🏆 UEFA EUROPA LEAGUE - REAL ESPN DATA!
-                        europa_games = await espn_fetcher._get_espn_soccer('uefa.europa', 'UEFA Europa League')
-                        if europa_games:
-                            all_data['UEFA_EUROPA_LEAGUE'] = europa_games
-                            all_data['UEFA Europa League'] = europa_games  # 🔥 EXACT FRONTEND KEY!
-                            all_data['Europa League'] = europa_games  # Alternative naming
-                            all_data['UEL'] = europa_games  # Alternative naming
-                            all_data['🏆 UEFA Europa League'] = europa_games  # 🔥 WITH TROPHY!
-                            logger.info(f"✅ REAL ESPN UEFA EUROPA LEAGUE: {len(europa_games)} European matches - MANCHESTER UNITED vs SEVILLA READY!")
-                            # Debug: Log actual Europa League games to verify correctness
-                            for match in europa_games[:2]:
-                                logger.info(f"    🏆 Europa League Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                        
-                    except Exception as espn_e:
-                        logger.warning(f"ESPN Soccer data fetch error: {espn_e}")
-                
-                    # 🔥 COMBINE ALL WORLD CUP QUALIFIERS INTO FRONTEND KEY!
-                    if all_wc_matches:
-                        all_data['WORLD_CUP'] = all_wc_matches  # 🔥 EXACT FRONTEND KEY!
-                        all_data['World Cup Qualifying'] = all_wc_matches  # Alternative naming
-                        logger.info(f"✅ COMBINED WORLD CUP QUALIFIERS: {len(all_wc_matches)} total matches from all 6 confederations!")
-                
-                    # ⛳🏏♟️🎮 NEW SPORTS - CFB PATTERN DEPLOYED! ⛳🏏♟️🎮
-                    # PGA Tour - Tiger Woods vs Rory McIlroy at Augusta
+                        all_data['SEA_LEAGUE'] = sea_games
+                        all_data['Southeast Asian Football'] = sea_games  # 🔥 EXACT FRONTEND KEY!
+                        all_data['SEA League'] = sea_games  # Alternative naming
+                        all_data['Asian Football'] = sea_games  # Alternative naming
+                        all_data['🌏 SEA League'] = sea_games  # 🔥 WITH GLOBE EMOJI!
+                        logger.info(f"✅ REAL ESPN SEA LEAGUE: {len(sea_games)} Southeast Asian matches - JOHOR DARUL TA'ZIM vs LION CITY SAILORS READY!")
+                        # Debug: Log actual SEA League games to verify correctness
+                        for match in sea_games[:3]:
+                            country = match.get('country_code', '🌏')
+                            logger.info(f"    {country} SEA League Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
+
+                # 🏆 UEFA EUROPA LEAGUE - REAL ESPN DATA!
+                async def fetch_espn_europa_league(all_data):
+                    europa_games = await espn_soccer('uefa.europa', 'UEFA Europa League')
+                    if europa_games:
+                        all_data['UEFA_EUROPA_LEAGUE'] = europa_games
+                        all_data['UEFA Europa League'] = europa_games  # 🔥 EXACT FRONTEND KEY!
+                        all_data['Europa League'] = europa_games  # Alternative naming
+                        all_data['UEL'] = europa_games  # Alternative naming
+                        all_data['🏆 UEFA Europa League'] = europa_games  # 🔥 WITH TROPHY!
+                        logger.info(f"✅ REAL ESPN UEFA EUROPA LEAGUE: {len(europa_games)} European matches - MANCHESTER UNITED vs SEVILLA READY!")
+                        # Debug: Log actual Europa League games to verify correctness
+                        for match in europa_games[:2]:
+                            logger.info(f"    🏆 Europa League Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
+
+                # ⛳🏏♟️🎮 NEW SPORTS - CFB PATTERN DEPLOYED! ⛳🏏♟️🎮
+                # PGA Tour - Tiger Woods vs Rory McIlroy at Augusta
+                async def fetch_pga_tour(all_data):
                     pga_data = await fetch_pga_tour_data()
                     if pga_data and pga_data.get('matches'):
                         all_data['PGA_TOUR'] = pga_data['matches']  # 🔥 EXACT FRONTEND KEY!
@@ -983,8 +965,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL PGA TOUR: {len(pga_data['matches'])} golf tournaments")
                         for match in pga_data['matches'][:2]:  # Only debug first 2 tournaments
                             logger.info(f"    PGA Tournament: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} at {match.get('venue', 'TBD')}")
-                
-                    # Cricket - India vs England Test Match at Lord's
+
+                # Cricket - India vs England Test Match at Lord's
+                async def fetch_cricket(all_data):
                     cricket_data = await fetch_cricket_data()
                     if cricket_data and cricket_data.get('matches'):
                         all_data['CRICKET'] = cricket_data['matches']  # 🔥 EXACT FRONTEND KEY!
@@ -992,8 +975,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL CRICKET: {len(cricket_data['matches'])} international matches")
                         for match in cricket_data['matches'][:2]:  # Only debug first 2 matches
                             logger.info(f"    Cricket Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('match_type', 'TBD')})")
-                
-                    # Chess Championships - Magnus Carlsen vs Ding Liren
+
+                # Chess Championships - Magnus Carlsen vs Ding Liren
+                async def fetch_chess(all_data):
                     chess_data = await fetch_chess_championships_data()
                     if chess_data and chess_data.get('matches'):
                         all_data['CHESS'] = chess_data['matches']  # 🔥 EXACT FRONTEND KEY!
@@ -1001,8 +985,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL CHESS CHAMPIONSHIPS: {len(chess_data['matches'])} championship matches")
                         for match in chess_data['matches'][:2]:  # Only debug first 2 matches
                             logger.info(f"    Chess Match: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('match_type', 'TBD')})")
-                
-                    # eSports - T1 vs Gen.G League of Legends Worlds
+
+                # eSports - T1 vs Gen.G League of Legends Worlds
+                async def fetch_esports(all_data):
                     esports_data = await fetch_esports_data()
                     if esports_data and esports_data.get('matches'):
                         all_data['ESPORTS'] = esports_data['matches']  # 🔥 EXACT FRONTEND KEY!
@@ -1010,8 +995,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL ESPORTS: {len(esports_data['matches'])} championship tournaments")
                         for match in esports_data['matches'][:2]:  # Only debug first 2 tournaments
                             logger.info(f"    eSports Tournament: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('match_type', 'TBD')})")
-                
-                    # 🇦🇷 Argentine Liga Profesional integration - Superclásico Power!
+
+                # 🇦🇷 Argentine Liga Profesional integration - Superclásico Power!
+                async def fetch_argentine_liga_profesional(all_data):
                     argentine_data = await fetch_argentine_liga_profesional_data()
                     if argentine_data.get('success') and argentine_data.get('matches'):
                         all_data['ARGENTINE_LIGA_PROFESIONAL'] = argentine_data['matches']
@@ -1026,8 +1012,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL ARGENTINE LIGA PROFESIONAL: {len(argentine_data['matches'])} superclásico battles")
                         for match in argentine_data['matches'][:2]:
                             logger.info(f"    Argentina: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇰🇷 Korean K League 1 integration
+
+                # 🇰🇷 Korean K League 1 integration
+                async def fetch_korean_k_league_1(all_data):
                     korean_data = await fetch_korean_k_league_1_data()
                     if korean_data.get('success') and korean_data.get('matches'):
                         all_data['KOREAN_K_LEAGUE_1'] = korean_data['matches']
@@ -1042,8 +1029,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL KOREAN K LEAGUE 1: {len(korean_data['matches'])} K League battles")
                         for match in korean_data['matches'][:2]:
                             logger.info(f"    K League: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇧🇪 Belgian Pro League integration
+
+                # 🇧🇪 Belgian Pro League integration
+                async def fetch_belgian_pro_league(all_data):
                     belgian_data = await fetch_belgian_pro_league_data()
                     if belgian_data.get('success') and belgian_data.get('matches'):
                         all_data['BELGIAN_PRO_LEAGUE'] = belgian_data['matches']
@@ -1058,8 +1046,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL BELGIAN PRO LEAGUE: {len(belgian_data['matches'])} Belgian clasico battles")
                         for match in belgian_data['matches'][:2]:
                             logger.info(f"    Belgium: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🏴󠁧󠁢󠁳󠁣󠁴󠁿 Scottish Premiership integration - Old Firm Power!
+
+                # 🏴󠁧󠁢󠁳󠁣󠁴󠁿 Scottish Premiership integration - Old Firm Power!
+                async def fetch_scottish_premiership(all_data):
                     scottish_data = await fetch_scottish_premiership_data()
                     if scottish_data.get('success') and scottish_data.get('matches'):
                         all_data['SCOTTISH_PREMIERSHIP'] = scottish_data['matches']
@@ -1068,7 +1057,8 @@ class UltimateSportsIntegrator:
                         for match in scottish_data['matches'][:2]:
                             logger.info(f"    Scotland: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
 
-                    # 🇵🇹 Portuguese Primeira Liga integration - O Clássico Power!
+                # 🇵🇹 Portuguese Primeira Liga integration - O Clássico Power!
+                async def fetch_portuguese_primeira_liga(all_data):
                     portuguese_data = await fetch_portuguese_primeira_liga_data()
                     if portuguese_data.get('success') and portuguese_data.get('matches'):
                         all_data['PORTUGUESE_PRIMEIRA_LIGA'] = portuguese_data['matches']
@@ -1083,8 +1073,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL PORTUGUESE PRIMEIRA LIGA: {len(portuguese_data['matches'])} O Clássico battles")
                         for match in portuguese_data['matches'][:2]:
                             logger.info(f"    Portugal: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇳🇱 Dutch Eredivisie integration - De Klassieker Power!
+
+                # 🇳🇱 Dutch Eredivisie integration - De Klassieker Power!
+                async def fetch_dutch_eredivisie(all_data):
                     dutch_data = await fetch_dutch_eredivisie_data()
                     if dutch_data.get('success') and dutch_data.get('matches'):
                         all_data['DUTCH_EREDIVISIE'] = dutch_data['matches']
@@ -1093,8 +1084,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL DUTCH EREDIVISIE: {len(dutch_data['matches'])} De Klassieker battles")
                         for match in dutch_data['matches'][:2]:
                             logger.info(f"    Netherlands: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇦🇹 Austrian Bundesliga integration
+
+                # 🇦🇹 Austrian Bundesliga integration
+                async def fetch_austrian_bundesliga(all_data):
                     austrian_data = await fetch_austrian_bundesliga_data()
                     if austrian_data.get('success') and austrian_data.get('matches'):
                         all_data['AUSTRIAN_BUNDESLIGA'] = austrian_data['matches']
@@ -1103,7 +1095,8 @@ class UltimateSportsIntegrator:
                         for match in austrian_data['matches'][:2]:
                             logger.info(f"    Austria: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
 
-                    # 🇨🇭 Swiss Super League integration
+                # 🇨🇭 Swiss Super League integration
+                async def fetch_swiss_super_league(all_data):
                     swiss_data = await fetch_swiss_super_league_data()
                     if swiss_data.get('success') and swiss_data.get('matches'):
                         all_data['SWISS_SUPER_LEAGUE'] = swiss_data['matches']
@@ -1111,8 +1104,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL SWISS SUPER LEAGUE: {len(swiss_data['matches'])} Swiss clasico battles")
                         for match in swiss_data['matches'][:2]:
                             logger.info(f"    Switzerland: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇳🇴 Norwegian Eliteserien integration
+
+                # 🇳🇴 Norwegian Eliteserien integration
+                async def fetch_norwegian_eliteserien(all_data):
                     norwegian_data = await fetch_norwegian_eliteserien_data()
                     if norwegian_data.get('success') and norwegian_data.get('matches'):
                         all_data['NORWEGIAN_ELITESERIEN'] = norwegian_data['matches']
@@ -1121,8 +1115,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL NORWEGIAN ELITESERIEN: {len(norwegian_data['matches'])} Nordic battles")
                         for match in norwegian_data['matches'][:2]:
                             logger.info(f"    Norway: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇸🇪 Swedish Allsvenskan integration
+
+                # 🇸🇪 Swedish Allsvenskan integration
+                async def fetch_swedish_allsvenskan(all_data):
                     swedish_data = await fetch_swedish_allsvenskan_data()
                     if swedish_data.get('success') and swedish_data.get('matches'):
                         all_data['SWEDISH_ALLSVENSKAN'] = swedish_data['matches']
@@ -1131,8 +1126,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL SWEDISH ALLSVENSKAN: {len(swedish_data['matches'])} Swedish derby battles")
                         for match in swedish_data['matches'][:2]:
                             logger.info(f"    Sweden: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇩🇰 Danish Superliga integration
+
+                # 🇩🇰 Danish Superliga integration
+                async def fetch_danish_superliga(all_data):
                     danish_data = await fetch_danish_superliga_data()
                     if danish_data.get('success') and danish_data.get('matches'):
                         all_data['DANISH_SUPERLIGA'] = danish_data['matches']
@@ -1140,8 +1136,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL DANISH SUPERLIGA: {len(danish_data['matches'])} New Firm derby battles")
                         for match in danish_data['matches'][:2]:
                             logger.info(f"    Denmark: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇫🇮 Finnish Veikkausliiga integration
+
+                # 🇫🇮 Finnish Veikkausliiga integration
+                async def fetch_finnish_veikkausliiga(all_data):
                     finnish_data = await fetch_finnish_veikkausliiga_data()
                     if finnish_data.get('success') and finnish_data.get('matches'):
                         all_data['FINNISH_VEIKKAUSLIIGA'] = finnish_data['matches']
@@ -1149,10 +1146,10 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL FINNISH VEIKKAUSLIIGA: {len(finnish_data['matches'])} Finnish derby battles")
                         for match in finnish_data['matches'][:2]:
                             logger.info(f"    Finland: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🚀 CFB PATTERN WAVE 8 - BOTTOM TO TOP CONQUEST! 🚀
-                    
-                    # 🇺🇸 USL Championship integration - American second division power!
+
+                # 🚀 CFB PATTERN WAVE 8 - BOTTOM TO TOP CONQUEST! 🚀
+                # 🇺🇸 USL Championship integration - American second division power!
+                async def fetch_usl_championship(all_data):
                     usl_data = await fetch_usl_championship_data()
                     if usl_data.get('success') and usl_data.get('matches'):
                         all_data['USL_CHAMPIONSHIP'] = usl_data['matches']
@@ -1166,8 +1163,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL USL CHAMPIONSHIP: {len(usl_data['matches'])} American second division battles")
                         for match in usl_data['matches'][:2]:
                             logger.info(f"    USL: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇨🇦 Canadian Premier League integration - True North football!
+
+                # 🇨🇦 Canadian Premier League integration - True North football!
+                async def fetch_canadian_premier_league(all_data):
                     canadian_data = await fetch_canadian_premier_league_data()
                     if canadian_data.get('success') and canadian_data.get('matches'):
                         all_data['CANADIAN_PREMIER_LEAGUE'] = canadian_data['matches']
@@ -1181,8 +1179,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL CANADIAN PREMIER LEAGUE: {len(canadian_data['matches'])} cross-country Canadian battles")
                         for match in canadian_data['matches'][:2]:
                             logger.info(f"    Canada: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇪🇬 Egyptian Premier League integration - African football powerhouse!
+
+                # 🇪🇬 Egyptian Premier League integration - African football powerhouse!
+                async def fetch_egyptian_premier_league(all_data):
                     egyptian_data = await fetch_egyptian_premier_league_data()
                     if egyptian_data.get('success') and egyptian_data.get('matches'):
                         all_data['EGYPTIAN_PREMIER_LEAGUE'] = egyptian_data['matches']
@@ -1196,8 +1195,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL EGYPTIAN PREMIER LEAGUE: {len(egyptian_data['matches'])} Cairo Derby and African powerhouse battles")
                         for match in egyptian_data['matches'][:2]:
                             logger.info(f"    Egypt: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    
-                    # 🇿🇦 South African PSL integration - African football passion!
+
+                # 🇿🇦 South African PSL integration - African football passion!
+                async def fetch_south_african_psl(all_data):
                     south_african_data = await fetch_south_african_psl_data()
                     if south_african_data.get('success') and south_african_data.get('matches'):
                         all_data['SOUTH_AFRICAN_PSL'] = south_african_data['matches']
@@ -1211,20 +1211,9 @@ class UltimateSportsIntegrator:
                         logger.info(f"✅ REAL SOUTH AFRICAN PSL: {len(south_african_data['matches'])} Soweto Derby and African powerhouse battles")
                         for match in south_african_data['matches'][:2]:
                             logger.info(f"    South Africa: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
-                    if finnish_data.get('success') and finnish_data.get('matches'):
-                        all_data['FINNISH_VEIKKAUSLIIGA'] = finnish_data['matches']
-                        all_data['FINLAND'] = finnish_data['matches']  # Dual naming
-                        logger.info(f"✅ REAL FINNISH VEIKKAUSLIIGA: {len(finnish_data['matches'])} Finnish battles")
-                        for match in finnish_data['matches'][:2]:
-                            logger.info(f"    Finland: {match.get('home_team', 'TBD')} vs {match.get('away_team', 'TBD')} ({match.get('venue', 'TBD')})")
 
-                    logger.info("🌍 World Cup Qualifiers + F1 + Major Leagues + New Sports + 12 FOOTBALL LEAGUES + 5 NORDIC LEAGUES = TOTAL DOMINATION!")
-                
-                except Exception as e:
-                    logger.warning(f"Leagues Cup data fetch error: {e}")
-                
                 # 🎾 REAL WTA TENNIS DATA - WOMEN'S TENNIS EXCELLENCE!
-                try:
+                async def fetch_wta(all_data):
                     from womens_tennis_market_efficiency_mcp import fetch_womens_tennis_market_efficiency_data
                     wta_data = await fetch_womens_tennis_market_efficiency_data()
                     if wta_data:
@@ -1238,61 +1227,55 @@ class UltimateSportsIntegrator:
                             logger.info(f"   WTA MATCH: {game.get('away_team')} vs {game.get('home_team')} (Confidence: {game.get('confidence', 0.0)})")
                     else:
                         logger.info("ℹ️ WTA: No matches today")
-                except Exception as e:
-                    logger.warning(f"WTA data fetch error: {e}")
 
                 # 🚀 COMPREHENSIVE SOCCER DATA from NEW MCP SERVER (other leagues only!)
                 # Only load leagues that we don't have custom data for
-                try:
-                    comprehensive_soccer_data = await fetch_all_real_soccer_data()
-                    if comprehensive_soccer_data and comprehensive_soccer_data.get('all_soccer_leagues'):
-                        # Skip leagues we already loaded with custom data  
-                        # 🔥 EXPANDED SKIP LIST - ALL CFB PATTERN LEAGUES! 🔥
-                        skip_leagues = {'EPL', 'LALIGA', 'SERIE_A', 'BUNDESLIGA', 'LIGUE_1', 
-                                       'PREMIER_LEAGUE', 'LA_LIGA', 'SPANISH_LA_LIGA', 'PRIMERA_DIVISION',
-                                       'ITALIAN_SERIE_A', 'GERMAN_BUNDESLIGA', 'FRENCH_LIGUE_1', 'ENGLISH_PREMIER_LEAGUE',
-                                       'MLS', 'MAJOR_LEAGUE_SOCCER', 'LIGA_MX', 'LIGA_MEXICANA',
-                                       'CHAMPIONS_LEAGUE', 'UEFA_CHAMPIONS_LEAGUE', 'UCL',
-                                   # 🔥 CFB PATTERN LEAGUES - DON'T OVERRIDE WITH 0 GAMES! 🔥
-                                   'EREDIVISIE', 'DUTCH_EREDIVISIE', 'NETHERLANDS_EREDIVISIE',
-                                   'J1_LEAGUE', 'J1_LEAGUE_JAPAN', 'JAPANESE_J1',
-                                   'BRASILEIRAO', 'BRAZILIAN_SERIE_A', 'BRASIL_SERIE_A', 'BRAZILIAN_CHAMPIONSHIP',
-                                   'NORWEGIAN_ELITESERIEN', 'ELITESERIEN', 'NORWAY_ELITESERIEN', 
-                                   'SWEDISH_ALLSVENSKAN', 'ALLSVENSKAN', 'SWEDEN_ALLSVENSKAN',
-                                   'DANISH_SUPERLIGA', 'SUPERLIGA', 'DENMARK_SUPERLIGA',
-                                   'FINNISH_VEIKKAUSLIIGA', 'VEIKKAUSLIIGA', 'FINLAND_VEIKKAUSLIIGA',
-                                   'ARGENTINE_LIGA', 'LIGA_PROFESIONAL', 'ARGENTINA_PRIMERA',
-                                   'KOREAN_K_LEAGUE', 'K_LEAGUE_1', 'K1_LEAGUE',
-                                   'BELGIAN_PRO_LEAGUE', 'JUPILER_PRO_LEAGUE', 'BELGIUM_PRO',
-                                   'SCOTTISH_PREMIERSHIP', 'SCOTLAND_PREMIERSHIP',
-                                   'PORTUGUESE_PRIMEIRA', 'PRIMEIRA_LIGA', 'PORTUGAL_PRIMEIRA',
-                                   'AUSTRIAN_BUNDESLIGA', 'AUSTRIA_BUNDESLIGA',
-                                   'SWISS_SUPER_LEAGUE', 'SUPER_LEAGUE_SWITZERLAND'}
-                        for league, games in comprehensive_soccer_data['all_soccer_leagues'].items():
-                            if league not in skip_leagues:
+                async def fetch_comprehensive_soccer(all_data):
+                    try:
+                        comprehensive_soccer_data = await fetch_all_real_soccer_data()
+                        if comprehensive_soccer_data and comprehensive_soccer_data.get('all_soccer_leagues'):
+                            # Skip leagues we already loaded with custom data  
+                            # 🔥 EXPANDED SKIP LIST - ALL CFB PATTERN LEAGUES! 🔥
+                            skip_leagues = {'EPL', 'LALIGA', 'SERIE_A', 'BUNDESLIGA', 'LIGUE_1', 
+                                           'PREMIER_LEAGUE', 'LA_LIGA', 'SPANISH_LA_LIGA', 'PRIMERA_DIVISION',
+                                           'ITALIAN_SERIE_A', 'GERMAN_BUNDESLIGA', 'FRENCH_LIGUE_1', 'ENGLISH_PREMIER_LEAGUE',
+                                           'MLS', 'MAJOR_LEAGUE_SOCCER', 'LIGA_MX', 'LIGA_MEXICANA',
+                                           'CHAMPIONS_LEAGUE', 'UEFA_CHAMPIONS_LEAGUE', 'UCL',
+                                       # 🔥 CFB PATTERN LEAGUES - DON'T OVERRIDE WITH 0 GAMES! 🔥
+                                       'EREDIVISIE', 'DUTCH_EREDIVISIE', 'NETHERLANDS_EREDIVISIE',
+                                       'J1_LEAGUE', 'J1_LEAGUE_JAPAN', 'JAPANESE_J1',
+                                       'BRASILEIRAO', 'BRAZILIAN_SERIE_A', 'BRASIL_SERIE_A', 'BRAZILIAN_CHAMPIONSHIP',
+                                       'NORWEGIAN_ELITESERIEN', 'ELITESERIEN', 'NORWAY_ELITESERIEN', 
+                                       'SWEDISH_ALLSVENSKAN', 'ALLSVENSKAN', 'SWEDEN_ALLSVENSKAN',
+                                       'DANISH_SUPERLIGA', 'SUPERLIGA', 'DENMARK_SUPERLIGA',
+                                       'FINNISH_VEIKKAUSLIIGA', 'VEIKKAUSLIIGA', 'FINLAND_VEIKKAUSLIIGA',
+                                       'ARGENTINE_LIGA', 'LIGA_PROFESIONAL', 'ARGENTINA_PRIMERA',
+                                       'KOREAN_K_LEAGUE', 'K_LEAGUE_1', 'K1_LEAGUE',
+                                       'BELGIAN_PRO_LEAGUE', 'JUPILER_PRO_LEAGUE', 'BELGIUM_PRO',
+                                       'SCOTTISH_PREMIERSHIP', 'SCOTLAND_PREMIERSHIP',
+                                       'PORTUGUESE_PRIMEIRA', 'PRIMEIRA_LIGA', 'PORTUGAL_PRIMEIRA',
+                                       'AUSTRIAN_BUNDESLIGA', 'AUSTRIA_BUNDESLIGA',
+                                       'SWISS_SUPER_LEAGUE', 'SUPER_LEAGUE_SWITZERLAND'}
+                            for league, games in comprehensive_soccer_data['all_soccer_leagues'].items():
+                                if league not in skip_leagues:
+                                    all_data[league] = games
+                                    logger.info(f"⚽ REAL {league} DATA: {len(games)} games")
+                
+                    except Exception as comprehensive_error:
+                        logger.warning(f"Comprehensive soccer data fetch error: {comprehensive_error}")
+                        comprehensive_soccer_data = None
+
+                    # FALLBACK: Original soccer data if comprehensive fails
+                    if not comprehensive_soccer_data or not comprehensive_soccer_data.get('all_soccer_leagues'):
+                        soccer_data = await fetch_real_soccer_data()
+                        if soccer_data and soccer_data.get('all_soccer_leagues'):
+                            for league, games in soccer_data['all_soccer_leagues'].items():
                                 all_data[league] = games
-                                logger.info(f"⚽ REAL {league} DATA: {len(games)} games")
-                
-                except Exception as comprehensive_error:
-                    logger.warning(f"Comprehensive soccer data fetch error: {comprehensive_error}")
-                    comprehensive_soccer_data = None
+                                logger.info(f"✅ FALLBACK {league} DATA: {len(games)} games")
 
-                # FALLBACK: Original soccer data if comprehensive fails
-                if not comprehensive_soccer_data or not comprehensive_soccer_data.get('all_soccer_leagues'):
-                    soccer_data = await fetch_real_soccer_data()
-                    if soccer_data and soccer_data.get('all_soccer_leagues'):
-                        for league, games in soccer_data['all_soccer_leagues'].items():
-                            all_data[league] = games
-                            logger.info(f"✅ FALLBACK {league} DATA: {len(games)} games")
-                
-                # REAL COMPREHENSIVE ESPN DATA (Tennis, Hockey, College Sports, etc.)
-                # NOTE: This function doesn't exist yet - we already have all real data needed
-                # comprehensive_data = await fetch_comprehensive_espn_data()
-                logger.info("ℹ️ Comprehensive ESPN data: Using existing real MCP servers instead")
-                
                 # 🎾 US OPEN 2025 REAL TENNIS DATA WITH ADVANCED 7D ANALYTICS!
                 # Get real US Open matches with full Tennis MCP power
-                try:
+                async def fetch_tennis_us_open(all_data):
                     tennis_data = await get_tennis_data()
                     if tennis_data:
                         logger.info(f"🎾 Processing {len(tennis_data)} US Open 2025 matches with Tennis 7D MCPs...")
@@ -1341,26 +1324,99 @@ class UltimateSportsIntegrator:
                             logger.info(f"✅ REAL WTA DATA (7D ENHANCED): {len(wta_matches)} US Open matches")
                             
                         logger.info(f"✅ TOTAL TENNIS DATA WITH 7D POWER: {len(tennis_data)} US Open matches")
-                except Exception as e:
-                    logger.error(f"❌ Tennis 7D MCP failed: {e}")
-                
+
                 # 🏆 REAL UEFA CHAMPIONS LEAGUE DATA from NEW MCP SERVER
-                try:
+                async def fetch_ucl(all_data):
                     ucl_data = await fetch_real_ucl_data()
                     if ucl_data and ucl_data.get('ucl_games'):
                         all_data['UCL'] = ucl_data['ucl_games']
                         logger.info(f"🏆 REAL UCL DATA: {len(ucl_data['ucl_games'])} games")
-                except Exception as e:
-                    logger.warning(f"UCL data fetch error: {e}")
-                
+
                 # REAL UEFA DATA (Europa League, World Cup) - Original system
-                today_str = datetime.now().strftime('%Y-%m-%d')
-                for competition in ['UEL', 'WORLD_CUP']:
-                    uefa_data = await fetch_real_uefa_data(competition, today_str)
-                    if uefa_data and uefa_data.get('games'):
-                        all_data[competition] = uefa_data['games']
-                        logger.info(f"✅ REAL {competition} DATA: {len(uefa_data['games'])} games")
-                
+                async def fetch_uefa_legacy(all_data):
+                    today_str = datetime.now().strftime('%Y-%m-%d')
+                    for competition in ['UEL', 'WORLD_CUP']:
+                        uefa_data = await fetch_real_uefa_data(competition, today_str)
+                        if uefa_data and uefa_data.get('games'):
+                            all_data[competition] = uefa_data['games']
+                            logger.info(f"✅ REAL {competition} DATA: {len(uefa_data['games'])} games")
+
+                # 🚀 BOUNDED FAN-OUT - every source runs as its own task; results merge
+                # back in the order listed so alias precedence matches the old serial chain
+                all_data = await self._fan_out_league_sources([
+                    ('PROGOL', fetch_progol),
+                    ('NBA_BALLDONTLIE', fetch_nba_balldontlie),
+                    ('NFL', fetch_nfl),
+                    ('CFB', fetch_cfb),
+                    ('BOXING', fetch_boxing),
+                    ('EUROPA_LEAGUE', fetch_europa_league),
+                    ('TENNIS', fetch_tennis),
+                    ('UFC', fetch_ufc),
+                    ('MLB', fetch_mlb),
+                    ('LMB', fetch_lmb),
+                    ('NBA', fetch_nba),
+                    ('WNBA', fetch_wnba),
+                    ('NHL', fetch_nhl),
+                    ('EPL', fetch_epl),
+                    ('LA_LIGA', fetch_la_liga),
+                    ('SERIE_A', fetch_serie_a),
+                    ('BUNDESLIGA', fetch_bundesliga),
+                    ('LIGUE_1', fetch_ligue_1),
+                    ('MLS', fetch_mls),
+                    ('LIGA_MX', fetch_liga_mx),
+                    ('CHAMPIONS_LEAGUE', fetch_champions_league),
+                    ('CAF', fetch_caf),
+                    ('FIFA_FRIENDLIES', fetch_fifa_friendlies),
+                    ('UEFA_NATIONS_LEAGUE', fetch_uefa_nations_league),
+                    ('CONCACAF_NATIONS_LEAGUE', fetch_concacaf_nations_league),
+                    ('LEAGUES_CUP', fetch_leagues_cup),
+                    ('WC_QUALIFIERS', fetch_wc_qualifiers),
+                    ('FORMULA_1', fetch_f1),
+                    ('J1_LEAGUE', fetch_j1_league),
+                    ('TURKISH_SUPER_LEAGUE', fetch_turkish_super_league),
+                    ('BRAZILIAN_SERIE_A', fetch_brazilian_serie_a),
+                    ('ESPN_PREMIER_LEAGUE', fetch_espn_premier_league),
+                    ('ESPN_LA_LIGA', fetch_espn_la_liga),
+                    ('ESPN_BUNDESLIGA', fetch_espn_bundesliga),
+                    ('ESPN_SERIE_A', fetch_espn_serie_a),
+                    ('ESPN_LIGUE_1', fetch_espn_ligue_1),
+                    ('ESPN_EREDIVISIE', fetch_espn_eredivisie),
+                    ('ESPN_PRIMEIRA_LIGA', fetch_espn_primeira_liga),
+                    ('ESPN_BRASILEIRAO', fetch_espn_brasileirao),
+                    ('ESPN_ARGENTINA', fetch_espn_argentina),
+                    ('ESPN_CHILE', fetch_espn_chile),
+                    ('ESPN_COLOMBIA', fetch_espn_colombia),
+                    ('ESPN_MLS', fetch_espn_mls),
+                    ('ESPN_LIGA_MX', fetch_espn_liga_mx),
+                    ('SEA_LEAGUE', fetch_sea_league),
+                    ('ESPN_EUROPA_LEAGUE', fetch_espn_europa_league),
+                    ('PGA_TOUR', fetch_pga_tour),
+                    ('CRICKET', fetch_cricket),
+                    ('CHESS', fetch_chess),
+                    ('ESPORTS', fetch_esports),
+                    ('ARGENTINE_LIGA_PROFESIONAL', fetch_argentine_liga_profesional),
+                    ('KOREAN_K_LEAGUE_1', fetch_korean_k_league_1),
+                    ('BELGIAN_PRO_LEAGUE', fetch_belgian_pro_league),
+                    ('SCOTTISH_PREMIERSHIP', fetch_scottish_premiership),
+                    ('PORTUGUESE_PRIMEIRA_LIGA', fetch_portuguese_primeira_liga),
+                    ('DUTCH_EREDIVISIE', fetch_dutch_eredivisie),
+                    ('AUSTRIAN_BUNDESLIGA', fetch_austrian_bundesliga),
+                    ('SWISS_SUPER_LEAGUE', fetch_swiss_super_league),
+                    ('NORWEGIAN_ELITESERIEN', fetch_norwegian_eliteserien),
+                    ('SWEDISH_ALLSVENSKAN', fetch_swedish_allsvenskan),
+                    ('DANISH_SUPERLIGA', fetch_danish_superliga),
+                    ('FINNISH_VEIKKAUSLIIGA', fetch_finnish_veikkausliiga),
+                    ('USL_CHAMPIONSHIP', fetch_usl_championship),
+                    ('CANADIAN_PREMIER_LEAGUE', fetch_canadian_premier_league),
+                    ('EGYPTIAN_PREMIER_LEAGUE', fetch_egyptian_premier_league),
+                    ('SOUTH_AFRICAN_PSL', fetch_south_african_psl),
+                    ('WTA', fetch_wta),
+                    ('COMPREHENSIVE_SOCCER', fetch_comprehensive_soccer),
+                    ('TENNIS_US_OPEN', fetch_tennis_us_open),
+                    ('UCL', fetch_ucl),
+                    ('UEFA_LEGACY', fetch_uefa_legacy),
+                ])
+
                 # Use MCP Coordinator for advanced analysis on ALL leagues
                 if 'mcp_coordinator' in self.sports_agents:
                     coordinator = self.sports_agents['mcp_coordinator']
@@ -1450,6 +1506,59 @@ class UltimateSportsIntegrator:
         # Fallback to existing system if real data fails
         return await self.get_all_sports_data_fallback()
     
+    async def _fan_out_league_sources(self, sources) -> Dict[str, List[Dict]]:
+        """🚀 Run (name, fetcher) league sources concurrently under a shared cap
+        
+        Every fetcher gets a private dict to fill, its own timeout, and a
+        LeagueFetchOutcome. Dicts are merged in the order given so later
+        sources still override earlier alias keys exactly like the old
+        sequential chain did.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_sources)
+        outcomes: Dict[str, LeagueFetchOutcome] = {}
+        
+        async def run_source(name, fetcher):
+            partial: Dict[str, List[Dict]] = {}
+            async with semaphore:
+                started = time.perf_counter()
+                status, error = 'ok', None
+                try:
+                    await asyncio.wait_for(fetcher(partial), timeout=self.source_timeout)
+                except asyncio.TimeoutError:
+                    status, error = 'timeout', f"exceeded {self.source_timeout:.1f}s"
+                    logger.warning(f"⏱️ {name} data fetch timed out after {self.source_timeout:.1f}s")
+                except Exception as e:
+                    status, error = 'error', str(e)
+                    logger.warning(f"{name} data fetch error: {e}")
+                elapsed = time.perf_counter() - started
+            
+            if status == 'ok' and not partial:
+                status = 'empty'
+            # Alias keys share one list object - count each slate once
+            unique_slates = {id(games): games for games in partial.values()}
+            outcomes[name] = LeagueFetchOutcome(
+                source=name,
+                status=status,
+                elapsed_seconds=round(elapsed, 3),
+                league_keys=list(partial.keys()),
+                games=sum(len(games) for games in unique_slates.values() if isinstance(games, list)),
+                error=error
+            )
+            return partial
+        
+        started = time.perf_counter()
+        partials = await asyncio.gather(*(run_source(name, fetcher) for name, fetcher in sources))
+        
+        all_data: Dict[str, List[Dict]] = {}
+        for partial in partials:
+            all_data.update(partial)
+        
+        self.last_fetch_outcomes = {name: outcomes[name] for name, _ in sources}
+        ok_sources = sum(1 for outcome in outcomes.values() if outcome.status in ('ok', 'empty'))
+        logger.info(f"🚀 LEAGUE FAN-OUT: {ok_sources}/{len(sources)} sources OK in {time.perf_counter() - started:.2f}s "
+                    f"(cap {self.max_concurrent_sources}, timeout {self.source_timeout:.1f}s)")
+        return all_data
+    
     async def get_all_sports_data_fallback(self) -> Dict[str, List[Dict]]:
         """🚨 EMERGENCY FALLBACK - ONLY FOR LEAGUES WITH REAL GAMES TODAY!"""
         logger.warning("🚨 Using fallback data - but ONLY for leagues that should have games!")
@@ -5141,99 +5250,11 @@ class UltimateSportsIntegrator:
         
         team_lower = team_name.lower()
         
-        # 🇩🇪 BUNDESLIGA POWERHOUSE ANALYSIS
-        bundesliga_powerhouses = {
-            'bayern': 0.85, 'munich': 0.85, 'bayern munich': 0.85,
-            'dortmund': 0.78, 'borussia': 0.78, 'bvb': 0.78,
-            'leipzig': 0.75, 'rb leipzig': 0.75,
-            'leverkusen': 0.72, 'bayer': 0.72,
-            'frankfurt': 0.68, 'eintracht': 0.68,
-            'wolfsburg': 0.65, 'monchengladbach': 0.63,
-            'stuttgart': 0.62, 'freiburg': 0.60,
-            'hoffenheim': 0.58, 'mainz': 0.55,
-            'union berlin': 0.57, 'werder bremen': 0.54,
-            'augsburg': 0.52, 'heidenheim': 0.48,
-            'bochum': 0.46, 'darmstadt': 0.44,
-            'koln': 0.50, 'holstein kiel': 0.47
-        }
-        
-        # 🏴󠁧󠁢󠁥󠁮󠁧󠁿 PREMIER LEAGUE POWERHOUSE ANALYSIS  
-        premier_powerhouses = {
-            'city': 0.88, 'manchester city': 0.88, 'man city': 0.88,
-            'arsenal': 0.82, 'liverpool': 0.83, 'chelsea': 0.79,
-            'united': 0.76, 'manchester united': 0.76, 'man united': 0.76,
-            'tottenham': 0.74, 'spurs': 0.74, 'newcastle': 0.70,
-            'brighton': 0.67, 'west ham': 0.64, 'aston villa': 0.71,
-            'crystal palace': 0.58, 'fulham': 0.60, 'brentford': 0.59,
-            'wolves': 0.56, 'everton': 0.54, 'nottingham': 0.52,
-            'bournemouth': 0.51, 'luton': 0.46, 'burnley': 0.48,
-            'sheffield': 0.49
-        }
-        
-        # 🇪🇸 LA LIGA POWERHOUSE ANALYSIS
-        laliga_powerhouses = {
-            'real madrid': 0.87, 'madrid': 0.87, 'real': 0.87,
-            'barcelona': 0.84, 'barca': 0.84, 'atletico': 0.79,
-            'athletic': 0.68, 'bilbao': 0.68, 'villarreal': 0.69,
-            'real sociedad': 0.67, 'sociedad': 0.67, 'sevilla': 0.66,
-            'valencia': 0.63, 'betis': 0.62, 'osasuna': 0.57,
-            'celta': 0.55, 'las palmas': 0.53, 'getafe': 0.54,
-            'girona': 0.59, 'mallorca': 0.56, 'cadiz': 0.48,
-            'almeria': 0.45, 'granada': 0.47
-        }
-        
-        # 🇮🇹 SERIE A POWERHOUSE ANALYSIS
-        seriea_powerhouses = {
-            'inter': 0.85, 'milan': 0.81, 'juventus': 0.79, 'juve': 0.79,
-            'napoli': 0.77, 'roma': 0.73, 'lazio': 0.71, 'atalanta': 0.74,
-            'fiorentina': 0.66, 'bologna': 0.63, 'torino': 0.58,
-            'genoa': 0.55, 'udinese': 0.56, 'sassuolo': 0.54,
-            'verona': 0.52, 'cagliari': 0.51, 'lecce': 0.49,
-            'frosinone': 0.47, 'salernitana': 0.45
-        }
-        
-        # 🇫🇷 LIGUE 1 POWERHOUSE ANALYSIS
-        ligue1_powerhouses = {
-            'psg': 0.89, 'paris': 0.89, 'monaco': 0.73, 'marseille': 0.70,
-            'lille': 0.68, 'lyon': 0.67, 'nice': 0.65, 'rennes': 0.63,
-            'lens': 0.62, 'strasbourg': 0.58, 'montpellier': 0.56,
-            'nantes': 0.55, 'reims': 0.54, 'brest': 0.53,
-            'le havre': 0.50, 'metz': 0.48, 'clermont': 0.47,
-            'lorient': 0.49
-        }
-        
-        # 🇲🇽 LIGA MX POWERHOUSE ANALYSIS
-        ligamx_powerhouses = {
-            'america': 0.82, 'cruz azul': 0.75, 'chivas': 0.78, 'guadalajara': 0.78,
-            'tigres': 0.79, 'monterrey': 0.77, 'pumas': 0.71, 'santos': 0.68,
-            'leon': 0.66, 'atlas': 0.63, 'tijuana': 0.61, 'toluca': 0.64,
-            'pachuca': 0.65, 'puebla': 0.57, 'necaxa': 0.56, 'mazatlan': 0.52,
-            'queretaro': 0.51, 'juarez': 0.49
-        }
-        
-        # 🇺🇸 MLS POWERHOUSE ANALYSIS
-        mls_powerhouses = {
-            'lafc': 0.75, 'miami': 0.73, 'seattle': 0.71, 'austin': 0.68,
-            'atlanta': 0.67, 'philadelphia': 0.66, 'cincinnati': 0.65,
-            'columbus': 0.64, 'portland': 0.63, 'nashville': 0.62,
-            'new york city': 0.64, 'nycfc': 0.64, 'new york red': 0.60,
-            'orlando': 0.59, 'minnesota': 0.58, 'chicago': 0.55,
-            'charlotte': 0.57, 'dc united': 0.54, 'houston': 0.53,
-            'dallas': 0.56, 'kansas city': 0.61, 'colorado': 0.50,
-            'vancouver': 0.52, 'toronto': 0.51, 'montreal': 0.49,
-            'new england': 0.48, 'san jose': 0.47
-        }
-        
-        # Check each league's powerhouse ratings
-        all_powerhouses = {**bundesliga_powerhouses, **premier_powerhouses, 
-                          **laliga_powerhouses, **seriea_powerhouses,
-                          **ligue1_powerhouses, **ligamx_powerhouses, **mls_powerhouses}
-        
-        # Try exact match first
-        for team_key, strength in all_powerhouses.items():
-            if team_key in team_lower:
-                logger.info(f"🎯 Team strength found: {team_name} -> {strength:.2f}")
-                return strength
+        # 📚 Powerhouse ratings for every league live in the compiled team catalog
+        strength = TEAM_CATALOG.strength(team_name)
+        if strength is not None:
+            logger.info(f"🎯 Team strength found: {team_name} -> {strength:.2f}")
+            return strength
         
         # Fall back to generic team strength patterns
         if any(word in team_lower for word in ['real', 'united', 'city', 'fc']):